@@ -22,6 +22,9 @@ from app.services.stt_service import STTService
 from app.services.media_service import MediaService
 from app.nllb_translator import NLLBTranslator
 
+from app.artifact_cache import artifact_cache, artifact_key, hash_file
+from app.warmup import Warmup
+
 # Import security & monitoring
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -60,6 +63,15 @@ stt_service = STTService()
 media_service = MediaService()
 nllb_translator = NLLBTranslator()
 
+# Warmup: modèl yo chaje ak fraz demo yo nan kachaj anvan readiness vin vèt
+warmup = Warmup.from_env(tts_service=tts_service, translator=nllb_translator)
+try:
+    from src.health import HealthChecker, readiness_endpoint
+    health_checker = HealthChecker(app_version="3.1.0")
+    health_checker.add_readiness_gate("warmup", warmup.is_ready)
+except ImportError:
+    health_checker = None
+
 # Initialize file validator
 if MONITORING_ENABLED:
     file_validator = FileValidator(
@@ -121,6 +133,23 @@ async def health_check():
     
     return health_status
 
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: 503 jiskaske warmup la fini (ak tcheki lokal rapid sèlman)"""
+    if health_checker is None:
+        ready = warmup.is_ready()
+        return JSONResponse(
+            {"status": "ready" if ready else "not_ready", "gates": {"warmup": ready}},
+            status_code=200 if ready else 503
+        )
+    result, status_code = await readiness_endpoint(health_checker)
+    return JSONResponse(result, status_code=status_code)
+
+@app.get("/api/warmup/status")
+async def warmup_status():
+    """Estati warmup la (tan modèl, kantite tèks pre-tradwi/pre-jenere, erè)"""
+    return JSONResponse({"status": "siksè", "warmup": warmup.get_status()})
+
 @app.get("/metrics")
 async def get_metrics():
     """Jwenn metrik aplikasyon an (Prometheus format)"""
@@ -143,26 +172,64 @@ async def get_cache_stats():
     """Jwenn estatistik kachaj la"""
     try:
         from app.cache import translation_cache, audio_cache
+        from app.cache_tiered import cache_stats
+        from app.singleflight import singleflight_stats
         
         return JSONResponse({
             "status": "siksè",
             "translation_cache": translation_cache.get_stats(),
-            "audio_cache": audio_cache.get_stats()
+            "audio_cache": audio_cache.get_stats(),
+            "tiered_cache": cache_stats(),
+            "singleflight": singleflight_stats(),
+            "artifact_cache": artifact_cache.get_stats()
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erè: {str(e)}")
 
+@app.get("/api/cache/keyspace")
+async def get_cache_keyspace(sample_size: int = 500):
+    """
+    Kantite kle ak memwa pa espas non nan Redis (estime pa echantiyon,
+    san SCAN total: an sekirite sou gwo keyspace)
+    """
+    try:
+        from app.cache_tiered import keyspace_stats
+        
+        sample_size = max(1, min(sample_size, 10000))
+        stats = keyspace_stats(sample_size)
+        return JSONResponse({"status": "siksè", **stats})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erè: {str(e)}")
+
+@app.get("/api/cache/analytics")
+async def get_cache_analytics(top: int = 10):
+    """
+    Hit ratio pa espas non sou fenèt 1m/5m/1h, byte hit ratio, kle ki pi
+    cho yo ak estatistik admisyon TinyLFU la
+    """
+    try:
+        from app.cache_tiered import cache_analytics
+
+        top = max(0, min(top, 32))
+        return JSONResponse({"status": "siksè", "namespaces": cache_analytics(top)})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erè: {str(e)}")
+
 @app.post("/api/cache/clear")
 async def clear_cache(cache_type: str = Form("all")):
     """Efase kachaj la"""
     try:
         from app.cache import translation_cache, audio_cache
+        from app.cache_tiered import translation_cache as tiered_translation_cache
         
         count = 0
         if cache_type in ["all", "translation"]:
             count += translation_cache.clear()
+            count += tiered_translation_cache.clear()
         if cache_type in ["all", "audio"]:
             count += audio_cache.clear()
+        if cache_type in ["all", "artifacts"]:
+            count += artifact_cache.clear()
         
         return JSONResponse({
             "status": "siksè",
@@ -215,13 +282,27 @@ async def text_to_speech(
         if MONITORING_ENABLED:
             track_audio_generation(voice, len(text))
         
-        audio_path = await tts_service.generate_speech(text, voice)
+        # Tèks ki deja jenere (ex: preview vwa yo, pre-jenere pa warmup)
+        # (lookup Redis la sync: li fèt nan yon thread pou pa bloke loop la)
+        audio_path = await asyncio.to_thread(tts_service.cached_speech, text, voice)
+        cached = audio_path is not None
+        
+        if not cached:
+            # Menm tèks + menm vwa an menm tan: yon sèl sentèz
+            from app.singleflight import get_flight
+            from app.cache_tiered import make_key
+            audio_path = await get_flight("tts").do_async(
+                make_key(voice, text),
+                lambda: tts_service.generate_speech(text, voice)
+            )
+            await asyncio.to_thread(tts_service.remember_speech, text, voice, audio_path)
         
         return JSONResponse({
             "status": "siksè",
             "message": "Odyo kreye avèk siksè! ✅",
             "audio_url": f"/output/{audio_path.name}",
-            "text_length": len(text)
+            "text_length": len(text),
+            "cached": cached
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erè: {str(e)}")
@@ -261,6 +342,21 @@ async def create_audiobook(
             shutil.copyfileobj(file.file, tmp)
             tmp_path = Path(tmp.name)
         
+        # Menm dokiman + menm opsyon deja fèt: retounen fichye yo dirèkteman
+        cache_key = artifact_key(
+            hash_file(tmp_path), "audiobook",
+            suffix=tmp_path.suffix.lower(), voice=voice, max_pages=max_pages
+        )
+        cached = artifact_cache.get(cache_key)
+        if cached is not None:
+            tmp_path.unlink()
+            return JSONResponse({
+                "status": "siksè",
+                "message": "Liv odyo kreye avèk siksè! 📚✅",
+                "files": cached,
+                "cached": True
+            })
+        
         # Log processing start
         print(f"\n{'='*60}")
         print(f"📚 AUDIOBOOK CREATION START")
@@ -280,6 +376,7 @@ async def create_audiobook(
         
         # Now create audiobook from extracted text
         result = await media_service.create_audiobook(tmp_path, voice)
+        artifact_cache.put(cache_key, result, kind="audiobook")
         
         # Cleanup
         tmp_path.unlink()
@@ -287,7 +384,8 @@ async def create_audiobook(
         return JSONResponse({
             "status": "siksè",
             "message": "Liv odyo kreye avèk siksè! 📚✅",
-            "files": result
+            "files": result,
+            "cached": False
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erè: {str(e)}")
@@ -451,8 +549,8 @@ async def translate_text(
         # Check cache if enabled
         if use_cache:
             try:
-                from app.cache import translation_cache
-                cache_key = translation_cache._get_cache_key(f"{source_lang}:{target_lang}:{text}")
+                from app.cache_tiered import translation_cache, translation_key
+                cache_key = translation_key(text, source_lang, target_lang)
                 cached_result = translation_cache.get(cache_key)
                 
                 if cached_result:
@@ -470,23 +568,36 @@ async def translate_text(
             except:
                 pass  # Cache not available, continue
         
-        # Translate with NLLB
-        result = await nllb_translator.translate_async(text, source_lang, target_lang)
+        # Translate with NLLB (single-flight: identical concurrent requests
+        # share one model call; across nodes, wait for the cached result)
+        from app.cache_tiered import translation_cache as flight_cache, translation_key
+        flight_key = translation_key(text, source_lang, target_lang)
+        
+        def cached_result():
+            cached = flight_cache._peek(flight_key)
+            return {"success": True, "translated_text": cached} if cached else None
+        
+        async def translate_and_cache():
+            result = await nllb_translator.translate_async(text, source_lang, target_lang)
+            # Sove anvan lidè a lage lock la: lòt nœud yo jwenn li nan kachaj la
+            if use_cache and result.get("success"):
+                try:
+                    await asyncio.to_thread(flight_cache.set, flight_key, result["translated_text"])
+                except Exception:
+                    pass  # Cache not available
+            return result
+        
+        result = await flight_cache.flight.do_async(
+            flight_key,
+            translate_and_cache,
+            cache_get=cached_result if use_cache else None
+        )
         
         if not result.get("success"):
             raise HTTPException(status_code=500, detail=result.get("error", "Translation failed"))
         
         translated_text = result["translated_text"]
         
-        # Save to cache
-        if use_cache:
-            try:
-                from app.cache import translation_cache
-                cache_key = translation_cache._get_cache_key(f"{source_lang}:{target_lang}:{text}")
-                translation_cache.set(cache_key, translated_text)
-            except:
-                pass  # Cache not available
-        
         return JSONResponse({
             "status": "siksè",
             "message": "Tradiksyon konplete ak NLLB! 🌍✅",
@@ -516,8 +627,14 @@ async def translate_pdf(
             shutil.copyfileobj(file.file, tmp)
             tmp_path = Path(tmp.name)
         
-        # Process PDF translation
-        result = await media_service.translate_pdf(tmp_path, target_lang)
+        # Menm PDF + menm lang deja tradwi: retounen fichye yo dirèkteman
+        cache_key = artifact_key(hash_file(tmp_path), "translate_pdf", target_lang=target_lang)
+        result = artifact_cache.get(cache_key)
+        cached = result is not None
+        if not cached:
+            # Process PDF translation
+            result = await media_service.translate_pdf(tmp_path, target_lang)
+            artifact_cache.put(cache_key, result, kind="translate_pdf")
         
         # Cleanup
         tmp_path.unlink()
@@ -525,7 +642,8 @@ async def translate_pdf(
         return JSONResponse({
             "status": "siksè",
             "message": "PDF tradwi avèk siksè! 📄✅",
-            "files": result
+            "files": result,
+            "cached": cached
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erè: {str(e)}")
@@ -625,4 +743,7 @@ async def startup_event():
     print("📚 API Docs:  http://localhost:8000/docs")
     print("=" * 60)
     print()
+    
+    # Chofe kachaj yo an background (liveness reponn, readiness tann)
+    warmup.start_background()
 
@@ -35,6 +35,7 @@ except Exception as e:
 
 try:
     from app.cache_redis import translation_cache, audio_cache
+    from src.cache_keys import translation_key
     REDIS_CACHE_AVAILABLE = True
 except Exception as e:
     print(f"⚠️  Redis cache not available: {e}")
@@ -163,8 +164,9 @@ def setup_enhanced_routes(app):
                 shutil.copyfileobj(file.file, tmp)
                 tmp_path = tmp.name
             
-            # Start background task
-            task = process_audiobook.delay(tmp_path, voice, max_pages)
+            # Start background task (limit paj pa tenant = itilizatè a)
+            tenant = current_user.get("id") if current_user else None
+            task = process_audiobook.delay(tmp_path, voice, max_pages, tenant)
             
             return {
                 "status": "processing",
@@ -251,7 +253,7 @@ def setup_enhanced_routes(app):
             from traduire_texte import traduire_avec_progress
             
             # Create cache key
-            cache_key = translation_cache._get_cache_key(f"auto:{target_lang}:{text}")
+            cache_key = translation_key(text, "auto", target_lang)
             
             # Try cache first
             cached_result = translation_cache.get(cache_key)
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📦 Artifact Cache
+Kachaj rezilta travay konplè (audiobook, tradiksyon PDF) adrese pa kontni:
+menm dokiman + menm vwa/lang/opsyon = menm fichye nan output/, san refè anyen
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import hashlib
+import json
+import os
+import threading
+import time
+
+ARTIFACT_CACHE_DIR = Path(os.getenv("ARTIFACT_CACHE_DIR", "output/artifacts"))
+ARTIFACT_CACHE_ENABLED = os.getenv("ARTIFACT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+ARTIFACT_CACHE_MAX_ENTRIES = int(os.getenv("ARTIFACT_CACHE_MAX_ENTRIES", "500"))
+ARTIFACT_CACHE_MAX_AGE_DAYS = float(os.getenv("ARTIFACT_CACHE_MAX_AGE_DAYS", "30"))
+# Chanje vèsyon sa a lè pipeline la pwodui yon lòt rezilta pou menm antre
+# (nouvo modèl, nouvo segmantasyon...): tout ansyen antre yo vin miss
+PIPELINE_VERSION = os.getenv("ARTIFACT_PIPELINE_VERSION", "1")
+
+OUTPUT_ROOT = Path("output")
+_OUTPUT_URL_PREFIX = "/output/"
+
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    SHA-256 yon fichye, pa moso (menm rezilta ak FileValidator._calculate_hash
+    sou tout kontni an, san chaje gwo PDF yo nan memwa)
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def artifact_key(file_hash: str, kind: str, **options: Any) -> str:
+    """
+    Kle yon rezilta
+
+    Args:
+        file_hash: SHA-256 fichye sous la
+        kind: Kalite travay ("audiobook", "translate_pdf", ...)
+        **options: Vwa, lang ak lòt opsyon ki chanje rezilta a
+
+    Returns:
+        SHA-256 (hash + vèsyon pipeline + kind + opsyon yo)
+    """
+    payload = json.dumps(
+        {"file": file_hash, "pipeline": PIPELINE_VERSION, "kind": kind, "options": options},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def output_files(result: Any) -> List[str]:
+    """Chemen relatif (anba output/) tout URL /output/... nan yon rezilta"""
+    files = []
+
+    def walk(value):
+        if isinstance(value, dict):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                walk(item)
+        elif isinstance(value, str) and value.startswith(_OUTPUT_URL_PREFIX):
+            files.append(value[len(_OUTPUT_URL_PREFIX):])
+
+    walk(result)
+    return sorted(set(files))
+
+
+class ArtifactCache:
+    """
+    Kachaj rezilta travay yo
+
+    Layout:
+        <dir>/<key>.json → {kind, result, files, created, last_used, hits}
+
+    Fichye yo rete kote pipeline la te ekri yo (output/...); yon antre
+    sèlman referans yo. Kantite referans yon fichye = kantite antre ki
+    lis li: lè yon antre soti (eviction, fichye ki manke, clear), fichye
+    ki pa gen referans ankò yo efase nan output/.
+
+    Example:
+        key = artifact_key(hash_file(path), "audiobook", voice=voice)
+        result = artifact_cache.get(key)
+        if result is None:
+            result = create_audiobook(path, voice)
+            artifact_cache.put(key, result, kind="audiobook")
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = ARTIFACT_CACHE_DIR,
+        output_root: Path = OUTPUT_ROOT,
+        max_entries: int = ARTIFACT_CACHE_MAX_ENTRIES,
+        max_age_days: float = ARTIFACT_CACHE_MAX_AGE_DAYS,
+        enabled: bool = ARTIFACT_CACHE_ENABLED
+    ):
+        """
+        Args:
+            cache_dir: Dosye endèks la
+            output_root: Rasin URL /output/ yo
+            max_entries: Kantite antre maks (LRU)
+            max_age_days: Antre ki pa itilize depi plis jou pase sa soti
+            enabled: Aktive kachaj la
+        """
+        self.cache_dir = Path(cache_dir)
+        self.output_root = Path(output_root)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "files_deleted": 0}
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, entry: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _entries(self) -> Dict[str, dict]:
+        if not self.cache_dir.exists():
+            return {}
+        entries = {}
+        for path in self.cache_dir.glob("*.json"):
+            entry = self._read(path)
+            if entry is not None:
+                entries[path.stem] = entry
+        return entries
+
+    # ------------------------------------------------------------
+    # Get / put
+    # ------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Rezilta yon travay ki deja fèt
+
+        Returns:
+            Rezilta a (ak "cached": True), oswa None si li pa la oswa
+            youn nan fichye li yo disparèt
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            path = self._entry_path(key)
+            entry = self._read(path)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if any(not (self.output_root / f).exists() for f in entry.get("files", [])):
+                print(f"⚠️  Artifact {key[:12]} gen fichye ki manke - retire l")
+                self._evict([key])
+                self.stats["misses"] += 1
+                return None
+            entry["last_used"] = time.time()
+            entry["hits"] = entry.get("hits", 0) + 1
+            self._write(path, entry)
+            self.stats["hits"] += 1
+        print(f"♻️  Artifact cache hit: {entry.get('kind')} ({key[:12]})")
+        return {**entry["result"], "cached": True}
+
+    def put(self, key: str, result: dict, kind: str = "", files: Iterable[str] = None) -> None:
+        """
+        Anrejistre rezilta yon travay
+
+        Args:
+            key: artifact_key(...)
+            result: Rezilta JSON travay la
+            kind: Kalite travay la
+            files: Fichye anba output/ (default: tout URL /output/... nan rezilta a)
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        entry = {
+            "kind": kind,
+            "pipeline": PIPELINE_VERSION,
+            "result": result,
+            "files": sorted(set(files)) if files is not None else output_files(result),
+            "created": datetime.now().isoformat(),
+            "last_used": now,
+            "hits": 0,
+        }
+        with self._lock:
+            previous = self._read(self._entry_path(key))
+            self._write(self._entry_path(key), entry)
+            self.stats["stores"] += 1
+            if previous:
+                # Ansyen fichye antre a ki pa nan nouvo a
+                self._delete_unreferenced(set(previous.get("files", [])) - set(entry["files"]))
+        self.cleanup()
+
+    # ------------------------------------------------------------
+    # Referans ak netwayaj
+    # ------------------------------------------------------------
+
+    def ref_counts(self) -> Dict[str, int]:
+        """Kantite antre ki referans chak fichye"""
+        counts: Dict[str, int] = {}
+        for entry in self._entries().values():
+            for f in entry.get("files", []):
+                counts[f] = counts.get(f, 0) + 1
+        return counts
+
+    def is_referenced(self, path: Path) -> bool:
+        """True si yon antre toujou bezwen fichye sa a (pou lòt netwayaj output/)"""
+        try:
+            relative = Path(path).resolve().relative_to(self.output_root.resolve()).as_posix()
+        except ValueError:
+            return False
+        return self.ref_counts().get(relative, 0) > 0
+
+    def _delete_unreferenced(self, candidates: Iterable[str]) -> int:
+        candidates = set(candidates)
+        if not candidates:
+            return 0
+        counts = self.ref_counts()
+        deleted = 0
+        for f in candidates:
+            if counts.get(f, 0) > 0:
+                continue
+            path = self.output_root / f
+            try:
+                if path.exists():
+                    path.unlink()
+                    deleted += 1
+                # Dosye travay la (ex: output/translation_.../) si li vid
+                if path.parent != self.output_root and not any(path.parent.iterdir()):
+                    path.parent.rmdir()
+            except OSError as e:
+                print(f"⚠️  Pa ka efase {path}: {e}")
+        self.stats["files_deleted"] += deleted
+        return deleted
+
+    def _evict(self, keys: Iterable[str]) -> int:
+        freed = set()
+        count = 0
+        for key in keys:
+            path = self._entry_path(key)
+            entry = self._read(path)
+            path.unlink(missing_ok=True)
+            if entry is not None:
+                freed.update(entry.get("files", []))
+                count += 1
+        self.stats["evictions"] += count
+        self._delete_unreferenced(freed)
+        return count
+
+    def evict(self, key: str) -> bool:
+        """Retire yon antre (ak fichye ki pa gen referans ankò)"""
+        with self._lock:
+            return self._evict([key]) > 0
+
+    def cleanup(self) -> int:
+        """
+        Retire antre ki twò vye oswa ki depase max_entries (LRU)
+
+        Returns:
+            Kantite antre retire
+        """
+        with self._lock:
+            entries = self._entries()
+            cutoff = time.time() - self.max_age_days * 86400
+            expired = [k for k, e in entries.items() if e.get("last_used", 0) < cutoff]
+            expired_set = set(expired)
+            remaining = sorted(
+                (k for k in entries if k not in expired_set),
+                key=lambda k: entries[k].get("last_used", 0)
+            )
+            overflow = remaining[:max(0, len(remaining) - self.max_entries)]
+            victims = expired + overflow
+            if not victims:
+                return 0
+            count = self._evict(victims)
+        print(f"🗑️  Artifact cache: {count} antre retire")
+        return count
+
+    def clear(self) -> int:
+        """Retire tout antre yo (ak fichye yo)"""
+        with self._lock:
+            return self._evict(list(self._entries()))
+
+    def get_stats(self) -> dict:
+        entries = self._entries()
+        counts = self.ref_counts()
+        total_size = 0
+        for f in counts:
+            try:
+                total_size += (self.output_root / f).stat().st_size
+            except OSError:
+                pass
+        return {
+            "enabled": self.enabled,
+            "entries": len(entries),
+            "files": len(counts),
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "pipeline_version": PIPELINE_VERSION,
+            "max_entries": self.max_entries,
+            **self.stats,
+        }
+
+
+# Kachaj global la
+artifact_cache = ArtifactCache()
@@ -7,24 +7,33 @@ Sistèm kachaj pou amelyore pèfòmans
 
 import hashlib
 import json
+import os
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Any
 
+from app.cache_codec import CacheCodec, default_codec
+from app.singleflight import SingleFlight
+
 class SimpleCache:
     """Sistèm kachaj senp pou storaj fichye"""
     
-    def __init__(self, cache_dir: str = "cache", ttl_hours: int = 24):
+    def __init__(self, cache_dir: str = "cache", ttl_hours: int = 24, codec: Optional[CacheCodec] = None):
         """
         Inisyalize kachaj
         
         Args:
             cache_dir: Dosye pou storaj kachaj
             ttl_hours: Tan lavi kachaj an è (time-to-live)
+            codec: Kodek pou fichye yo (default: app.cache_codec.default_codec)
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(hours=ttl_hours)
+        self.codec = codec or default_codec
+        # Demann idantik konkiran kalkile yon sèl fwa
+        self.flight = SingleFlight(f"file:{cache_dir}")
         print(f"✅ Cache initialized: {cache_dir} (TTL: {ttl_hours}h)")
     
     def _get_cache_key(self, data: str) -> str:
@@ -32,9 +41,26 @@ class SimpleCache:
         return hashlib.md5(data.encode('utf-8')).hexdigest()
     
     def _get_cache_path(self, key: str) -> Path:
-        """Jwenn chemen fichye kachaj la"""
+        """Jwenn chemen fichye kachaj la (fòma kodek la)"""
+        return self.cache_dir / f"{key}.bin"
+    
+    def _get_legacy_path(self, key: str) -> Path:
+        """Chemen ansyen fichye JSON yo (li sèlman)"""
         return self.cache_dir / f"{key}.json"
     
+    def _entries(self) -> list:
+        """Tout fichye kachaj yo (nouvo ak ansyen)"""
+        return list(self.cache_dir.glob("*.bin")) + list(self.cache_dir.glob("*.json"))
+    
+    def _is_expired(self, cache_file: Path) -> bool:
+        """Fichye .bin: dat modifikasyon; fichye .json: timestamp anndan l"""
+        if cache_file.suffix == '.bin':
+            return time.time() - cache_file.stat().st_mtime > self.ttl.total_seconds()
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache_data = json.load(f)
+        cached_time = datetime.fromisoformat(cache_data['timestamp'])
+        return datetime.now() - cached_time > self.ttl
+    
     def get(self, key: str) -> Optional[Any]:
         """
         Rekipere valè soti nan kachaj
@@ -49,32 +75,42 @@ class SimpleCache:
             cache_path = self._get_cache_path(key)
             
             if not cache_path.exists():
+                legacy_path = self._get_legacy_path(key)
+                if legacy_path.exists():
+                    return self._get_legacy(legacy_path)
                 return None
             
-            # Li cache file
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
             # Verifye si cache la eksipe
-            cached_time = datetime.fromisoformat(cache_data['timestamp'])
-            if datetime.now() - cached_time > self.ttl:
+            if self._is_expired(cache_path):
                 # Cache eksipe, efase l
                 cache_path.unlink()
                 return None
             
-            return cache_data['value']
+            return self.codec.decode(cache_path.read_bytes())
             
         except Exception as e:
             print(f"⚠️  Cache read error: {e}")
             return None
     
+    def _get_legacy(self, cache_path: Path) -> Optional[Any]:
+        """Li yon ansyen fichye JSON ({'timestamp', 'value'})"""
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache_data = json.load(f)
+        
+        cached_time = datetime.fromisoformat(cache_data['timestamp'])
+        if datetime.now() - cached_time > self.ttl:
+            cache_path.unlink()
+            return None
+        
+        return cache_data['value']
+    
     def set(self, key: str, value: Any) -> bool:
         """
         Sove valè nan kachaj
         
         Args:
             key: Cache key
-            value: Valè pou sove
+            value: Valè pou sove (tèks, bytes odyo, oswa done JSON/msgpack)
             
         Returns:
             True si siksè, False si echèk
@@ -82,13 +118,13 @@ class SimpleCache:
         try:
             cache_path = self._get_cache_path(key)
             
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'value': value
-            }
+            # Ekri nan yon fichye tanporè epi ranplase (pa janm mwatye fichye)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(self.codec.encode(value))
+            os.replace(tmp_path, cache_path)
             
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            # Ansyen vèsyon JSON la pa itil ankò
+            self._get_legacy_path(key).unlink(missing_ok=True)
             
             return True
             
@@ -113,14 +149,17 @@ class SimpleCache:
             print(f"💾 Cache hit: {key[:16]}...")
             return cached_value
         
-        # Kalkile valè a
-        print(f"🔄 Cache miss, computing: {key[:16]}...")
-        value = compute_fn()
-        
-        # Sove nan kachaj
-        self.set(key, value)
+        def compute():
+            # Kalkile valè a
+            print(f"🔄 Cache miss, computing: {key[:16]}...")
+            value = compute_fn()
+            
+            # Sove nan kachaj
+            self.set(key, value)
+            return value
         
-        return value
+        # Lòt apèl pou menm kle a pandan kalkil la ap tann rezilta sa a
+        return self.flight.do(key, compute)
     
     def clear(self) -> int:
         """
@@ -130,7 +169,7 @@ class SimpleCache:
             Kantite fichye ki efase
         """
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
+        for cache_file in self._entries():
             try:
                 cache_file.unlink()
                 count += 1
@@ -148,13 +187,9 @@ class SimpleCache:
             Kantite fichye ki efase
         """
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
+        for cache_file in self._entries():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                
-                cached_time = datetime.fromisoformat(cache_data['timestamp'])
-                if datetime.now() - cached_time > self.ttl:
+                if self._is_expired(cache_file):
                     cache_file.unlink()
                     count += 1
                     
@@ -171,16 +206,13 @@ class SimpleCache:
         Returns:
             dict ak enfòmasyon sou kachaj la
         """
-        cache_files = list(self.cache_dir.glob("*.json"))
+        cache_files = self._entries()
         total_size = sum(f.stat().st_size for f in cache_files)
         
         expired_count = 0
         for cache_file in cache_files:
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                cached_time = datetime.fromisoformat(cache_data['timestamp'])
-                if datetime.now() - cached_time > self.ttl:
+                if self._is_expired(cache_file):
                     expired_count += 1
             except:
                 pass
@@ -191,7 +223,8 @@ class SimpleCache:
             "valid_entries": len(cache_files) - expired_count,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "cache_dir": str(self.cache_dir),
-            "ttl_hours": self.ttl.total_seconds() / 3600
+            "ttl_hours": self.ttl.total_seconds() / 3600,
+            "codec": self.codec.name
         }
 
 
@@ -204,7 +237,7 @@ audio_cache = SimpleCache(cache_dir="cache/audio", ttl_hours=72)  # 3 days
 
 def cached_translation(text: str, source_lang: str, target_lang: str, translate_fn) -> str:
     """
-    Helper pou tradwi ak kachaj
+    Helper pou tradwi ak kachaj (L1 memwa + Redis, gade app.cache_tiered)
     
     Args:
         text: Tèks pou tradwi
@@ -215,15 +248,8 @@ def cached_translation(text: str, source_lang: str, target_lang: str, translate_
     Returns:
         Tèks ki tradwi
     """
-    # Kreye cache key
-    cache_data = f"{source_lang}:{target_lang}:{text}"
-    cache_key = translation_cache._get_cache_key(cache_data)
-    
-    # Get or compute
-    return translation_cache.get_or_compute(
-        cache_key,
-        lambda: translate_fn(text, source_lang, target_lang)
-    )
+    from app.cache_tiered import cached_translation as tiered_cached_translation
+    return tiered_cached_translation(text, source_lang, target_lang, translate_fn)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗜️ Cache Codec
+Serializasyon binè + konpresyon pou valè kachaj yo (tèks ak odyo)
+
+Fòma: [vèsyon][flags][payload]
+  - vèsyon: CODEC_VERSION (valè JSON ansyen yo pa janm kòmanse ak bytes sa a)
+  - flags:  4 bit ba = serializer, 4 bit wo = konpresyon
+"""
+
+from typing import Any, Optional
+import base64
+import json
+import os
+import zlib
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+CODEC_VERSION = 0x01
+
+# Serializers
+RAW = 0       # bytes tèl kèl (MP3, PCM, ...)
+UTF8 = 1      # str
+JSON = 2      # lòt valè (bytes anndan yo an base64)
+MSGPACK = 3   # lòt valè (bytes natif)
+
+# Konpresyon
+NONE = 0
+ZLIB = 1
+ZSTD = 2
+
+CACHE_CODEC_SERIALIZER = os.getenv("CACHE_CODEC_SERIALIZER", "auto")  # auto, msgpack, json
+CACHE_CODEC_COMPRESSION = os.getenv("CACHE_CODEC_COMPRESSION", "auto")  # auto, zstd, zlib, none
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "1024"))
+# Kenbe vèsyon konprese a sèlman si li pi piti pase 90% orijinal la
+# (MP3 deja konprese: pa gen rezon pou peye dekonpresyon)
+CACHE_COMPRESS_MIN_SAVING = 0.9
+
+_COMPRESSION_NAMES = {"none": NONE, "zlib": ZLIB, "zstd": ZSTD}
+
+
+class CodecError(ValueError):
+    """Valè kachaj la pa ka dekode"""
+
+
+def _json_default(value):
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"__bytes__": base64.b64encode(bytes(value)).decode("ascii")}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_hook(obj):
+    if len(obj) == 1 and "__bytes__" in obj:
+        return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+class CacheCodec:
+    """
+    Kodek kachaj la
+
+    - bytes yo estoke tèl kèl (pa gen base64, pa gen JSON)
+    - str yo an UTF-8
+    - rès yo ak msgpack (si enstale) oswa JSON konpak
+    - payload ki pi gwo pase `compress_min_bytes` konprese ak zstd
+      (si enstale) oswa zlib
+    - decode() li tou valè JSON ansyen yo (san bytes vèsyon an)
+
+    Pickle pa itilize: yon valè nan yon Redis pataje pa dwe ka egzekite kòd.
+
+    Example:
+        codec = CacheCodec()
+        blob = codec.encode({"translated": "Bonjou"})
+        value = codec.decode(blob)
+    """
+
+    def __init__(
+        self,
+        serializer: str = CACHE_CODEC_SERIALIZER,
+        compression: str = CACHE_CODEC_COMPRESSION,
+        compress_min_bytes: int = CACHE_COMPRESS_MIN_BYTES,
+        zlib_level: int = 6,
+        zstd_level: int = 3
+    ):
+        """
+        Args:
+            serializer: "auto" (msgpack si disponib), "msgpack" oswa "json"
+            compression: "auto" (zstd si disponib, sinon zlib), "zstd", "zlib" oswa "none"
+            compress_min_bytes: Gwosè minimòm pou eseye konprese
+            zlib_level: Nivo zlib
+            zstd_level: Nivo zstd
+        """
+        if serializer == "auto":
+            serializer = "msgpack" if MSGPACK_AVAILABLE else "json"
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack pa enstale (pip install msgpack)")
+        if serializer not in ("msgpack", "json"):
+            raise ValueError(f"Serializer enkoni: {serializer}")
+
+        if compression == "auto":
+            compression = "zstd" if ZSTD_AVAILABLE else "zlib"
+        if compression not in _COMPRESSION_NAMES:
+            raise ValueError(f"Konpresyon enkoni: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstandard pa enstale (pip install zstandard)")
+
+        self.serializer = MSGPACK if serializer == "msgpack" else JSON
+        self.compression = _COMPRESSION_NAMES[compression]
+        self.compress_min_bytes = compress_min_bytes
+        self.zlib_level = zlib_level
+        self.zstd_level = zstd_level
+
+    @property
+    def name(self) -> str:
+        serializer = "msgpack" if self.serializer == MSGPACK else "json"
+        compression = {NONE: "none", ZLIB: "zlib", ZSTD: "zstd"}[self.compression]
+        return f"v{CODEC_VERSION}-{serializer}-{compression}"
+
+    # ------------------------------------------------------------
+    # Encode
+    # ------------------------------------------------------------
+
+    def _serialize(self, value: Any) -> tuple:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return RAW, bytes(value)
+        if isinstance(value, str):
+            return UTF8, value.encode("utf-8")
+        if self.serializer == MSGPACK:
+            return MSGPACK, msgpack.packb(value, use_bin_type=True)
+        data = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+        return JSON, data.encode("utf-8")
+
+    def _compress(self, payload: bytes) -> tuple:
+        if self.compression == NONE or len(payload) < self.compress_min_bytes:
+            return NONE, payload
+        if self.compression == ZSTD:
+            packed = zstandard.ZstdCompressor(level=self.zstd_level).compress(payload)
+        else:
+            packed = zlib.compress(payload, self.zlib_level)
+        if len(packed) >= len(payload) * CACHE_COMPRESS_MIN_SAVING:
+            return NONE, payload
+        return self.compression, packed
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Enkode yon valè
+
+        Args:
+            value: bytes, str, oswa valè msgpack/JSON
+
+        Returns:
+            bytes pou estoke
+        """
+        serializer, payload = self._serialize(value)
+        compression, payload = self._compress(payload)
+        return bytes((CODEC_VERSION, serializer | (compression << 4))) + payload
+
+    # ------------------------------------------------------------
+    # Decode
+    # ------------------------------------------------------------
+
+    def decode(self, data: Any) -> Any:
+        """
+        Dekode yon valè (fòma vèsyone oswa JSON ansyen)
+
+        Args:
+            data: bytes (oswa str pou JSON ansyen)
+
+        Returns:
+            Valè orijinal la
+        """
+        if data is None:
+            return None
+        if isinstance(data, str):
+            return json.loads(data)
+        data = bytes(data)
+        if not is_encoded(data):
+            # Valè ansyen: JSON tèks
+            return json.loads(data)
+
+        flags = data[1]
+        serializer, compression = flags & 0x0F, flags >> 4
+        payload = data[2:]
+
+        if compression == ZLIB:
+            payload = zlib.decompress(payload)
+        elif compression == ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise CodecError("Valè a konprese ak zstd men zstandard pa enstale")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        elif compression != NONE:
+            raise CodecError(f"Konpresyon enkoni: {compression}")
+
+        if serializer == RAW:
+            return payload
+        if serializer == UTF8:
+            return payload.decode("utf-8")
+        if serializer == JSON:
+            return json.loads(payload, object_hook=_json_hook)
+        if serializer == MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise CodecError("Valè a an msgpack men msgpack pa enstale")
+            return msgpack.unpackb(payload, raw=False)
+        raise CodecError(f"Serializer enkoni: {serializer}")
+
+
+def is_encoded(data: Optional[bytes]) -> bool:
+    """True si done yo nan fòma vèsyone a (pa JSON ansyen)"""
+    return bool(data) and len(data) >= 2 and data[0] == CODEC_VERSION
+
+
+# Kodek default la (konfigire ak varyab anviwònman yo)
+default_codec = CacheCodec()
+
+
+def encode(value: Any) -> bytes:
+    """Enkode ak kodek default la"""
+    return default_codec.encode(value)
+
+
+def decode(data: Any) -> Any:
+    """Dekode ak kodek default la"""
+    return default_codec.decode(data)
@@ -6,12 +6,20 @@ Sistèm kachaj distribiye ak Redis (100x pi rapid ke file cache!)
 """
 
 import redis
-import json
 import os
 import hashlib
 from typing import Optional, Any, Callable
 from datetime import timedelta
 
+from app.cache_codec import default_codec
+from app.cache_tiered import LRUTTLCache, RedisHealth, REDIS_RECONNECT_INTERVAL, _CONNECTION_ERRORS
+from app.singleflight import SingleFlight
+from src.redis_maintenance import sample_keyspace, scan_delete
+
+# Kachaj memwa pandan Redis tonbe: limite an antre ak bytes, ak TTL
+REDIS_FALLBACK_MAX_ENTRIES = int(os.getenv("REDIS_FALLBACK_MAX_ENTRIES", "10000"))
+REDIS_FALLBACK_MAX_BYTES = int(os.getenv("REDIS_FALLBACK_MAX_BYTES", str(64 * 1024 * 1024)))
+
 class RedisCache:
     """
     Sistèm kachaj distribiye ak Redis
@@ -22,6 +30,11 @@ class RedisCache:
     - Auto-expiration
     - Atomic operations
     - Memory efficient
+    
+    Si Redis tonbe, kachaj la pase sou yon magazen memwa limite (LRU +
+    TTL) epi li eseye rekonekte chak REDIS_RECONNECT_INTERVAL segonn
+    (menm app.cache_tiered.RedisHealth ak kachaj pataje yo); lè Redis
+    reponn ankò, li retounen sou Redis otomatikman.
     """
     
     def __init__(
@@ -30,7 +43,8 @@ class RedisCache:
         port: int = None,
         db: int = 0,
         ttl_hours: int = 24,
-        prefix: str = ""
+        prefix: str = "",
+        client: Any = None
     ):
         """
         Inisyalize Redis cache
@@ -41,38 +55,85 @@ class RedisCache:
             db: Redis database number
             ttl_hours: Time-to-live an è
             prefix: Prefix pou tout keys
+            client: Kliyan Redis ki deja kreye (default: konekte ak host/port)
         """
+        self.ttl = timedelta(hours=ttl_hours)
+        self.prefix = prefix
+        
+        # Fallback store: bounded in entries and bytes, TTL enforced, LRU eviction
+        self._memory_cache = LRUTTLCache(
+            max_entries=REDIS_FALLBACK_MAX_ENTRIES,
+            default_ttl=self.ttl.total_seconds(),
+            max_bytes=REDIS_FALLBACK_MAX_BYTES
+        )
         # Get from environment or use defaults
         host = host or os.getenv("REDIS_HOST", "localhost")
         port = port or int(os.getenv("REDIS_PORT", "6379"))
         password = os.getenv("REDIS_PASSWORD", None)
         
-        # Try to connect to Redis
-        try:
-            self.redis = redis.Redis(
+        if client is None:
+            client = redis.Redis(
                 host=host,
                 port=port,
                 db=db,
                 password=password,
-                decode_responses=True,
+                decode_responses=False,  # valè yo se bytes kodek (app.cache_codec)
                 socket_connect_timeout=5,
                 socket_timeout=5
             )
-            
-            # Test connection
+        self.redis = client
+        self.health = RedisHealth.for_client(client, reconnect_interval=REDIS_RECONNECT_INTERVAL)
+        self.health.on_recover(self._memory_cache.clear)
+        
+        # Test connection
+        try:
             self.redis.ping()
-            self.available = True
             print(f"✅ Redis Cache initialized: {host}:{port} DB{db} (TTL: {ttl_hours}h)")
-            
-        except (redis.ConnectionError, redis.TimeoutError) as e:
+        except _CONNECTION_ERRORS as e:
             print(f"⚠️  Redis not available: {e}")
             print(f"   Falling back to memory cache...")
-            self.redis = None
-            self.available = False
-            self._memory_cache = {}  # Fallback to in-memory dict
+            self.health.mark_down(e)
         
-        self.ttl = timedelta(hours=ttl_hours)
-        self.prefix = prefix
+        # Single-flight: lock Redis kout pou evite stampede ant nœud yo
+        self.flight = SingleFlight(
+            prefix or "default",
+            redis_client=lambda: self.redis if self.available else None
+        )
+    
+    # ------------------------------------------------------------
+    # Fallback / health
+    # ------------------------------------------------------------
+    
+    @property
+    def available(self) -> bool:
+        return self.health.available
+    
+    def _check_health(self) -> bool:
+        """
+        True si Redis disponib. Pandan yon pann, eseye yon PING
+        (pa plis pase yon fwa chak REDIS_RECONNECT_INTERVAL segonn).
+        """
+        if not self.health.available:
+            self._memory_cache.purge_expired()
+        return self.health.client() is not None
+    
+    def _on_error(self, action: str, error: Exception) -> None:
+        print(f"⚠️  Redis {action} error: {error}")
+        if isinstance(error, _CONNECTION_ERRORS):
+            print("   Falling back to memory cache...")
+            self.health.mark_down(error)
+    
+    def _fallback_metrics(self) -> dict:
+        return {
+            **self.health.get_stats(),
+            "entries": len(self._memory_cache),
+            "bytes": self._memory_cache.bytes,
+            "max_entries": self._memory_cache.max_entries,
+            "max_bytes": self._memory_cache.max_bytes,
+            "evictions": self._memory_cache.stats["evictions"],
+            "expirations": self._memory_cache.stats["expirations"],
+            "rejected": self._memory_cache.stats["rejected"],
+        }
     
     def _get_key(self, key: str) -> str:
         """Generate full key with prefix"""
@@ -92,7 +153,7 @@ class RedisCache:
         Returns:
             Cached value or None if not found/expired
         """
-        if not self.available:
+        if not self._check_health():
             # Fallback to memory cache
             return self._memory_cache.get(self._get_key(key))
         
@@ -103,11 +164,11 @@ class RedisCache:
             if value is None:
                 return None
             
-            # Deserialize JSON
-            return json.loads(value)
+            # Decode (codec format, or legacy JSON)
+            return default_codec.decode(value)
             
         except Exception as e:
-            print(f"⚠️  Redis GET error: {e}")
+            self._on_error("GET", e)
             return None
     
     def set(
@@ -127,17 +188,16 @@ class RedisCache:
         Returns:
             True if successful, False otherwise
         """
-        if not self.available:
-            # Fallback to memory cache
-            self._memory_cache[self._get_key(key)] = value
-            return True
+        if not self._check_health():
+            # Fallback to memory cache (bounded, same TTL)
+            return self._memory_cache.set(self._get_key(key), value, ttl)
         
         try:
             full_key = self._get_key(key)
             ttl_seconds = ttl or int(self.ttl.total_seconds())
             
-            # Serialize to JSON
-            serialized = json.dumps(value, ensure_ascii=False)
+            # Serialize (binary codec, compressed above a size threshold)
+            serialized = default_codec.encode(value)
             
             # Set with expiration
             return self.redis.setex(
@@ -147,7 +207,9 @@ class RedisCache:
             )
             
         except Exception as e:
-            print(f"⚠️  Redis SET error: {e}")
+            self._on_error("SET", e)
+            if not self.available:
+                return self._memory_cache.set(self._get_key(key), value, ttl)
             return False
     
     def get_or_compute(
@@ -172,13 +234,20 @@ class RedisCache:
         if cached is not None:
             return cached
         
-        # Compute value
-        value = compute_fn()
-        
-        # Cache it
-        self.set(key, value, ttl)
+        def compute():
+            # Compute value
+            value = compute_fn()
+            
+            # Cache it
+            self.set(key, value, ttl)
+            return value
         
-        return value
+        # Concurrent callers for the same key wait for the first one
+        return self.flight.do(
+            key,
+            compute,
+            cache_get=lambda: self.get(key) if self.available else None
+        )
     
     def delete(self, key: str) -> bool:
         """
@@ -190,72 +259,62 @@ class RedisCache:
         Returns:
             True if deleted, False otherwise
         """
-        if not self.available:
-            self._memory_cache.pop(self._get_key(key), None)
+        if not self._check_health():
+            self._memory_cache.delete(self._get_key(key))
             return True
         
         try:
             full_key = self._get_key(key)
             return bool(self.redis.delete(full_key))
         except Exception as e:
-            print(f"⚠️  Redis DELETE error: {e}")
+            self._on_error("DELETE", e)
             return False
     
-    def clear_pattern(self, pattern: str) -> int:
+    def clear_pattern(self, pattern: str, progress: Callable = None) -> int:
         """
         Clear all keys matching a pattern
         
         Args:
             pattern: Pattern to match (e.g., "user:*")
+            progress: Called as progress(deleted, scanned) after each batch
         
         Returns:
             Number of keys deleted
         """
-        if not self.available:
-            # Clear from memory cache
-            keys_to_delete = [
-                k for k in self._memory_cache.keys()
-                if pattern.replace('*', '') in k
-            ]
-            for k in keys_to_delete:
-                del self._memory_cache[k]
-            return len(keys_to_delete)
+        if not self._check_health():
+            # Clear from memory cache (everything before the first wildcard)
+            return self._memory_cache.delete_prefix(self._get_key(pattern).split('*', 1)[0])
         
         try:
             full_pattern = self._get_key(pattern)
-            keys = list(self.redis.scan_iter(match=full_pattern))
-            
-            if keys:
-                return self.redis.delete(*keys)
-            return 0
+            # SCAN + UNLINK pa lo (pa janm tout kle yo an memwa)
+            return scan_delete(self.redis, full_pattern, progress=progress)
             
         except Exception as e:
-            print(f"⚠️  Redis CLEAR error: {e}")
+            self._on_error("CLEAR", e)
             return 0
     
-    def clear(self) -> int:
+    def clear(self, progress: Callable = None) -> int:
         """
         Clear all keys with this cache's prefix
         
+        Args:
+            progress: Called as progress(deleted, scanned) after each batch
+        
         Returns:
             Number of keys deleted
         """
         if self.prefix:
-            return self.clear_pattern(f"{self.prefix}:*")
+            return self.clear_pattern("*", progress=progress)
         else:
             # Be careful - this clears entire DB!
-            if not self.available:
-                count = len(self._memory_cache)
-                self._memory_cache.clear()
-                return count
+            if not self._check_health():
+                return self._memory_cache.clear()
             
             try:
-                keys = list(self.redis.scan_iter())
-                if keys:
-                    return self.redis.delete(*keys)
-                return 0
+                return scan_delete(self.redis, "*", progress=progress)
             except Exception as e:
-                print(f"⚠️  Redis CLEAR ALL error: {e}")
+                self._on_error("CLEAR ALL", e)
                 return 0
     
     def get_stats(self) -> dict:
@@ -265,12 +324,13 @@ class RedisCache:
         Returns:
             Dictionary with cache stats
         """
-        if not self.available:
+        if not self._check_health():
             return {
                 "available": False,
                 "fallback": "memory",
                 "keys": len(self._memory_cache),
-                "ttl_hours": self.ttl.total_seconds() / 3600
+                "ttl_hours": self.ttl.total_seconds() / 3600,
+                "fallback_stats": self._fallback_metrics()
             }
         
         try:
@@ -293,16 +353,36 @@ class RedisCache:
                 "misses": misses,
                 "hit_rate": f"{hit_rate:.1f}%",
                 "memory_used": memory_info.get('used_memory_human', 'N/A'),
-                "ttl_hours": self.ttl.total_seconds() / 3600
+                "ttl_hours": self.ttl.total_seconds() / 3600,
+                "fallback_stats": self._fallback_metrics()
             }
             
         except Exception as e:
-            print(f"⚠️  Redis STATS error: {e}")
+            self._on_error("STATS", e)
             return {
                 "available": False,
                 "error": str(e)
             }
     
+    def keyspace_stats(self, sample_size: int = 500) -> dict:
+        """
+        Kantite kle ak memwa pa espas non, estime pa echantiyon (pa gen SCAN total)
+
+        Args:
+            sample_size: Kantite kle pou echantiyone
+
+        Returns:
+            Dictionary with per-namespace estimates
+        """
+        if not self._check_health():
+            return {"available": False}
+
+        try:
+            return {"available": True, **sample_keyspace(self.redis, sample_size=sample_size)}
+        except Exception as e:
+            self._on_error("KEYSPACE", e)
+            return {"available": False, "error": str(e)}
+
     def ping(self) -> bool:
         """
         Test if Redis is available
@@ -310,12 +390,13 @@ class RedisCache:
         Returns:
             True if Redis responds, False otherwise
         """
-        if not self.available:
+        if not self._check_health():
             return False
         
         try:
             return self.redis.ping()
-        except:
+        except Exception as e:
+            self._on_error("PING", e)
             return False
 
 
@@ -323,60 +404,15 @@ class RedisCache:
 # GLOBAL CACHE INSTANCES
 # ============================================================
 
-# Translation cache (1 week TTL)
-translation_cache = RedisCache(
-    db=0,
-    ttl_hours=168,  # 7 days
-    prefix="trans"
+# Kachaj pataje yo se TieredCache: L1 memwa (limite) devan Redis, menm
+# entèfas ak RedisCache (get/set/get_or_compute/delete/clear/get_stats)
+from app.cache_tiered import (  # noqa: E402
+    translation_cache,
+    audio_cache,
+    session_cache,
+    cached_translation,
 )
 
-# Audio cache (3 days TTL)
-audio_cache = RedisCache(
-    db=1,
-    ttl_hours=72,  # 3 days
-    prefix="audio"
-)
-
-# Session cache (1 day TTL)
-session_cache = RedisCache(
-    db=2,
-    ttl_hours=24,  # 1 day
-    prefix="session"
-)
-
-
-# ============================================================
-# HELPER FUNCTIONS
-# ============================================================
-
-def cached_translation(
-    text: str,
-    source_lang: str,
-    target_lang: str,
-    translate_fn: Callable
-) -> str:
-    """
-    Helper function for cached translation
-    
-    Args:
-        text: Text to translate
-        source_lang: Source language
-        target_lang: Target language
-        translate_fn: Translation function
-    
-    Returns:
-        Translated text
-    """
-    # Create cache key
-    cache_data = f"{source_lang}:{target_lang}:{text}"
-    cache_key = translation_cache._get_cache_key(cache_data)
-    
-    # Get or compute
-    return translation_cache.get_or_compute(
-        cache_key,
-        lambda: translate_fn(text, source_lang, target_lang)
-    )
-
 
 if __name__ == "__main__":
     print("🧪 Testing Redis Cache...")
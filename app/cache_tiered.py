@@ -0,0 +1,943 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧊 Tiered Cache
+Kachaj an de nivo: L1 LRU/TTL nan memwa pwosesis la devan L2 Redis
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+import hashlib
+import os
+import threading
+import time
+import weakref
+
+from app.cache_codec import CacheCodec, default_codec
+from app.singleflight import SingleFlight
+from src.cache_admission import TinyLFU, analytics_report, get_analytics
+from src.cache_keys import translation_key
+from src.redis_maintenance import sample_keyspace, scan_delete
+
+REDIS_URL = os.getenv("REDIS_URL", None)
+# L1: kantite antre maks pa espas non, ak TTL kout pou limite done ki pa ajou
+# lè yon lòt enstans chanje L2
+CACHE_L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", "2048"))
+CACHE_L1_TTL_SECONDS = int(os.getenv("CACHE_L1_TTL_SECONDS", "300"))
+# L1 se tou magazen fallback la pandan Redis tonbe: limite an bytes tou
+CACHE_L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", str(64 * 1024 * 1024)))
+# Entèval (segonn) ant tantativ rekoneksyon pandan Redis tonbe
+REDIS_RECONNECT_INTERVAL = float(os.getenv("REDIS_RECONNECT_INTERVAL", "5"))
+# Admisyon TinyLFU pou kachaj trans/audio yo: lè L1 plen, yon antre nouvo
+# antre sèlman si yo mande l pi souvan pase sa li ta mete deyò
+CACHE_ADMISSION = os.getenv("CACHE_ADMISSION", "true").lower() in ("1", "true", "yes")
+# Admisyon L2: ak CACHE_ADMISSION, yon valè ale nan Redis sèlman si L2 te
+# rate kle a omwen fwa sa yo, tout worker yo konte ansanm (kontè Redis ak
+# TTL): yon moso liv yo wè yon sèl fwa rete nan L1
+CACHE_L2_MIN_FREQUENCY = int(os.getenv("CACHE_L2_MIN_FREQUENCY", "2"))
+CACHE_L2_FREQUENCY_TTL = int(os.getenv("CACHE_L2_FREQUENCY_TTL", str(7 * 24 * 3600)))
+# Kontè dènye miss yo, pou set() pa bezwen reli yo nan Redis
+_L2_MISS_MEMO = 4096
+
+
+def _value_size(value: Any) -> int:
+    """Gwosè apwoksimatif yon valè (bytes yo tèl kèl, rès yo kòm kodek la ta estoke yo)"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return len(default_codec.encode(value))
+
+
+class LRUTTLCache:
+    """
+    Kachaj memwa LRU ak TTL (thread-safe)
+
+    Chak antre gen yon dat ekspirasyon; lè kachaj la plen (antre oswa
+    bytes), sa ki pa t itilize depi pi lontan an soti an premye.
+
+    Ak yon politik admisyon (TinyLFU), yon kle nouvo ki ta mete yon lòt
+    deyò antre sèlman si frekans li pi wo pase pa viktim nan: moso yon
+    liv yo wè yon sèl fwa pa pouse fraz tout moun mande yo deyò.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_L1_MAX_ENTRIES,
+        default_ttl: Optional[float] = CACHE_L1_TTL_SECONDS,
+        max_bytes: Optional[int] = None,
+        sizer: Optional[Callable[[Any], int]] = None,
+        admission: Optional[TinyLFU] = None
+    ):
+        """
+        Args:
+            max_entries: Kantite antre maks
+            default_ttl: TTL an segonn (None = pa ekspire)
+            max_bytes: Gwosè total maks (None = pa limite)
+            sizer: Kalkile gwosè yon valè (default: gwosè kodek la)
+            admission: Politik admisyon lè kachaj la plen (None = admèt tout)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries dwe omwen 1")
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.sizer = sizer or _value_size
+        self.admission = admission
+        self.bytes = 0
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0,
+                      "rejected": 0, "not_admitted": 0}
+
+    def _pop(self, key: str) -> None:
+        _, _, size = self._data.pop(key)
+        self.bytes -= size
+
+    def get(self, key: str) -> Optional[Any]:
+        """Valè a oswa None (si li pa la oswa li ekspire)"""
+        if self.admission is not None:
+            self.admission.record(key)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._pop(key)
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        Mete yon valè (ttl an segonn, default: default_ttl)
+
+        Returns:
+            False si valè a pi gwo pase max_bytes pou kont li, oswa si
+            politik admisyon an refize l
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        size = self.sizer(value) if self.max_bytes is not None else 0
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                self.stats["rejected"] += 1
+                return False
+            if not self._admit(key, size):
+                self.stats["not_admitted"] += 1
+                return False
+            self._data[key] = (value, expires_at, size)
+            self.bytes += size
+            while len(self._data) > self.max_entries or (
+                self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._data.popitem(last=False)
+                self.bytes -= evicted_size
+                self.stats["evictions"] += 1
+            return True
+
+    def _admit(self, key: str, size: int) -> bool:
+        """Konpare kle a ak premye viktim LRU a si li ta fè youn soti"""
+        if self.admission is None or not self._data:
+            return True
+        full = len(self._data) >= self.max_entries or (
+            self.max_bytes is not None and self.bytes + size > self.max_bytes
+        )
+        if not full:
+            return True
+        return self.admission.admit(key, next(iter(self._data)))
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._pop(key)
+            return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Efase tout kle ki kòmanse ak prefix la"""
+        with self._lock:
+            keys = [k for k in self._data if k.startswith(prefix)]
+            for k in keys:
+                self._pop(k)
+            return len(keys)
+
+    def purge_expired(self) -> int:
+        """Retire antre ki ekspire yo menm si pèsonn pa li yo"""
+        now = time.monotonic()
+        with self._lock:
+            keys = [k for k, (_, expires_at, _) in self._data.items()
+                    if expires_at is not None and expires_at <= now]
+            for k in keys:
+                self._pop(k)
+            self.stats["expirations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            self.bytes = 0
+            return count
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+# ============================================================
+# REDIS CLIENT (L2)
+# ============================================================
+
+_SHARED = object()
+
+# Erè ki vle di Redis pa reponn (pa yon move valè)
+try:
+    import redis as _redis_module
+    _CONNECTION_ERRORS = (_redis_module.ConnectionError, _redis_module.TimeoutError,
+                          ConnectionError, TimeoutError)
+except ImportError:
+    _CONNECTION_ERRORS = (ConnectionError, TimeoutError)
+
+
+def _connect_redis():
+    """
+    Konekte ak Redis (REDIS_URL oswa REDIS_HOST/REDIS_PORT)
+
+    Returns:
+        Kliyan an (PING deja pase), oswa None si redis pa enstale
+
+    Raises:
+        Erè koneksyon an si Redis pa reponn
+    """
+    try:
+        import redis
+    except ImportError:
+        print("⚠️  redis pa enstale - kachaj L1 sèlman")
+        return None
+    if REDIS_URL:
+        client = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=2, socket_timeout=2)
+    else:
+        client = redis.Redis(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            password=os.getenv("REDIS_PASSWORD", None),
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+    client.ping()
+    return client
+
+
+class RedisHealth:
+    """
+    Eta koneksyon yon kliyan Redis (thread-safe)
+
+    - client(): kliyan an si Redis disponib, None pandan yon pann
+    - mark_down(): yon erè koneksyon → pa eseye Redis ankò jiskaske
+      reconnect_interval segonn pase (pa gen timeout 2s sou chak apèl)
+    - pandan pann lan, yon sèl PING/koneksyon chak reconnect_interval;
+      lè l reponn, callback on_recover yo rele (ex: vide L1 ki pa ajou)
+    """
+
+    def __init__(
+        self,
+        connect: Optional[Callable[[], Any]],
+        client: Any = None,
+        reconnect_interval: float = REDIS_RECONNECT_INTERVAL
+    ):
+        """
+        Args:
+            connect: Kreye yon kliyan (PING pase) oswa leve yon erè; None = pa janm konekte
+            client: Kliyan ki deja konekte (disponib tousuit)
+            reconnect_interval: Segonn ant de tantativ pandan yon pann
+        """
+        self._connect = connect
+        self._client = client
+        self.available = client is not None
+        self.reconnect_interval = reconnect_interval
+        self._last_attempt: Optional[float] = None
+        self._down_since: Optional[float] = None
+        self._listeners: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self.stats = {
+            "activations": 0,
+            "recoveries": 0,
+            "reconnect_attempts": 0,
+            "fallback_seconds": 0.0,
+        }
+
+    @classmethod
+    def for_client(cls, client: Any, **kwargs) -> "RedisHealth":
+        """Eta pou yon kliyan ki deja kreye (rekoneksyon = PING sou li)"""
+        def ping():
+            client.ping()
+            return client
+        return cls(ping, client=client, **kwargs)
+
+    def on_recover(self, callback: Callable[[], None]) -> None:
+        self._listeners.append(callback)
+
+    def client(self) -> Any:
+        """Kliyan an, oswa None si Redis pa disponib (eseye rekonekte si entèval la pase)"""
+        if self.available:
+            return self._client
+        if self._connect is None:
+            return None
+        with self._lock:
+            if self.available:
+                return self._client
+            now = time.monotonic()
+            if self._last_attempt is not None and now - self._last_attempt < self.reconnect_interval:
+                return None
+            first = self._last_attempt is None
+            self._last_attempt = now
+            if not first:
+                self.stats["reconnect_attempts"] += 1
+            try:
+                client = self._connect()
+            except Exception as e:
+                if first:
+                    print(f"⚠️  Redis not available ({e}) - kachaj L1 sèlman, "
+                          f"nou ap eseye ankò chak {self.reconnect_interval:g}s")
+                self._enter_down(now)
+                return None
+            if client is None:
+                # redis pa enstale: pa gen anyen pou eseye ankò
+                self._connect = None
+                return None
+            self._client = client
+            self.available = True
+            recovered = self._down_since is not None
+            if recovered:
+                self.stats["fallback_seconds"] += now - self._down_since
+                self.stats["recoveries"] += 1
+                self._down_since = None
+        if recovered:
+            print("✅ Redis reconnected - L2 disponib ankò")
+            for callback in list(self._listeners):
+                callback()
+        elif first:
+            print("✅ Tiered cache: Redis L2 konekte")
+        return client
+
+    def _enter_down(self, now: float) -> None:
+        self.available = False
+        if self._down_since is None:
+            self._down_since = now
+            self.stats["activations"] += 1
+
+    def mark_down(self, error: Exception = None) -> None:
+        """Redis pa reponn: pase sou L1 sèlman jiska pwochen tantativ la"""
+        with self._lock:
+            if not self.available:
+                return
+            now = time.monotonic()
+            self._last_attempt = now
+            self._enter_down(now)
+        print(f"⚠️  Redis down ({error}) - kachaj L1 sèlman, "
+              f"nou ap eseye ankò chak {self.reconnect_interval:g}s")
+
+    def reset(self, client: Any) -> None:
+        """Ranplase kliyan an (None = pa gen L2, pa janm eseye konekte)"""
+        with self._lock:
+            self._client = client
+            self.available = client is not None
+            self._connect = RedisHealth.for_client(client)._connect if client is not None else None
+            self._last_attempt = None
+            self._down_since = None
+
+    def get_stats(self) -> dict:
+        seconds = self.stats["fallback_seconds"]
+        if self._down_since is not None:
+            seconds += time.monotonic() - self._down_since
+        return {
+            "active": not self.available,
+            **self.stats,
+            "fallback_seconds": round(seconds, 3),
+            "reconnect_interval": self.reconnect_interval,
+        }
+
+
+def _weak_callback(method: Callable) -> Callable[[], None]:
+    """Callback ki pa kenbe objè a vivan (kachaj tès yo ka disparèt)"""
+    ref = weakref.WeakMethod(method)
+
+    def callback():
+        bound = ref()
+        if bound is not None:
+            bound()
+    return callback
+
+
+# Koneksyon pataje a: konekte premye fwa yon kachaj bezwen l, epi
+# rekonekte otomatikman apre yon pann
+_shared_health = RedisHealth(_connect_redis)
+
+
+def get_redis_client():
+    """Kliyan Redis pataje a, oswa None pandan yon pann (rekonekte poukont li)"""
+    return _shared_health.client()
+
+
+def set_redis_client(client) -> None:
+    """Ranplase kliyan L2 a (tès, oswa yon koneksyon ki deja ouvè)"""
+    _shared_health.reset(client)
+
+
+# ============================================================
+# TIERED CACHE
+# ============================================================
+
+def make_key(*parts: Any) -> str:
+    """Kle kachaj ki soti nan plizyè pati (MD5, menm jan ak ansyen kachaj yo)"""
+    data = ":".join(str(p) for p in parts)
+    return hashlib.md5(data.encode('utf-8')).hexdigest()
+
+
+class TieredCache:
+    """
+    Kachaj inifye: L1 memwa devan L2 Redis
+
+    - get: L1 → L2 (epi mete L1 ajou) → None
+    - set: write-through (L2 epi L1)
+    - delete/clear: envalide toude nivo yo
+
+    Si Redis tonbe, L1 (limite an antre ak bytes) vin magazen fallback la:
+    pa gen apèl Redis ankò (ni timeout) jiskaske yon tantativ rekoneksyon
+    reyisi (chak REDIS_RECONNECT_INTERVAL segonn); lè sa a L1 vide paske
+    lòt nœud yo te ka chanje L2 pandan pann lan.
+    Entèfas la menm ak app.cache_redis.RedisCache pou ranplase l dirèkteman.
+
+    Example:
+        cache = get_cache("trans", ttl_hours=168)
+        key = translation_key(text, src, tgt)
+        translated = cache.get_or_compute(key, lambda: translate(text))
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_hours: float = 24,
+        l1: Optional[LRUTTLCache] = None,
+        l1_ttl: Optional[float] = None,
+        redis_client: Any = _SHARED,
+        codec: Optional[CacheCodec] = None,
+        admission: bool = False
+    ):
+        """
+        Args:
+            namespace: Prefiks kle yo nan Redis ("trans", "audio", ...)
+            ttl_hours: TTL L2 an è
+            l1: Kachaj L1 (default: yon LRUTTLCache nouvo)
+            l1_ttl: TTL L1 an segonn (default: CACHE_L1_TTL_SECONDS, pa plis pase TTL L2)
+            redis_client: Kliyan Redis (default: kliyan pataje a, None = L1 sèlman)
+            codec: Kodek pou valè L2 yo (default: app.cache_codec.default_codec)
+            admission: Mete yon politik TinyLFU devan L1 la (si l1 pa bay),
+                epi ekri nan L2 sèlman kle L2 te deja rate
+                (CACHE_L2_MIN_FREQUENCY, kontè pataje nan Redis)
+        """
+        self.namespace = namespace
+        self.prefix = namespace
+        self.ttl_seconds = int(ttl_hours * 3600)
+        if l1_ttl is None:
+            l1_ttl = min(CACHE_L1_TTL_SECONDS, self.ttl_seconds)
+        if l1 is None:
+            l1 = LRUTTLCache(default_ttl=l1_ttl, max_bytes=CACHE_L1_MAX_BYTES,
+                             admission=TinyLFU() if admission else None)
+        self.l1 = l1
+        self.admission = admission
+        self._l2_misses: "OrderedDict[str, int]" = OrderedDict()
+        self._l2_misses_lock = threading.Lock()
+        # Hit ratio pa fenèt tan, byte hit ratio ak kle ki pi cho yo
+        self.analytics = get_analytics(namespace)
+        if redis_client is _SHARED:
+            self.health = _shared_health
+        elif redis_client is not None:
+            self.health = RedisHealth.for_client(redis_client)
+        else:
+            self.health = None
+        if self.health is not None:
+            self.health.on_recover(_weak_callback(self._on_redis_recovered))
+        self.codec = codec or default_codec
+        # Demann idantik konkiran pou menm kle a kalkile yon sèl fwa
+        self.flight = SingleFlight(namespace, redis_client=lambda: self.redis)
+        self.stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "deletes": 0,
+            "errors": 0,
+            "l2_not_admitted": 0,
+        }
+
+    @property
+    def redis(self):
+        """Kliyan L2 a, oswa None (pa gen L2 oswa Redis tonbe)"""
+        return self.health.client() if self.health is not None else None
+
+    def _on_error(self, action: str, error: Exception) -> None:
+        self.stats["errors"] += 1
+        print(f"⚠️  Redis {action} error: {error}")
+        if self.health is not None and isinstance(error, _CONNECTION_ERRORS):
+            self.health.mark_down(error)
+
+    def _on_redis_recovered(self) -> None:
+        # Valè L1 yo ka pa ajou: lòt nœud yo te ka ekri nan L2 pandan pann lan
+        self.l1.clear()
+
+    def _l1_ttl(self, ttl_seconds: int, l2_ok: bool) -> float:
+        """TTL kout devan L2; TTL konplè lè L1 se sèl magazen an (fallback)"""
+        if not l2_ok:
+            return ttl_seconds
+        return min(self.l1.default_ttl or ttl_seconds, ttl_seconds)
+
+    def _freq_key(self, key: str) -> str:
+        return f"{self.namespace}:freq:{key}"
+
+    def _count_l2_misses(self, client, keys: List[str]) -> None:
+        """INCR kontè miss pataje yo (yon pipeline) epi kenbe valè yo pou set()"""
+        if not self.admission or not keys:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key in keys:
+                pipe.incr(self._freq_key(key))
+                pipe.expire(self._freq_key(key), CACHE_L2_FREQUENCY_TTL)
+            counts = pipe.execute()[::2]
+        except Exception as e:
+            self._on_error("INCR", e)
+            return
+        with self._l2_misses_lock:
+            for key, count in zip(keys, counts):
+                self._l2_misses.pop(key, None)
+                self._l2_misses[key] = int(count)
+            while len(self._l2_misses) > _L2_MISS_MEMO:
+                self._l2_misses.popitem(last=False)
+
+    def _admit_l2(self, client, keys: List[str], force: bool = False) -> List[str]:
+        """
+        Kle ki ka ale nan Redis
+
+        Sèlman kle L2 te rate omwen CACHE_L2_MIN_FREQUENCY fwa, kèlkeswa
+        worker la (yon nœud k ap tann rezilta a nan single-flight te rate
+        tou, kidonk li konte).
+        """
+        if force or not self.admission:
+            return list(keys)
+        with self._l2_misses_lock:
+            counts = {key: self._l2_misses.pop(key) for key in keys if key in self._l2_misses}
+        unknown = [key for key in keys if key not in counts]
+        if unknown:
+            try:
+                raws = client.mget([self._freq_key(key) for key in unknown])
+                counts.update((key, int(raw or 0)) for key, raw in zip(unknown, raws))
+            except Exception as e:
+                self._on_error("MGET", e)
+        admitted = [key for key in keys if counts.get(key, 0) >= CACHE_L2_MIN_FREQUENCY]
+        self.stats["l2_not_admitted"] += len(keys) - len(admitted)
+        return admitted
+
+    @property
+    def available(self) -> bool:
+        """True si L2 (Redis) disponib"""
+        return self.redis is not None
+
+    def _full_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _get_cache_key(self, data: str) -> str:
+        return make_key(data)
+
+    def _encode(self, value: Any) -> bytes:
+        return self.codec.encode(value)
+
+    def _decode(self, raw: Any) -> Any:
+        # Li tou valè JSON ki te ekri anvan kodek la
+        return self.codec.decode(raw)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Jwenn yon valè
+
+        Args:
+            key: Kle a (san espas non)
+
+        Returns:
+            Valè a oswa None
+        """
+        full_key = self._full_key(key)
+        value = self.l1.get(full_key)
+        if value is not None:
+            self.stats["l1_hits"] += 1
+            self.analytics.record_hit(key, _value_size(value))
+            return value
+
+        client = self.redis
+        if client is not None:
+            try:
+                raw = client.get(full_key)
+                if raw is not None:
+                    value = self._decode(raw)
+                    self.l1.set(full_key, value)
+                    self.stats["l2_hits"] += 1
+                    self.analytics.record_hit(key, len(raw))
+                    return value
+                self._count_l2_misses(client, [key])
+            except Exception as e:
+                self._on_error("GET", e)
+
+        self.stats["misses"] += 1
+        self.analytics.record_miss(key)
+        return None
+
+    def set(self, key: str, value: Any, ttl: int = None, force: bool = False) -> bool:
+        """
+        Mete yon valè nan toude nivo yo (write-through)
+
+        Args:
+            key: Kle a
+            value: Valè (str, bytes, oswa valè msgpack/JSON)
+            ttl: TTL L2 an segonn (default: TTL espas non an)
+            force: Pase admisyon L2 a (valè pre-kalkile, ex: warmup)
+
+        Returns:
+            True si L2 sove l (oswa si pa gen L2, oswa admisyon refize l)
+        """
+        full_key = self._full_key(key)
+        ttl_seconds = ttl or self.ttl_seconds
+        self.stats["sets"] += 1
+        self.analytics.record_fill(_value_size(value))
+
+        ok = True
+        client = self.redis
+        if client is not None and self._admit_l2(client, [key], force):
+            try:
+                client.setex(full_key, ttl_seconds, self._encode(value))
+            except Exception as e:
+                self._on_error("SET", e)
+                ok = False
+        self.l1.set(full_key, value, self._l1_ttl(ttl_seconds, client is not None and ok))
+        return ok
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Jwenn plizyè valè: L1 dabò, epi yon sèl MGET pou sa ki manke
+
+        Args:
+            keys: Kle yo (san espas non)
+
+        Returns:
+            Valè yo nan menm lòd la (None pou sa ki pa la)
+        """
+        values: List[Optional[Any]] = [None] * len(keys)
+        missing = []
+        for i, key in enumerate(keys):
+            value = self.l1.get(self._full_key(key))
+            if value is not None:
+                values[i] = value
+                self.stats["l1_hits"] += 1
+                self.analytics.record_hit(key, _value_size(value))
+            else:
+                missing.append(i)
+
+        client = self.redis
+        if missing and client is not None:
+            try:
+                raws = client.mget([self._full_key(keys[i]) for i in missing])
+                still_missing = []
+                for i, raw in zip(missing, raws):
+                    if raw is None:
+                        still_missing.append(i)
+                        continue
+                    values[i] = self._decode(raw)
+                    self.l1.set(self._full_key(keys[i]), values[i])
+                    self.stats["l2_hits"] += 1
+                    self.analytics.record_hit(keys[i], len(raw))
+                missing = still_missing
+                self._count_l2_misses(client, [keys[i] for i in missing])
+            except Exception as e:
+                self._on_error("MGET", e)
+
+        self.stats["misses"] += len(missing)
+        for i in missing:
+            self.analytics.record_miss(keys[i])
+        return values
+
+    def set_many(self, items: Dict[str, Any], ttl: int = None, force: bool = False) -> bool:
+        """
+        Mete plizyè valè nan yon sèl pipeline (write-through)
+
+        Args:
+            items: Kle → valè
+            ttl: TTL L2 an segonn
+            force: Pase admisyon L2 a
+
+        Returns:
+            True si L2 sove yo (oswa si pa gen L2)
+        """
+        if not items:
+            return True
+        ttl_seconds = ttl or self.ttl_seconds
+        self.stats["sets"] += len(items)
+        self.analytics.record_fill(sum(_value_size(v) for v in items.values()))
+
+        ok = True
+        client = self.redis
+        admitted = self._admit_l2(client, list(items), force) if client is not None else []
+        if admitted:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for key in admitted:
+                    pipe.setex(self._full_key(key), ttl_seconds, self._encode(items[key]))
+                pipe.execute()
+            except Exception as e:
+                self._on_error("pipeline SET", e)
+                ok = False
+        l1_ttl = self._l1_ttl(ttl_seconds, client is not None and ok)
+        for key, value in items.items():
+            self.l1.set(self._full_key(key), value, l1_ttl)
+        return ok
+
+    def _peek(self, key: str) -> Optional[Any]:
+        """Li L1/L2 san konte nan estatistik yo (pou single-flight)"""
+        full_key = self._full_key(key)
+        value = self.l1.get(full_key)
+        client = self.redis
+        if value is None and client is not None:
+            try:
+                raw = client.get(full_key)
+                value = self._decode(raw) if raw is not None else None
+            except Exception as e:
+                if isinstance(e, _CONNECTION_ERRORS):
+                    self.health.mark_down(e)
+                return None
+        return value
+
+    def get_or_compute(self, key: str, compute_fn: Callable, ttl: int = None) -> Any:
+        """
+        Jwenn valè a nan kachaj oswa kalkile l epi sove l
+
+        Apèl konkiran pou menm kle a pa relanse kalkil la: yo tann
+        rezilta premye a (single-flight, ak lock Redis ant nœud yo).
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        def compute():
+            value = compute_fn()
+            self.set(key, value, ttl)
+            return value
+
+        return self.flight.do(key, compute, cache_get=lambda: self._peek(key))
+
+    async def get_or_compute_async(self, key: str, coro_fn: Callable, ttl: int = None) -> Any:
+        """
+        Vèsyon async get_or_compute
+
+        Args:
+            key: Kle a
+            coro_fn: Fonksyon ki kreye coroutine kalkil la
+            ttl: TTL L2 an segonn
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        async def compute():
+            value = await coro_fn()
+            self.set(key, value, ttl)
+            return value
+
+        return await self.flight.do_async(key, compute, cache_get=lambda: self._peek(key))
+
+    def delete(self, key: str) -> bool:
+        """Envalide yon kle nan L1 ak L2"""
+        full_key = self._full_key(key)
+        self.stats["deletes"] += 1
+        self.l1.delete(full_key)
+        client = self.redis
+        if client is not None:
+            try:
+                client.delete(full_key)
+            except Exception as e:
+                self._on_error("DELETE", e)
+                return False
+        return True
+
+    def clear_pattern(self, pattern: str, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Efase kle ki matche yon modèl (ex: "user:*") nan espas non an
+
+        SCAN + UNLINK pa lo: Redis pa janm bloke, kle yo pa janm tout an memwa.
+
+        Args:
+            pattern: Modèl kle yo
+            progress: Rele progress(deleted, scanned) apre chak lo
+
+        Returns:
+            Kantite kle efase nan L2 (oswa L1 si pa gen L2)
+        """
+        full_pattern = self._full_key(pattern)
+        removed = self.l1.delete_prefix(full_pattern.rstrip('*'))
+        client = self.redis
+        if client is None:
+            return removed
+        try:
+            return scan_delete(client, full_pattern, progress=progress)
+        except Exception as e:
+            self._on_error("CLEAR", e)
+            return 0
+
+    def clear(self, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """Efase tout espas non an"""
+        return self.clear_pattern("*", progress=progress)
+
+    def ping(self) -> bool:
+        client = self.redis
+        if client is None:
+            return False
+        try:
+            return bool(client.ping())
+        except Exception as e:
+            self._on_error("PING", e)
+            return False
+
+    def get_stats(self) -> dict:
+        """
+        Estatistik espas non an
+
+        Returns:
+            dict ak hits L1/L2, misses, hit rate, gwosè L1
+        """
+        hits = self.stats["l1_hits"] + self.stats["l2_hits"]
+        total = hits + self.stats["misses"]
+        return {
+            "namespace": self.namespace,
+            "available": self.available,
+            **self.stats,
+            "hit_rate": f"{(hits / total * 100) if total else 0:.1f}%",
+            "l1_hit_rate": f"{(self.stats['l1_hits'] / total * 100) if total else 0:.1f}%",
+            "l1_entries": len(self.l1),
+            "l1_max_entries": self.l1.max_entries,
+            "l1_evictions": self.l1.stats["evictions"],
+            "l1_not_admitted": self.l1.stats["not_admitted"],
+            "l1_bytes": self.l1.bytes,
+            "fallback": self.health.get_stats() if self.health is not None else {"active": True},
+            "coalesced": self.flight.stats["coalesced"] + self.flight.stats["remote_coalesced"],
+            "ttl_hours": self.ttl_seconds / 3600,
+        }
+
+    def reset_stats(self) -> None:
+        for name in self.stats:
+            self.stats[name] = 0
+        self.analytics.reset()
+
+
+# ============================================================
+# REGISTRY
+# ============================================================
+
+_caches: Dict[str, TieredCache] = {}
+
+
+def get_cache(namespace: str, ttl_hours: float = 24, **kwargs) -> TieredCache:
+    """
+    Kachaj pataje pou yon espas non (kreye l premye fwa)
+
+    Args:
+        namespace: Espas non ("trans", "audio", "session", ...)
+        ttl_hours: TTL L2 (itilize sèlman premye fwa)
+
+    Returns:
+        TieredCache
+    """
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = _caches.setdefault(namespace, TieredCache(namespace, ttl_hours=ttl_hours, **kwargs))
+    return cache
+
+
+def cache_stats() -> Dict[str, dict]:
+    """Estatistik tout espas non yo"""
+    return {name: cache.get_stats() for name, cache in _caches.items()}
+
+
+def cache_analytics(top: int = 10) -> Dict[str, dict]:
+    """
+    Hit ratio pa fenèt tan (1m/5m/1h), byte hit ratio ak kle ki pi cho yo
+    pou chak espas non, ak estatistik admisyon TinyLFU la kote l aktive
+
+    Args:
+        top: Kantite kle cho pa espas non
+    """
+    report = analytics_report(top)
+    for name, cache in _caches.items():
+        if cache.l1.admission is not None:
+            entry = report.setdefault(name, cache.analytics.snapshot(top))
+            entry["admission"] = {
+                **cache.l1.admission.get_stats(),
+                "l1_not_admitted": cache.l1.stats["not_admitted"],
+                "l2_not_admitted": cache.stats["l2_not_admitted"],
+            }
+    return report
+
+
+def keyspace_stats(sample_size: int = 500) -> dict:
+    """
+    Kantite kle ak memwa pa espas non nan Redis L2, estime pa echantiyon
+    (RANDOMKEY + MEMORY USAGE, pa janm yon SCAN total)
+
+    Args:
+        sample_size: Kantite kle pou echantiyone
+
+    Returns:
+        dict ak total_keys, method, sampled ak namespaces
+    """
+    client = get_redis_client()
+    if client is None:
+        return {"available": False}
+    try:
+        return {"available": True, **sample_keyspace(client, sample_size=sample_size)}
+    except Exception as e:
+        print(f"⚠️  Redis KEYSPACE error: {e}")
+        if isinstance(e, _CONNECTION_ERRORS):
+            _shared_health.mark_down(e)
+        return {"available": False, "error": str(e)}
+
+
+# Kachaj pataje yo (menm TTL ak ansyen kachaj yo)
+translation_cache = get_cache("trans", ttl_hours=168, admission=CACHE_ADMISSION)  # 7 jou
+audio_cache = get_cache("audio", ttl_hours=72, admission=CACHE_ADMISSION)  # 3 jou
+session_cache = get_cache("session", ttl_hours=24)  # 1 jou
+
+
+def cached_translation(text: str, source_lang: str, target_lang: str, translate_fn: Callable) -> str:
+    """
+    Tradwi ak kachaj L1/L2
+
+    Args:
+        text: Tèks pou tradwi
+        source_lang: Lang sous
+        target_lang: Lang sib
+        translate_fn: Fonksyon tradiksyon (text, source_lang, target_lang)
+
+    Returns:
+        Tèks ki tradwi
+    """
+    cache_key = translation_key(text, source_lang, target_lang)
+    return translation_cache.get_or_compute(
+        cache_key,
+        lambda: translate_fn(text, source_lang, target_lang)
+    )
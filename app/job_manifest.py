@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📋 Job Manifest
+Manifest travay audiobook pa moso: estati chak moso, tèks li ak chemen
+odyo li, pou yon task ki rekòmanse sote sa ki deja fèt
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+import hashlib
+import json
+import os
+import re
+import shutil
+
+JOBS_ROOT = Path(os.getenv("JOBS_DIR", "output/jobs"))
+
+CHUNK_PENDING = "pending"
+CHUNK_DONE = "done"
+
+_SAFE_ID_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Ekri JSON nan yon fichye tanporè epi ranplase l"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class JobManifest:
+    """
+    Manifest yon travay audiobook
+
+    Layout:
+        <root>/<job_id>/manifest.json     → paramèt, estati, rapò
+        <root>/<job_id>/source.txt        → tèks ekstrè (pa re-ekstrè)
+        <root>/<job_id>/chunks/00000.json → tèks, estati, chemen odyo
+        <root>/<job_id>/audio/00000.mp3   → odyo chak moso
+
+    Chak moso gen pwòp fichye JSON pa l, kidonk plizyè worker ka make
+    moso diferan kòm fini an menm tan san yo pa goumen pou manifest la.
+    """
+
+    def __init__(self, job_id: str, root: Path = None):
+        """
+        Args:
+            job_id: ID travay la (Celery task ID)
+            root: Dosye rasin travay yo
+        """
+        if not job_id:
+            raise ValueError("job_id obligatwa")
+        self.job_id = job_id
+        self.dir = Path(root or JOBS_ROOT) / _SAFE_ID_RE.sub("_", job_id)
+        self.manifest_path = self.dir / "manifest.json"
+        self.source_path = self.dir / "source.txt"
+        self.chunks_dir = self.dir / "chunks"
+        self.audio_dir = self.dir / "audio"
+        self.data = self._read()
+        # Moso jenere nan kouri aktyèl la (pa instans sa a)
+        self.recomputed = 0
+
+    # ------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------
+
+    def _read(self) -> dict:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def exists(self) -> bool:
+        return bool(self.data)
+
+    @classmethod
+    def load(cls, job_id: str, root: Path = None) -> "JobManifest":
+        """
+        Chaje manifest yon travay ki egziste
+
+        Raises:
+            FileNotFoundError: Si travay la pa gen manifest
+        """
+        manifest = cls(job_id, root=root)
+        if not manifest.exists():
+            raise FileNotFoundError(f"Pa gen manifest pou travay {job_id} nan {manifest.dir}")
+        return manifest
+
+    def save(self) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.data["updated_at"] = datetime.now().isoformat()
+        _write_json_atomic(self.manifest_path, self.data)
+
+    def start(self, params: dict) -> None:
+        """
+        Kòmanse (oswa rekòmanse) travay la ak paramèt li yo
+
+        Args:
+            params: Paramèt task la (file_path, voice, max_pages, ...)
+        """
+        if not self.data:
+            self.data = {
+                "job_id": self.job_id,
+                "created_at": datetime.now().isoformat(),
+                "params": params,
+                "runs": [],
+            }
+        self.data["status"] = "running"
+        self.data["runs"].append({"started_at": datetime.now().isoformat()})
+        self.save()
+
+    @property
+    def params(self) -> dict:
+        return self.data.get("params", {})
+
+    @property
+    def status(self) -> Optional[str]:
+        return self.data.get("status")
+
+    # ------------------------------------------------------------
+    # Source text
+    # ------------------------------------------------------------
+
+    def load_text(self) -> Optional[str]:
+        """Tèks ekstrè nan yon kouri anvan (None si pa genyen)"""
+        if self.source_path.exists():
+            return self.source_path.read_text(encoding="utf-8")
+        return None
+
+    def save_text(self, text: str) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.source_path.with_suffix(".txt.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, self.source_path)
+
+    # ------------------------------------------------------------
+    # Chunks
+    # ------------------------------------------------------------
+
+    def _chunk_path(self, index: int) -> Path:
+        return self.chunks_dir / f"{index:05d}.json"
+
+    def chunk(self, index: int) -> dict:
+        return json.loads(self._chunk_path(index).read_text(encoding="utf-8"))
+
+    def _is_reusable(self, index: int, text_hash: str) -> bool:
+        try:
+            chunk = self.chunk(index)
+        except (OSError, ValueError):
+            return False
+        return (
+            chunk.get("status") == CHUNK_DONE
+            and chunk.get("text_hash") == text_hash
+            and bool(chunk.get("audio"))
+            and Path(chunk["audio"]).exists()
+        )
+
+    def prepare_chunks(self, chunks: List[str]) -> dict:
+        """
+        Anrejistre moso yo; kenbe sa ki deja fini ak menm tèks la
+
+        Args:
+            chunks: Tèks chak moso, nan lòd
+
+        Returns:
+            dict: total, reused, pending
+        """
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.audio_dir.mkdir(parents=True, exist_ok=True)
+
+        reused = 0
+        for index, text in enumerate(chunks):
+            text_hash = _text_hash(text)
+            if self._is_reusable(index, text_hash):
+                reused += 1
+                continue
+            _write_json_atomic(self._chunk_path(index), {
+                "index": index,
+                "status": CHUNK_PENDING,
+                "text": text,
+                "text_hash": text_hash,
+                "audio": None,
+            })
+
+        # Moso ki depase nouvo kantite a (tèks la chanje) pa itil ankò
+        for stale in self.chunks_dir.glob("*.json"):
+            if int(stale.stem) >= len(chunks):
+                stale.unlink()
+
+        self.data["chunk_count"] = len(chunks)
+        self.data["runs"][-1].update(reused=reused, pending=len(chunks) - reused)
+        self.save()
+        return {"total": len(chunks), "reused": reused, "pending": len(chunks) - reused}
+
+    def pending_chunks(self) -> List[int]:
+        """Endis moso ki poko fini"""
+        return [
+            index for index in range(self.data.get("chunk_count", 0))
+            if self.chunk(index).get("status") != CHUNK_DONE
+        ]
+
+    def audio_path_for(self, index: int, suffix: str = ".mp3") -> Path:
+        return self.audio_dir / f"{index:05d}{suffix}"
+
+    def mark_done(self, index: int, audio_path: Path) -> None:
+        """Make yon moso kòm fini ak chemen odyo li"""
+        chunk = self.chunk(index)
+        chunk.update(
+            status=CHUNK_DONE,
+            audio=str(audio_path),
+            completed_at=datetime.now().isoformat(),
+        )
+        _write_json_atomic(self._chunk_path(index), chunk)
+
+    def audio_paths(self) -> List[Path]:
+        """Chemen odyo tout moso yo, nan lòd"""
+        return [Path(self.chunk(index)["audio"]) for index in range(self.data.get("chunk_count", 0))]
+
+    # ------------------------------------------------------------
+    # Finish
+    # ------------------------------------------------------------
+
+    def report(self) -> dict:
+        """Rapò travay ki reitilize vs travay ki refèt nan kouri aktyèl la"""
+        run = (self.data.get("runs") or [{}])[-1]
+        return {
+            "job_id": self.job_id,
+            "chunks": self.data.get("chunk_count", 0),
+            "reused": run.get("reused", 0),
+            "recomputed": run.get("recomputed", self.recomputed),
+            "runs": len(self.data.get("runs", [])),
+        }
+
+    def complete(self, result: dict) -> None:
+        """Make travay la kòm fini epi retire odyo pa moso yo"""
+        self.data["runs"][-1]["recomputed"] = self.recomputed
+        self.data["status"] = "complete"
+        self.data["result"] = result
+        self.save()
+        shutil.rmtree(self.audio_dir, ignore_errors=True)
+
+    def fail(self, error: str) -> None:
+        self.data.setdefault("runs", [{}])[-1]["recomputed"] = self.recomputed
+        self.data["status"] = "failed"
+        self.data["error"] = error
+        self.save()
+
+
+def merge_audio_files(paths: List[Path], output_path: Path) -> Path:
+    """
+    Mete odyo moso yo ansanm
+
+    Pase pa utils.audio_concat.concat_audio: MP3 ki gen menm kodek ak
+    sample rate kole ankadreman pa ankadreman (tag ID3 yo retire), WAV ki
+    gen menm paramèt PCM kole san re-ankode, lòt ka yo re-ankode yon sèl fwa.
+
+    Args:
+        paths: Fichye odyo yo, nan lòd
+        output_path: Fichye final la (yon fizyon WAV sèlman resevwa .wav)
+
+    Returns:
+        Path: Chemen fichye final la
+    """
+    from utils.audio_concat import concat_audio
+    return Path(concat_audio(paths, output_path).output)
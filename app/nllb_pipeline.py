@@ -10,6 +10,7 @@ from gtts import gTTS
 import PyPDF2
 from pathlib import Path
 from tqdm import tqdm
+import shutil
 import sys
 
 # Add parent directory to path
@@ -90,24 +91,43 @@ class NLLBPipeline:
         
         # Translate each chunk with progress bar
         for chunk in tqdm(chunks, desc="Tradiksyon"):
-            try:
-                translation = self.translator(
-                    chunk, 
-                    src_lang=src_lang, 
-                    tgt_lang=tgt_lang,
-                    max_length=512
-                )[0]['translation_text']
-                
-                translated_chunks.append(translation)
-            except Exception as e:
-                print(f"\n⚠️ Erè ak chunk: {str(e)[:100]}")
-                translated_chunks.append(chunk)  # Keep original if translation fails
+            translated_chunks.append(self._translate_chunk(chunk, src_lang, tgt_lang))
         
         result = " ".join(translated_chunks)
         print(f"✅ Tradiksyon konplete: {len(result)} karaktè")
         
         return result
     
+    def iter_pdf_pages(self, pdf_path: str):
+        """
+        Ekstrè paj PDF yo youn apre lòt (pou pipeline streaming)
+        
+        Args:
+            pdf_path: Chemen fichye PDF
+            
+        Yields:
+            str: Tèks chak paj ki gen tèks
+        """
+        with open(pdf_path, "rb") as file:
+            reader = PyPDF2.PdfReader(file)
+            for page in reader.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    yield page_text
+    
+    def _translate_chunk(self, chunk: str, src_lang: str, tgt_lang: str = "hat_Latn") -> str:
+        """Tradwi yon sèl moso (kenbe orijinal la si gen erè)"""
+        try:
+            return self.translator(
+                chunk,
+                src_lang=src_lang,
+                tgt_lang=tgt_lang,
+                max_length=512
+            )[0]['translation_text']
+        except Exception as e:
+            print(f"\n⚠️ Erè ak chunk: {str(e)[:100]}")
+            return chunk
+    
     def text_to_audio(
         self, 
         text: str, 
@@ -154,7 +174,9 @@ class NLLBPipeline:
         pdf_path: str,
         output_dir: str = "output/nllb",
         src_lang: str = "fra_Latn",
-        use_native_tts: bool = False
+        use_native_tts: bool = False,
+        streaming: bool = False,
+        tts_workers: int = 2
     ) -> dict:
         """
         Pipeline konplè: PDF → Translation → Audiobook
@@ -164,6 +186,8 @@ class NLLBPipeline:
             output_dir: Dosye pou sove output yo
             src_lang: Lang sous (fra_Latn oswa eng_Latn)
             use_native_tts: Itilize Kreyòl native TTS olye de gTTS
+            streaming: Ekstraksyon, tradiksyon ak TTS an menm tan (src.pipeline)
+            tts_workers: Kantite thread gTTS an mòd streaming
             
         Returns:
             dict: Info sou fichye yo kreye
@@ -179,6 +203,9 @@ class NLLBPipeline:
         # Get base name
         base_name = Path(pdf_path).stem
         
+        if streaming:
+            return self._process_streaming(pdf_path, output_path, base_name, src_lang, use_native_tts, tts_workers)
+        
         # Step 1: Extract text
         print("\n📖 STEP 1: Ekstraksyon tèks")
         print("-" * 60)
@@ -232,6 +259,98 @@ class NLLBPipeline:
             }
         }
 
+    def _process_streaming(
+        self,
+        pdf_path: str,
+        output_path: Path,
+        base_name: str,
+        src_lang: str,
+        use_native_tts: bool,
+        tts_workers: int
+    ) -> dict:
+        """
+        PDF → Translation → Audiobook ak etap ki kouri an menm tan
+        
+        Paj yo ekstrè youn apre lòt, moso k la tradwi pandan moso k-1 ap
+        vin odyo. Modèl NLLB la gen yon sèl worker (torch deja paralèl);
+        gTTS (rezo) gen tts_workers. Kreyòl native TTS chaje modèl li pou
+        chak apèl, kidonk li kouri yon sèl fwa sou tout tèks la alafen.
+        """
+        from src.pipeline import Stage, StagedPipeline
+        from src.utils import iter_chunks
+        
+        print("\n⚡ MODE STREAMING: ekstraksyon → tradiksyon → odyo")
+        print("-" * 60)
+        
+        parts_dir = output_path / f"{base_name}_parts"
+        with_gtts = not use_native_tts
+        
+        def translate(item):
+            i, chunk = item
+            return i, chunk, self._translate_chunk(chunk, src_lang)
+        
+        def synthesize(item):
+            i, chunk, translation = item
+            part_path = parts_dir / f"part_{i:05d}.mp3"
+            gTTS(text=translation, lang="ht", slow=False).save(str(part_path))
+            return i, chunk, translation, part_path
+        
+        stages = [Stage("translate", translate, workers=1)]
+        if with_gtts:
+            parts_dir.mkdir(parents=True, exist_ok=True)
+            stages.append(Stage("tts", synthesize, workers=tts_workers))
+        
+        chunks = enumerate(iter_chunks(self.iter_pdf_pages(pdf_path), max_size=500))
+        pipeline = StagedPipeline(stages, source_name="extract")
+        
+        originals, translations, parts = [], [], []
+        for result in tqdm(pipeline.run(chunks), desc="Pipeline", unit="moso"):
+            originals.append(result[1])
+            translations.append(result[2])
+            if with_gtts:
+                parts.append(result[3])
+        
+        text = "\n\n".join(originals)
+        translated_text = " ".join(translations)
+        
+        extracted_path = output_path / f"{base_name}_extracted.txt"
+        extracted_path.write_text(text, encoding='utf-8')
+        translated_path = output_path / f"{base_name}_kreyol.txt"
+        translated_path.write_text(translated_text, encoding='utf-8')
+        
+        audio_path = output_path / f"{base_name}_audiobook.mp3"
+        if with_gtts:
+            # MP3 = ankadreman endepandan: nou ka kole pati yo
+            with open(audio_path, "wb") as out:
+                for part in parts:
+                    out.write(part.read_bytes())
+            shutil.rmtree(parts_dir, ignore_errors=True)
+        else:
+            from generer_audio_huggingface import generer_audio_creole
+            generer_audio_creole(translated_text, audio_path)
+        
+        stats = pipeline.stats()
+        print("\n" + "="*60)
+        print("✅ PWOSESIS KONPLETE!")
+        print("="*60)
+        print(f"📄 Tèks orijinal: {len(text)} karaktè")
+        print(f"🇭🇹 Tèks tradwi: {len(translated_text)} karaktè")
+        print(f"⚡ Tan total: {stats['wall_seconds']:.1f}s (bottleneck: {stats['bottleneck']})")
+        print(f"📁 Output dosye: {output_path}")
+        print("="*60)
+        
+        return {
+            "extracted_text": str(extracted_path),
+            "translated_text": str(translated_path),
+            "audiobook": str(audio_path),
+            "stats": {
+                "original_chars": len(text),
+                "translated_chars": len(translated_text),
+                "output_dir": str(output_path),
+                "pipeline": stats
+            }
+        }
+
 
 # -----------------------------------------------------
 # STANDALONE FUNCTION
@@ -242,7 +361,8 @@ def pdf_to_kreyol_audiobook(
     output_dir: str = "output/nllb",
     src_lang: str = "fra_Latn",
     model_name: str = "facebook/nllb-200-distilled-600M",
-    use_native_tts: bool = False
+    use_native_tts: bool = False,
+    streaming: bool = False
 ) -> dict:
     """
     Fonksyon senp pou konvèti PDF an audiobook Kreyòl
@@ -253,6 +373,7 @@ def pdf_to_kreyol_audiobook(
         src_lang: Lang sous (fra_Latn=Franse, eng_Latn=Angle)
         model_name: Model NLLB pou itilize
         use_native_tts: Itilize Kreyòl native TTS
+        streaming: Ekstraksyon, tradiksyon ak TTS an menm tan
         
     Returns:
         dict: Info sou fichye yo kreye
@@ -262,7 +383,8 @@ def pdf_to_kreyol_audiobook(
         pdf_path=pdf_path,
         output_dir=output_dir,
         src_lang=src_lang,
-        use_native_tts=use_native_tts
+        use_native_tts=use_native_tts,
+        streaming=streaming
     )
 
 
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗓️ Workflow Scheduler
+Planifikatè asenkwon pou travay lou: limit konkirans, priyorite,
+timeout pa travay, anilasyon, ak rezilta ki sòti youn apre lòt
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import heapq
+import itertools
+import time
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUS_CANCELLED = "cancelled"
+
+
+@dataclass
+class JobResult:
+    """
+    Rezilta yon travay
+
+    Attributes:
+        job_id: ID travay la (lòd soumisyon)
+        key: Etikèt itilizatè a (URL, chemen fichye, ...)
+        status: ok, error, timeout oswa cancelled
+        result: Valè coroutine nan (si ok)
+        error: Eksepsyon an (si pa ok)
+        seconds: Tan egzekisyon
+    """
+    job_id: int
+    key: Any
+    status: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+    @property
+    def value(self) -> Any:
+        """Rezilta a oswa eksepsyon an (menm jan ak gather(return_exceptions=True))"""
+        return self.result if self.ok else self.error
+
+
+@dataclass(order=True)
+class _Job:
+    sort_key: tuple
+    job_id: int = field(compare=False)
+    key: Any = field(compare=False)
+    factory: Callable[[], Awaitable] = field(compare=False)
+    timeout: Optional[float] = field(compare=False)
+
+
+class WorkflowScheduler:
+    """
+    Planifikatè travay ak konkirans limite
+
+    Travay yo soumèt kòm *factory* (fonksyon ki kreye coroutine nan), kidonk
+    coroutine nan pa egziste anvan yon plas libere: 200 URL pa vle di 200
+    telechajman ak 200 modèl TTS nan memwa an menm tan.
+
+    Example:
+        scheduler = WorkflowScheduler(max_concurrency=4, default_timeout=600)
+        for url in urls:
+            scheduler.submit(lambda url=url: url_to_audio(url, voice, out_dir), key=url)
+        async for job in scheduler.as_completed():
+            print(job.key, job.status)
+    """
+
+    def __init__(self, max_concurrency: int = 4, default_timeout: Optional[float] = None):
+        """
+        Args:
+            max_concurrency: Maksimòm travay k ap kouri an menm tan
+            default_timeout: Timeout pa travay an segonn (None = pa gen limit)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency dwe omwen 1")
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self._pending: List[_Job] = []
+        self._running: Dict[asyncio.Task, _Job] = {}
+        self._started: Dict[asyncio.Task, float] = {}
+        self._cancelled: set = set()
+        self._ids = itertools.count()
+        self._iterating = False
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "cancelled": 0,
+            "max_running": 0,
+        }
+
+    def submit(
+        self,
+        factory: Callable[[], Awaitable],
+        priority: int = 0,
+        timeout: Optional[float] = None,
+        key: Any = None
+    ) -> int:
+        """
+        Ajoute yon travay nan fil la
+
+        Args:
+            factory: Fonksyon san agiman ki retounen coroutine travay la
+            priority: Pi gwo priyorite a kouri anvan (menm priyorite: lòd soumisyon)
+            timeout: Timeout travay sa a (default: default_timeout)
+            key: Etikèt pou rekonèt rezilta a
+
+        Returns:
+            int: ID travay la
+        """
+        job_id = next(self._ids)
+        heapq.heappush(self._pending, _Job(
+            sort_key=(-priority, job_id),
+            job_id=job_id,
+            key=key,
+            factory=factory,
+            timeout=self.default_timeout if timeout is None else timeout,
+        ))
+        self.stats["submitted"] += 1
+        return job_id
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Anile yon travay (nan fil la oswa k ap kouri)
+
+        Returns:
+            bool: True si travay la te la pou anile
+        """
+        for task, job in self._running.items():
+            if job.job_id == job_id:
+                return task.cancel()
+        if any(job.job_id == job_id for job in self._pending):
+            self._cancelled.add(job_id)
+            return True
+        return False
+
+    def cancel_all(self) -> None:
+        """Anile tout travay ki rete yo"""
+        self._cancelled.update(job.job_id for job in self._pending)
+        for task in self._running:
+            task.cancel()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def running_count(self) -> int:
+        return len(self._running)
+
+    async def _execute(self, job: _Job) -> Any:
+        if job.timeout is None:
+            return await job.factory()
+        return await asyncio.wait_for(job.factory(), timeout=job.timeout)
+
+    def _start_ready(self) -> List[JobResult]:
+        """Lanse travay nan fil la jiska limit la; retounen sa ki te anile"""
+        skipped = []
+        while self._pending and len(self._running) < self.max_concurrency:
+            job = heapq.heappop(self._pending)
+            if job.job_id in self._cancelled:
+                self._cancelled.discard(job.job_id)
+                self.stats["cancelled"] += 1
+                skipped.append(JobResult(
+                    job.job_id, job.key, STATUS_CANCELLED,
+                    error=asyncio.CancelledError("cancelled before start")
+                ))
+                continue
+            task = asyncio.ensure_future(self._execute(job))
+            self._running[task] = job
+            self._started[task] = time.perf_counter()
+        self.stats["max_running"] = max(self.stats["max_running"], len(self._running))
+        return skipped
+
+    def _collect(self, task: asyncio.Task) -> JobResult:
+        job = self._running.pop(task)
+        seconds = time.perf_counter() - self._started.pop(task)
+        if task.cancelled():
+            self.stats["cancelled"] += 1
+            return JobResult(job.job_id, job.key, STATUS_CANCELLED,
+                             error=asyncio.CancelledError(), seconds=seconds)
+        error = task.exception()
+        if error is None:
+            self.stats["completed"] += 1
+            return JobResult(job.job_id, job.key, STATUS_OK, result=task.result(), seconds=seconds)
+        if isinstance(error, asyncio.TimeoutError):
+            self.stats["timed_out"] += 1
+            return JobResult(job.job_id, job.key, STATUS_TIMEOUT, error=error, seconds=seconds)
+        self.stats["failed"] += 1
+        return JobResult(job.job_id, job.key, STATUS_ERROR, error=error, seconds=seconds)
+
+    async def as_completed(self) -> AsyncIterator[JobResult]:
+        """
+        Kouri travay yo epi bay rezilta yo lè yo fini
+
+        Travay ka soumèt oswa anile pandan iterasyon an. Si moun ki
+        ap li rezilta yo kanpe (break), travay k ap kouri yo anile.
+
+        Yields:
+            JobResult: Nan lòd yo fini (pa nan lòd soumisyon)
+        """
+        if self._iterating:
+            raise RuntimeError("as_completed() deja ap kouri pou planifikatè sa a")
+        self._iterating = True
+        try:
+            while True:
+                for skipped in self._start_ready():
+                    yield skipped
+                if not self._running:
+                    if not self._pending:
+                        break
+                    continue
+                done, _ = await asyncio.wait(
+                    list(self._running), return_when=asyncio.FIRST_COMPLETED
+                )
+                # Lòd soumisyon pou travay ki fini an menm tan
+                for task in sorted(done, key=lambda t: self._running[t].job_id):
+                    yield self._collect(task)
+        finally:
+            self._iterating = False
+            if self._running:
+                for task in self._running:
+                    task.cancel()
+                await asyncio.gather(*self._running, return_exceptions=True)
+                self._running.clear()
+                self._started.clear()
+
+    async def run_all(self) -> List[Any]:
+        """
+        Kouri tout travay yo epi retounen rezilta yo nan lòd soumisyon
+
+        Returns:
+            list: Valè oswa eksepsyon chak travay (tankou gather(return_exceptions=True))
+        """
+        results = {}
+        async for job in self.as_completed():
+            results[job.job_id] = job.value
+        return [results[job_id] for job_id in sorted(results)]
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📖 EPUB Extractor
+Ekstrè chapit EPUB yo nan lòd spine la, ak analiz paralèl
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+import os
+import re
+
+# Tags ki kòmanse yon nouvo blòk tèks
+BLOCK_TAGS = (
+    "p", "div", "br", "li", "tr", "blockquote", "pre", "section", "article",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+)
+HEADING_TAGS = ("h1", "h2", "h3")
+
+_BLANK_LINES_RE = re.compile(r"\n[ \t]*\n[\s]*")
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+\n")
+
+try:
+    import lxml.html
+    # Dokiman EPUB yo an UTF-8 (XHTML), pa kite lxml devine latin-1
+    _LXML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+@dataclass
+class EpubChapter:
+    """Yon chapit EPUB ak tit li"""
+    index: int
+    title: str
+    href: str
+    text: str
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _normalize_text(text: str) -> str:
+    """Retire espas initil epi kenbe separasyon paragraf yo"""
+    text = _TRAILING_SPACE_RE.sub("\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
+
+def _parse_with_lxml(content: bytes) -> Tuple[Optional[str], str]:
+    """Analize HTML ak lxml (C parser, pi rapid)"""
+    root = lxml.html.fromstring(content, parser=_LXML_PARSER)
+    for element in root.xpath("//script|//style"):
+        element.drop_tree()
+
+    heading = None
+    for element in root.iter(*HEADING_TAGS):
+        heading = element.text_content().strip() or None
+        if heading:
+            break
+    if heading is None:
+        titles = root.xpath("//title/text()")
+        heading = titles[0].strip() if titles and titles[0].strip() else None
+    for element in root.xpath("//head"):
+        element.drop_tree()
+
+    # Ajoute liy nouvo apre chak blòk pou kenbe paragraf yo
+    for element in root.iter(*BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+
+    return heading, _normalize_text(root.text_content())
+
+
+def _parse_with_bs4(content: bytes) -> Tuple[Optional[str], str]:
+    """Analize HTML ak BeautifulSoup (fallback pur Python)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "html.parser")
+    for element in soup(["script", "style"]):
+        element.decompose()
+
+    heading_tag = soup.find(HEADING_TAGS) or soup.find("title")
+    heading = heading_tag.get_text().strip() if heading_tag else None
+    if soup.head:
+        soup.head.decompose()
+
+    for element in soup.find_all(BLOCK_TAGS):
+        element.append("\n")
+
+    return heading or None, _normalize_text(soup.get_text())
+
+
+def parse_chapter_html(content: bytes) -> Tuple[Optional[str], str]:
+    """
+    Ekstrè tit ak tèks yon chapit XHTML
+
+    Args:
+        content: Kontni XHTML chapit la
+
+    Returns:
+        Tuple (tit oswa None, tèks)
+    """
+    if LXML_AVAILABLE:
+        try:
+            return _parse_with_lxml(content)
+        except Exception:
+            # lxml refize kèk dokiman vid oswa malfòme
+            pass
+    return _parse_with_bs4(content)
+
+
+def _toc_titles(toc) -> dict:
+    """Mape href (san fragman) → tit soti nan tab matyè a"""
+    from ebooklib import epub
+
+    titles = {}
+    pending = list(toc)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, tuple):
+            section, children = node
+            href = getattr(section, "href", None)
+            if href:
+                titles.setdefault(href.split("#")[0], section.title)
+            pending[:0] = list(children)
+        elif isinstance(node, epub.Link):
+            titles.setdefault(node.href.split("#")[0], node.title)
+    return titles
+
+
+def _spine_documents(book) -> List:
+    """Jwenn dokiman yo nan lòd lekti spine la"""
+    import ebooklib
+
+    documents = []
+    seen = set()
+    for entry in book.spine:
+        idref = entry[0] if isinstance(entry, tuple) else entry
+        item = book.get_item_with_id(idref)
+        if item is None or item.get_type() != ebooklib.ITEM_DOCUMENT:
+            continue
+        if item.get_id() in seen:
+            continue
+        seen.add(item.get_id())
+        documents.append(item)
+
+    # Kèk EPUB pa gen spine valid: itilize lòd manifest la
+    if not documents:
+        documents = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+    return documents
+
+
+def _select_range(documents: List, chapter_range: Optional[Tuple[int, int]]) -> List[Tuple[int, object]]:
+    """Aplike chapter_range (1-based, enklizif) sou lis dokiman yo"""
+    indexed = list(enumerate(documents, 1))
+    if not chapter_range:
+        return indexed
+
+    start, end = chapter_range
+    start = max(1, start or 1)
+    end = len(documents) if end is None else min(end, len(documents))
+    if start > end:
+        raise ValueError(f"chapter_range envalid: {chapter_range} (EPUB gen {len(documents)} chapit)")
+    return indexed[start - 1:end]
+
+
+def iter_epub_chapters(
+    epub_path: Path,
+    chapter_range: Optional[Tuple[int, int]] = None,
+    max_workers: Optional[int] = None,
+    skip_empty: bool = True
+) -> Iterator[EpubChapter]:
+    """
+    Ekstrè chapit EPUB yo youn apre lòt nan lòd spine la
+
+    Chapit yo analize an paralèl, men yo sòti nan lòd lekti a.
+    Sèlman yon ti fenèt chapit kenbe an memwa an menm tan.
+
+    Args:
+        epub_path: Chemen fichye EPUB la
+        chapter_range: (premye, dènye) chapit pou ekstrè, 1-based enklizif
+                       (None = tout chapit yo)
+        max_workers: Kantite thread pou analiz (None = selon CPU)
+        skip_empty: Sote chapit ki pa gen tèks (kouvèti, paj blan)
+
+    Yields:
+        EpubChapter: Chapit ak tit, href ak tèks
+    """
+    try:
+        from ebooklib import epub
+    except ImportError:
+        raise ImportError("ebooklib pa enstale! Run: pip install ebooklib")
+
+    book = epub.read_epub(str(epub_path), options={"ignore_ncx": False})
+    toc_titles = _toc_titles(book.toc)
+    selected = _select_range(_spine_documents(book), chapter_range)
+
+    workers = max_workers or min(8, (os.cpu_count() or 2))
+    window = deque()
+
+    def emit(position: int, item, future) -> Optional[EpubChapter]:
+        heading, text = future.result()
+        if skip_empty and not text:
+            return None
+        href = item.get_name()
+        title = toc_titles.get(href) or heading or f"Chapit {position}"
+        return EpubChapter(index=position, title=title.strip(), href=href, text=text)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for position, item in selected:
+            window.append((position, item, executor.submit(parse_chapter_html, item.get_content())))
+            if len(window) >= workers * 2:
+                chapter = emit(*window.popleft())
+                if chapter:
+                    yield chapter
+
+        while window:
+            chapter = emit(*window.popleft())
+            if chapter:
+                yield chapter
+
+
+def extract_epub_chapters(
+    epub_path: Path,
+    chapter_range: Optional[Tuple[int, int]] = None,
+    max_workers: Optional[int] = None
+) -> List[EpubChapter]:
+    """
+    Ekstrè tout chapit yo (nan lòd spine) kòm lis
+
+    Args:
+        epub_path: Chemen fichye EPUB la
+        chapter_range: (premye, dènye) chapit, 1-based enklizif
+        max_workers: Kantite thread pou analiz
+
+    Returns:
+        List[EpubChapter]: Chapit yo
+    """
+    return list(iter_epub_chapters(epub_path, chapter_range=chapter_range, max_workers=max_workers))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+💾 Extraction Checkpoints
+Sove pwogrè ekstraksyon gwo PDF yo pou yon travay ka rekòmanse kote l te rive
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+import json
+import os
+import re
+import shutil
+
+CHECKPOINT_ROOT = Path(os.getenv("EXTRACTION_CHECKPOINT_DIR", "output/checkpoints"))
+MANIFEST_NAME = "manifest.json"
+
+_SAFE_ID_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def get_page_budget(tenant: str = None) -> Optional[int]:
+    """
+    Jwenn limit paj pa travay pou yon tenant
+
+    Li PAGE_BUDGET_<TENANT> (egz. PAGE_BUDGET_ACME=2000), epi
+    PAGE_BUDGET_DEFAULT si tenant la pa gen pwòp limit li.
+
+    Args:
+        tenant: Idantifyan tenant la (None = default)
+
+    Returns:
+        int oswa None (pa gen limit)
+    """
+    names = []
+    if tenant:
+        names.append(f"PAGE_BUDGET_{_SAFE_ID_RE.sub('_', tenant).upper()}")
+    names.append("PAGE_BUDGET_DEFAULT")
+
+    for name in names:
+        value = os.getenv(name)
+        if value:
+            try:
+                budget = int(value)
+            except ValueError:
+                print(f"⚠️  {name} envalid: {value!r}")
+                continue
+            return budget if budget > 0 else None
+    return None
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Ekri JSON nan yon fichye tanporè epi ranplase l (pa janm mwatye ekri)"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class ExtractionCheckpoint:
+    """
+    Checkpoint ekstraksyon pou yon travay
+
+    Layout:
+        <root>/<job_id>/manifest.json   → sous, total paj, pwochen paj
+        <root>/<job_id>/pages_00000.json → tèks paj [0, N)
+        <root>/<job_id>/pages_00050.json → tèks paj [N, 2N) ...
+    """
+
+    def __init__(self, job_id: str, root: Path = None):
+        """
+        Args:
+            job_id: ID travay la (egz. Celery task ID)
+            root: Dosye rasin checkpoint yo
+        """
+        if not job_id:
+            raise ValueError("job_id obligatwa pou checkpoint")
+        self.job_id = job_id
+        self.dir = Path(root or CHECKPOINT_ROOT) / _SAFE_ID_RE.sub("_", job_id)
+        self.manifest_path = self.dir / MANIFEST_NAME
+        self.manifest = None
+
+    def _source_info(self, pdf_path: Path, total_pages: int) -> dict:
+        return {
+            "source": str(pdf_path),
+            "source_size": Path(pdf_path).stat().st_size,
+            "total_pages": total_pages,
+        }
+
+    def resume(self, pdf_path: Path, total_pages: int) -> int:
+        """
+        Chaje manifest la epi retounen premye paj ki pa ekstrè ankò
+
+        Si manifest la pa koresponn ak PDF sa a, li efase epi rekòmanse a 0.
+
+        Args:
+            pdf_path: Chemen PDF la
+            total_pages: Total paj nan PDF la
+
+        Returns:
+            int: Endis (0-based) premye paj pou ekstrè
+        """
+        source = self._source_info(pdf_path, total_pages)
+
+        if self.manifest_path.exists():
+            try:
+                manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                manifest = None
+
+            if manifest and all(manifest.get(k) == v for k, v in source.items()):
+                self.manifest = manifest
+                return manifest["next_page"]
+
+            print(f"⚠️  Checkpoint {self.job_id} pa koresponn ak PDF la, rekòmanse")
+            self.clear()
+
+        self.manifest = {**source, "next_page": 0, "shards": [], "created_at": datetime.now().isoformat()}
+        return 0
+
+    def save(self, start: int, pages: List[str]) -> None:
+        """
+        Sove yon shard paj epi avanse manifest la
+
+        Args:
+            start: Endis premye paj nan shard la
+            pages: Tèks chak paj
+        """
+        if self.manifest is None:
+            raise RuntimeError("Rele resume() anvan save()")
+        if start != self.manifest["next_page"]:
+            raise ValueError(f"Shard {start} pa swiv checkpoint la (next_page={self.manifest['next_page']})")
+
+        self.dir.mkdir(parents=True, exist_ok=True)
+        shard_name = f"pages_{start:05d}.json"
+        _write_json_atomic(self.dir / shard_name, pages)
+
+        # Manifest la ekri apre shard la: yon aksidan pa janm kite yon shard ki manke
+        self.manifest["shards"].append(shard_name)
+        self.manifest["next_page"] = start + len(pages)
+        self.manifest["updated_at"] = datetime.now().isoformat()
+        _write_json_atomic(self.manifest_path, self.manifest)
+
+    def load_pages(self) -> List[str]:
+        """Chaje tèks tout paj ki deja nan checkpoint la, nan lòd"""
+        pages = []
+        for shard_name in (self.manifest or {}).get("shards", []):
+            pages.extend(json.loads((self.dir / shard_name).read_text(encoding="utf-8")))
+        return pages
+
+    def clear(self) -> None:
+        """Efase checkpoint la (apre travay la fini)"""
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self.manifest = None
@@ -21,6 +21,8 @@ class MediaService:
         """Inisyalize sèvis medya"""
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
+        # Estatistik netwayaj dènye PDF la (karaktè, token, segonn odyo)
+        self.last_cleanup_stats = None
         print("✅ Media Service initialized")
     
     # ============================================================
@@ -148,7 +150,11 @@ class MediaService:
         pdf_path: Path,
         max_pages: int = None,
         show_progress: bool = True,
-        chunk_size: int = 50
+        chunk_size: int = 50,
+        clean_layout: bool = True,
+        job_id: str = None,
+        progress_callback = None,
+        tenant: str = None
     ) -> str:
         """
         Ekstrè tèks soti nan PDF ak optimize pou gwo fichye
@@ -157,7 +163,12 @@ class MediaService:
             pdf_path: Chemen fichye PDF la
             max_pages: Limit maksimòm paj (None = tout)
             show_progress: Afiche pwogresyon
-            chunk_size: Kantite paj pou pwosese an menm tan
+            chunk_size: Kantite paj pou pwosese an menm tan (ak pa checkpoint)
+            clean_layout: Retire antèt/pye paj ki repete epi rekole mo ki koupe
+            job_id: Si bay, sove yon checkpoint chak chunk_size paj epi
+                    rekòmanse kote travay la te rive
+            progress_callback: Fonksyon callback(pages_done, pages_total)
+            tenant: Tenant pou aplike limit paj (PAGE_BUDGET_<TENANT>)
             
         Returns:
             str: Tèks ki ekstrè
@@ -179,6 +190,13 @@ class MediaService:
                 print(f"   💾 Gwosè: {file_size_mb:.2f} MB")
                 print(f"   ⏱️  Tan estimé: {total_pages//50}-{total_pages//30} minit")
             
+            # Limit paj pa travay pou tenant la
+            from app.services.extraction_checkpoint import ExtractionCheckpoint, get_page_budget
+            page_budget = get_page_budget(tenant)
+            if page_budget and (not max_pages or page_budget < max_pages):
+                print(f"\n💳 Limit paj tenant: {page_budget:,}")
+                max_pages = page_budget
+            
             # Determine pages to process
             if max_pages and max_pages < total_pages:
                 pages_to_process = max_pages
@@ -186,13 +204,22 @@ class MediaService:
             else:
                 pages_to_process = total_pages
             
-            # Streaming extraction with chunks
+            # Rekòmanse apati dènye checkpoint la
+            checkpoint = None
+            first_page = 0
             all_text = []
+            if job_id:
+                checkpoint = ExtractionCheckpoint(job_id)
+                first_page = min(checkpoint.resume(pdf_path, total_pages), pages_to_process)
+                if first_page:
+                    all_text = checkpoint.load_pages()[:first_page]
+                    print(f"\n♻️  Rekòmanse apati checkpoint: paj {first_page + 1}/{pages_to_process}")
             
             if show_progress and total_pages > 20:
                 # Use progress bar for large files
                 pbar = tqdm(
                     total=pages_to_process,
+                    initial=first_page,
                     desc="📄 Ekstrè PDF",
                     unit="paj",
                     ncols=80
@@ -200,8 +227,11 @@ class MediaService:
             else:
                 pbar = None
             
+            if progress_callback:
+                progress_callback(first_page, pages_to_process)
+            
             # Process in chunks
-            for start in range(0, pages_to_process, chunk_size):
+            for start in range(first_page, pages_to_process, chunk_size):
                 end = min(start + chunk_size, pages_to_process)
                 
                 # Extract chunk
@@ -217,8 +247,13 @@ class MediaService:
                     if pbar:
                         pbar.update(1)
                 
-                # Join chunk and add to all text
-                all_text.append("\n".join(chunk_text))
+                # Kenbe paj yo separe pou netwayaj layout la
+                all_text.extend(chunk_text)
+                
+                if checkpoint:
+                    checkpoint.save(start, chunk_text)
+                if progress_callback:
+                    progress_callback(end, pages_to_process)
                 
                 # Progress message for manual tracking
                 if not pbar and show_progress and end % 100 == 0:
@@ -227,6 +262,12 @@ class MediaService:
             if pbar:
                 pbar.close()
             
+            # Retire antèt, pye paj ak nimewo paj ki repete
+            cleanup_stats = None
+            if clean_layout:
+                from app.services.page_cleaner import clean_pages
+                all_text, cleanup_stats = clean_pages(all_text)
+            
             # Final text
             text = "\n".join(all_text)
             
@@ -242,6 +283,12 @@ class MediaService:
             print(f"   📄 Paj pwosese: {pages_to_process}/{total_pages}")
             print(f"   📝 Mo: {word_count:,}")
             print(f"   🔤 Karaktè: {char_count:,}")
+            if cleanup_stats and cleanup_stats.chars_removed:
+                print(f"   🧹 Netwaye: {cleanup_stats.chars_removed:,} karaktè "
+                      f"({cleanup_stats.lines_removed:,} liy, {cleanup_stats.hyphens_joined:,} mo rekole)")
+                print(f"      ≈ {cleanup_stats.tokens_saved:,} token tradiksyon, "
+                      f"{cleanup_stats.audio_seconds_saved:,.0f}s odyo ekonomize")
+            self.last_cleanup_stats = cleanup_stats.to_dict() if cleanup_stats else None
             
             return text.strip()
             
@@ -353,20 +400,28 @@ class MediaService:
     # ============================================================
     
     async def extract_text_from_document(
-        self, 
-        file_path: str, 
+        self,
+        file_path: str,
         max_pages: int = None,
-        show_progress: bool = True
+        show_progress: bool = True,
+        chapter_range: tuple = None,
+        job_id: str = None,
+        progress_callback = None,
+        tenant: str = None
     ) -> str:
         """
         Ekstrè tèks soti nan yon dokiman (ak sipò pou gwo fichye)
         Sipòte: PDF, TXT, DOCX, EPUB
-        
+
         Args:
             file_path: Chemen fichye dokiman an
             max_pages: Limit maksimòm paj pou ekstrè (None = tout paj yo)
             show_progress: Afiche pwogresyon pou gwo fichye
-            
+            chapter_range: (premye, dènye) chapit EPUB pou ekstrè, 1-based (None = tout)
+            job_id: ID travay pou checkpoint PDF (rekòmanse apre yon aksidan)
+            progress_callback: callback(pages_done, pages_total) pou PDF
+            tenant: Tenant pou limit paj PDF (PAGE_BUDGET_<TENANT>)
+
         Returns:
             str: Tèks ki ekstrè
         """
@@ -383,7 +438,10 @@ class MediaService:
                 text = await self._extract_pdf_optimized(
                     file_path_obj, 
                     max_pages=max_pages,
-                    show_progress=show_progress
+                    show_progress=show_progress,
+                    job_id=job_id,
+                    progress_callback=progress_callback,
+                    tenant=tenant
                 )
                     
             elif ext == '.docx':
@@ -396,24 +454,10 @@ class MediaService:
                     raise ImportError("python-docx pa enstale! Run: pip install python-docx")
                     
             elif ext == '.epub':
-                # EPUB ebook
-                try:
-                    import ebooklib
-                    from ebooklib import epub
-                    from bs4 import BeautifulSoup
-                    
-                    book = epub.read_epub(file_path_obj)
-                    text_parts = []
-                    
-                    for item in book.get_items():
-                        if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                            soup = BeautifulSoup(item.get_content(), 'html.parser')
-                            text_parts.append(soup.get_text())
-                    
-                    text = "\n".join(text_parts)
-                except ImportError:
-                    raise ImportError("ebooklib pa enstale! Run: pip install ebooklib")
-                    
+                # EPUB ebook (lòd spine, analiz paralèl)
+                chapters = self.extract_epub_chapters(file_path_obj, chapter_range=chapter_range)
+                text = "\n\n".join(chapter["text"] for chapter in chapters)
+
             else:
                 raise ValueError(f"Format pa sipòte: {ext}. Sipòte: .txt, .pdf, .docx, .epub")
             
@@ -422,12 +466,35 @@ class MediaService:
         except Exception as e:
             print(f"❌ Error extracting text from {file_path}: {e}")
             raise
-    
+
+    def extract_epub_chapters(self, file_path: Path, chapter_range: tuple = None) -> list:
+        """
+        Ekstrè chapit EPUB yo ak tit yo (pou liv odyo an chapit)
+
+        Args:
+            file_path: Chemen fichye EPUB la
+            chapter_range: (premye, dènye) chapit pou ekstrè, 1-based (None = tout)
+
+        Returns:
+            list: Lis dict ak index, title, href, text pou chak chapit
+        """
+        from app.services.epub_extractor import iter_epub_chapters
+
+        chapters = [
+            chapter.to_dict()
+            for chapter in iter_epub_chapters(Path(file_path), chapter_range=chapter_range)
+        ]
+        print(f"📖 EPUB: {len(chapters)} chapit ekstrè")
+        return chapters
+
     async def html_to_text(self, url: str) -> str:
         """
         Konvèti paj HTML an tèks
         Retire script, style, header, footer, nav, aside
         
+        Itilize URLFetcher pataje a (pool koneksyon, limit pa host,
+        cache ETag/Last-Modified, analiz nan yon thread).
+        
         Args:
             url: URL paj wèb la
             
@@ -435,25 +502,9 @@ class MediaService:
             str: Tèks ki ekstrè
         """
         try:
-            import httpx
-            from bs4 import BeautifulSoup
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup(["script", "style", "header", "footer", "nav", "aside"]):
-                element.decompose()
-            
-            # Get text with line breaks
-            text = soup.get_text(separator="\n")
+            from app.services.url_fetcher import get_url_fetcher
             
-            # Clean up: remove empty lines and strip whitespace
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            text = "\n".join(lines)
+            text = await get_url_fetcher().fetch_text(url)
             
             print(f"✅ Extracted {len(text)} characters from {url}")
             return text
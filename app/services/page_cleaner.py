@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧹 Page Cleaner
+Retire antèt, pye paj ak nimewo paj ki repete nan tèks PDF yo
+"""
+
+from collections import Counter
+from dataclasses import dataclass, asdict
+from typing import Iterable, List
+import re
+
+# Estimasyon pou kalkile sa netwayaj la ekonomize
+CHARS_PER_TOKEN = 4.0       # Mwayèn karaktè pa token tradiksyon
+CHARS_PER_AUDIO_SECOND = 15.0  # Mwayèn karaktè li pa segonn odyo (TTS)
+
+_DIGITS_RE = re.compile(r"\d+")
+_SPACES_RE = re.compile(r"\s+")
+_PAGE_NUMBER_RE = re.compile(r"^(?:paj|page|p\.?)?\s*[-–—]?\s*#\s*(?:/\s*#|sou\s*#|of\s*#)?\s*[-–—]?$", re.IGNORECASE)
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-[ \t]*\n[ \t]*([a-zà-ÿ])")
+
+
+@dataclass
+class CleanupStats:
+    """Estatistik netwayaj paj yo"""
+    pages: int = 0
+    lines_removed: int = 0
+    hyphens_joined: int = 0
+    chars_before: int = 0
+    chars_after: int = 0
+
+    @property
+    def chars_removed(self) -> int:
+        return self.chars_before - self.chars_after
+
+    @property
+    def tokens_saved(self) -> int:
+        return int(self.chars_removed / CHARS_PER_TOKEN)
+
+    @property
+    def audio_seconds_saved(self) -> float:
+        return round(self.chars_removed / CHARS_PER_AUDIO_SECOND, 1)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.update(
+            chars_removed=self.chars_removed,
+            tokens_saved=self.tokens_saved,
+            audio_seconds_saved=self.audio_seconds_saved,
+        )
+        return data
+
+
+def _line_key(line: str) -> str:
+    """Nòmalize yon liy pou konpare l ant paj (chif → #)"""
+    return _SPACES_RE.sub(" ", _DIGITS_RE.sub("#", line)).strip().lower()
+
+
+def dehyphenate(text: str) -> tuple:
+    """
+    Rekole mo ki koupe ak tire nan fen liy
+
+    Args:
+        text: Tèks pou korije
+
+    Returns:
+        Tuple (tèks korije, kantite mo rekole)
+    """
+    return _HYPHEN_BREAK_RE.subn(r"\1\2", text)
+
+
+class PageCleaner:
+    """
+    Aprann liy ki repete anlè/anba paj yo epi retire yo
+
+    Chak paj ajoute ak add_page() (yon sèl pase lineyè pou aprann),
+    epi clean_pages() retounen paj yo san antèt, pye paj ni nimewo paj.
+    """
+
+    def __init__(self, edge_lines: int = 2, min_ratio: float = 0.5, min_pages: int = 3):
+        """
+        Args:
+            edge_lines: Kantite liy anlè ak anba chak paj pou egzamine
+            min_ratio: Pwopòsyon paj minimòm kote yon liy dwe parèt pou retire l
+            min_pages: Kantite paj minimòm anvan nou retire anyen
+        """
+        self.edge_lines = edge_lines
+        self.min_ratio = min_ratio
+        self.min_pages = min_pages
+        self._pages: List[List[str]] = []
+        self._top = Counter()
+        self._bottom = Counter()
+
+    def _edges(self, lines: List[str]) -> tuple:
+        """Endis liy ki pa vid anlè ak anba yon paj"""
+        filled = [i for i, line in enumerate(lines) if line.strip()]
+        return filled[:self.edge_lines], filled[-self.edge_lines:]
+
+    def add_page(self, text: str):
+        """Ajoute yon paj epi konte liy bò li yo"""
+        lines = (text or "").splitlines()
+        self._pages.append(lines)
+        top, bottom = self._edges(lines)
+        # set() pou yon liy konte yon sèl fwa pa paj
+        self._top.update({_line_key(lines[i]) for i in top})
+        self._bottom.update({_line_key(lines[i]) for i in bottom})
+
+    def add_pages(self, pages: Iterable[str]):
+        for text in pages:
+            self.add_page(text)
+
+    def _repeated(self, counter: Counter) -> set:
+        threshold = max(self.min_pages, int(len(self._pages) * self.min_ratio))
+        return {key for key, count in counter.items() if key and count >= threshold}
+
+    def clean_pages(self, stats: CleanupStats = None) -> List[str]:
+        """
+        Retounen paj yo netwaye
+
+        Args:
+            stats: CleanupStats pou mete ajou (opsyonèl)
+
+        Returns:
+            List[str]: Tèks chak paj san liy ki repete yo
+        """
+        stats = stats if stats is not None else CleanupStats()
+        enough_pages = len(self._pages) >= self.min_pages
+        top_repeated = self._repeated(self._top) if enough_pages else set()
+        bottom_repeated = self._repeated(self._bottom) if enough_pages else set()
+
+        cleaned = []
+        for lines in self._pages:
+            top, bottom = self._edges(lines)
+            drop = set()
+            for i in top:
+                key = _line_key(lines[i])
+                if key in top_repeated or (enough_pages and _PAGE_NUMBER_RE.match(key)):
+                    drop.add(i)
+            for i in bottom:
+                key = _line_key(lines[i])
+                if key in bottom_repeated or (enough_pages and _PAGE_NUMBER_RE.match(key)):
+                    drop.add(i)
+
+            stats.pages += 1
+            stats.lines_removed += len(drop)
+            stats.chars_before += len("\n".join(lines))
+            page = "\n".join(line for i, line in enumerate(lines) if i not in drop)
+            stats.chars_after += len(page)
+            cleaned.append(page)
+        return cleaned
+
+
+def clean_pages(pages: Iterable[str], dehyphenate_words: bool = True, **kwargs) -> tuple:
+    """
+    Netwaye yon seri paj PDF epi rekole mo ki koupe
+
+    Args:
+        pages: Tèks chak paj (nan lòd)
+        dehyphenate_words: Rekole mo ki koupe ak tire nan fen liy
+        **kwargs: Opsyon pou PageCleaner
+
+    Returns:
+        Tuple (lis paj netwaye, CleanupStats)
+    """
+    cleaner = PageCleaner(**kwargs)
+    cleaner.add_pages(pages)
+    stats = CleanupStats()
+    cleaned = cleaner.clean_pages(stats)
+
+    if dehyphenate_words:
+        for i, page in enumerate(cleaned):
+            fixed, joined = dehyphenate(page)
+            stats.hyphens_joined += joined
+            stats.chars_after -= len(page) - len(fixed)
+            cleaned[i] = fixed
+    return cleaned, stats
@@ -56,6 +56,26 @@ class TTSService:
             print(f"❌ Error generating audio: {e}")
             raise
     
+    def cached_speech(self, text: str, voice: str = "creole-native"):
+        """
+        Odyo ki deja jenere pou menm tèks + menm vwa (kachaj "audio")
+        
+        Returns:
+            Path oswa None (pa nan kachaj, oswa fichye a pa sou nœud sa a)
+        """
+        from app.cache_tiered import audio_cache, make_key
+        
+        filename = audio_cache.get(make_key("tts", voice, text))
+        if filename and (self.output_dir / filename).exists():
+            return self.output_dir / filename
+        return None
+    
+    def remember_speech(self, text: str, voice: str, audio_path: Path, force: bool = False) -> None:
+        """Anrejistre fichye odyo yon tèks pou pwochen demann yo (force: pase admisyon L2 a)"""
+        from app.cache_tiered import audio_cache, make_key
+        
+        audio_cache.set(make_key("tts", voice, text), Path(audio_path).name, force=force)
+    
     async def text_to_speech_file(self, text: str, output_path: str, voice: str = "creole-native") -> Path:
         """
         Konvèti tèks an paròl epi sove nan yon fichye espesifik
@@ -147,8 +147,11 @@ class StreamingTTSService:
         
         print(f"   Merging chunks into: {final_filename}...")
         
+        merge_report = None
         try:
-            await self._merge_audio_files(chunk_files, final_path)
+            merge_report = await self._merge_audio_files(chunk_files, final_path)
+            if merge_report:
+                final_filename = Path(merge_report.output).name
             print(f"   ✅ Final audiobook created!")
         except Exception as e:
             print(f"   ⚠️  Merge failed: {e}")
@@ -157,6 +160,7 @@ class StreamingTTSService:
         return {
             "status": "completed",
             "final_audio": f"/output/{final_filename}",
+            "merge": merge_report.to_dict() if merge_report else None,
             "chunks": chunk_urls,
             "total_chunks": len(chunk_urls),
             "text_length": len(text)
@@ -210,21 +214,23 @@ class StreamingTTSService:
         """
         Merge multiple audio files into one
         
+        Chunks with the same codec parameters are concatenated frame by
+        frame (no decode/encode); otherwise they are re-encoded once.
+        
         Args:
             audio_files: List of audio file paths
             output_file: Output file path
+        
+        Returns:
+            ConcatReport with the path taken and the time saved
+            (None when the ffmpeg fallback was used)
         """
         try:
-            # Try using pydub if available
-            from pydub import AudioSegment
-            
-            combined = AudioSegment.empty()
-            
-            for audio_file in audio_files:
-                audio = AudioSegment.from_mp3(audio_file)
-                combined += audio
+            from utils.audio_concat import concat_audio
             
-            combined.export(output_file, format="mp3")
+            report = await asyncio.to_thread(concat_audio, audio_files, output_file)
+            print(f"   🔗 Merge: {report.summary()}")
+            return report
             
         except ImportError:
             # Fallback: use ffmpeg directly
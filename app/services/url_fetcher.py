@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🌐 URL Fetcher
+Telechaje paj wèb an paralèl ak yon sèl kliyan, limit pa host,
+cache HTTP kondisyonèl (ETag/Last-Modified) sou disk, epi analiz HTML
+andeyò event loop la
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlsplit
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+import weakref
+
+import httpx
+
+# Maksimòm antre nan cache HTTP disk la (pi ansyen yo pa mtime soti an premye)
+URL_CACHE_MAX_ENTRIES = int(os.getenv("URL_CACHE_MAX_ENTRIES", "1000"))
+
+# Eleman ki pa fè pati kontni atik la
+STRIP_TAGS = ["script", "style", "header", "footer", "nav", "aside", "noscript"]
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def extract_article_text(html: Union[str, bytes]) -> str:
+    """
+    Konvèti HTML an tèks (CPU: rele l nan yon thread)
+
+    Args:
+        html: Kontni HTML la
+
+    Returns:
+        str: Tèks san script, style, header, footer, nav, aside
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, HTML_PARSER)
+    for element in soup(STRIP_TAGS):
+        element.decompose()
+
+    text = soup.get_text(separator="\n")
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return "\n".join(lines)
+
+
+@dataclass
+class FetchResult:
+    """Rezilta yon telechajman"""
+    url: str
+    status_code: int
+    content: bytes
+    encoding: str
+    from_cache: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+@dataclass
+class _LoopClient:
+    """Kliyan ak limit yon event loop (semafò asyncio yo mare ak loop yo)"""
+    client: httpx.AsyncClient
+    global_limit: asyncio.Semaphore
+    host_limits: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+class URLFetcher:
+    """
+    Telechaje URL yo ak yon kliyan httpx pataje
+
+    - Pool koneksyon ak keep-alive (yon sèl AsyncClient)
+    - Limit konkirans global ak pa host
+    - Cache disk ak GET kondisyonèl (If-None-Match / If-Modified-Since)
+    - Analiz HTML nan asyncio.to_thread pou pa bloke event loop la
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = Path("cache/http"),
+        max_connections: int = 20,
+        per_host: int = 4,
+        max_cache_entries: int = URL_CACHE_MAX_ENTRIES,
+        timeout: float = 30.0,
+        user_agent: str = "KreyolIA/4.0 (+url-to-audio)"
+    ):
+        """
+        Args:
+            cache_dir: Dosye cache HTTP la (None = pa gen cache)
+            max_connections: Maksimòm koneksyon an menm tan (tout host)
+            per_host: Maksimòm demann an menm tan pou yon sèl host
+            max_cache_entries: Maksimòm URL nan cache disk la (0 = san limit)
+            timeout: Timeout pa demann (segonn)
+            user_agent: User-Agent pou voye
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.max_cache_entries = max_cache_entries
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+        # Yon kliyan pa event loop (Celery, thread yo kouri pwòp loop yo)
+        self._clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self.stats = {"requests": 0, "cache_revalidated": 0, "cache_stored": 0, "errors": 0}
+
+    # ------------------------------------------------------------
+    # Client
+    # ------------------------------------------------------------
+
+    async def _get_client(self) -> _LoopClient:
+        """
+        Kliyan loop aktyèl la (kreye l premye fwa)
+
+        Kliyan loop ki fèmen yo (egz. yon task Celery ki fini) fèmen
+        isit la olye yo kite koneksyon yo ouvè.
+        """
+        loop = asyncio.get_running_loop()
+        for stale_loop in [l for l in list(self._clients) if l.is_closed()]:
+            await self._close_client(self._clients.pop(stale_loop).client)
+
+        state = self._clients.get(loop)
+        if state is None:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+            # Tann isit olye de nan pool httpx la (pa gen PoolTimeout)
+            state = self._clients[loop] = _LoopClient(client, asyncio.Semaphore(self.max_connections))
+        return state
+
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception:
+            # Loop li a fèmen deja: transpò yo pa ka fèmen pwòpman ankò
+            pass
+
+    def _host_limit(self, state: _LoopClient, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        if host not in state.host_limits:
+            state.host_limits[host] = asyncio.Semaphore(self.per_host)
+        return state.host_limits[host]
+
+    async def aclose(self):
+        """Fèmen kliyan loop aktyèl la (ak sa loop ki fèmen yo) ak koneksyon yo"""
+        loop = asyncio.get_running_loop()
+        for owner in list(self._clients):
+            if owner is loop or owner.is_closed():
+                await self._close_client(self._clients.pop(owner).client)
+
+    # ------------------------------------------------------------
+    # Disk cache
+    # ------------------------------------------------------------
+
+    def _cache_paths(self, url: str) -> tuple:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _read_cache(self, url: str) -> Optional[dict]:
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("url") != url or not body_path.exists():
+                return None
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    def _read_body(self, url: str) -> bytes:
+        meta_path, body_path = self._cache_paths(url)
+        content = body_path.read_bytes()
+        try:
+            # Antre ki fèk revalide yo se dènye pou soti
+            os.utime(meta_path)
+        except OSError:
+            pass
+        return content
+
+    def _write_cache(self, url: str, response: httpx.Response):
+        meta_path, body_path = self._cache_paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Kò a anvan metadata a, chak nan yon fichye tanporè inik
+        # (de telechajman menm URL la an menm tan pa ekri menm fichye a)
+        self._replace_atomic(body_path, response.content)
+
+        meta = {
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "encoding": response.encoding,
+            "fetched_at": time.time(),
+        }
+        self._replace_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        self._evict()
+
+    def _evict(self) -> None:
+        """Retire antre ki pi ansyen yo (mtime metadata a) lè cache la depase limit la"""
+        if not self.max_cache_entries:
+            return
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((meta_path.stat().st_mtime, meta_path))
+            except OSError:
+                continue
+        if len(entries) <= self.max_cache_entries:
+            return
+        entries.sort()
+        for _, meta_path in entries[:len(entries) - self.max_cache_entries]:
+            for path in (meta_path, meta_path.with_suffix(".body")):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _replace_atomic(self, path: Path, data: bytes) -> None:
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=path.name, suffix=".tmp",
+                                         delete=False) as tmp:
+            tmp.write(data)
+        try:
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+    # ------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------
+
+    async def fetch(self, url: str) -> FetchResult:
+        """
+        Telechaje yon URL (revalide cache la si genyen)
+
+        Args:
+            url: URL pou telechaje
+
+        Returns:
+            FetchResult: Kontni, status ak si li soti nan cache
+        """
+        state = await self._get_client()
+        cached = await asyncio.to_thread(self._read_cache, url) if self.cache_dir else None
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        start = time.perf_counter()
+        # Host la anvan: yon host ki satire pa kenbe plas global yo
+        async with self._host_limit(state, url), state.global_limit:
+            self.stats["requests"] += 1
+            try:
+                response = await state.client.get(url, headers=headers)
+            except httpx.HTTPError:
+                self.stats["errors"] += 1
+                raise
+
+        if response.status_code == 304 and cached:
+            self.stats["cache_revalidated"] += 1
+            content = await asyncio.to_thread(self._read_body, url)
+            return FetchResult(url, 304, content, cached.get("encoding") or "utf-8",
+                               from_cache=True, elapsed=time.perf_counter() - start)
+
+        response.raise_for_status()
+
+        if self.cache_dir and (response.headers.get("etag") or response.headers.get("last-modified")):
+            await asyncio.to_thread(self._write_cache, url, response)
+            self.stats["cache_stored"] += 1
+
+        return FetchResult(url, response.status_code, response.content, response.encoding or "utf-8",
+                           elapsed=time.perf_counter() - start)
+
+    async def fetch_text(self, url: str) -> str:
+        """
+        Telechaje yon paj epi ekstrè tèks atik la
+
+        Args:
+            url: URL paj wèb la
+
+        Returns:
+            str: Tèks ki ekstrè
+        """
+        result = await self.fetch(url)
+        return await asyncio.to_thread(extract_article_text, result.text)
+
+    async def fetch_many_text(self, urls: List[str], return_exceptions: bool = True) -> list:
+        """
+        Telechaje epi ekstrè plizyè URL an paralèl (limit pa host aplike)
+
+        Args:
+            urls: Lis URL yo
+            return_exceptions: Retounen erè yo nan lis la olye de leve yo
+
+        Returns:
+            list: Tèks (oswa Exception) pou chak URL, nan menm lòd la
+        """
+        return await asyncio.gather(
+            *(self.fetch_text(url) for url in urls),
+            return_exceptions=return_exceptions
+        )
+
+
+_shared_fetcher: Optional[URLFetcher] = None
+
+
+def get_url_fetcher() -> URLFetcher:
+    """Jwenn URLFetcher pataje a (yon sèl pool koneksyon pou tout app la)"""
+    global _shared_fetcher
+    if _shared_fetcher is None:
+        _shared_fetcher = URLFetcher()
+    return _shared_fetcher
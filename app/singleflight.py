@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🛬 Single-flight
+Rasanble demann idantik k ap fèt an menm tan: premye a kalkile,
+lòt yo tann menm rezilta a (nan pwosesis la, ak yon lock Redis kout
+ant plizyè nœud)
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import os
+import threading
+import time
+import uuid
+import weakref
+
+# Lock ant nœud yo: dire maks (ms) ak tan maks pou tann lidè a
+SINGLEFLIGHT_LOCK_MS = int(os.getenv("SINGLEFLIGHT_LOCK_MS", "30000"))
+SINGLEFLIGHT_WAIT_SECONDS = float(os.getenv("SINGLEFLIGHT_WAIT_SECONDS", "60"))
+SINGLEFLIGHT_POLL_SECONDS = float(os.getenv("SINGLEFLIGHT_POLL_SECONDS", "0.05"))
+
+
+class _Call:
+    """Yon kalkil k ap fèt (pou apèl sync yo)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Koalesans demann idantik
+
+    - Nan pwosesis la: premye apèl pou yon kle vin lidè; lòt apèl yo
+      (thread oswa coroutine) tann rezilta l olye yo kalkile ankò.
+    - Ant nœud yo (si gen Redis ak `cache_get`): lidè a pran yon lock
+      `SET NX PX`; si yon lòt nœud gen lock la deja, nou tann valè a
+      parèt nan kachaj la olye nou lanse modèl la tou.
+
+    Example:
+        flight = SingleFlight(redis_client=redis, namespace="trans")
+        value = flight.do(key, lambda: model(text), cache_get=lambda: cache.get(key))
+        value = await flight.do_async(key, lambda: translate_async(text))
+    """
+
+    def __init__(
+        self,
+        namespace: str = "default",
+        redis_client: Any = None,
+        lock_ms: int = SINGLEFLIGHT_LOCK_MS,
+        wait_seconds: float = SINGLEFLIGHT_WAIT_SECONDS,
+        poll_seconds: float = SINGLEFLIGHT_POLL_SECONDS
+    ):
+        """
+        Args:
+            namespace: Prefiks kle lock yo
+            redis_client: Kliyan Redis pou lock ant nœud (None = lokal sèlman),
+                oswa yon fonksyon ki retounen kliyan an
+            lock_ms: Dire lock la (li ekspire si lidè a mouri)
+            wait_seconds: Tan maks pou tann yon lòt nœud
+            poll_seconds: Entèval pou tcheke kachaj la pandan n ap tann
+        """
+        self.namespace = namespace
+        self._redis = redis_client
+        self.lock_ms = lock_ms
+        self.wait_seconds = wait_seconds
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._futures: Dict[str, asyncio.Future] = {}
+        self.stats = {
+            "leaders": 0,
+            "coalesced": 0,
+            "remote_coalesced": 0,
+            "lock_timeouts": 0,
+        }
+        _instances.add(self)
+
+    @property
+    def redis(self):
+        return self._redis() if callable(self._redis) else self._redis
+
+    def _lock_key(self, key: str) -> str:
+        return f"sf:{self.namespace}:{key}"
+
+    # ------------------------------------------------------------
+    # Lock ant nœud yo
+    # ------------------------------------------------------------
+
+    def _acquire(self, key: str) -> Optional[str]:
+        """
+        Pran lock Redis la
+
+        Returns:
+            Token an si nou gen lock la (oswa "" si pa gen Redis),
+            None si yon lòt nœud genyen l
+        """
+        client = self.redis
+        if client is None:
+            return ""
+        token = uuid.uuid4().hex
+        try:
+            if client.set(self._lock_key(key), token, nx=True, px=self.lock_ms):
+                return token
+            return None
+        except Exception as e:
+            print(f"⚠️  Single-flight lock error: {e}")
+            return ""
+
+    def _release(self, key: str, token: str) -> None:
+        client = self.redis
+        if not token or client is None:
+            return
+        try:
+            # Efase sèlman lock pa nou (li ka ekspire epi yon lòt pran l)
+            current = client.get(self._lock_key(key))
+            if current is not None and (current.decode() if isinstance(current, bytes) else current) == token:
+                client.delete(self._lock_key(key))
+        except Exception as e:
+            print(f"⚠️  Single-flight unlock error: {e}")
+
+    def _lock_held(self, key: str) -> bool:
+        try:
+            return self.redis.get(self._lock_key(key)) is not None
+        except Exception:
+            return False
+
+    def _wait_remote(self, key: str, cache_get: Callable[[], Any]) -> Any:
+        """Tann yon lòt nœud: valè a nan kachaj la, oswa None si lock la tonbe"""
+        deadline = time.monotonic() + self.wait_seconds
+        while time.monotonic() < deadline:
+            value = cache_get()
+            if value is not None:
+                return value
+            if not self._lock_held(key):
+                return cache_get()
+            time.sleep(self.poll_seconds)
+        self.stats["lock_timeouts"] += 1
+        return None
+
+    async def _wait_remote_async(self, key: str, cache_get: Callable[[], Any]) -> Any:
+        # Kliyan Redis la sync: apèl yo fèt nan yon thread pou pa bloke loop la
+        deadline = time.monotonic() + self.wait_seconds
+        while time.monotonic() < deadline:
+            value = await asyncio.to_thread(cache_get)
+            if value is not None:
+                return value
+            if not await asyncio.to_thread(self._lock_held, key):
+                return await asyncio.to_thread(cache_get)
+            await asyncio.sleep(self.poll_seconds)
+        self.stats["lock_timeouts"] += 1
+        return None
+
+    # ------------------------------------------------------------
+    # Sync (threads)
+    # ------------------------------------------------------------
+
+    def _lead(self, key: str, fn: Callable[[], Any], cache_get: Optional[Callable[[], Any]]) -> Any:
+        token = self._acquire(key) if cache_get is not None else ""
+        if token is None:
+            value = self._wait_remote(key, cache_get)
+            if value is not None:
+                self.stats["remote_coalesced"] += 1
+                return value
+            token = ""
+        try:
+            return fn()
+        finally:
+            self._release(key, token)
+
+    def do(self, key: str, fn: Callable[[], Any], cache_get: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Kalkile `fn()` yon sèl fwa pou tout apèl konkiran ak menm kle a
+
+        Args:
+            key: Kle demann lan (ex: kle kachaj la)
+            fn: Kalkil la
+            cache_get: Li valè a nan kachaj pataje a (aktive lock ant nœud)
+
+        Returns:
+            Rezilta fn() (oswa valè yon lòt nœud te kalkile)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.stats["coalesced"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.stats["leaders"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._lead(key, fn, cache_get)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    # ------------------------------------------------------------
+    # Async (coroutines)
+    # ------------------------------------------------------------
+
+    async def do_async(
+        self,
+        key: str,
+        coro_fn: Callable[[], Awaitable],
+        cache_get: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        """
+        Vèsyon async `do`: coroutine konkiran yo tann menm Future a
+
+        Args:
+            key: Kle demann lan
+            coro_fn: Fonksyon ki kreye coroutine kalkil la
+            cache_get: Li valè a nan kachaj pataje a (aktive lock ant nœud)
+
+        Returns:
+            Rezilta coroutine nan
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            # shield: si yon moun k ap tann anile, lidè a kontinye
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        self.stats["leaders"] += 1
+        try:
+            token = await asyncio.to_thread(self._acquire, key) if cache_get is not None else ""
+            value = None
+            if token is None:
+                value = await self._wait_remote_async(key, cache_get)
+                if value is not None:
+                    self.stats["remote_coalesced"] += 1
+                token = ""
+            if value is None:
+                try:
+                    value = await coro_fn()
+                finally:
+                    if token:
+                        await asyncio.to_thread(self._release, key, token)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Evite "exception was never retrieved" si pèsonn pa t ap tann
+                    future.exception()
+            raise
+        finally:
+            self._futures.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Kantite kalkil k ap fèt kounye a"""
+        return len(self._calls) + len(self._futures)
+
+    def get_stats(self) -> dict:
+        return {"namespace": self.namespace, **self.stats, "in_flight": self.in_flight()}
+
+
+# ============================================================
+# REGISTRY
+# ============================================================
+
+_flights: Dict[str, SingleFlight] = {}
+# Tout SingleFlight yo (kachaj yo kreye pa yo) pou estatistik global yo
+_instances: "weakref.WeakSet[SingleFlight]" = weakref.WeakSet()
+
+
+def get_flight(namespace: str, redis_client: Any = None) -> SingleFlight:
+    """SingleFlight pataje pou yon espas non"""
+    flight = _flights.get(namespace)
+    if flight is None:
+        flight = _flights.setdefault(namespace, SingleFlight(namespace, redis_client=redis_client))
+    return flight
+
+
+def singleflight_stats() -> dict:
+    """
+    Estatistik koalesans pa espas non
+
+    Returns:
+        dict ak "namespaces" (total pa espas non) ak "total_coalesced"
+    """
+    namespaces: Dict[str, dict] = {}
+    for flight in list(_instances):
+        totals = namespaces.setdefault(flight.namespace, {name: 0 for name in flight.stats})
+        for name, value in flight.stats.items():
+            totals[name] += value
+        totals["in_flight"] = totals.get("in_flight", 0) + flight.in_flight()
+    total = sum(s["coalesced"] + s["remote_coalesced"] for s in namespaces.values())
+    return {"namespaces": namespaces, "total_coalesced": total}
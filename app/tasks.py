@@ -5,14 +5,18 @@
 Sistèm task asenkwon pou pwosesis long
 """
 
-from celery import Celery
+from celery import Celery, chord, group
+from celery.exceptions import Ignore
 from pathlib import Path
 import os
 import sys
+from typing import Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from app.artifact_cache import artifact_cache, artifact_key, hash_file
+
 # Configure Celery
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
@@ -35,179 +39,505 @@ celery_app.conf.update(
     task_soft_time_limit=3300,  # 55 minutes soft limit
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=50,
+    # Yon worker ki tonbe remèt task la nan fil la; ak checkpoint yo,
+    # travay la rekòmanse kote l te rive olye de paj 1
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
 )
 
 # ============================================================
 # AUDIOBOOK TASKS
 # ============================================================
 
+# Gwosè moso tèks pou TTS (chak moso = yon fichye odyo + yon antre manifest)
+AUDIOBOOK_CHUNK_CHARS = int(os.getenv("AUDIOBOOK_CHUNK_CHARS", "4000"))
+
+# Fan-out: voye moso yo bay tout worker yo (chord) olye de yon sèl worker
+AUDIOBOOK_FANOUT = os.getenv("AUDIOBOOK_FANOUT", "true").lower() in ("1", "true", "yes")
+AUDIOBOOK_FANOUT_MIN_CHUNKS = int(os.getenv("AUDIOBOOK_FANOUT_MIN_CHUNKS", "2"))
+# Subtask yo li manifest la nan JOBS_DIR: fan-out mande pou tout worker
+# yo wè menm dosye a (volim pataje, NFS, ...). Si se pa sa, travay la
+# rete sou yon sèl worker.
+JOBS_DIR_SHARED = os.getenv("JOBS_DIR_SHARED", "false").lower() in ("1", "true", "yes")
+# Kontè moso fini (Redis INCR) pou pwogresyon fan-out la
+AUDIOBOOK_COUNTER_TTL = int(os.getenv("AUDIOBOOK_COUNTER_TTL", "86400"))
+
+
+def _update_progress(task, current: int, status: str, stage: str, task_id: str = None, **extra):
+    """
+    Mete pwogresyon task la ajou (PROGRESS meta)
+    
+    Lè task la kouri lokalman (apply / resume CLI), pa gen backend pou
+    anrejistre eta a: nou jis afiche l.
+    
+    Args:
+        task: Task k ap rapòte a
+        current: Pousantaj (0-100)
+        status: Mesaj pou itilizatè a
+        stage: Etap pwosesis la
+        task_id: Task pou mete ajou (default: task la menm; yon moso
+                 fan-out mete task paran an ajou)
+    """
+    meta = {'current': current, 'total': 100, 'status': status, 'stage': stage, **extra}
+    if task.request.is_eager:
+        print(f"   [{current:3d}%] {status}")
+        return
+    task.update_state(task_id=task_id, state='PROGRESS', meta=meta)
+
+
+def _use_fan_out(task, fan_out, pending_count: int) -> bool:
+    """
+    Deside si moso yo ale nan yon chord oswa rete nan task la
+    
+    Raises:
+        RuntimeError: fan_out=True men JOBS_DIR pa pataje ant worker yo
+    """
+    if fan_out is None:
+        # Lokalman (resume CLI, tests) pa gen worker pou separe travay la
+        fan_out = AUDIOBOOK_FANOUT and JOBS_DIR_SHARED and not task.request.is_eager
+    elif fan_out and not JOBS_DIR_SHARED:
+        raise RuntimeError(
+            "Fan-out mande yon JOBS_DIR pataje ant worker yo (mete JOBS_DIR_SHARED=true)"
+        )
+    return bool(fan_out) and pending_count >= AUDIOBOOK_FANOUT_MIN_CHUNKS
+
+
+def _chunk_counter_key(job_id: str) -> str:
+    return f"audiobook:{job_id}:chunks_done"
+
+
+def _start_chunk_counter(job_id: str, done: int) -> None:
+    """Inisyalize kontè moso fini yo (moso reitilize yo deja konte)"""
+    from app.cache_tiered import get_redis_client
+    
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.set(_chunk_counter_key(job_id), done, ex=AUDIOBOOK_COUNTER_TTL)
+    except Exception as e:
+        print(f"⚠️  Kontè moso pa inisyalize: {e}")
+
+
+def _clear_chunk_counter(job_id: str) -> None:
+    from app.cache_tiered import get_redis_client
+    
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.delete(_chunk_counter_key(job_id))
+    except Exception:
+        pass
+
+
+def _count_done_chunk(job_id: str) -> Optional[int]:
+    """
+    Konte yon moso fini (Redis INCR atomik, tout worker yo ansanm)
+    
+    Returns:
+        int: Kantite moso fini, oswa None si Redis pa disponib
+    """
+    from app.cache_tiered import get_redis_client
+    
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        return int(client.incr(_chunk_counter_key(job_id)))
+    except Exception as e:
+        print(f"⚠️  Kontè moso pa disponib: {e}")
+        return None
+
+
+def synthesize_job_chunk(job_id: str, index: int, voice: str) -> str:
+    """
+    Jenere odyo yon moso nan manifest travay la epi make l fini
+    
+    Args:
+        job_id: ID travay la
+        index: Endis moso a
+        voice: Vwa pou itilize
+    
+    Returns:
+        str: Chemen fichye odyo moso a
+    """
+    from app.job_manifest import JobManifest
+    from app.services.tts_service import TTSService
+    import asyncio
+    
+    manifest = JobManifest.load(job_id)
+    chunk = manifest.chunk(index)
+    audio_path = manifest.audio_path_for(index)
+    
+    loop = asyncio.new_event_loop()
+    try:
+        produced = loop.run_until_complete(
+            TTSService().text_to_speech_file(chunk["text"], str(audio_path), voice)
+        )
+    finally:
+        loop.close()
+    
+    # Kreyòl natif la ka ekri yon WAV si ffmpeg pa la
+    produced = Path(produced) if produced else audio_path
+    if not produced.exists() and audio_path.with_suffix('.wav').exists():
+        produced = audio_path.with_suffix('.wav')
+    
+    manifest.mark_done(index, produced)
+    return str(produced)
+
+
 @celery_app.task(bind=True, name='app.tasks.process_audiobook')
-def process_audiobook(self, file_path: str, voice: str, max_pages: int = None):
+def process_audiobook(self, file_path: str, voice: str, max_pages: int = None, tenant: str = None, job_id: str = None, fan_out: bool = None):
     """
     Pwosese audiobook nan background ak progress tracking
     
+    Travay la gen yon manifest (output/jobs/<job_id>/) ak estati chak moso:
+    si task la rekòmanse (time limit, worker ki tonbe, resume CLI), moso
+    ki deja fini yo pa refèt.
+    
+    Ak fan-out, task la ranplase tèt li ak yon chord: yon subtask pa moso
+    (synthesize_audiobook_chunk) sou tout worker yo, epi merge_audiobook_chunks
+    mete odyo a ansanm. Rezilta final la rete sou ID task sa a.
+    
     Args:
         self: Task instance (auto-injected by bind=True)
         file_path: Chemen fichye dokiman
         voice: Vwa pou itilize
         max_pages: Limit paj (optional)
+        tenant: Tenant pou limit paj (PAGE_BUDGET_<TENANT>, optional)
+        job_id: ID travay pou rekòmanse (default: ID task la)
+        fan_out: Separe moso yo sou worker yo (default: AUDIOBOOK_FANOUT
+                 lè task la pa kouri lokalman)
     
     Returns:
         dict: Rezilta ak chemen fichye yo
     """
+    from app.job_manifest import JobManifest
+    
+    job_id = job_id or self.request.id
+    manifest = JobManifest(job_id)
+    
     try:
         from app.services.media_service import MediaService
-        from app.services.tts_service import TTSService
+        from src.utils import smart_chunk_text
         import asyncio
         
         print(f"\n{'='*60}")
         print(f"📚 BACKGROUND AUDIOBOOK TASK START")
         print(f"   Task ID: {self.request.id}")
+        print(f"   Job ID: {job_id}")
         print(f"   File: {file_path}")
         print(f"   Voice: {voice}")
         print(f"{'='*60}\n")
         
-        # Update state: Starting
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 0,
-                'total': 100,
-                'status': 'Kòmanse pwosesis...',
-                'stage': 'initialization'
-            }
-        )
+        # Travay ki deja fini: retounen rezilta a
+        if manifest.status == "complete" and manifest.data.get("result"):
+            print("♻️  Travay sa a deja fini")
+            return manifest.data["result"]
         
-        # Initialize services
-        media_service = MediaService()
-        tts_service = TTSService()
-        
-        # Stage 1: Extract text (0-40%)
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 5,
-                'total': 100,
-                'status': 'Ekstrè tèks soti nan dokiman...',
-                'stage': 'extraction'
-            }
+        # Menm dokiman + menm opsyon deja fèt nan yon lòt travay: pa refè anyen
+        cache_key = manifest.params.get('artifact_key') or _audiobook_artifact_key(
+            file_path, voice, max_pages, tenant
         )
+        cached = artifact_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            Path(file_path).unlink(missing_ok=True)
+            _update_progress(self, 100, 'Liv odyo deja egziste! ♻️', 'complete')
+            return {**cached, 'job_id': job_id}
+        
+        manifest.start({
+            'file_path': file_path,
+            'voice': voice,
+            'max_pages': max_pages,
+            'tenant': tenant,
+            'artifact_key': cache_key
+        })
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Update state: Starting
+        _update_progress(self, 0, 'Kòmanse pwosesis...', 'initialization')
         
-        text = loop.run_until_complete(
-            media_service.extract_text_from_document(
-                file_path,
-                max_pages=max_pages,
-                show_progress=False  # We handle progress here
+        # Stage 1: Extract text (0-40%)
+        _update_progress(self, 5, 'Ekstrè tèks soti nan dokiman...', 'extraction')
+        
+        def report_extraction(pages_done: int, pages_total: int):
+            """Paj ekstrè → 5-40% pwogresyon"""
+            _update_progress(
+                self,
+                5 + int(35 * pages_done / max(pages_total, 1)),
+                f'Ekstrè paj {pages_done:,}/{pages_total:,}...',
+                'extraction',
+                pages_done=pages_done,
+                pages_total=pages_total
             )
-        )
         
-        if not text or len(text.strip()) < 10:
-            raise ValueError("Dokiman an vid oswa pa gen ase tèks!")
+        text = manifest.load_text()
+        if text is None:
+            media_service = MediaService()
+            loop = asyncio.new_event_loop()
+            try:
+                text = loop.run_until_complete(
+                    media_service.extract_text_from_document(
+                        file_path,
+                        max_pages=max_pages,
+                        show_progress=False,  # We handle progress here
+                        job_id=job_id,
+                        progress_callback=report_extraction,
+                        tenant=tenant
+                    )
+                )
+            finally:
+                loop.close()
+            
+            if not text or len(text.strip()) < 10:
+                raise ValueError("Dokiman an vid oswa pa gen ase tèks!")
+            manifest.save_text(text)
+        else:
+            print("♻️  Tèks ekstrè reitilize soti nan manifest la")
         
         word_count = len(text.split())
         char_count = len(text)
         
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 40,
-                'total': 100,
-                'status': f'Ekstraksyon konple! {word_count:,} mo ekstrè.',
-                'stage': 'extraction_complete',
-                'word_count': word_count,
-                'char_count': char_count
-            }
-        )
+        chunks = smart_chunk_text(text, max_size=AUDIOBOOK_CHUNK_CHARS)
+        plan = manifest.prepare_chunks(chunks)
         
-        # Stage 2: Generate audio (40-90%)
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 45,
-                'total': 100,
-                'status': 'Jenere odyo...',
-                'stage': 'audio_generation'
-            }
-        )
-        
-        from datetime import datetime
-        audio_filename = f"audiobook_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
-        audio_path = Path("output") / audio_filename
-        audio_path.parent.mkdir(exist_ok=True)
-        
-        # Generate audio
-        loop.run_until_complete(
-            tts_service.text_to_speech_file(text, str(audio_path), voice)
+        _update_progress(
+            self, 40, f'Ekstraksyon konple! {word_count:,} mo ekstrè.', 'extraction_complete',
+            word_count=word_count,
+            char_count=char_count,
+            chunks_total=plan['total'],
+            chunks_reused=plan['reused']
         )
         
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 85,
-                'total': 100,
-                'status': 'Odyo kreye! Finalizasyon...',
-                'stage': 'audio_complete'
-            }
-        )
+        # Stage 2: Generate audio (40-85%), sèlman moso ki manke yo
+        pending = manifest.pending_chunks()
+        print(f"🧩 Moso: {plan['total']} total, {plan['reused']} reitilize, {len(pending)} pou jenere")
         
-        # Stage 3: Save metadata (90-100%)
-        preview_filename = f"audiobook_{datetime.now().strftime('%Y%m%d_%H%M%S')}_text.txt"
-        preview_path = Path("output") / preview_filename
-        preview_path.write_text(
-            text[:1000] + "..." if len(text) > 1000 else text,
-            encoding='utf-8'
-        )
-        
-        self.update_state(
-            state='PROGRESS',
-            meta={
-                'current': 95,
-                'total': 100,
-                'status': 'Finalizasyon...',
-                'stage': 'finalization'
-            }
-        )
-        
-        # Cleanup
-        Path(file_path).unlink(missing_ok=True)
-        
-        # Final result
-        result = {
-            'status': 'success',
-            'audio': f"/output/{audio_filename}",
-            'preview': f"/output/{preview_filename}",
-            'stats': {
-                'word_count': word_count,
-                'char_count': char_count,
-                'voice': voice
-            }
-        }
-        
-        print(f"\n✅ AUDIOBOOK TASK COMPLETE!")
-        print(f"   Audio: {audio_filename}")
-        print(f"   Words: {word_count:,}")
-        print(f"{'='*60}\n")
+        if _use_fan_out(self, fan_out, len(pending)):
+            print(f"🌐 Fan-out: {len(pending)} moso voye bay worker yo")
+            _start_chunk_counter(job_id, plan['reused'])
+            header = group(
+                synthesize_audiobook_chunk.s(job_id, index, voice, self.request.id, plan['total'])
+                for index in pending
+            )
+            callback = merge_audiobook_chunks.s(job_id).on_error(
+                audiobook_job_failed.s(job_id=job_id)
+            )
+            return self.replace(chord(header, callback))
+        
+        for done, index in enumerate(pending, 1):
+            synthesize_job_chunk(job_id, index, voice)
+            manifest.recomputed += 1
+            _update_progress(
+                self,
+                40 + int(45 * (plan['reused'] + done) / max(plan['total'], 1)),
+                f'Jenere odyo: moso {plan["reused"] + done}/{plan["total"]}',
+                'audio_generation',
+                chunks_done=plan['reused'] + done,
+                chunks_total=plan['total']
+            )
         
-        return result
+        return _finalize_audiobook(self, manifest)
         
+    except Ignore:
+        # self.replace(): chord la pran plas task la
+        raise
     except Exception as e:
         print(f"\n❌ AUDIOBOOK TASK FAILED: {str(e)}\n")
-        self.update_state(
-            state='FAILURE',
-            meta={
-                'current': 0,
-                'total': 100,
-                'status': f'Erè: {str(e)}',
-                'stage': 'failed',
-                'error': str(e)
-            }
+        if manifest.exists():
+            manifest.fail(str(e))
+        if not self.request.is_eager:
+            self.update_state(
+                state='FAILURE',
+                meta={
+                    'current': 0,
+                    'total': 100,
+                    'status': f'Erè: {str(e)}',
+                    'stage': 'failed',
+                    'error': str(e)
+                }
+            )
+        raise
+
+
+def _audiobook_artifact_key(file_path: str, voice: str, max_pages: int = None, tenant: str = None):
+    """
+    Kle artifact cache pou yon audiobook (None si fichye a pa la)
+    
+    Limit paj tenant la chanje tèks la, kidonk se limit efektif la ki
+    nan kle a (pa tenant la): de tenant ak menm limit pataje rezilta a.
+    """
+    from app.services.extraction_checkpoint import get_page_budget
+    
+    if not file_path or not Path(file_path).exists():
+        return None
+    page_budget = get_page_budget(tenant)
+    if page_budget and (not max_pages or page_budget < max_pages):
+        max_pages = page_budget
+    return artifact_key(
+        hash_file(file_path), "audiobook_job",
+        suffix=Path(file_path).suffix.lower(),
+        voice=voice,
+        max_pages=max_pages,
+        chunk_chars=AUDIOBOOK_CHUNK_CHARS
+    )
+
+
+def _finalize_audiobook(task, manifest) -> dict:
+    """
+    Mete odyo moso yo ansanm, ekri preview a epi fèmen manifest la
+    
+    Args:
+        task: Task k ap rapòte pwogresyon an
+        manifest: Manifest travay la (tout moso fini)
+    
+    Returns:
+        dict: Rezilta final travay la
+    """
+    from app.job_manifest import merge_audio_files
+    from app.services.extraction_checkpoint import ExtractionCheckpoint
+    from datetime import datetime
+    
+    text = manifest.load_text() or ""
+    word_count = len(text.split())
+    char_count = len(text)
+    voice = manifest.params.get('voice')
+    
+    audio_filename = f"audiobook_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
+    audio_path = merge_audio_files(manifest.audio_paths(), Path("output") / audio_filename)
+    audio_filename = audio_path.name
+    
+    _update_progress(task, 85, 'Odyo kreye! Finalizasyon...', 'audio_complete')
+    
+    # Stage 3: Save metadata (90-100%)
+    preview_filename = f"audiobook_{datetime.now().strftime('%Y%m%d_%H%M%S')}_text.txt"
+    preview_path = Path("output") / preview_filename
+    preview_path.write_text(
+        text[:1000] + "..." if len(text) > 1000 else text,
+        encoding='utf-8'
+    )
+    
+    _update_progress(task, 95, 'Finalizasyon...', 'finalization')
+    
+    # Cleanup
+    if manifest.params.get('file_path'):
+        Path(manifest.params['file_path']).unlink(missing_ok=True)
+    ExtractionCheckpoint(manifest.job_id).clear()
+    
+    # Final result
+    report = manifest.report()
+    result = {
+        'status': 'success',
+        'job_id': manifest.job_id,
+        'audio': f"/output/{audio_filename}",
+        'preview': f"/output/{preview_filename}",
+        'stats': {
+            'word_count': word_count,
+            'char_count': char_count,
+            'voice': voice,
+            'chunks': report
+        }
+    }
+    manifest.complete(result)
+    if manifest.params.get('artifact_key'):
+        artifact_cache.put(manifest.params['artifact_key'], result, kind="audiobook_job")
+    
+    print(f"\n✅ AUDIOBOOK TASK COMPLETE!")
+    print(f"   Audio: {audio_filename}")
+    print(f"   Words: {word_count:,}")
+    print(f"   Moso: {report['reused']} reitilize, {report['recomputed']} refèt")
+    print(f"{'='*60}\n")
+    
+    return result
+
+
+@celery_app.task(
+    bind=True,
+    name='app.tasks.synthesize_audiobook_chunk',
+    autoretry_for=(Exception,),
+    max_retries=2,
+    retry_backoff=True
+)
+def synthesize_audiobook_chunk(self, job_id: str, index: int, voice: str, parent_id: str = None, total: int = 0):
+    """
+    Subtask fan-out: jenere odyo yon sèl moso sou nenpòt worker
+    
+    Manifest la ak odyo a rete nan JOBS_DIR, ki dwe pataje ant worker yo
+    (JOBS_DIR_SHARED). Yon worker ki pa wè manifest la echwe touswit.
+    
+    Args:
+        job_id: ID travay la
+        index: Endis moso a
+        voice: Vwa pou itilize
+        parent_id: Task process_audiobook la (pou PROGRESS meta li)
+        total: Kantite moso nan travay la
+    
+    Returns:
+        str: Chemen fichye odyo moso a
+    
+    Raises:
+        RuntimeError: Manifest la pa vizib sou worker sa a
+    """
+    from app.job_manifest import JobManifest
+    
+    if not JobManifest(job_id).exists():
+        raise RuntimeError(
+            f"Manifest travay {job_id} pa vizib sou worker sa a: "
+            f"JOBS_DIR dwe pataje ant tout worker yo pou fan-out"
         )
+    
+    audio_path = synthesize_job_chunk(job_id, index, voice)
+    
+    # Yon INCR atomik olye de reli tout moso yo (O(n) pa subtask)
+    done = _count_done_chunk(job_id)
+    if done is None:
+        return audio_path
+    _update_progress(
+        self,
+        40 + int(45 * done / max(total, 1)),
+        f'Jenere odyo: moso {done}/{total}',
+        'audio_generation',
+        task_id=parent_id,
+        chunks_done=done,
+        chunks_total=total
+    )
+    return audio_path
+
+
+@celery_app.task(bind=True, name='app.tasks.merge_audiobook_chunks')
+def merge_audiobook_chunks(self, chunk_paths: list, job_id: str):
+    """
+    Callback chord la: tout moso fini, mete odyo a ansanm
+    
+    Args:
+        chunk_paths: Rezilta subtask yo (chemen odyo moso ki te refèt)
+        job_id: ID travay la
+    
+    Returns:
+        dict: Rezilta final travay la (anrejistre sou ID task paran an)
+    """
+    from app.job_manifest import JobManifest
+    
+    manifest = JobManifest.load(job_id)
+    manifest.recomputed = len(chunk_paths)
+    _clear_chunk_counter(job_id)
+    try:
+        return _finalize_audiobook(self, manifest)
+    except Exception as e:
+        print(f"\n❌ AUDIOBOOK MERGE FAILED: {str(e)}\n")
+        manifest.fail(str(e))
         raise
 
 
+@celery_app.task(name='app.tasks.audiobook_job_failed')
+def audiobook_job_failed(request, exc, traceback, job_id: str):
+    """Errback chord la: yon moso echwe nèt, make travay la echwe"""
+    from app.job_manifest import JobManifest
+    
+    print(f"\n❌ AUDIOBOOK CHUNK FAILED ({job_id}): {exc}\n")
+    JobManifest(job_id).fail(str(exc))
+
+
 @celery_app.task(bind=True, name='app.tasks.process_translation')
 def process_translation(self, text: str, target_lang: str):
     """
@@ -378,10 +708,74 @@ def get_task_status(task_id: str) -> dict:
         }
 
 
+def resume_job(job_id: str, queue: bool = False) -> dict:
+    """
+    Rekòmanse yon travay audiobook apati manifest li
+    
+    Args:
+        job_id: ID travay la (output/jobs/<job_id>)
+        queue: Voye l bay worker Celery yo olye de kouri l isit la
+    
+    Returns:
+        dict: Rezilta task la (oswa task_id si queue=True)
+    """
+    from app.job_manifest import JobManifest
+    
+    manifest = JobManifest.load(job_id)
+    params = manifest.params
+    kwargs = {
+        'file_path': params.get('file_path'),
+        'voice': params.get('voice', 'creole-native'),
+        'max_pages': params.get('max_pages'),
+        'tenant': params.get('tenant'),
+        'job_id': job_id,
+        # Lokalman: pa gen worker pou separe moso yo; nan fil la,
+        # AUDIOBOOK_FANOUT / JOBS_DIR_SHARED deside
+        'fan_out': None if queue else False
+    }
+    
+    if queue:
+        task = process_audiobook.apply_async(kwargs=kwargs)
+        return {'status': 'queued', 'task_id': task.id, 'job_id': job_id}
+    
+    return process_audiobook.apply(kwargs=kwargs, task_id=job_id).get()
+
+
+def _resume_main(job: str, queue: bool = False) -> int:
+    """
+    Kòmand `resume` la: rekòmanse travay la epi enprime rezilta a
+
+    Returns:
+        int: Kòd sòti (0 si travay la reyisi oswa voye nan fil la)
+    """
+    try:
+        outcome = resume_job(job, queue=queue)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return 1
+    
+    status = outcome.get('status')
+    print(f"\n📋 Travay {job}: {status}")
+    chunks = outcome.get('stats', {}).get('chunks')
+    if chunks:
+        print(f"   ♻️  Reitilize: {chunks['reused']}/{chunks['chunks']} moso")
+        print(f"   🔁 Refèt: {chunks['recomputed']}/{chunks['chunks']} moso")
+    if outcome.get('audio'):
+        print(f"   🎧 Odyo: {outcome['audio']}")
+    return 0 if status in ('success', 'queued') else 1
+
+
 if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "resume":
+        # python app/tasks.py resume <job_id> [--queue]
+        sys.exit(_resume_main(sys.argv[2], queue="--queue" in sys.argv[3:]))
+    
     print("🔄 Celery Worker")
     print("=" * 60)
     print("Pou lance worker la:")
     print("  celery -A app.tasks worker --loglevel=info --pool=solo")
+    print()
+    print("Pou rekòmanse yon travay audiobook:")
+    print("  python app/tasks.py resume <job_id> [--queue]")
     print("=" * 60)
 
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔥 Cache Warmup
+Chofe yon worker anvan li resevwa trafik: chaje modèl yo, fè yon
+enferans bidon, epi pre-tradwi / pre-jenere fraz demo ak preview vwa
+yo nan kachaj yo
+
+Itilizasyon:
+    python -m app.warmup                       # fraz default + data/*.txt
+    python -m app.warmup --phrases fraz.txt --voices creole-native,openai-nova
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import glob
+import os
+import re
+import tempfile
+import threading
+import time
+
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+# Yon fraz pa liy (liy vid ak liy ki kòmanse ak # inyore)
+WARMUP_PHRASES_FILE = os.getenv("WARMUP_PHRASES_FILE", "")
+WARMUP_SAMPLES_GLOB = os.getenv("WARMUP_SAMPLES_GLOB", "data/*.txt")
+WARMUP_SAMPLE_CHARS = int(os.getenv("WARMUP_SAMPLE_CHARS", "500"))
+WARMUP_VOICES = os.getenv("WARMUP_VOICES", "creole-native")
+# Pè lang "sous:sib" (sa paj yo voye: source_lang default "auto")
+WARMUP_LANG_PAIRS = os.getenv("WARMUP_LANG_PAIRS", "auto:ht")
+# Apre tan sa a, readiness pa tann warmup la ankò (yon modèl ki pa reponn
+# pa dwe kenbe worker la deyò pou tout tan)
+WARMUP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_TIMEOUT_SECONDS", "600"))
+
+# Tèks paj yo mande plis (preview vwa, demo)
+DEFAULT_PHRASES = [
+    "Bonjou! Byenveni nan Kreyòl IA Studio.",
+    "Mwen se vwa natif kreyòl ayisyen an.",
+    "Kreyòl se lang tout Ayisyen.",
+    "Mèsi paske ou itilize sèvis nou an.",
+]
+
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s|$)")
+
+
+def _split_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _lang_pairs(value: str) -> List[Tuple[str, str]]:
+    pairs = []
+    for item in _split_list(value):
+        source, _, target = item.partition(":")
+        pairs.append((source or "auto", target or "ht"))
+    return pairs
+
+
+def sample_text(text: str, max_chars: int = WARMUP_SAMPLE_CHARS) -> str:
+    """Kòmansman yon tèks, koupe nan fen yon fraz si posib"""
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+    head = text[:max_chars]
+    ends = [m.end() for m in _SENTENCE_END_RE.finditer(head)]
+    return head[:ends[-1]] if ends else head
+
+
+def load_phrases(
+    phrases_file: str = WARMUP_PHRASES_FILE,
+    samples_glob: str = WARMUP_SAMPLES_GLOB,
+    sample_chars: int = WARMUP_SAMPLE_CHARS
+) -> List[str]:
+    """
+    Lis tèks pou chofe
+
+    Args:
+        phrases_file: Fichye fraz (default: DEFAULT_PHRASES)
+        samples_glob: Echantiyon tèks (premye sample_chars karaktè chak fichye)
+        sample_chars: Gwosè maks chak echantiyon
+
+    Returns:
+        Tèks yo, san doublon, nan lòd
+    """
+    if phrases_file:
+        lines = Path(phrases_file).read_text(encoding="utf-8").splitlines()
+        phrases = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    else:
+        phrases = list(DEFAULT_PHRASES)
+
+    if samples_glob:
+        for path in sorted(glob.glob(samples_glob)):
+            try:
+                sample = sample_text(Path(path).read_text(encoding="utf-8"), sample_chars)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"⚠️  Warmup: pa ka li {path}: {e}")
+                continue
+            if sample:
+                phrases.append(sample)
+
+    return list(dict.fromkeys(phrases))
+
+
+class Warmup:
+    """
+    Warmup yon worker
+
+    Etap yo:
+        1. modèl: enpòte/chaje modèl TTS la epi fè yon enferans bidon
+           (inisyalizasyon lazy torch/transformers), plis yon tradiksyon
+        2. tradiksyon: chak tèks x chak pè lang → kachaj "trans"
+        3. sentèz: chak tèks x chak vwa → kachaj "audio" (menm kle ak /api/tts)
+
+    Yon etap ki echwe pa bloke lòt yo; erè yo nan rapò a. is_ready()
+    vin True lè warmup la fini (oswa li dezaktive, oswa li depase timeout).
+
+    Example:
+        warmup = Warmup.from_env()
+        health_checker.add_readiness_gate("warmup", warmup.is_ready)
+        warmup.start_background()
+    """
+
+    def __init__(
+        self,
+        phrases: List[str],
+        voices: List[str],
+        lang_pairs: List[Tuple[str, str]],
+        tts_service: Any = None,
+        translator: Any = None,
+        enabled: bool = True,
+        timeout: float = WARMUP_TIMEOUT_SECONDS
+    ):
+        """
+        Args:
+            phrases: Tèks pou pre-tradwi ak pre-jenere
+            voices: Vwa pou pre-jenere (vid = pa gen sentèz)
+            lang_pairs: Pè (sous, sib) pou pre-tradwi (vid = pa gen tradiksyon)
+            tts_service: TTSService (default: yon nouvo)
+            translator: NLLBTranslator (default: yon nouvo)
+            enabled: False = readiness pa tann anyen
+            timeout: Tan maks readiness tann warmup la
+        """
+        self.phrases = phrases
+        self.voices = voices
+        self.lang_pairs = lang_pairs
+        self._tts_service = tts_service
+        self._translator = translator
+        self.enabled = enabled
+        self.timeout = timeout
+        self.status = "pending" if enabled else "disabled"
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self.report: Dict[str, Any] = {
+            "models": {},
+            "translated": 0,
+            "synthesized": 0,
+            "already_cached": 0,
+            "errors": [],
+        }
+
+    @classmethod
+    def from_env(cls, **overrides) -> "Warmup":
+        """Warmup konfigire ak varyab anviwònman WARMUP_* yo"""
+        params = {
+            "phrases": load_phrases(),
+            "voices": _split_list(WARMUP_VOICES),
+            "lang_pairs": _lang_pairs(WARMUP_LANG_PAIRS),
+            "enabled": WARMUP_ENABLED,
+        }
+        params.update(overrides)
+        return cls(**params)
+
+    @property
+    def tts_service(self):
+        if self._tts_service is None:
+            from app.services.tts_service import TTSService
+            self._tts_service = TTSService()
+        return self._tts_service
+
+    @property
+    def translator(self):
+        if self._translator is None:
+            from app.nllb_translator import NLLBTranslator
+            self._translator = NLLBTranslator()
+        return self._translator
+
+    def _error(self, step: str, error: Exception) -> None:
+        print(f"⚠️  Warmup {step}: {error}")
+        self.report["errors"].append({"step": step, "error": str(error)})
+
+    # ------------------------------------------------------------
+    # Etap yo
+    # ------------------------------------------------------------
+
+    async def _load_models(self) -> None:
+        """Chaje modèl yo + yon enferans bidon pou chak motè"""
+        if self.voices:
+            start = time.perf_counter()
+            try:
+                with tempfile.TemporaryDirectory() as tmp:
+                    await self.tts_service.text_to_speech_file(
+                        "Bonjou.", str(Path(tmp) / "warmup.mp3"), self.voices[0]
+                    )
+                self.report["models"]["tts"] = round(time.perf_counter() - start, 2)
+            except Exception as e:
+                self._error("tts_model", e)
+
+        if self.lang_pairs:
+            start = time.perf_counter()
+            source, target = self.lang_pairs[0]
+            result = self.translator.translate("Bonjour", source, target)
+            if result.get("success"):
+                self.report["models"]["translation"] = round(time.perf_counter() - start, 2)
+            else:
+                self._error("translation_model", Exception(result.get("error", "translation failed")))
+
+    def _translate_all(self) -> None:
+        from app.cache_tiered import translation_cache, translation_key
+
+        for source, target in self.lang_pairs:
+            for text in self.phrases:
+                # Menm kle ak /api/translate
+                key = translation_key(text, source, target)
+                if translation_cache.get(key) is not None:
+                    self.report["already_cached"] += 1
+                    continue
+                result = self.translator.translate(text, source, target)
+                if not result.get("success"):
+                    self._error("translate", Exception(result.get("error", "translation failed")))
+                    continue
+                # Fraz warmup yo fèt pou pataje: yo pa tann admisyon L2 a
+                translation_cache.set(key, result["translated_text"], force=True)
+                self.report["translated"] += 1
+
+    async def _synthesize_all(self) -> None:
+        service = self.tts_service
+        for voice in self.voices:
+            for text in self.phrases:
+                if service.cached_speech(text, voice) is not None:
+                    self.report["already_cached"] += 1
+                    continue
+                try:
+                    audio_path = await service.generate_speech(text, voice)
+                except Exception as e:
+                    self._error("synthesize", e)
+                    continue
+                service.remember_speech(text, voice, audio_path, force=True)
+                self.report["synthesized"] += 1
+
+    async def run(self) -> dict:
+        """
+        Fè tout warmup la
+
+        Returns:
+            Rapò a (tan modèl, kantite tradwi/jenere, erè)
+        """
+        self.status = "running"
+        self.started_at = time.time()
+        print(f"🔥 Warmup: {len(self.phrases)} tèks, vwa {self.voices}, lang {self.lang_pairs}")
+        try:
+            await self._load_models()
+            if self.lang_pairs:
+                self._translate_all()
+            if self.voices:
+                await self._synthesize_all()
+        except Exception as e:
+            self._error("warmup", e)
+        finally:
+            self.finished_at = time.time()
+            self.report["seconds"] = round(self.finished_at - self.started_at, 2)
+            self.status = "complete"
+        print(f"✅ Warmup fini: {self.report['translated']} tradwi, "
+              f"{self.report['synthesized']} jenere, {self.report['already_cached']} deja nan kachaj, "
+              f"{len(self.report['errors'])} erè ({self.report['seconds']}s)")
+        return self.report
+
+    def start_background(self) -> Optional[threading.Thread]:
+        """Lanse warmup la nan yon thread (sèvè a reponn liveness pandan l ap chofe)"""
+        if not self.enabled or self._thread is not None:
+            return self._thread
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self.run()), name="warmup", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    # ------------------------------------------------------------
+    # Readiness
+    # ------------------------------------------------------------
+
+    def is_ready(self) -> bool:
+        """True lè worker la ka resevwa trafik"""
+        if self.status in ("complete", "disabled"):
+            return True
+        if self.started_at is not None and time.time() - self.started_at > self.timeout:
+            return True
+        return False
+
+    def get_status(self) -> dict:
+        return {
+            "status": self.status,
+            "ready": self.is_ready(),
+            "phrases": len(self.phrases),
+            "voices": self.voices,
+            "lang_pairs": [f"{s}:{t}" for s, t in self.lang_pairs],
+            **self.report,
+        }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="🔥 Chofe kachaj yo (tradiksyon + TTS)")
+    parser.add_argument("--phrases", default=WARMUP_PHRASES_FILE, help="Fichye fraz (yon pa liy)")
+    parser.add_argument("--samples", default=WARMUP_SAMPLES_GLOB, help="Glob echantiyon tèks")
+    parser.add_argument("--voices", default=WARMUP_VOICES, help="Vwa yo, separe ak vigil")
+    parser.add_argument("--langs", default=WARMUP_LANG_PAIRS, help="Pè lang sous:sib, separe ak vigil")
+    parser.add_argument("--no-tts", action="store_true", help="Pa pre-jenere odyo")
+    parser.add_argument("--no-translate", action="store_true", help="Pa pre-tradwi")
+    args = parser.parse_args(argv)
+
+    warmup = Warmup(
+        phrases=load_phrases(args.phrases, args.samples),
+        voices=[] if args.no_tts else _split_list(args.voices),
+        lang_pairs=[] if args.no_translate else _lang_pairs(args.langs),
+    )
+    report = asyncio.run(warmup.run())
+    for error in report["errors"]:
+        print(f"   ❌ {error['step']}: {error['error']}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
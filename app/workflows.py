@@ -18,6 +18,7 @@ from app.services.media_service import (
     generate_soundtrack_for_video,
 )
 from app.nllb_translator import NLLBTranslator
+from app.scheduler import WorkflowScheduler
 import os
 import asyncio
 from pathlib import Path
@@ -276,46 +277,96 @@ async def ai_soundtrack_generator(video_file: str, out_dir: str) -> dict:
 # BATCH PROCESSING
 # ============================================================
 
-async def batch_process_audiobooks(file_paths: list, voice: str, out_base_dir: str) -> list:
+async def batch_process_audiobooks(
+    file_paths: list,
+    voice: str,
+    out_base_dir: str,
+    max_concurrency: int = 2,
+    timeout: float = None
+) -> list:
     """
     Pwosese plizyè audiobook an menm tan
     
+    Yon WorkflowScheduler limite kantite audiobook k ap kouri an menm tan;
+    lòt yo tann nan fil la san yo pa kreye.
+    
     Args:
         file_paths: Lis chemen fichye yo
         voice: Vwa pou itilize
         out_base_dir: Dosye baz pou sove rezilta yo
+        max_concurrency: Maksimòm audiobook an menm tan
+        timeout: Timeout pa audiobook an segonn (optional)
         
     Returns:
-        list: Lis rezilta yo
+        list: Lis rezilta yo (oswa eksepsyon an), nan lòd fichye yo
     """
-    tasks = []
+    scheduler = WorkflowScheduler(max_concurrency=max_concurrency, default_timeout=timeout)
     for i, file_path in enumerate(file_paths):
         out_dir = os.path.join(out_base_dir, f"audiobook_{i+1}")
-        os.makedirs(out_dir, exist_ok=True)
-        tasks.append(create_audiobook(file_path, voice, out_dir))
+        scheduler.submit(
+            lambda file_path=file_path, out_dir=out_dir: _in_dir(out_dir, create_audiobook, file_path, voice),
+            key=file_path
+        )
     
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    return results
+    return await scheduler.run_all()
 
 
-async def batch_url_to_audio(urls: list, voice: str, out_base_dir: str) -> list:
+async def batch_url_to_audio(
+    urls: list,
+    voice: str,
+    out_base_dir: str,
+    max_concurrency: int = 4,
+    timeout: float = None
+) -> list:
     """
     Konvèti plizyè URL an odyo an menm tan
     
+    Telechajman yo pataje pool koneksyon URLFetcher la (limit pa host);
+    max_concurrency limite kantite URL k ap pwosese (TTS) an menm tan.
+    
     Args:
         urls: Lis URL yo
         voice: Vwa pou itilize
         out_base_dir: Dosye baz pou sove rezilta yo
+        max_concurrency: Maksimòm URL an menm tan
+        timeout: Timeout pa URL an segonn (optional)
         
     Returns:
-        list: Lis rezilta yo
+        list: Lis rezilta yo (oswa eksepsyon an), nan lòd URL yo
+    """
+    return await _url_scheduler(urls, voice, out_base_dir, max_concurrency, timeout).run_all()
+
+
+async def stream_url_to_audio(
+    urls: list,
+    voice: str,
+    out_base_dir: str,
+    max_concurrency: int = 4,
+    timeout: float = None
+):
     """
-    tasks = []
+    Menm jan ak batch_url_to_audio, men bay chak rezilta lè l fini
+    
+    Yields:
+        JobResult: key = URL la, status = ok/error/timeout/cancelled
+    """
+    scheduler = _url_scheduler(urls, voice, out_base_dir, max_concurrency, timeout)
+    async for job in scheduler.as_completed():
+        yield job
+
+
+def _url_scheduler(urls: list, voice: str, out_base_dir: str, max_concurrency: int, timeout: float) -> WorkflowScheduler:
+    scheduler = WorkflowScheduler(max_concurrency=max_concurrency, default_timeout=timeout)
     for i, url in enumerate(urls):
         out_dir = os.path.join(out_base_dir, f"url_audio_{i+1}")
-        os.makedirs(out_dir, exist_ok=True)
-        tasks.append(url_to_audio(url, voice, out_dir))
-    
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    return results
+        scheduler.submit(
+            lambda url=url, out_dir=out_dir: _in_dir(out_dir, url_to_audio, url, voice),
+            key=url
+        )
+    return scheduler
+
 
+async def _in_dir(out_dir: str, workflow, *args):
+    """Kreye dosye sòti a sèlman lè travay la kòmanse, epi kouri workflow(*args, out_dir)"""
+    os.makedirs(out_dir, exist_ok=True)
+    return await workflow(*args, out_dir)
@@ -9,7 +9,8 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+from src.pipeline import BatchExecutor
 from utils.cloud_storage import upload_to_gcs, download_from_gcs
 from utils.text_extraction import extract_text_from_pdf
 from utils.translate import translate_text
@@ -18,15 +19,49 @@ from utils.podcast_mix import mix_voices
 from utils.email_notifier import EmailNotifier
 
 
+# Kantite liv an menm tan / Books processed concurrently
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "2"))
+
+# Limit pa etap pou tout batch la / Per-stage limits across the batch:
+# yon sèl modèl tradiksyon pataje, TTS ak rezo ka fè plizyè an menm tan
+DEFAULT_STAGE_LIMITS = {
+    'download': 4,
+    'extract': 2,
+    'translate': 1,
+    'audio': 2,
+    'podcast': 2,
+}
+
+
 class BatchProcessor:
     """Klas pou trete plizyè liv / Class for batch processing"""
     
-    def __init__(self, bucket_name: str, enable_email: bool = True):
+    def __init__(
+        self,
+        bucket_name: str,
+        enable_email: bool = True,
+        max_concurrent: Optional[int] = None,
+        stage_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            bucket_name: GCS bucket
+            enable_email: Voye notifikasyon / Send email notifications
+            max_concurrent: Liv an menm tan / Books processed concurrently
+                            (default: BATCH_CONCURRENCY)
+            stage_limits: Limit pa etap / Per-stage concurrency limits
+                          (merged over DEFAULT_STAGE_LIMITS)
+        """
         self.bucket = bucket_name
         self.results = []
         self.start_time = None
         self.end_time = None
         self.email_notifier = EmailNotifier() if enable_email else None
+        self.executor = BatchExecutor(
+            max_concurrent=max_concurrent or BATCH_CONCURRENCY,
+            stage_limits={**DEFAULT_STAGE_LIMITS, **(stage_limits or {})}
+        )
+        self.batch_stats = None
     
     def process_book(self, book_config: Dict) -> Dict:
         """
@@ -68,7 +103,8 @@ class BatchProcessor:
             Path("input").mkdir(exist_ok=True)
             
             try:
-                download_from_gcs(input_pdf, local_pdf, self.bucket)
+                with self.executor.stage('download'):
+                    download_from_gcs(input_pdf, local_pdf, self.bucket)
             except Exception as e:
                 result['errors'].append(f"Download error: {e}")
                 result['status'] = 'failed'
@@ -77,7 +113,8 @@ class BatchProcessor:
             # 2. Extract text
             print(f"\n📄 2. Ekstraksyon tèks / Extracting text...")
             try:
-                text = extract_text_from_pdf(local_pdf)
+                with self.executor.stage('extract'):
+                    text = extract_text_from_pdf(local_pdf)
                 print(f"✅ Ekstré {len(text)} karaktè / Extracted {len(text)} characters")
             except Exception as e:
                 result['errors'].append(f"Extraction error: {e}")
@@ -87,7 +124,8 @@ class BatchProcessor:
             # 3. Translate
             print(f"\n🌍 3. Tradiksyon / Translation...")
             try:
-                translated = translate_text(text, "ht")
+                with self.executor.stage('translate'):
+                    translated = translate_text(text, "ht")
                 
                 # Save translated text
                 txt_path = output_dir / f"{book_name}_kreyol.txt"
@@ -107,7 +145,8 @@ class BatchProcessor:
             print(f"\n🎧 4. Kreyasyon audiobook / Creating audiobook...")
             try:
                 audio_path = output_dir / f"{book_name}_audio.mp3"
-                generate_audio(translated, str(audio_path), language="ht")
+                with self.executor.stage('audio'):
+                    generate_audio(translated, str(audio_path), language="ht")
                 
                 # Upload
                 remote_audio = f"output/{book_name}/{book_name}_audio.mp3"
@@ -122,7 +161,8 @@ class BatchProcessor:
             print(f"\n🎙️ 5. Kreyasyon podcast / Creating podcast...")
             try:
                 podcast_path = output_dir / f"{book_name}_podcast.mp3"
-                mix_voices([str(audio_path)], str(podcast_path))
+                with self.executor.stage('podcast'):
+                    mix_voices([str(audio_path)], str(podcast_path))
                 
                 # Upload
                 remote_podcast = f"output/{book_name}/{book_name}_podcast.mp3"
@@ -163,23 +203,27 @@ class BatchProcessor:
         """
         Trete plizyè liv / Process multiple books
         
+        Books run concurrently (max_concurrent) with per-stage limits;
+        results are collected in input order.
+        
         Args:
             books: List of book configs
         
         Returns:
-            List of results
+            List of results, in the same order as books
         """
         self.start_time = datetime.now()
         print(f"\n{'='*60}")
-        print(f"🚀 BATCH PROCESSING - {len(books)} LIV")
+        print(f"🚀 BATCH PROCESSING - {len(books)} LIV "
+              f"({self.executor.max_concurrent} an menm tan / concurrent)")
         print(f"{'='*60}")
         
-        for i, book in enumerate(books, 1):
-            print(f"\n📖 Liv {i}/{len(books)}")
-            result = self.process_book(book)
+        for i, result in enumerate(self.executor.run(books, self.process_book), 1):
+            print(f"\n📖 Liv {i}/{len(books)} fini / done: {result['name']} ({result['status']})")
             self.results.append(result)
         
         self.end_time = datetime.now()
+        self.batch_stats = self.executor.stats()
         
         # Save results
         self.save_results()
@@ -205,6 +249,8 @@ class BatchProcessor:
             'completed': len([r for r in self.results if r['status'] == 'completed']),
             'partial': len([r for r in self.results if r['status'] == 'partial']),
             'failed': len([r for r in self.results if r['status'] == 'failed']),
+            'books_per_hour': self.books_per_hour(),
+            'stage_stats': (self.batch_stats or {}).get('stages', []),
             'results': self.results
         }
         
@@ -224,6 +270,11 @@ class BatchProcessor:
         except Exception as e:
             print(f"⚠️  Could not upload results: {e}")
     
+    def books_per_hour(self) -> float:
+        """Liv pa èdtan / Throughput of the last batch"""
+        duration = (self.end_time - self.start_time).total_seconds()
+        return round(len(self.results) * 3600 / duration, 1) if duration > 0 else 0.0
+    
     def print_summary(self):
         """Afiche rezime / Print summary"""
         duration = (self.end_time - self.start_time).total_seconds()
@@ -237,6 +288,9 @@ class BatchProcessor:
         print(f"{'='*60}")
         print(f"⏱️  Dire / Duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
         print(f"📚 Total liv / Total books: {len(self.results)}")
+        print(f"⚡ Liv pa èdtan / Books per hour: {self.books_per_hour():.1f}")
+        if self.batch_stats and self.batch_stats['bottleneck']:
+            print(f"🐢 Bottleneck: {self.batch_stats['bottleneck']}")
         print(f"✅ Konple / Completed: {len(completed)}")
         print(f"⚠️  Pasyèl / Partial: {len(partial)}")
         print(f"❌ Echwe / Failed: {len(failed)}")
@@ -7,6 +7,9 @@ Enhanced CLI with arguments and options
 
 import sys
 import argparse
+import contextlib
+import itertools
+import shutil
 from pathlib import Path
 from typing import Optional
 
@@ -20,6 +23,8 @@ if sys.platform.startswith('win'):
         pass
 
 from src import Config, PDFExtractor, CreoleTranslator, AudiobookGenerator, setup_logging
+from src.pipeline import BatchExecutor, Stage, StagedPipeline
+from src.utils import iter_chunks
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -43,6 +48,9 @@ Examples / Egzanp:
   # Batch processing
   python cli.py *.pdf --batch
   
+  # Streaming pipeline (extraction, translation and TTS overlap)
+  python cli.py input.pdf --pipeline --workers 4
+  
   # Custom chunk size
   python cli.py input.pdf --chunk-size 1500
   
@@ -120,6 +128,24 @@ Examples / Egzanp:
         default=3,
         help='Kantite workers pou paralèl / Number of workers for parallel (default: 3)'
     )
+    perf_group.add_argument(
+        '--books',
+        type=int,
+        default=2,
+        help='Kantite liv an menm tan nan batch / Books processed concurrently in batch mode (default: 2)'
+    )
+    perf_group.add_argument(
+        '--stage-limit',
+        action='append',
+        default=[],
+        metavar='STAGE=N',
+        help='Limit pa etap nan batch (extract, translate, tts) / Per-stage concurrency limit, e.g. translate=1'
+    )
+    perf_group.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Ekstraksyon, tradiksyon ak odyo an menm tan / Overlap extraction, translation and TTS'
+    )
     
     # Processing options
     proc_group = parser.add_argument_group('Processing Options')
@@ -159,11 +185,55 @@ Examples / Egzanp:
     return parser
 
 
+def parse_stage_limits(values: list[str], books: int) -> dict:
+    """
+    Li limit etap yo / Parse --stage-limit STAGE=N options
+    
+    Defaults: extraction runs for every book in flight, the shared
+    translation model serves one book at a time, TTS two.
+    """
+    limits = {'extract': books, 'translate': 1, 'tts': 2}
+    for value in values:
+        name, sep, count = value.partition('=')
+        if not sep or not count.strip().isdigit():
+            raise ValueError(f"Limit etap envalid / Invalid stage limit: {value!r} (expected STAGE=N)")
+        limits[name.strip()] = int(count)
+    return limits
+
+
+def _stage(executor: Optional[BatchExecutor], name: str):
+    """Etap limite nan batch, oswa anyen / Batch stage limit or no-op"""
+    return executor.stage(name) if executor else contextlib.nullcontext()
+
+
+def _output_paths(pdf_path: Path, config: Config, args: argparse.Namespace, batch: bool) -> dict:
+    """
+    Chemen sòti yo / Output paths for one file
+    
+    In batch mode every book gets its own files so concurrent books never
+    overwrite each other's text, translation or audio.
+    """
+    if not batch:
+        return {
+            'text': config.output_text_path,
+            'translation': config.output_translation_path,
+            'audio': Path(args.output) if args.output else config.output_audio_path,
+        }
+    stem = pdf_path.stem
+    return {
+        'text': config.data_dir / f"{stem}_text.txt",
+        'translation': config.output_dir / f"{stem}_traduction.txt",
+        'audio': config.output_dir / f"{stem}_audiobook.mp3",
+    }
+
+
 def process_single_file(
     pdf_path: Path,
     config: Config,
     args: argparse.Namespace,
-    logger
+    logger,
+    modules: Optional[tuple] = None,
+    executor: Optional[BatchExecutor] = None
 ) -> bool:
     """
     Trete yon sèl fichye / Process single file
@@ -173,10 +243,17 @@ def process_single_file(
         config: Configuration
         args: CLI arguments
         logger: Logger instance
+        modules: Shared (extractor, translator, generator) already warm
+                 (batch mode); created here if None
+        executor: Batch executor whose stage limits apply (batch mode)
     
     Returns:
         True if successful
     """
+    if getattr(args, 'pipeline', False) and not args.extract_only:
+        return process_single_file_pipeline(pdf_path, config, args, logger,
+                                            modules=modules, executor=executor)
+    
     try:
         if not args.quiet:
             print(f"\n{'='*60}")
@@ -185,19 +262,25 @@ def process_single_file(
         
         logger.info(f"Processing: {pdf_path}")
         
-        # Initialize modules
-        extractor = PDFExtractor(config)
-        translator = CreoleTranslator(config)
-        generator = AudiobookGenerator(config)
+        # Initialize modules (batch mode shares warm instances)
+        if modules:
+            extractor, translator, generator = modules
+        else:
+            extractor = PDFExtractor(config)
+            translator = CreoleTranslator(config)
+            generator = AudiobookGenerator(config)
+        paths = _output_paths(pdf_path, config, args, batch=executor is not None)
         
         # Step 1: Extract
         if not args.quiet:
             print("\n⏳ ETAP 1: Ekstraksyon...")
         
-        text = extractor.extract_and_save(
-            pdf_path,
-            show_progress=not args.quiet
-        )
+        with _stage(executor, 'extract'):
+            text = extractor.extract_and_save(
+                pdf_path,
+                output_path=paths['text'],
+                show_progress=not args.quiet
+            )
         
         if args.extract_only:
             if not args.quiet:
@@ -208,11 +291,13 @@ def process_single_file(
         if not args.quiet:
             print("\n🧠 ETAP 2: Tradiksyon...")
         
-        translated = translator.translate_and_save(
-            text,
-            src_lang=args.source_lang,
-            show_progress=not args.quiet
-        )
+        with _stage(executor, 'translate'):
+            translated = translator.translate_and_save(
+                text,
+                output_path=paths['translation'],
+                src_lang=args.source_lang,
+                show_progress=not args.quiet
+            )
         
         if args.translate_only or args.no_audio:
             if not args.quiet:
@@ -223,8 +308,8 @@ def process_single_file(
         if not args.quiet:
             print("\n🎧 ETAP 3: Kreyasyon odyo...")
         
-        output_path = args.output if args.output else config.output_audio_path
-        generator.generate(translated, output_path=Path(output_path))
+        with _stage(executor, 'tts'):
+            generator.generate(translated, output_path=Path(paths['audio']))
         
         if not args.quiet:
             print(f"\n{'='*60}")
@@ -241,6 +326,124 @@ def process_single_file(
         return False
 
 
+def process_single_file_pipeline(
+    pdf_path: Path,
+    config: Config,
+    args: argparse.Namespace,
+    logger,
+    modules: Optional[tuple] = None,
+    executor: Optional[BatchExecutor] = None
+) -> bool:
+    """
+    Trete yon fichye ak pipeline an etap / Process file with staged pipeline
+    
+    Pages are extracted lazily and chunked as they arrive; translation of
+    chunk k overlaps TTS of chunk k-1 and extraction of chunk k+1. Audio
+    parts are merged at the end.
+    
+    Args:
+        pdf_path: Path to PDF
+        config: Configuration
+        args: CLI arguments
+        logger: Logger instance
+        modules: Shared (extractor, translator, generator) already warm
+        executor: Batch executor whose stage limits apply (batch mode)
+    
+    Returns:
+        True if successful
+    """
+    try:
+        if not args.quiet:
+            print(f"\n{'='*60}")
+            print(f"📄 Ap trete / Processing (pipeline): {pdf_path.name}")
+            print(f"{'='*60}")
+        
+        logger.info(f"Processing with pipeline: {pdf_path}")
+        
+        if modules:
+            extractor, translator, generator = modules
+        else:
+            extractor = PDFExtractor(config)
+            translator = CreoleTranslator(config)
+            generator = AudiobookGenerator(config)
+        paths = _output_paths(pdf_path, config, args, batch=executor is not None)
+        text_path = Path(paths['text'])
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        def pages():
+            # Tèks la sove pandan paj yo ap pase / Save the text as pages stream by
+            with open(text_path, 'w', encoding='utf-8') as f:
+                for page_text in extractor.iter_pages(pdf_path):
+                    f.write(page_text + "\n\n")
+                    yield page_text
+        
+        chunks = iter_chunks(pages(), max_size=config.chunk_size)
+        first = next(chunks, None)
+        if first is None:
+            raise ValueError("Pa gen tèks nan PDF la / No text found in PDF")
+        
+        # Lang lan detekte sou premye moso a
+        src_lang = args.source_lang or translator.detect_language(first)
+        numbered = enumerate(itertools.chain([first], chunks))
+        
+        parts_dir = Path(config.output_dir) / f"{pdf_path.stem}_parts"
+        with_audio = not (args.translate_only or args.no_audio)
+        
+        def translate(item):
+            i, chunk = item
+            with _stage(executor, 'translate'):
+                return i, translator.translate_chunk(chunk, src_lang)
+        
+        def synthesize(item):
+            i, text = item
+            part_path = parts_dir / f"part_{i:05d}.mp3"
+            with _stage(executor, 'tts'):
+                generator.generate(text, output_path=part_path)
+            return i, text, part_path
+        
+        stages = [Stage("translate", translate, workers=config.max_workers)]
+        if with_audio:
+            parts_dir.mkdir(parents=True, exist_ok=True)
+            stages.append(Stage("tts", synthesize, workers=config.max_workers))
+        
+        pipeline = StagedPipeline(stages, source_name="extract")
+        translated, parts = [], []
+        for result in pipeline.run(numbered):
+            translated.append(result[1])
+            if with_audio:
+                parts.append(result[2])
+        
+        # Sove tradiksyon an
+        translation_path = Path(paths['translation'])
+        translation_path.parent.mkdir(parents=True, exist_ok=True)
+        translation_path.write_text("\n\n".join(translated), encoding='utf-8')
+        
+        if with_audio:
+            generator.merge_parts(parts, Path(paths['audio']))
+            shutil.rmtree(parts_dir, ignore_errors=True)
+        
+        stats = pipeline.stats()
+        logger.info(f"Pipeline stats: {stats}")
+        if not args.quiet:
+            print(f"\n⚡ Pipeline: {len(translated)} moso / chunks in {stats['wall_seconds']:.1f}s")
+            for stage in stats['stages']:
+                print(f"   • {stage['name']:<10} ×{stage['workers']}  "
+                      f"busy {stage['busy_seconds']:.1f}s  util {stage['utilization']:.0%}")
+            print(f"   🐢 Bottleneck: {stats['bottleneck']}")
+            print(f"\n{'='*60}")
+            print("✅ KONPLE! / COMPLETE!")
+            print(f"{'='*60}")
+        
+        logger.info(f"Successfully processed: {pdf_path}")
+        return True
+        
+    except Exception as e:
+        if not args.quiet:
+            print(f"\n❌ ERÈR / ERROR: {str(e)}")
+        logger.error(f"Error processing {pdf_path}: {e}")
+        return False
+
+
 def process_batch(
     pdf_paths: list[Path],
     config: Config,
@@ -250,6 +453,9 @@ def process_batch(
     """
     Trete plizyè fichye / Process multiple files
     
+    Several books run at once (--books) on one set of warm modules, with
+    per-stage limits (--stage-limit); results are reported in input order.
+    
     Args:
         pdf_paths: List of PDF paths
         config: Configuration
@@ -259,24 +465,44 @@ def process_batch(
     Returns:
         Tuple of (successful, failed) counts
     """
+    books = max(1, getattr(args, 'books', 1))
+    executor = BatchExecutor(
+        max_concurrent=books,
+        stage_limits=parse_stage_limits(getattr(args, 'stage_limit', []), books)
+    )
+    
     print(f"\n{'='*60}")
-    print(f"📦 BATCH PROCESSING - {len(pdf_paths)} fichye")
+    print(f"📦 BATCH PROCESSING - {len(pdf_paths)} fichye ({books} an menm tan / concurrent)")
     print(f"{'='*60}")
     
+    # Modèl yo chaje yon sèl fwa pou tout batch la
+    modules = (PDFExtractor(config), CreoleTranslator(config), AudiobookGenerator(config))
+    
+    def run_one(pdf_path: Path) -> bool:
+        return process_single_file(pdf_path, config, args, logger, modules=modules, executor=executor)
+    
     successful = 0
     failed = 0
     
-    for i, pdf_path in enumerate(pdf_paths, 1):
-        print(f"\n[{i}/{len(pdf_paths)}] {pdf_path.name}")
+    for i, (pdf_path, ok) in enumerate(zip(pdf_paths, executor.run(pdf_paths, run_one)), 1):
+        print(f"\n[{i}/{len(pdf_paths)}] {pdf_path.name}: {'✅' if ok else '❌'}")
         
-        if process_single_file(pdf_path, config, args, logger):
+        if ok:
             successful += 1
         else:
             failed += 1
     
+    stats = executor.stats()
+    logger.info(f"Batch stats: {stats}")
+    
     print(f"\n{'='*60}")
     print(f"✅ Siksè / Success: {successful}")
     print(f"❌ Echwe / Failed: {failed}")
+    print(f"⏱️  Dire / Duration: {stats['wall_seconds']:.1f}s")
+    print(f"⚡ Liv pa èdtan / Books per hour: {stats['items_per_hour']:.1f}")
+    for stage in stats['stages']:
+        print(f"   • {stage['name']:<10} ×{stage['workers']}  "
+              f"busy {stage['busy_seconds']:.1f}s  wait {stage['blocked_seconds']:.1f}s")
     print(f"{'='*60}")
     
     return successful, failed
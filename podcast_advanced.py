@@ -5,22 +5,31 @@ Advanced Podcast Creator - Version avec Hugging Face
 Utilise des voix natives créoles et détection automatique
 """
 
+import os
 import sys
 from pathlib import Path
 import torch
 from transformers import VitsModel, AutoTokenizer
-import numpy as np
-from pydub import AudioSegment
 import scipy.io.wavfile as wavfile
 import re
 from tqdm import tqdm
 
+from utils.audio_assembly import AudioAssembler
+from utils.segment_synth import SegmentSynthesizer
+from utils.voice_dsp import apply_voice, to_int16
+
+# VITS est limité par le CPU: un processus (et un modèle) par worker
+VITS_WORKERS = int(os.getenv("PODCAST_VITS_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) // 2)))))
+# gTTS (fallback) est limité par le réseau: des threads suffisent
+GTTS_WORKERS = int(os.getenv("PODCAST_TTS_WORKERS", "4"))
+
 class AdvancedPodcastCreator:
     """Créateur de podcasts avancé avec voix natives"""
     
     def __init__(self):
         self.model = None
         self.tokenizer = None
+        self.model_name = "facebook/mms-tts-hat"
         self.voices_config = {
             'host': {
                 'name': 'Chris (Host)',
@@ -44,6 +53,7 @@ class AdvancedPodcastCreator:
         
     def load_model(self, model_name="facebook/mms-tts-hat"):
         """Charger le modèle TTS"""
+        self.model_name = model_name
         if self.model is None:
             print(f"📥 Chargement du modèle {model_name}...")
             try:
@@ -126,40 +136,24 @@ class AdvancedPodcastCreator:
             
             # Convertir
             audio_np = output.squeeze().cpu().numpy()
+            rate = self.model.config.sampling_rate
             
-            # Normaliser
-            audio_np = audio_np / np.max(np.abs(audio_np))
-            audio_int16 = (audio_np * 32767).astype(np.int16)
-            
-            # Sauvegarder WAV temporaire
-            wav_path = output_path.with_suffix('.wav')
-            wavfile.write(
-                str(wav_path),
-                rate=self.model.config.sampling_rate,
-                data=audio_int16
+            # Pitch / vitesse en mémoire sur la forme d'onde (numpy/scipy),
+            # sans aller-retour WAV ni pydub
+            audio_np = apply_voice(
+                audio_np,
+                pitch_shift=voice_config['pitch_shift'],
+                speed=voice_config['speed']
             )
+            audio_int16 = to_int16(audio_np, normalize=True)
             
-            # Convertir en MP3 avec modification de pitch/speed
-            audio = AudioSegment.from_wav(str(wav_path))
-            
-            # Appliquer pitch shift
-            if voice_config['pitch_shift'] != 0:
-                # Approximation simple du pitch shift
-                new_sample_rate = int(audio.frame_rate * (1.0 + voice_config['pitch_shift'] * 0.05))
-                audio = audio._spawn(audio.raw_data, overrides={
-                    "frame_rate": new_sample_rate
-                })
-                audio = audio.set_frame_rate(44100)
-            
-            # Appliquer speed
-            if voice_config['speed'] != 1.0:
-                audio = audio.speedup(playback_speed=voice_config['speed'])
-            
-            # Exporter MP3
-            audio.export(str(output_path), format="mp3")
-            
-            # Nettoyer WAV
-            wav_path.unlink()
+            # Exporter (WAV direct pour les segments temporaires)
+            if output_path.suffix.lower() == '.wav':
+                wavfile.write(str(output_path), rate=rate, data=audio_int16)
+            else:
+                segment = AudioAssembler(sample_rate=rate)
+                segment.add_array(audio_int16, rate)
+                segment.export(output_path)
             
             return True
             
@@ -184,53 +178,50 @@ class AdvancedPodcastCreator:
         temp_dir = Path("temp_podcast_advanced")
         temp_dir.mkdir(exist_ok=True)
         
-        audio_files = []
-        
         print("🎤 Génération audio...")
+        jobs = [
+            {'text': seg['text'], 'voice': self.voices_config[seg['speaker']]}
+            for seg in segments
+        ]
+        if not use_hf:
+            synthesizer = SegmentSynthesizer(_gtts_segment, engine='gtts', ext='mp3',
+                                             max_workers=GTTS_WORKERS)
+        elif VITS_WORKERS > 1:
+            synthesizer = SegmentSynthesizer(
+                _vits_segment, engine='vits', ext='wav',
+                max_workers=VITS_WORKERS, use_processes=True,
+                initializer=_init_vits_worker,
+                initargs=(self.model_name, max(1, (os.cpu_count() or 1) // VITS_WORKERS))
+            )
+        else:
+            synthesizer = SegmentSynthesizer(self.generate_segment_hf, engine='vits',
+                                             ext='wav', max_workers=1)
+        
         with tqdm(total=len(segments), desc="Segments", unit="seg") as pbar:
-            for i, segment in enumerate(segments):
-                temp_file = temp_dir / f"seg_{i:03d}.mp3"
-                voice_config = self.voices_config[segment['speaker']]
-                
-                if use_hf:
-                    success = self.generate_segment_hf(
-                        segment['text'],
-                        voice_config,
-                        temp_file
-                    )
-                else:
-                    # Fallback gTTS
-                    from gtts import gTTS
-                    tts = gTTS(text=segment['text'], lang='fr')
-                    tts.save(str(temp_file))
-                    success = True
-                
-                if success:
-                    audio_files.append(temp_file)
-                
-                pbar.update(1)
+            results = synthesizer.synthesize(jobs, temp_dir, prefix='seg',
+                                             progress=lambda r: pbar.update(1))
+        audio_files = [r.path for r in results if r.ok]
+        print(f"♻️ {synthesizer.stats['cache_hits']} segment(s) depuis le cache, "
+              f"{synthesizer.stats['synthesized']} synthétisé(s)")
         
-        # Assembler
+        # Assembler en mémoire (PCM), un seul encodage MP3
         print("\n🔗 Assemblage...")
-        podcast = AudioSegment.empty()
+        podcast = AudioAssembler()
         
         for audio_file in audio_files:
-            segment_audio = AudioSegment.from_mp3(str(audio_file))
-            podcast += segment_audio
-            podcast += AudioSegment.silent(duration=400)
+            podcast.add_file(audio_file)
+            podcast.add_silence(400)
         
         # Normaliser et exporter
-        podcast = podcast.normalize()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        podcast.export(str(output_path), format="mp3", bitrate="192k")
+        podcast.export(output_path, format="mp3", bitrate="192k", normalize=True)
         
-        # Nettoyer
-        for f in audio_files:
+        # Nettoyer (y compris les restes des segments en échec)
+        for f in temp_dir.glob("*"):
             f.unlink()
         temp_dir.rmdir()
         
         # Stats
-        duration = len(podcast) / 1000
+        duration = podcast.duration_seconds
         size = output_path.stat().st_size / 1024
         
         print("\n" + "=" * 60)
@@ -243,6 +234,32 @@ class AdvancedPodcastCreator:
         print("=" * 60)
 
 
+# ------------------------------------------------------------
+# Workers de synthèse (fonctions de module: picklables)
+# ------------------------------------------------------------
+
+_worker_creator = None
+
+
+def _init_vits_worker(model_name, torch_threads):
+    """Charger le modèle une fois par processus worker"""
+    global _worker_creator
+    torch.set_num_threads(torch_threads)
+    _worker_creator = AdvancedPodcastCreator()
+    _worker_creator.load_model(model_name)
+
+
+def _vits_segment(text, voice_config, output_path):
+    """Segment VITS dans un processus worker"""
+    return _worker_creator.generate_segment_hf(text, voice_config, output_path)
+
+
+def _gtts_segment(text, voice_config, output_path):
+    """Segment gTTS (fallback)"""
+    from gtts import gTTS
+    gTTS(text=text, lang='fr').save(str(output_path))
+
+
 def main():
     """Main"""
     print("🇭🇹 ADVANCED PODCAST CREATOR")
@@ -5,6 +5,8 @@ Podcast Creator - Pwojè Kreyòl IA
 Créer des podcasts professionnels avec plusieurs voix en créole
 """
 
+import io
+import os
 import sys
 from pathlib import Path
 from gtts import gTTS
@@ -12,8 +14,13 @@ import re
 from tqdm import tqdm
 import json
 import subprocess
+import tempfile
 import wave
-import struct
+
+# Cache disque des silences (un fichier par durée / fréquence / codec)
+SILENCE_CACHE_DIR = Path(os.getenv("SILENCE_CACHE_DIR", "cache/silence"))
+# Segments gTTS synthétisés en parallèle (appels réseau)
+PODCAST_TTS_WORKERS = int(os.getenv("PODCAST_TTS_WORKERS", "4"))
 
 class PodcastCreator:
     """Créateur de podcasts multi-voix"""
@@ -25,6 +32,11 @@ class PodcastCreator:
             'pierre': {'lang': 'fr', 'tld': 'fr', 'gender': 'male'},
             'marie': {'lang': 'fr', 'tld': 'com', 'gender': 'female'},
         }
+        self.last_merge_report = None
+        self.last_synthesis_stats = None
+        # Silences déjà générés: (durée ms, fréquence, codec) -> octets
+        self._silence_cache = {}
+        self.silence_stats = {'memory_hits': 0, 'disk_hits': 0, 'generated': 0}
         
     def parse_script(self, script_text):
         """
@@ -83,35 +95,95 @@ class PodcastCreator:
         tts.save(str(output_path))
         return output_path
     
-    def create_silence_mp3(self, output_path, duration_ms=500):
-        """Créer un fichier MP3 de silence"""
-        # Créer un WAV de silence
-        wav_path = output_path.with_suffix('.wav')
-        sample_rate = 22050
-        num_samples = int(sample_rate * duration_ms / 1000)
-        
-        with wave.open(str(wav_path), 'w') as wav_file:
+    def get_silence(self, duration_ms=300, sample_rate=22050, codec='mp3', template=None):
+        """
+        Silence réutilisable, généré une seule fois par (durée, fréquence, codec)
+        
+        Ordre: cache mémoire → cache disque (SILENCE_CACHE_DIR) → génération.
+        Le WAV est écrit en un seul bloc de zéros; le MP3 est fait de trames
+        silencieuses calquées sur `template` (aucun encodeur), ou sinon
+        encodé une fois avec ffmpeg puis gardé sur disque.
+        
+        Args:
+            duration_ms: Durée du silence
+            sample_rate: Fréquence d'échantillonnage
+            codec: 'mp3' ou 'wav'
+            template: Mp3Frame d'un segment (trames compatibles pour la copie)
+        
+        Returns:
+            tuple: (octets du silence, codec réel) — 'wav' si ffmpeg manque
+        """
+        if template is not None:
+            sample_rate = template.sample_rate
+            codec_key = f"mp3-v{template.version}-l{template.layer}-{template.channels}ch-{template.bitrate}"
+        else:
+            codec_key = codec
+        key = (duration_ms, sample_rate, codec_key)
+        
+        if key in self._silence_cache:
+            self.silence_stats['memory_hits'] += 1
+            return self._silence_cache[key]
+        
+        ext = 'wav' if codec == 'wav' else 'mp3'
+        disk_path = SILENCE_CACHE_DIR / f"silence_{duration_ms}ms_{sample_rate}_{codec_key}.{ext}"
+        fallback_path = disk_path.with_suffix('.wav')
+        if disk_path.exists():
+            self.silence_stats['disk_hits'] += 1
+            entry = (disk_path.read_bytes(), ext)
+        elif ext == 'mp3' and fallback_path.exists() and template is None:
+            self.silence_stats['disk_hits'] += 1
+            entry = (fallback_path.read_bytes(), 'wav')
+        else:
+            self.silence_stats['generated'] += 1
+            entry = self._generate_silence(duration_ms, sample_rate, ext, template)
+            SILENCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            target = disk_path if entry[1] == ext else fallback_path
+            # Fichier temporaire unique: deux processus peuvent générer le même silence
+            with tempfile.NamedTemporaryFile(dir=SILENCE_CACHE_DIR, prefix=target.name, suffix='.tmp',
+                                             delete=False) as tmp:
+                tmp.write(entry[0])
+            try:
+                os.replace(tmp.name, target)
+            except OSError:
+                os.unlink(tmp.name)
+                raise
+        
+        self._silence_cache[key] = entry
+        return entry
+    
+    def _generate_silence(self, duration_ms, sample_rate, codec, template=None):
+        """Générer un silence (sans boucle Python par échantillon)"""
+        if codec == 'mp3' and template is not None:
+            from utils.audio_concat import silent_frames
+            return silent_frames(template, duration_ms), 'mp3'
+        
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav_file:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            
-            # Écrire des zéros (silence)
-            for _ in range(num_samples):
-                wav_file.writeframes(struct.pack('<h', 0))
+            wav_file.writeframes(bytes(2 * int(sample_rate * duration_ms / 1000)))
+        wav_bytes = buffer.getvalue()
+        if codec == 'wav':
+            return wav_bytes, 'wav'
         
-        # Convertir en MP3 si ffmpeg est disponible
+        # Encoder en MP3 si ffmpeg est disponible (une seule fois grâce au cache)
         try:
-            subprocess.run([
-                'ffmpeg', '-i', str(wav_path),
+            result = subprocess.run([
+                'ffmpeg', '-f', 'wav', '-i', 'pipe:0',
                 '-codec:a', 'libmp3lame', '-qscale:a', '2',
-                str(output_path), '-y'
-            ], check=True, capture_output=True)
-            wav_path.unlink()
-        except:
+                '-f', 'mp3', 'pipe:1'
+            ], input=wav_bytes, check=True, capture_output=True)
+            return result.stdout, 'mp3'
+        except (OSError, subprocess.CalledProcessError):
             # Si ffmpeg n'est pas disponible, garder le WAV
-            output_path.unlink(missing_ok=True)
-            wav_path.rename(output_path)
-        
+            return wav_bytes, 'wav'
+    
+    def create_silence_mp3(self, output_path, duration_ms=500, sample_rate=22050, template=None):
+        """Créer un fichier MP3 de silence (WAV si ffmpeg n'est pas disponible)"""
+        data, _ = self.get_silence(duration_ms, sample_rate, 'mp3', template=template)
+        output_path = Path(output_path)
+        output_path.write_bytes(data)
         return output_path
     
     def create_podcast(self, script_text, output_path, add_music=False):
@@ -141,74 +213,62 @@ class PodcastCreator:
         temp_dir = Path("temp_podcast")
         temp_dir.mkdir(exist_ok=True)
         
-        audio_files = []
+        # Segments en parallèle (gTTS = réseau → threads), ordre du script
+        # conservé; une ligne inchangée est reprise du cache de segments
+        from utils.segment_synth import SegmentSynthesizer
+        
+        synthesizer = SegmentSynthesizer(
+            lambda text, voice, path: self.generate_audio_segment(text, voice['speaker'], path),
+            engine='gtts',
+            ext='mp3',
+            max_workers=PODCAST_TTS_WORKERS
+        )
+        jobs = [
+            {'text': seg['text'], 'voice': {'speaker': seg['speaker'], **self.voices[seg['speaker']]}}
+            for seg in segments
+        ]
         
         with tqdm(total=len(segments), desc="Segments", unit="seg") as pbar:
-            for i, segment in enumerate(segments):
-                temp_file = temp_dir / f"segment_{i:03d}.mp3"
-                
-                try:
-                    self.generate_audio_segment(
-                        segment['text'],
-                        segment['speaker'],
-                        temp_file
-                    )
-                    audio_files.append(temp_file)
-                except Exception as e:
-                    print(f"\n⚠️ Erreur segment {i}: {e}")
-                    continue
-                
-                pbar.update(1)
+            results = synthesizer.synthesize(jobs, temp_dir, progress=lambda r: pbar.update(1))
+        
+        audio_files = []
+        for result in results:
+            if result.ok:
+                audio_files.append(result.path)
+            else:
+                print(f"\n⚠️ Erreur segment {result.index}: {result.error}")
+        self.last_synthesis_stats = dict(synthesizer.stats)
+        print(f"♻️ {synthesizer.stats['cache_hits']} segment(s) depuis le cache, "
+              f"{synthesizer.stats['synthesized']} synthétisé(s)")
         
         print()
         print("🔗 Assemblage du podcast...")
         
-        # 3. Assembler tous les segments avec ffmpeg
+        # 3. Assembler: copie des trames si les segments ont le même codec,
+        #    ré-encodage seulement sinon
         try:
-            # Créer un fichier de liste pour ffmpeg
-            concat_file = temp_dir / "concat_list.txt"
+            from utils.audio_concat import concat_audio
             
-            with open(concat_file, 'w', encoding='utf-8') as f:
-                for i, audio_file in enumerate(audio_files):
-                    f.write(f"file '{audio_file.absolute()}'\n")
-                    
-                    # Ajouter silence entre segments
-                    if i < len(audio_files) - 1:
-                        silence_file = temp_dir / f"silence_{i}.mp3"
-                        self.create_silence_mp3(silence_file, 300)
-                        f.write(f"file '{silence_file.absolute()}'\n")
+            if not audio_files:
+                raise ValueError("Aucun segment audio généré")
             
-            # Assembler avec ffmpeg
-            print("🔗 Assemblage avec ffmpeg...")
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                subprocess.run([
-                    'ffmpeg', '-f', 'concat', '-safe', '0',
-                    '-i', str(concat_file),
-                    '-c', 'copy',
-                    str(output_path), '-y'
-                ], check=True, capture_output=True)
-                
-            except FileNotFoundError:
-                print("⚠️ ffmpeg non trouvé, assemblage simple...")
-                # Fallback: copier juste le premier fichier
-                import shutil
-                shutil.copy(audio_files[0], output_path)
+            report = concat_audio(audio_files, output_path, silence_ms=300)
+            output_path = Path(report.output)
+            print(f"🔗 Assemblage: {report.summary()}")
             
             # Nettoyer les fichiers temporaires
             print("🧹 Nettoyage...")
             for temp_file in temp_dir.glob("*"):
                 temp_file.unlink()
-            concat_file.unlink(missing_ok=True)
             temp_dir.rmdir()
             
             # Statistiques
             size_kb = output_path.stat().st_size / 1024
             
-            # Estimer la durée (approximativement 150 chars = 1 seconde de parole)
+            # Durée réelle des trames (sinon ~150 chars = 1 seconde de parole)
             total_chars = sum(len(seg['text']) for seg in segments)
-            duration_sec = total_chars / 150
+            duration_sec = report.audio_seconds or total_chars / 150
             
             print()
             print("=" * 60)
@@ -219,8 +279,10 @@ class PodcastCreator:
             print(f"💾 Taille: {size_kb:.1f} Ko")
             print(f"🗣️ Speakers: {len(speakers)}")
             print(f"📝 Segments: {len(segments)}")
+            print(f"⚡ Assemblage: {report.mode} ({report.saved_seconds:.1f}s de ré-encodage évité)")
             print("=" * 60)
             
+            self.last_merge_report = report
             return True
             
         except Exception as e:
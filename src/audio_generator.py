@@ -235,6 +235,30 @@ class AudiobookGenerator:
         logger.info(f"Generated {len(audio_files)} audio files")
         return audio_files
     
+    def merge_parts(self, part_paths: List[Path], output_path: Path) -> Path:
+        """
+        Mete pati odyo yo ansanm / Merge audio parts into one file
+        
+        Parts go through utils.audio_concat.concat_audio: MP3 frames are
+        copied only when codec and sample rate match (ID3 tags stripped),
+        otherwise the parts are re-encoded once.
+        
+        Args:
+            part_paths: Audio part files, in order
+            output_path: Merged audio file path
+        
+        Returns:
+            Path to merged audio file
+        """
+        from utils.audio_concat import concat_audio
+        
+        report = concat_audio(part_paths, output_path)
+        output_path = Path(report.output)
+        
+        size = format_file_size(output_path.stat().st_size)
+        logger.info(f"Merged {len(part_paths)} parts into {output_path} ({size}): {report.summary()}")
+        return output_path
+    
     def get_audio_info(self, audio_path: Path) -> dict:
         """
         Get audio file information
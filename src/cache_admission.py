@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache Admission & Analytics
+TinyLFU-style admission policy and windowed hit-ratio analytics
+
+A bounded cache that admits everything lets one pass over a long book
+push out the phrases every user asks for. TinyLFU keeps an approximate
+access frequency for every key seen recently (count-min sketch, 4-bit
+counters, periodically halved) and, when the cache is full, only lets a
+new entry in if it has been asked for more often than the entry it
+would evict.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+logger = logging.getLogger('KreyolAI.CacheAdmission')
+
+MAX_COUNT = 15  # 4-bit counters, as in TinyLFU
+DEFAULT_SKETCH_WIDTH = 4096
+DEFAULT_SKETCH_DEPTH = 4
+DEFAULT_WINDOWS = (("1m", 60), ("5m", 300), ("1h", 3600))
+DEFAULT_BUCKET_SECONDS = 10
+DEFAULT_TOP_KEYS = 32
+
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+def _hashes(key: str, depth: int) -> List[int]:
+    """depth independent-enough hashes of a key (Kirsch-Mitzenmacher double hashing)"""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) & 0xFFFFFFFFFFFFFFFF for i in range(depth)]
+
+
+class FrequencySketch:
+    """
+    Count-min sketch with saturating 4-bit counters and aging
+
+    After sample_size increments every counter is halved, so keys that
+    were hot yesterday do not keep their advantage forever.
+    """
+
+    def __init__(
+        self,
+        width: int = DEFAULT_SKETCH_WIDTH,
+        depth: int = DEFAULT_SKETCH_DEPTH,
+        sample_size: Optional[int] = None
+    ):
+        """
+        Args:
+            width: Counters per row (rounded up to a power of two)
+            depth: Number of rows (hash functions)
+            sample_size: Increments between two halvings (default: 10 × width)
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be at least 1")
+        self.width = 1 << (width - 1).bit_length()
+        self.depth = depth
+        self.sample_size = sample_size or 10 * self.width
+        self._mask = self.width - 1
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+        # Doorkeeper: one-hit wonders only set a bit, not the counters
+        self._door = bytearray(self.width // 2 or 1)
+        self.additions = 0
+        self.resets = 0
+
+    def _door_bits(self, hashes: Sequence[int]) -> List[int]:
+        size = len(self._door) * 8
+        return [(h >> 17) % size for h in hashes[:2]]
+
+    def increment(self, key: str) -> None:
+        hashes = _hashes(key, self.depth)
+        bits = self._door_bits(hashes)
+        if not all(self._door[b >> 3] & (1 << (b & 7)) for b in bits):
+            for b in bits:
+                self._door[b >> 3] |= 1 << (b & 7)
+        else:
+            for row, h in zip(self._rows, hashes):
+                i = h & self._mask
+                if row[i] < MAX_COUNT:
+                    row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._reset()
+
+    def estimate(self, key: str) -> int:
+        """Approximate number of recent accesses (never underestimates before aging)"""
+        hashes = _hashes(key, self.depth)
+        bits = self._door_bits(hashes)
+        seen = all(self._door[b >> 3] & (1 << (b & 7)) for b in bits)
+        count = min(row[h & self._mask] for row, h in zip(self._rows, hashes))
+        return count + 1 if seen else count
+
+    def _reset(self) -> None:
+        self._rows = [bytearray(row.translate(_HALVE)) for row in self._rows]
+        self._door = bytearray(len(self._door))
+        self.additions //= 2
+        self.resets += 1
+        logger.debug(f"Frequency sketch aged (reset #{self.resets})")
+
+
+class TinyLFU:
+    """
+    Frequency-based admission policy (thread-safe)
+
+    Example:
+        policy = TinyLFU()
+        policy.record(key)              # on every lookup
+        if policy.admit(key, victim):   # before evicting victim for key
+            ...
+    """
+
+    def __init__(self, width: int = DEFAULT_SKETCH_WIDTH, depth: int = DEFAULT_SKETCH_DEPTH):
+        self.sketch = FrequencySketch(width=width, depth=depth)
+        self._lock = threading.Lock()
+        self.stats = {"admitted": 0, "rejected": 0}
+
+    def record(self, key: str) -> None:
+        """Count one access to key"""
+        with self._lock:
+            self.sketch.increment(key)
+
+    def frequency(self, key: str) -> int:
+        with self._lock:
+            return self.sketch.estimate(key)
+
+    def admit(self, candidate: str, victim: str) -> bool:
+        """
+        Decide whether candidate may replace victim
+
+        Args:
+            candidate: Key that wants to enter the full cache
+            victim: Key the cache would evict for it
+
+        Returns:
+            True if candidate was accessed more often than victim
+        """
+        with self._lock:
+            admitted = self.sketch.estimate(candidate) > self.sketch.estimate(victim)
+            self.stats["admitted" if admitted else "rejected"] += 1
+        return admitted
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "sketch_width": self.sketch.width,
+            "sketch_depth": self.sketch.depth,
+            "resets": self.sketch.resets,
+        }
+
+
+# ============================================================
+# ANALYTICS
+# ============================================================
+
+def _ratio(part: float, total: float) -> float:
+    return round(part / total, 4) if total else 0.0
+
+
+class CacheAnalytics:
+    """
+    Hit ratio, byte hit ratio and hot keys for one cache namespace
+
+    Counts go into fixed-width time buckets so ratios can be reported
+    for the last minute, five minutes and hour; hot keys are tracked
+    with a bounded Space-Saving table.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        windows: Sequence = DEFAULT_WINDOWS,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+        top_keys: int = DEFAULT_TOP_KEYS,
+        clock=time.time
+    ):
+        """
+        Args:
+            namespace: Cache namespace ("trans", "audio", ...)
+            windows: (label, seconds) pairs to report
+            bucket_seconds: Bucket width
+            top_keys: Number of keys tracked for the hot list
+            clock: Time source (tests)
+        """
+        self.namespace = namespace
+        self.windows = list(windows)
+        self.bucket_seconds = bucket_seconds
+        self.top_keys = top_keys
+        self.clock = clock
+        horizon = max((seconds for _, seconds in self.windows), default=bucket_seconds)
+        self._buckets: Deque[list] = deque(maxlen=horizon // bucket_seconds + 1)
+        self._totals = {"hits": 0, "misses": 0, "hit_bytes": 0, "miss_bytes": 0}
+        # key → [count, overestimate, label]
+        self._hot: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self) -> list:
+        start = int(self.clock() // self.bucket_seconds) * self.bucket_seconds
+        if not self._buckets or self._buckets[-1][0] != start:
+            self._buckets.append([start, 0, 0, 0, 0])
+        return self._buckets[-1]
+
+    def _touch(self, key: str, label: Optional[str]) -> None:
+        entry = self._hot.get(key)
+        if entry is not None:
+            entry[0] += 1
+            entry[2] = entry[2] or label
+            return
+        if len(self._hot) < self.top_keys:
+            self._hot[key] = [1, 0, label]
+            return
+        # Space-Saving: the new key takes over the smallest counter
+        smallest = min(self._hot, key=lambda k: self._hot[k][0])
+        count = self._hot.pop(smallest)[0]
+        self._hot[key] = [count + 1, count, label]
+
+    def record_hit(self, key: str, size: int = 0, label: Optional[str] = None) -> None:
+        """A lookup served from the cache (size = bytes served)"""
+        with self._lock:
+            bucket = self._bucket()
+            bucket[1] += 1
+            bucket[3] += size
+            self._totals["hits"] += 1
+            self._totals["hit_bytes"] += size
+            self._touch(key, label)
+
+    def record_miss(self, key: str, label: Optional[str] = None) -> None:
+        """A lookup the cache could not serve"""
+        with self._lock:
+            self._bucket()[2] += 1
+            self._totals["misses"] += 1
+            self._touch(key, label)
+
+    def record_fill(self, size: int) -> None:
+        """Bytes computed after a miss (the denominator side of the byte hit ratio)"""
+        with self._lock:
+            self._bucket()[4] += size
+            self._totals["miss_bytes"] += size
+
+    @property
+    def hits(self) -> int:
+        return self._totals["hits"]
+
+    @property
+    def misses(self) -> int:
+        return self._totals["misses"]
+
+    @staticmethod
+    def _summary(hits: int, misses: int, hit_bytes: int, miss_bytes: int) -> dict:
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": _ratio(hits, hits + misses),
+            "hit_bytes": hit_bytes,
+            "miss_bytes": miss_bytes,
+            "byte_hit_ratio": _ratio(hit_bytes, hit_bytes + miss_bytes),
+        }
+
+    def hot_keys(self, top: int = 10) -> List[dict]:
+        """Most requested keys (count is an upper bound, error its maximum overestimate)"""
+        with self._lock:
+            ranked = sorted(self._hot.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        return [
+            {"key": key, "label": label, "count": count, "error": error}
+            for key, (count, error, label) in ranked
+        ]
+
+    def snapshot(self, top: int = 10) -> dict:
+        """
+        Totals since start, per-window ratios and hot keys
+
+        Returns:
+            dict with namespace, totals, windows and hot_keys
+        """
+        now = self.clock()
+        with self._lock:
+            buckets = list(self._buckets)
+            totals = dict(self._totals)
+        windows = {}
+        for label, seconds in self.windows:
+            recent = [b for b in buckets if b[0] > now - seconds - self.bucket_seconds]
+            windows[label] = self._summary(*(sum(b[i] for b in recent) for i in range(1, 5)))
+        return {
+            "namespace": self.namespace,
+            "totals": self._summary(totals["hits"], totals["misses"],
+                                    totals["hit_bytes"], totals["miss_bytes"]),
+            "windows": windows,
+            "hot_keys": self.hot_keys(top),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._hot.clear()
+            for name in self._totals:
+                self._totals[name] = 0
+
+
+_analytics: Dict[str, CacheAnalytics] = {}
+_analytics_lock = threading.Lock()
+
+
+def get_analytics(namespace: str) -> CacheAnalytics:
+    """Shared analytics for a namespace (created on first use)"""
+    with _analytics_lock:
+        analytics = _analytics.get(namespace)
+        if analytics is None:
+            analytics = _analytics[namespace] = CacheAnalytics(namespace)
+        return analytics
+
+
+def analytics_report(top: int = 10) -> Dict[str, dict]:
+    """Snapshot of every namespace seen so far"""
+    with _analytics_lock:
+        namespaces = list(_analytics.values())
+    return {a.namespace: a.snapshot(top) for a in namespaces}
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kle Kachaj / Translation Cache Keys
+Canonical, versioned keys for translation caches
+
+Hashing the raw text means "Bonjou  tout moun", "Bonjou tout moun"
+and a PDF line-wrapped "Bonjou\\ntout moun" are three cache entries for
+one translation. Text is canonicalized before hashing:
+
+- Unicode NFC (composed and decomposed accents match)
+- invisible characters removed (zero-width space, BOM, soft hyphen)
+- every Unicode space (NBSP, narrow NBSP, ...) folded to a space
+- single line breaks and runs of spaces folded to one space;
+  paragraph breaks kept as one blank line
+- curly quotes, primes and backticks mapped to ASCII quotes
+- case rule (CACHE_KEY_CASE): "preserve", "lower" or "first"
+  (lowercase only the first letter, for sentence-initial capitals)
+
+KEY_VERSION is part of every hash: bump it whenever these rules change
+so old entries stop matching instead of returning a wrong translation.
+
+Replay a corpus to measure the effect on hit rate:
+    python src/cache_keys.py data/*.txt --segment paragraph
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger('KreyolAI.CacheKeys')
+
+KEY_VERSION = "k2"
+CASE_RULES = ("preserve", "lower", "first")
+CACHE_KEY_CASE = os.getenv("CACHE_KEY_CASE", "preserve").lower()
+if CACHE_KEY_CASE not in CASE_RULES:
+    logger.warning(f"Unknown CACHE_KEY_CASE={CACHE_KEY_CASE!r}, using 'preserve'")
+    CACHE_KEY_CASE = "preserve"
+
+# Zero-width space, word joiner, BOM, soft hyphen
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u2060\ufeff\u00ad"))
+_QUOTES = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201b": "'",
+    "\u2032": "'", "`": "'", "\u00b4": "'",
+    "\u201c": '"', "\u201d": '"', "\u201e": '"', "\u201f": '"', "\u2033": '"',
+})
+_PARAGRAPH = re.compile(r"\n\s*\n")
+_SPACES = re.compile(r"\s+")
+
+
+def _fold_spaces(text: str) -> str:
+    # \s covers NBSP and the other Unicode spaces once the text is NFC
+    return _SPACES.sub(" ", text).strip()
+
+
+def canonicalize(text: str, case: Optional[str] = None) -> str:
+    """
+    Canonical form of a text for cache keys
+
+    Args:
+        text: Source text
+        case: Case rule (default: CACHE_KEY_CASE)
+
+    Returns:
+        Canonical text (only used for hashing, never translated)
+    """
+    case = (case or CACHE_KEY_CASE).lower()
+    if case not in CASE_RULES:
+        raise ValueError(f"Unknown case rule: {case} (expected one of {', '.join(CASE_RULES)})")
+
+    text = unicodedata.normalize("NFC", text)
+    text = text.translate(_INVISIBLE).translate(_QUOTES)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    paragraphs = (_fold_spaces(p) for p in _PARAGRAPH.split(text))
+    text = "\n\n".join(p for p in paragraphs if p)
+
+    if case == "lower":
+        text = text.casefold()
+    elif case == "first" and text:
+        text = text[0].lower() + text[1:]
+    return text
+
+
+def key_version(case: Optional[str] = None) -> str:
+    """Version tag of the key scheme (rules version + case rule)"""
+    case = (case or CACHE_KEY_CASE).lower()
+    return KEY_VERSION if case == "preserve" else f"{KEY_VERSION}-{case}"
+
+
+def translation_key_data(text: str, src_lang: str, tgt_lang: str, case: Optional[str] = None) -> str:
+    """Versioned string hashed into a translation key"""
+    return f"{key_version(case)}|{src_lang}|{tgt_lang}|{canonicalize(text, case)}"
+
+
+def translation_key(text: str, src_lang: str, tgt_lang: str, case: Optional[str] = None) -> str:
+    """
+    Cache key of a translation (MD5 hex, like the previous raw-text keys)
+
+    Args:
+        text: Source text
+        src_lang: Source language ("auto" included as-is)
+        tgt_lang: Target language
+        case: Case rule (default: CACHE_KEY_CASE)
+    """
+    data = translation_key_data(text, src_lang, tgt_lang, case)
+    return hashlib.md5(data.encode('utf-8')).hexdigest()
+
+
+# ============================================================
+# CORPUS REPLAY
+# ============================================================
+
+def split_segments(text: str, segment: str = "paragraph") -> List[str]:
+    """
+    Split a corpus into the units a cache would see
+
+    Args:
+        text: Corpus text
+        segment: "line" (one request per line) or "paragraph" (blank-line separated)
+    """
+    if segment == "line":
+        parts = text.splitlines()
+    elif segment == "paragraph":
+        parts = _PARAGRAPH.split(text.replace("\r\n", "\n"))
+    else:
+        raise ValueError(f"Unknown segment mode: {segment}")
+    return [p for p in parts if p.strip()]
+
+
+def _replay(segments: Iterable[str], key_fn) -> dict:
+    seen = set()
+    hits = total = 0
+    for text in segments:
+        key = key_fn(text)
+        total += 1
+        if key in seen:
+            hits += 1
+        else:
+            seen.add(key)
+    return {
+        "unique_keys": len(seen),
+        "hits": hits,
+        "hit_rate": round(hits / total * 100, 2) if total else 0.0,
+    }
+
+
+def replay_corpus(segments: List[str], src_lang: str = "auto", tgt_lang: str = "ht") -> dict:
+    """
+    Replay segments through an unbounded cache with raw and canonical keys
+
+    Returns:
+        dict with segments, raw, one entry per case rule, and the
+        improvement (percentage points) of the configured rule over raw keys
+    """
+    def raw_key(text):
+        return hashlib.md5(f"{text}_{src_lang}_{tgt_lang}".encode('utf-8')).hexdigest()
+
+    report: Dict[str, dict] = {"raw": _replay(segments, raw_key)}
+    for case in CASE_RULES:
+        report[case] = _replay(segments, lambda text, c=case: translation_key(text, src_lang, tgt_lang, c))
+    return {
+        "segments": len(segments),
+        "key_version": key_version(),
+        **report,
+        "improvement": round(report[CACHE_KEY_CASE]["hit_rate"] - report["raw"]["hit_rate"], 2),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a corpus and compare raw vs canonical cache key hit rates"
+    )
+    parser.add_argument("files", nargs="+", help="Corpus text files (read in order)")
+    parser.add_argument("--segment", choices=("line", "paragraph"), default="paragraph")
+    parser.add_argument("--src", default="auto", help="Source language")
+    parser.add_argument("--tgt", default="ht", help="Target language")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    segments = []
+    for name in args.files:
+        segments.extend(split_segments(Path(name).read_text(encoding="utf-8"), args.segment))
+    report = replay_corpus(segments, args.src, args.tgt)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"📊 {report['segments']} segments ({args.segment}), key version {report['key_version']}")
+    for name in ("raw",) + CASE_RULES:
+        row = report[name]
+        print(f"  {name:<9} {row['hit_rate']:6.2f}% hit rate, {row['unique_keys']} unique keys")
+    print(f"  ➜ +{report['improvement']:.2f} points with CACHE_KEY_CASE={CACHE_KEY_CASE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
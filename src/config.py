@@ -36,6 +36,7 @@ class Config:
     target_language: str = "ht"  # Haitian Creole
     chunk_size: int = 1000
     enable_cache: bool = True
+    cache_max_entries: int = 50_000  # 0 = unbounded; TinyLFU admission when full
     
     # Audio Settings
     tts_language: str = "ht"  # Note: gTTS will use 'fr' for Haitian Creole
@@ -90,6 +91,7 @@ class Config:
             translation_model=os.getenv("TRANSLATION_MODEL", "facebook/m2m100_418M"),
             chunk_size=int(os.getenv("CHUNK_SIZE", 1000)),
             enable_cache=os.getenv("ENABLE_CACHE", "true").lower() == "true",
+            cache_max_entries=int(os.getenv("CACHE_MAX_ENTRIES", 50_000)),
             enable_parallel=os.getenv("ENABLE_PARALLEL", "false").lower() == "true",
             max_workers=int(os.getenv("MAX_WORKERS", 3)),
         )
@@ -107,6 +109,7 @@ class Config:
             "target_language": self.target_language,
             "chunk_size": self.chunk_size,
             "enable_cache": self.enable_cache,
+            "cache_max_entries": self.cache_max_entries,
             "enable_parallel": self.enable_parallel,
         }
     
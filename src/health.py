@@ -8,7 +8,7 @@ Comprehensive health checks for production monitoring
 import logging
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from enum import Enum
 from pydantic import BaseModel
 
@@ -56,8 +56,30 @@ class HealthChecker:
         self.app_version = app_version
         self.environment = environment
         self.start_time = time.time()
+        self._readiness_gates: Dict[str, Callable[[], bool]] = {}
         logger.info("Health checker initialized")
     
+    def add_readiness_gate(self, name: str, check: Callable[[], bool]) -> None:
+        """
+        Register a condition that must hold before the instance is ready
+        (e.g. cache warmup finished)
+        
+        Args:
+            name: Gate name (shown in the readiness response)
+            check: Returns True once the gate is open
+        """
+        self._readiness_gates[name] = check
+    
+    def _check_gates(self) -> Dict[str, bool]:
+        gates = {}
+        for name, check in self._readiness_gates.items():
+            try:
+                gates[name] = bool(check())
+            except Exception as e:
+                logger.error(f"Readiness gate {name} failed: {e}")
+                gates[name] = False
+        return gates
+    
     async def check_all(self, include_details: bool = True) -> HealthCheck:
         """
         Check health of all components
@@ -372,20 +394,31 @@ class HealthChecker:
         Kubernetes-style readiness probe
         Check if application is ready to serve traffic
         
+        Only the readiness gates and cheap local checks run here: the
+        probe is polled every few seconds, and a remote dependency
+        (online translator, database) being down must not take an
+        offline-capable instance out of rotation. Use check_all() for
+        the full component report.
+        
         Returns:
             Dict with status and component checks
         """
-        health = await self.check_all(include_details=True)
+        components = {"storage": await self.check_storage()}
+        gates = self._check_gates()
         
-        is_ready = health.status in [HealthStatus.HEALTHY, HealthStatus.DEGRADED]
+        is_ready = (
+            all(comp.status != HealthStatus.UNHEALTHY for comp in components.values())
+            and all(gates.values())
+        )
         
         return {
             "status": "ready" if is_ready else "not_ready",
-            "timestamp": health.timestamp,
+            "timestamp": datetime.utcnow().isoformat(),
             "components": {
                 name: comp.status
-                for name, comp in health.components.items()
-            }
+                for name, comp in components.items()
+            },
+            "gates": gates
         }
     
     async def startup_probe(self) -> Dict[str, Any]:
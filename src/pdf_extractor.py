@@ -7,7 +7,7 @@ Extract text from PDF files with validation
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError
 from tqdm import tqdm
@@ -130,6 +130,50 @@ class PDFExtractor:
             logger.error(f"Extraction error: {e}")
             raise
     
+    def iter_pages(self, pdf_path: Path) -> Iterator[str]:
+        """
+        Ekstrè paj yo youn apre lòt / Stream page texts
+        
+        Lazily extracts one page at a time so downstream stages (chunking,
+        translation, TTS) can start before the whole PDF is read.
+        
+        Args:
+            pdf_path: Path to PDF file
+        
+        Yields:
+            Text of each page that has text
+        
+        Raises:
+            ValueError: If PDF is invalid, corrupted or has too many pages
+        """
+        pdf_path = Path(pdf_path)
+        self.validate_pdf(pdf_path)
+        
+        try:
+            reader = PdfReader(str(pdf_path))
+        except PdfReadError as e:
+            logger.error(f"PDF read error: {e}")
+            raise ValueError(
+                f"PDF koronpi oswa pwoteje / PDF corrupted or encrypted: {e}"
+            )
+        
+        total_pages = len(reader.pages)
+        if total_pages > self.config.max_pdf_pages:
+            raise ValueError(
+                f"PDF gen twòp paj: {total_pages} (max: {self.config.max_pdf_pages})\n"
+                f"PDF has too many pages: {total_pages} (max: {self.config.max_pdf_pages})"
+            )
+        
+        logger.info(f"Streaming {total_pages} pages from {pdf_path.name}")
+        for i, page in enumerate(reader.pages, 1):
+            try:
+                page_text = page.extract_text()
+            except Exception as e:
+                logger.warning(f"Error extracting page {i}: {e}")
+                continue
+            if page_text:
+                yield page_text
+    
     def extract_and_save(
         self,
         pdf_path: Path,
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Staged Pipeline Module
+Ekstraksyon → tradiksyon → TTS an paralèl ak ke limite ant etap yo
+Overlapped extract → translate → synthesize with bounded queues
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+logger = logging.getLogger('KreyolAI.Pipeline')
+
+_STOP = object()
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class Stage:
+    """
+    Yon etap nan pipeline la / A pipeline stage
+
+    Attributes:
+        name: Stage name (for stats and logs)
+        func: Function applied to each item
+        workers: Number of worker threads for this stage
+        queue_size: Capacity of the stage's input queue (backpressure)
+    """
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = 4
+
+
+@dataclass
+class StageStats:
+    """Estatistik yon etap / Per-stage statistics"""
+    name: str
+    workers: int
+    items: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, busy: float, blocked: float) -> None:
+        with self._lock:
+            self.items += 1
+            self.busy_seconds += busy
+            self.blocked_seconds += blocked
+
+    def to_dict(self, wall_seconds: float) -> dict:
+        capacity = max(wall_seconds * self.workers, 1e-9)
+        return {
+            'name': self.name,
+            'workers': self.workers,
+            'items': self.items,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'blocked_seconds': round(self.blocked_seconds, 3),
+            'utilization': round(min(self.busy_seconds / capacity, 1.0), 3),
+        }
+
+
+class _Failure:
+    """Erè yon item ki pase atravè rès etap yo / Error carried downstream"""
+
+    def __init__(self, stage: str, error: BaseException):
+        self.stage = stage
+        self.error = error
+
+
+class StagedPipeline:
+    """
+    Pipeline ak etap paralèl / Staged pipeline engine
+
+    Each stage runs in its own worker threads and is connected to the next
+    by a bounded queue.Queue, so chunk k can be translated while chunk k-1
+    is synthesized and chunk k+1 is extracted. A full queue blocks the
+    upstream stage (backpressure), which bounds memory. Results come out
+    in input order. Wall time approaches the slowest stage instead of the
+    sum of all stages.
+
+    Example:
+        pipeline = StagedPipeline([
+            Stage("translate", translate_chunk, workers=3),
+            Stage("tts", synthesize_chunk, workers=2),
+        ])
+        for audio_path in pipeline.run(iter_chunks(pages)):
+            ...
+    """
+
+    def __init__(self, stages: List[Stage], source_name: str = "source"):
+        """
+        Initialize pipeline
+
+        Args:
+            stages: Ordered list of stages
+            source_name: Stats name for the thread that pulls from the input
+                         iterable (e.g. page extraction)
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+        self.source_name = source_name
+        self._stats: Dict[str, StageStats] = {}
+        self._wall_seconds = 0.0
+
+    def _put(self, q: queue.Queue, item: Any, abort: threading.Event) -> float:
+        """Put with backpressure; returns seconds spent blocked"""
+        start = time.perf_counter()
+        while not abort.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                break
+            except queue.Full:
+                continue
+        return time.perf_counter() - start
+
+    def _get(self, q: queue.Queue, abort: threading.Event) -> Any:
+        while not abort.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _STOP
+
+    def _feed(self, items: Iterable, out_q: queue.Queue, abort: threading.Event) -> None:
+        """Source thread: pulls lazily from the iterable (extraction overlaps)"""
+        stats = self._stats[self.source_name]
+        iterator = iter(items)
+        seq = 0
+        while not abort.is_set():
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            except BaseException as e:
+                item = _Failure(self.source_name, e)
+            busy = time.perf_counter() - start
+            blocked = self._put(out_q, (seq, item), abort)
+            stats.record(busy, blocked)
+            seq += 1
+            if isinstance(item, _Failure):
+                break
+        self._put(out_q, _STOP, abort)
+
+    def _work(
+        self,
+        stage: Stage,
+        in_q: queue.Queue,
+        out_q: queue.Queue,
+        abort: threading.Event,
+        remaining: List[int],
+        lock: threading.Lock
+    ) -> None:
+        """Worker thread for one stage"""
+        stats = self._stats[stage.name]
+        while True:
+            entry = self._get(in_q, abort)
+            if entry is _STOP:
+                # Let sibling workers see the stop marker too
+                if not abort.is_set():
+                    in_q.put(_STOP)
+                break
+
+            seq, item = entry
+            start = time.perf_counter()
+            if not isinstance(item, _Failure):
+                try:
+                    item = stage.func(item)
+                except BaseException as e:
+                    logger.error(f"Stage '{stage.name}' failed on item {seq}: {e}")
+                    item = _Failure(stage.name, e)
+            busy = time.perf_counter() - start
+            blocked = self._put(out_q, (seq, item), abort)
+            stats.record(busy, blocked)
+
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            self._put(out_q, _STOP, abort)
+
+    def run(self, items: Iterable) -> Iterator[Any]:
+        """
+        Kouri pipeline la / Run items through all stages
+
+        Args:
+            items: Input iterable (consumed lazily in a source thread)
+
+        Yields:
+            Final stage results, in input order
+
+        Raises:
+            The first exception raised by any stage, in input order
+        """
+        abort = threading.Event()
+        self._stats = {self.source_name: StageStats(self.source_name, 1)}
+        queues = [queue.Queue(maxsize=max(1, stage.queue_size)) for stage in self.stages]
+        output_q = queue.Queue(maxsize=max(1, self.stages[-1].queue_size))
+        queues.append(output_q)
+
+        threads = [threading.Thread(
+            target=self._feed, args=(items, queues[0], abort),
+            name=f"pipeline-{self.source_name}", daemon=True
+        )]
+        for i, stage in enumerate(self.stages):
+            self._stats[stage.name] = StageStats(stage.name, stage.workers)
+            remaining, lock = [max(1, stage.workers)], threading.Lock()
+            for w in range(max(1, stage.workers)):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[i], queues[i + 1], abort, remaining, lock),
+                    name=f"pipeline-{stage.name}-{w}", daemon=True
+                ))
+
+        logger.info(
+            "Pipeline start: " + " → ".join(f"{s.name}×{s.workers}" for s in self.stages)
+        )
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        pending = {}
+        next_seq = 0
+        try:
+            while True:
+                entry = self._get(output_q, abort)
+                if entry is _STOP:
+                    break
+                seq, item = entry
+                pending[seq] = item
+                # Reorder: emit everything that is now contiguous
+                while next_seq in pending:
+                    result = pending.pop(next_seq)
+                    next_seq += 1
+                    if isinstance(result, _Failure):
+                        raise result.error
+                    yield result
+        finally:
+            abort.set()
+            for thread in threads:
+                thread.join(timeout=5)
+            self._wall_seconds = time.perf_counter() - started
+            logger.info(f"Pipeline finished in {self._wall_seconds:.2f}s ({next_seq} items)")
+
+    def stats(self) -> dict:
+        """
+        Estatistik pa etap / Per-stage statistics of the last run
+
+        Returns:
+            Dict with wall time, per-stage busy/blocked time and the
+            bottleneck stage (highest utilization)
+        """
+        stages = [s.to_dict(self._wall_seconds) for s in self._stats.values()]
+        bottleneck = max(stages, key=lambda s: s['utilization'])['name'] if stages else None
+        return {
+            'wall_seconds': round(self._wall_seconds, 3),
+            'stages': stages,
+            'bottleneck': bottleneck,
+        }
+
+
+def run_pipeline(items: Iterable, stages: List[Stage], source_name: str = "source") -> tuple:
+    """
+    Kouri yon pipeline epi retounen tout rezilta yo / Run and collect results
+
+    Args:
+        items: Input iterable
+        stages: Pipeline stages
+        source_name: Name of the source stage in stats
+
+    Returns:
+        Tuple of (results list, stats dict)
+    """
+    pipeline = StagedPipeline(stages, source_name=source_name)
+    results = list(pipeline.run(items))
+    return results, pipeline.stats()
+
+
+class BatchExecutor:
+    """
+    Trete plizyè liv an menm tan / Concurrent executor for whole items
+
+    Runs one function per item (a whole book) on a thread pool, while
+    ``stage()`` blocks cap how many items may be inside a given stage at
+    once across the batch (e.g. one translation at a time on the shared
+    model, several network-bound TTS calls). Results come back in input
+    order, so reports and saved results read the same as a sequential run.
+
+    Example:
+        executor = BatchExecutor(max_concurrent=3, stage_limits={"translate": 1})
+
+        def process(book):
+            with executor.stage("extract"):
+                text = extractor.extract(book)
+            with executor.stage("translate"):
+                return translator.translate(text)
+
+        for result in executor.run(books, process):
+            ...
+    """
+
+    def __init__(self, max_concurrent: int = 2, stage_limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize executor
+
+        Args:
+            max_concurrent: Items processed at the same time
+            stage_limits: Max items inside each named stage at once
+                          (stages without a limit are only bounded by
+                          max_concurrent)
+        """
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.stage_limits = {name: max(1, int(n)) for name, n in (stage_limits or {}).items()}
+        self._semaphores = {
+            name: threading.BoundedSemaphore(n) for name, n in self.stage_limits.items()
+        }
+        self._stats: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+        self._items = 0
+        self._wall_seconds = 0.0
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Antre nan yon etap / Enter a concurrency-limited stage
+
+        Time spent waiting for a slot is recorded as blocked time, time
+        inside the block as busy time.
+        """
+        with self._lock:
+            if name not in self._stats:
+                workers = min(self.stage_limits.get(name, self.max_concurrent), self.max_concurrent)
+                self._stats[name] = StageStats(name, workers)
+            stats = self._stats[name]
+
+        semaphore = self._semaphores.get(name)
+        start = time.perf_counter()
+        if semaphore is not None:
+            semaphore.acquire()
+        entered = time.perf_counter()
+        try:
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+            stats.record(time.perf_counter() - entered, entered - start)
+
+    def run(self, items: Iterable, func: Callable[[Any], Any]) -> Iterator[Any]:
+        """
+        Kouri func sou chak item / Process items concurrently
+
+        Args:
+            items: Items to process (e.g. book configs or PDF paths)
+            func: Function applied to each item
+
+        Yields:
+            func results, in input order (as soon as each is next in line)
+
+        Raises:
+            The first exception raised by func, in input order; items not
+            yet started are cancelled
+        """
+        items = list(items)
+        self._stats = {}
+        self._items = 0
+        logger.info(
+            f"Batch start: {len(items)} items, {self.max_concurrent} concurrent, "
+            f"stage limits {self.stage_limits}"
+        )
+        started = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="batch")
+        try:
+            futures = [pool.submit(func, item) for item in items]
+            for future in futures:
+                result = future.result()
+                self._items += 1
+                yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            self._wall_seconds = time.perf_counter() - started
+            logger.info(f"Batch finished in {self._wall_seconds:.2f}s ({self._items} items)")
+
+    def stats(self) -> dict:
+        """
+        Estatistik batch la / Statistics of the last run
+
+        Returns:
+            Dict with wall time, items, items per hour, per-stage busy and
+            waiting time, and the bottleneck stage
+        """
+        wall = self._wall_seconds
+        stages = [s.to_dict(wall) for s in self._stats.values()]
+        bottleneck = max(stages, key=lambda s: s['utilization'])['name'] if stages else None
+        return {
+            'wall_seconds': round(wall, 3),
+            'items': self._items,
+            'items_per_hour': round(self._items * 3600 / wall, 1) if wall > 0 else 0.0,
+            'max_concurrent': self.max_concurrent,
+            'stages': stages,
+            'bottleneck': bottleneck,
+        }
@@ -8,9 +8,12 @@ Distributed caching for improved scalability
 import logging
 import json
 import hashlib
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, List, Tuple
 from datetime import timedelta
 
+from .cache_keys import translation_key_data
+from .redis_maintenance import sample_keyspace, scan_delete
+
 logger = logging.getLogger('KreyolAI.RedisCache')
 
 try:
@@ -147,6 +150,73 @@ class RedisCache:
             logger.error(f"Cache set error: {e}")
             return False
     
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get many values in one round trip (MGET)
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Values in the same order (None for misses)
+        """
+        if not keys:
+            return []
+        if not self.enabled:
+            return [None] * len(keys)
+        
+        try:
+            raw_values = self.client.mget(keys)
+        except Exception as e:
+            logger.error(f"Cache mget error: {e}")
+            return [None] * len(keys)
+        
+        values = []
+        for raw in raw_values:
+            if raw is None:
+                self.misses += 1
+                values.append(None)
+                continue
+            try:
+                values.append(json.loads(raw))
+                self.hits += 1
+            except ValueError as e:
+                logger.warning(f"Cache decode error: {e}")
+                self.misses += 1
+                values.append(None)
+        logger.debug(f"Cache mget: {len(keys)} keys, {sum(v is not None for v in values)} hits")
+        return values
+    
+    def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set many values in one round trip (pipelined SETEX)
+        
+        Args:
+            items: Mapping of key to value
+            ttl: Time-to-live in seconds (None = default)
+        
+        Returns:
+            True if successful
+        """
+        if not self.enabled or not items:
+            return False
+        
+        try:
+            ttl = ttl or self.default_ttl
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, json.dumps(value, ensure_ascii=False))
+            pipe.execute()
+            logger.debug(f"Cache set_many: {len(items)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache set_many error: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """
         Delete value from cache
@@ -168,12 +238,17 @@ class RedisCache:
             logger.error(f"Cache delete error: {e}")
             return False
     
-    def clear(self, pattern: Optional[str] = None) -> bool:
+    def clear(
+        self,
+        pattern: Optional[str] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> bool:
         """
         Clear cache
         
         Args:
             pattern: Key pattern to clear (None = all)
+            progress: Called as progress(deleted, scanned) after each batch
         
         Returns:
             True if successful
@@ -183,10 +258,9 @@ class RedisCache:
         
         try:
             if pattern:
-                keys = self.client.keys(pattern)
-                if keys:
-                    self.client.delete(*keys)
-                logger.info(f"Cache cleared: {pattern} ({len(keys)} keys)")
+                # SCAN + batched UNLINK: never blocks Redis like KEYS does
+                deleted = scan_delete(self.client, pattern, progress=progress)
+                logger.info(f"Cache cleared: {pattern} ({deleted} keys)")
             else:
                 self.client.flushdb()
                 logger.info("Cache cleared: all keys")
@@ -225,7 +299,26 @@ class RedisCache:
                 logger.error(f"Failed to get Redis info: {e}")
         
         return stats
-    
+
+    def keyspace_stats(self, sample_size: int = 500) -> dict:
+        """
+        Per-namespace key counts and memory, estimated by sampling
+
+        Args:
+            sample_size: Number of keys to sample
+
+        Returns:
+            Dictionary with estimates (empty if cache disabled)
+        """
+        if not self.enabled or not self.client:
+            return {}
+
+        try:
+            return sample_keyspace(self.client, sample_size=sample_size)
+        except Exception as e:
+            logger.error(f"Failed to sample keyspace: {e}")
+            return {}
+
     def reset_stats(self):
         """Reset cache statistics"""
         self.hits = 0
@@ -269,8 +362,7 @@ class TranslationCache:
         Returns:
             Cache key
         """
-        data = f"{text}|{src_lang}|{tgt_lang}"
-        return self.cache._make_key(self.prefix, data)
+        return self.cache._make_key(self.prefix, translation_key_data(text, src_lang, tgt_lang))
     
     def get_translation(
         self,
@@ -336,6 +428,69 @@ class TranslationCache:
         
         return success
     
+    def get_many(
+        self,
+        texts: List[str],
+        src_lang: str,
+        tgt_lang: str
+    ) -> List[Optional[str]]:
+        """
+        Get cached translations for many texts in one round trip
+        
+        Args:
+            texts: Source texts
+            src_lang: Source language
+            tgt_lang: Target language
+        
+        Returns:
+            Translations in the same order (None for misses)
+        """
+        keys = [self._make_key(text, src_lang, tgt_lang) for text in texts]
+        results = self.cache.get_many(keys)
+        translations = [r.get("translation") if r else None for r in results]
+        hits = sum(t is not None for t in translations)
+        logger.info(f"Translation cache batch: {hits}/{len(texts)} hits ({src_lang} → {tgt_lang})")
+        return translations
+    
+    def set_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        src_lang: str,
+        tgt_lang: str,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache many translations in one round trip
+        
+        Args:
+            pairs: (text, translation) pairs
+            src_lang: Source language
+            tgt_lang: Target language
+            ttl: Time-to-live in seconds
+        
+        Returns:
+            True if successful
+        """
+        items = {
+            self._make_key(text, src_lang, tgt_lang): {
+                "translation": translation,
+                "src_lang": src_lang,
+                "tgt_lang": tgt_lang,
+                "text_length": len(text),
+                "translation_length": len(translation)
+            }
+            for text, translation in pairs
+        }
+        return self.cache.set_many(items, ttl)
+    
+    def get(self, text: str, src_lang: str, tgt_lang: str) -> Optional[str]:
+        """Same interface as the file cache (src.translator.TranslationCache)"""
+        return self.get_translation(text, src_lang, tgt_lang)
+    
+    def set(self, text: str, translation: str, src_lang: str, tgt_lang: str) -> None:
+        """Same interface as the file cache (src.translator.TranslationCache)"""
+        self.set_translation(text, translation, src_lang, tgt_lang)
+    
     def clear_translations(self):
         """Clear all translation cache"""
         return self.cache.clear(f"{self.prefix}:*")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Redis Maintenance Helpers
+Non-blocking bulk deletes and sampled keyspace statistics
+
+KEYS and one giant DEL block Redis for the whole keyspace; these helpers
+walk it with SCAN cursors and UNLINK in bounded batches instead.
+"""
+
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger('KreyolAI.RedisMaintenance')
+
+DEFAULT_SCAN_COUNT = 1000
+DEFAULT_DELETE_BATCH = 500
+DEFAULT_SAMPLE_SIZE = 500
+NO_NAMESPACE = "(none)"
+
+
+def _to_str(key: Any) -> str:
+    return key.decode("utf-8", "replace") if isinstance(key, bytes) else str(key)
+
+
+def _unlink(client, keys: List[Any]) -> int:
+    """UNLINK a batch (frees memory in the background); DEL on Redis < 4"""
+    try:
+        return client.unlink(*keys) or 0
+    except Exception as e:
+        if "unknown command" not in str(e).lower():
+            raise
+        return client.delete(*keys) or 0
+
+
+def scan_delete(
+    client,
+    pattern: str = "*",
+    batch_size: int = DEFAULT_DELETE_BATCH,
+    scan_count: int = DEFAULT_SCAN_COUNT,
+    progress: Optional[Callable[[int, int], None]] = None,
+    pause: float = 0.0
+) -> int:
+    """
+    Delete every key matching a pattern without blocking the server
+
+    Args:
+        client: Redis client
+        pattern: Glob pattern (e.g. "trans:*")
+        batch_size: Keys per UNLINK call
+        scan_count: COUNT hint for each SCAN call
+        progress: Called as progress(deleted, scanned) after each batch
+        pause: Seconds to sleep between batches (throttle on busy servers)
+
+    Returns:
+        Number of keys deleted
+    """
+    deleted = 0
+    scanned = 0
+    batch: List[Any] = []
+    cursor = 0
+
+    def flush(keys: List[Any]) -> None:
+        nonlocal deleted
+        deleted += _unlink(client, keys)
+        if progress is not None:
+            progress(deleted, scanned)
+        if pause:
+            time.sleep(pause)
+
+    while True:
+        cursor, keys = client.scan(cursor=cursor, match=pattern, count=scan_count)
+        cursor = int(cursor)
+        scanned += len(keys)
+        batch.extend(keys)
+        while len(batch) >= batch_size:
+            flush(batch[:batch_size])
+            batch = batch[batch_size:]
+        if cursor == 0:
+            break
+
+    if batch:
+        flush(batch)
+
+    logger.info(f"Deleted {deleted} keys matching {pattern}")
+    return deleted
+
+
+def namespace_of(key: Any, separator: str = ":") -> str:
+    """Namespace of a key: text before the first separator"""
+    key = _to_str(key)
+    return key.split(separator, 1)[0] if separator in key else NO_NAMESPACE
+
+
+def _human_bytes(size: float) -> str:
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
+
+
+def _memory_usage(client, keys: List[Any]) -> List[int]:
+    """MEMORY USAGE for each key in one round trip (0 if unsupported/expired)"""
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.memory_usage(key)
+        return [int(size or 0) for size in pipe.execute()]
+    except Exception as e:
+        logger.warning(f"MEMORY USAGE unavailable: {e}")
+        return [0] * len(keys)
+
+
+def sample_keyspace(
+    client,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    separator: str = ":",
+    with_memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Estimate per-namespace key counts and memory without a full scan
+
+    Small keyspaces (<= sample_size keys) are scanned exactly. Larger ones
+    are sampled with RANDOMKEY: each namespace's share of the sample times
+    DBSIZE estimates its key count, and the average MEMORY USAGE of its
+    sampled keys estimates its memory.
+
+    Args:
+        client: Redis client
+        sample_size: Number of keys to sample
+        separator: Namespace separator in key names
+        with_memory: Also sample MEMORY USAGE
+
+    Returns:
+        dict with total_keys, method, sampled and per-namespace estimates
+    """
+    total = int(client.dbsize())
+    if total == 0:
+        return {"total_keys": 0, "method": "exact", "sampled": 0, "namespaces": {}}
+
+    if total <= sample_size:
+        method = "exact"
+        keys = list(client.scan_iter(count=DEFAULT_SCAN_COUNT))
+    else:
+        method = "sample"
+        pipe = client.pipeline(transaction=False)
+        for _ in range(sample_size):
+            pipe.randomkey()
+        keys = [key for key in pipe.execute() if key is not None]
+
+    if not keys:
+        return {"total_keys": total, "method": method, "sampled": 0, "namespaces": {}}
+
+    sizes = _memory_usage(client, keys) if with_memory else [0] * len(keys)
+
+    groups: Dict[str, List[int]] = {}
+    for key, size in zip(keys, sizes):
+        groups.setdefault(namespace_of(key, separator), []).append(size)
+
+    n = len(keys)
+    namespaces = {}
+    for name, group in sorted(groups.items(), key=lambda item: -len(item[1])):
+        share = len(group) / n
+        estimate = total * share if method == "sample" else len(group)
+        avg_bytes = sum(group) / len(group)
+        entry = {
+            "keys": int(round(estimate)),
+            "share": round(share, 4),
+            "sampled": len(group),
+        }
+        if method == "sample":
+            # 95% interval on the share (normal approximation)
+            entry["keys_margin"] = int(round(total * 1.96 * math.sqrt(share * (1 - share) / n)))
+        if with_memory:
+            entry["avg_bytes"] = int(round(avg_bytes))
+            entry["memory_bytes"] = int(round(avg_bytes * estimate))
+            entry["memory_human"] = _human_bytes(avg_bytes * estimate)
+        namespaces[name] = entry
+
+    return {"total_keys": total, "method": method, "sampled": n, "namespaces": namespaces}
@@ -5,16 +5,20 @@ Translator Module with Caching
 Translate text to Haitian Creole with intelligent caching
 """
 
-import hashlib
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from transformers import pipeline
 from langdetect import detect, LangDetectException
 from tqdm import tqdm
 
+from .cache_admission import CacheAnalytics, TinyLFU
+from .cache_keys import translation_key
 from .config import Config
 from .utils import smart_chunk_text
 
@@ -22,26 +26,56 @@ from .utils import smart_chunk_text
 logger = logging.getLogger('KreyolAI.Translator')
 
 
+# Bounded by default so TinyLFU admission protects the cache out of the box
+DEFAULT_CACHE_MAX_ENTRIES = 50_000
+
+
 class TranslationCache:
     """Sistèm cache pou tradiksyon / Translation cache system"""
     
-    def __init__(self, cache_dir: Path):
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        admission: Optional[TinyLFU] = None
+    ):
         """
         Initialize cache
         
         Args:
             cache_dir: Directory for cache files
+            max_entries: Maximum number of cached translations (0 = unbounded).
+                When full, a new translation only replaces the least recently
+                used one if the admission policy ranks it as more frequent.
+            admission: Admission policy (default: a TinyLFU sketch when bounded)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
-        self.hits = 0
-        self.misses = 0
+        self.max_entries = max_entries
+        self.admission = admission if admission is not None else (TinyLFU() if max_entries else None)
+        self.analytics = CacheAnalytics("translator")
+        self._index: Optional[OrderedDict] = None
+        self._lock = threading.Lock()
         logger.info(f"Translation cache initialized: {cache_dir}")
     
+    @property
+    def hits(self) -> int:
+        return self.analytics.hits
+    
+    @property
+    def misses(self) -> int:
+        return self.analytics.misses
+    
     def _get_cache_key(self, text: str, src_lang: str, tgt_lang: str) -> str:
-        """Generate unique cache key"""
-        content = f"{text}_{src_lang}_{tgt_lang}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        """Generate unique cache key (canonical text, see src.cache_keys)"""
+        return translation_key(text, src_lang, tgt_lang)
+    
+    def _lru_index(self) -> OrderedDict:
+        """Cached keys, least recently used first (loaded from file mtimes once)"""
+        if self._index is None:
+            files = sorted(self.cache_dir.glob("*.json"), key=lambda f: f.stat().st_mtime)
+            self._index = OrderedDict((f.stem, None) for f in files)
+        return self._index
     
     def get(self, text: str, src_lang: str, tgt_lang: str) -> Optional[str]:
         """
@@ -57,21 +91,48 @@ class TranslationCache:
         """
         cache_key = self._get_cache_key(text, src_lang, tgt_lang)
         cache_file = self.cache_dir / f"{cache_key}.json"
+        if self.admission is not None:
+            self.admission.record(cache_key)
         
         if cache_file.exists():
             try:
                 with open(cache_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                self.hits += 1
+                translation = data['translation']
+                self.analytics.record_hit(cache_key, len(translation.encode('utf-8')), text[:40])
+                if self.max_entries:
+                    os.utime(cache_file)
+                    with self._lock:
+                        self._lru_index()[cache_key] = None
+                        self._index.move_to_end(cache_key)
                 logger.debug(f"Cache hit: {cache_key[:8]}...")
-                return data['translation']
+                return translation
             except Exception as e:
                 logger.warning(f"Cache read error: {e}")
                 return None
         
-        self.misses += 1
+        self.analytics.record_miss(cache_key, text[:40])
         return None
     
+    def _admit(self, cache_key: str) -> bool:
+        """Make room for a new key, unless the admission policy prefers the LRU victim"""
+        if not self.max_entries:
+            return True
+        with self._lock:
+            index = self._lru_index()
+            if cache_key in index:
+                index.move_to_end(cache_key)
+                return True
+            while len(index) >= self.max_entries:
+                victim = next(iter(index))
+                if self.admission is not None and not self.admission.admit(cache_key, victim):
+                    logger.debug(f"Cache admission rejected: {cache_key[:8]}...")
+                    return False
+                index.pop(victim)
+                (self.cache_dir / f"{victim}.json").unlink(missing_ok=True)
+            index[cache_key] = None
+            return True
+    
     def set(self, text: str, translation: str, src_lang: str, tgt_lang: str) -> None:
         """
         Save translation to cache
@@ -84,6 +145,9 @@ class TranslationCache:
         """
         cache_key = self._get_cache_key(text, src_lang, tgt_lang)
         cache_file = self.cache_dir / f"{cache_key}.json"
+        self.analytics.record_fill(len(translation.encode('utf-8')))
+        if not self._admit(cache_key):
+            return
         
         try:
             data = {
@@ -101,54 +165,104 @@ class TranslationCache:
         except Exception as e:
             logger.warning(f"Cache write error: {e}")
     
+    def get_many(self, texts: List[str], src_lang: str, tgt_lang: str) -> List[Optional[str]]:
+        """
+        Get cached translations for many texts at once
+        
+        Args:
+            texts: Source texts
+            src_lang: Source language
+            tgt_lang: Target language
+        
+        Returns:
+            Translations in the same order (None for misses)
+        """
+        return [self.get(text, src_lang, tgt_lang) for text in texts]
+    
+    def set_many(self, pairs: List[Tuple[str, str]], src_lang: str, tgt_lang: str) -> None:
+        """
+        Save many translations at once
+        
+        Args:
+            pairs: (text, translation) pairs
+            src_lang: Source language
+            tgt_lang: Target language
+        """
+        for text, translation in pairs:
+            self.set(text, translation, src_lang, tgt_lang)
+    
     def clear(self) -> int:
         """Clear all cache files"""
         count = 0
         for cache_file in self.cache_dir.glob("*.json"):
             cache_file.unlink()
             count += 1
+        with self._lock:
+            self._index = None
         logger.info(f"Cache cleared: {count} files removed")
         return count
     
     def get_stats(self) -> dict:
-        """Get cache statistics"""
-        total = self.hits + self.misses
-        hit_rate = (self.hits / total * 100) if total > 0 else 0
+        """
+        Get cache statistics
+        
+        Returns:
+            dict with hits, misses, hit_rate (%), byte_hit_ratio, per-window
+            ratios, hot keys, admission counters and files/size on disk
+        """
+        snapshot = self.analytics.snapshot()
+        totals = snapshot['totals']
         
         cache_files = list(self.cache_dir.glob("*.json"))
         total_size = sum(f.stat().st_size for f in cache_files)
         
-        return {
-            'hits': self.hits,
-            'misses': self.misses,
-            'hit_rate': hit_rate,
+        stats = {
+            'hits': totals['hits'],
+            'misses': totals['misses'],
+            'hit_rate': totals['hit_ratio'] * 100,
+            'byte_hit_ratio': totals['byte_hit_ratio'],
+            'windows': snapshot['windows'],
+            'hot_keys': snapshot['hot_keys'],
             'files': len(cache_files),
             'size_mb': total_size / (1024 * 1024),
+            'max_entries': self.max_entries,
         }
+        if self.admission is not None:
+            stats['admission'] = self.admission.get_stats()
+        return stats
 
 
 class CreoleTranslator:
     """Klas pou tradui an Kreyòl / Class for Creole translation"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, cache=None):
         """
         Initialize translator
         
         Args:
             config: Configuration object
+            cache: Translation cache with get/set/get_many/set_many
+                (default: file cache in config.cache_dir, e.g.
+                src.redis_cache.TranslationCache for Redis)
         """
         self.config = config
         self.translator = None  # Lazy loading
-        self.cache = TranslationCache(config.cache_dir) if config.enable_cache else None
+        self._load_lock = threading.Lock()
+        if cache is None and config.enable_cache:
+            cache = TranslationCache(config.cache_dir, max_entries=config.cache_max_entries)
+        self.cache = cache
         logger.info(f"Translator initialized (cache: {config.enable_cache})")
     
     def _load_model(self) -> None:
-        """Load translation model (lazy loading)"""
-        if self.translator is None:
-            logger.info(f"Loading translation model: {self.config.translation_model}")
-            print(f"🧠 Ap chaje modèl / Loading model: {self.config.translation_model}")
-            self.translator = pipeline("translation", model=self.config.translation_model)
-            logger.info("Model loaded successfully")
+        """Load translation model (lazy loading, once even when shared by threads)"""
+        if self.translator is not None:
+            return
+        with self._load_lock:
+            if self.translator is None:
+                logger.info(f"Loading translation model: {self.config.translation_model}")
+                print(f"🧠 Ap chaje modèl / Loading model: {self.config.translation_model}")
+                self.translator = pipeline("translation", model=self.config.translation_model)
+                logger.info("Model loaded successfully")
     
     def detect_language(self, text: str) -> str:
         """
@@ -247,11 +361,30 @@ class CreoleTranslator:
         print(f"  📊 {len(chunks)} moso / chunks")
         logger.info(f"Split into {len(chunks)} chunks")
         
-        # Translate with parallel processing if enabled
-        if self.config.enable_parallel and len(chunks) > 3:
-            translated = self._translate_parallel(chunks, src_lang, show_progress)
-        else:
-            translated = self._translate_sequential(chunks, src_lang, show_progress)
+        # Resolve cached chunks in one batch, then translate only the misses
+        translated = self._lookup_cached(chunks, src_lang)
+        missing = list(dict.fromkeys(
+            chunk for chunk, trans in zip(chunks, translated) if trans is None
+        ))
+        if missing:
+            if len(missing) < len(chunks):
+                print(f"  💾 {len(chunks) - len(missing)} moso nan cache / chunks cached, "
+                      f"{len(missing)} pou tradui / to translate")
+            
+            # Translate with parallel processing if enabled
+            if self.config.enable_parallel and len(missing) > 3:
+                new = self._translate_parallel(missing, src_lang, show_progress, use_cache=False)
+            else:
+                new = self._translate_sequential(missing, src_lang, show_progress, use_cache=False)
+            
+            fresh = dict(zip(missing, new))
+            # Failed chunks come back as the original string object: not cached
+            self._store_cached(
+                [(chunk, trans) for chunk, trans in fresh.items() if trans is not chunk],
+                src_lang
+            )
+            translated = [fresh[chunk] if trans is None else trans
+                          for chunk, trans in zip(chunks, translated)]
         
         result = "\n\n".join(translated)
         
@@ -264,18 +397,39 @@ class CreoleTranslator:
         logger.info(f"Translation completed: {len(result)} characters")
         return result
     
+    def _lookup_cached(self, chunks: List[str], src_lang: str) -> List[Optional[str]]:
+        """Cached translation of each chunk (None = miss), one batch lookup"""
+        if not self.cache:
+            return [None] * len(chunks)
+        try:
+            found = self.cache.get_many(chunks, src_lang, self.config.target_language)
+        except Exception as e:
+            logger.warning(f"Cache batch read error: {e}")
+            return [None] * len(chunks)
+        return [trans or None for trans in found]
+    
+    def _store_cached(self, pairs: List[Tuple[str, str]], src_lang: str) -> None:
+        """Save new translations in one batch"""
+        if not self.cache or not pairs:
+            return
+        try:
+            self.cache.set_many(pairs, src_lang, self.config.target_language)
+        except Exception as e:
+            logger.warning(f"Cache batch write error: {e}")
+    
     def _translate_sequential(
         self,
         chunks: List[str],
         src_lang: str,
-        show_progress: bool
+        show_progress: bool,
+        use_cache: bool = True
     ) -> List[str]:
         """Translate chunks sequentially"""
         translated = []
         iterator = tqdm(chunks, desc="Tradiksyon", disable=not show_progress)
         
         for chunk in iterator:
-            trans = self.translate_chunk(chunk, src_lang)
+            trans = self.translate_chunk(chunk, src_lang, use_cache=use_cache)
             translated.append(trans)
         
         return translated
@@ -284,7 +438,8 @@ class CreoleTranslator:
         self,
         chunks: List[str],
         src_lang: str,
-        show_progress: bool
+        show_progress: bool,
+        use_cache: bool = True
     ) -> List[str]:
         """Translate chunks in parallel"""
         logger.info(f"Parallel translation with {self.config.max_workers} workers")
@@ -295,7 +450,7 @@ class CreoleTranslator:
         with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
             # Submit all tasks
             future_to_idx = {
-                executor.submit(self.translate_chunk, chunk, src_lang): i
+                executor.submit(self.translate_chunk, chunk, src_lang, use_cache): i
                 for i, chunk in enumerate(chunks)
             }
             
@@ -10,7 +10,7 @@ import logging
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
 
 def setup_logging(log_dir: Path = Path("logs"), log_level: str = "INFO") -> logging.Logger:
@@ -54,6 +54,108 @@ def setup_logging(log_dir: Path = Path("logs"), log_level: str = "INFO") -> logg
     return logger
 
 
+# Limit fraz (ponktiyasyon + espas) oswa limit paragraf (2+ liy nouvo)
+_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+|[^\S\n]*\n[^\S\n]*\n\s*')
+_PARAGRAPH_RE = re.compile(r'\n[^\S\n]*\n')
+_WHITESPACE = (' ', '\n', '\t', '\r')
+
+
+def iter_chunk_spans(text: str, max_size: int = 1000) -> Iterator[Tuple[int, int]]:
+    """
+    Jenere pozisyon (start, end) chak moso / Yield chunk offsets
+
+    Single pass over the precompiled boundary regex. Consecutive
+    paragraphs are packed into one chunk up to max_size; when a chunk is
+    full it is cut at the last paragraph break that fits, else the last
+    sentence boundary, then the last whitespace, then at max_size. Spans
+    never overlap and the gaps between them contain only whitespace
+    (lossless coverage).
+
+    Args:
+        text: Text to chunk
+        max_size: Maximum chunk size in characters
+
+    Yields:
+        (start, end) offsets into text
+    """
+    if max_size < 1:
+        raise ValueError(f"max_size must be >= 1, got {max_size}")
+
+    length = len(text)
+    if length == 0:
+        return
+    if length <= max_size:
+        yield (0, length)
+        return
+
+    def skip_space(pos: int) -> int:
+        while pos < length and text[pos].isspace():
+            pos += 1
+        return pos
+
+    def trim_end(start: int, end: int) -> int:
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return end
+
+    chunk_start = skip_space(0)
+    # (end, resume) of the last sentence / paragraph boundary that fits
+    cut = para_cut = None
+
+    def boundaries():
+        for match in _BOUNDARY_RE.finditer(text):
+            yield match.start(), match.end(), match.group().count('\n') >= 2
+        yield length, length, False
+
+    for seg_end, resume, is_paragraph in boundaries():
+        # Current chunk would overflow: cut before this segment
+        while seg_end - chunk_start > max_size:
+            best = para_cut or cut
+            if best is not None:
+                end = trim_end(chunk_start, best[0])
+                if end > chunk_start:
+                    yield (chunk_start, end)
+                chunk_start = best[1]
+                # A sentence boundary after the paragraph break still fits
+                cut = cut if cut is not None and cut[0] > chunk_start else None
+                para_cut = None
+                continue
+
+            # Single segment longer than max_size: last whitespace, else hard cut
+            limit = chunk_start + max_size
+            split = max(text.rfind(ws, chunk_start + 1, limit + 1) for ws in _WHITESPACE)
+            if split > chunk_start:
+                end = trim_end(chunk_start, split)
+                yield (chunk_start, end)
+                chunk_start = skip_space(split)
+            else:
+                yield (chunk_start, limit)
+                chunk_start = limit
+
+        if seg_end > chunk_start:
+            cut = (seg_end, resume)
+            if is_paragraph:
+                para_cut = cut
+
+    end = trim_end(chunk_start, length)
+    if end > chunk_start:
+        yield (chunk_start, end)
+
+
+def smart_chunk_spans(text: str, max_size: int = 1000) -> List[Tuple[int, int]]:
+    """
+    Pozisyon moso yo / Chunk offsets into the original text
+
+    Args:
+        text: Text to chunk
+        max_size: Maximum chunk size in characters
+
+    Returns:
+        List of (start, end) offsets, see iter_chunk_spans
+    """
+    return list(iter_chunk_spans(text, max_size))
+
+
 def smart_chunk_text(text: str, max_size: int = 1000) -> List[str]:
     """
     Divize tèks entèlijan / Smart text chunking
@@ -66,55 +168,37 @@ def smart_chunk_text(text: str, max_size: int = 1000) -> List[str]:
     Returns:
         List of text chunks
     """
-    if not text or len(text) <= max_size:
-        return [text] if text else []
-    
-    chunks = []
-    
-    # Split by double newlines (paragraphs)
-    paragraphs = re.split(r'\n\s*\n', text)
-    current_chunk = ""
-    
-    for para in paragraphs:
-        # If paragraph fits in current chunk
-        if len(current_chunk) + len(para) + 2 <= max_size:
-            current_chunk += para + "\n\n"
-        else:
-            # Save current chunk if not empty
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            
-            # If paragraph itself is too long, split by sentences
-            if len(para) > max_size:
-                sentences = re.split(r'(?<=[.!?])\s+', para)
-                temp = ""
-                
-                for sentence in sentences:
-                    if len(temp) + len(sentence) + 1 <= max_size:
-                        temp += sentence + " "
-                    else:
-                        if temp:
-                            chunks.append(temp.strip())
-                        # If even a single sentence is too long, force split
-                        if len(sentence) > max_size:
-                            for i in range(0, len(sentence), max_size):
-                                chunks.append(sentence[i:i+max_size])
-                            temp = ""
-                        else:
-                            temp = sentence + " "
-                
-                if temp:
-                    current_chunk = temp
-                else:
-                    current_chunk = ""
-            else:
-                current_chunk = para + "\n\n"
-    
-    # Add remaining chunk
-    if current_chunk:
-        chunks.append(current_chunk.strip())
-    
-    return chunks
+    return [text[start:end] for start, end in iter_chunk_spans(text, max_size)]
+
+
+def iter_chunks(texts: Iterable[str], max_size: int = 1000) -> Iterator[str]:
+    """
+    Divize tèks an moso pandan l ap rive / Streamed chunking
+
+    Each text (e.g. a PDF page) is treated like a paragraph-separated block,
+    matching PDFExtractor.extract, which joins pages with blank lines. The
+    last chunk of a page is held back and packed with the next page, so
+    the output equals smart_chunk_text on the joined document while the
+    other chunks are yielded as soon as their page is available.
+
+    Args:
+        texts: Iterable of texts (pages)
+        max_size: Maximum chunk size in characters
+
+    Yields:
+        Non-empty text chunks
+    """
+    carry = ""
+    for text in texts:
+        if not text or not text.strip():
+            continue
+        block = f"{carry}\n\n{text}" if carry else text
+        spans = [(start, end) for start, end in iter_chunk_spans(block, max_size) if end > start]
+        for start, end in spans[:-1]:
+            yield block[start:end]
+        carry = block[spans[-1][0]:spans[-1][1]].strip() if spans else ""
+    if carry:
+        yield carry
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -11,3 +11,257 @@ import io
 sys.stdout = sys.__stdout__
 sys.stderr = sys.__stderr__
 
+
+
+import fnmatch
+import os
+import random
+import time
+
+import pytest
+
+# Benchmark wall-clock yo pa kouri pa default (yo depann de machin nan)
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS", "").lower() in ("1", "true", "yes")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: wall-clock comparison, skipped unless RUN_BENCHMARKS=1"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+    skip = pytest.mark.skip(reason="benchmark: set RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+class FakeRedis:
+    """
+    Redis an memwa pou tès yo (sèlman kòmand kachaj yo itilize)
+
+    Valè yo estoke an bytes tankou yon vrè Redis (decode_responses=False).
+    Mete `down = True` pou simile yon Redis ki pa reponn.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._expires = {}
+        self._scan_snapshot = []
+        self._random_keys = []
+        self._random_dirty = False
+        self.down = False
+        self.calls = {}
+
+    # -- entèn --------------------------------------------------------
+    def _call(self, name):
+        if self.down:
+            raise ConnectionError("fake redis is down")
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _alive(self, key):
+        expires = self._expires.get(key)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    @staticmethod
+    def _bytes(value):
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode("utf-8")
+
+    @staticmethod
+    def _str(key):
+        return key.decode("utf-8") if isinstance(key, bytes) else key
+
+    # -- kòmand -------------------------------------------------------
+    def ping(self):
+        self._call("ping")
+        return True
+
+    def get(self, key):
+        self._call("get")
+        key = self._str(key)
+        return self._data[key] if self._alive(key) else None
+
+    def mget(self, *keys):
+        self._call("mget")
+        if len(keys) == 1 and isinstance(keys[0], (list, tuple)):
+            keys = keys[0]
+        keys = [self._str(k) for k in keys]
+        return [self._data[k] if self._alive(k) else None for k in keys]
+
+    def set(self, key, value, ex=None, px=None, nx=False, xx=False):
+        self._call("set")
+        key = self._str(key)
+        exists = self._alive(key)
+        if (nx and exists) or (xx and not exists):
+            return None
+        self._data[key] = self._bytes(value)
+        self._expires.pop(key, None)
+        if ex is not None:
+            self._expires[key] = time.monotonic() + ex
+        if px is not None:
+            self._expires[key] = time.monotonic() + px / 1000
+        return True
+
+    def setex(self, key, seconds, value):
+        return self.set(key, value, ex=seconds)
+
+    def psetex(self, key, ms, value):
+        return self.set(key, value, px=ms)
+
+    def mset(self, mapping):
+        for key, value in mapping.items():
+            self.set(key, value)
+        return True
+
+    def delete(self, *keys):
+        self._call("delete")
+        return self._remove(keys)
+
+    def unlink(self, *keys):
+        self._call("unlink")
+        return self._remove(keys)
+
+    def _remove(self, keys):
+        count = 0
+        for key in keys:
+            key = self._str(key)
+            if self._alive(key):
+                del self._data[key]
+                self._expires.pop(key, None)
+                self._random_dirty = True
+                count += 1
+        return count
+
+    def exists(self, *keys):
+        return sum(1 for k in keys if self._alive(self._str(k)))
+
+    def incr(self, key, amount=1):
+        self._call("incr")
+        key = self._str(key)
+        value = int(self._data[key]) if self._alive(key) else 0
+        self._data[key] = self._bytes(value + amount)
+        return value + amount
+
+    incrby = incr
+
+    def expire(self, key, seconds):
+        key = self._str(key)
+        if not self._alive(key):
+            return False
+        self._expires[key] = time.monotonic() + seconds
+        return True
+
+    def pexpire(self, key, ms):
+        return self.expire(key, ms / 1000)
+
+    def ttl(self, key):
+        key = self._str(key)
+        if not self._alive(key):
+            return -2
+        expires = self._expires.get(key)
+        return -1 if expires is None else int(round(expires - time.monotonic()))
+
+    def pttl(self, key):
+        key = self._str(key)
+        if not self._alive(key):
+            return -2
+        expires = self._expires.get(key)
+        return -1 if expires is None else int((expires - time.monotonic()) * 1000)
+
+    def strlen(self, key):
+        value = self.get(key)
+        return len(value) if value is not None else 0
+
+    def memory_usage(self, key, samples=None):
+        value = self.get(key)
+        return None if value is None else len(value) + len(self._str(key)) + 48
+
+    def scan(self, cursor=0, match=None, count=10, _type=None):
+        self._call("scan")
+        if cursor == 0:
+            self._scan_snapshot = list(self._data)
+        batch = self._scan_snapshot[cursor:cursor + count]
+        next_cursor = cursor + count if cursor + count < len(self._scan_snapshot) else 0
+        keys = [k.encode("utf-8") for k in batch
+                if self._alive(k) and (match is None or fnmatch.fnmatchcase(k, match))]
+        return next_cursor, keys
+
+    def scan_iter(self, match=None, count=10):
+        cursor = 0
+        while True:
+            cursor, keys = self.scan(cursor, match=match, count=count)
+            yield from keys
+            if cursor == 0:
+                break
+
+    def randomkey(self):
+        self._call("randomkey")
+        # Lis kle yo rebati sèlman lè keyspace la chanje (O(1) pa apèl)
+        if len(self._random_keys) != len(self._data) or self._random_dirty:
+            self._random_keys = list(self._data)
+            self._random_dirty = False
+        while self._random_keys:
+            key = random.choice(self._random_keys)
+            if self._alive(key):
+                return key.encode("utf-8")
+            self._random_keys = list(self._data)
+        return None
+
+    def keys(self, pattern="*"):
+        return [k.encode("utf-8") for k in list(self._data)
+                if self._alive(k) and fnmatch.fnmatchcase(k, pattern)]
+
+    def dbsize(self):
+        return sum(1 for k in list(self._data) if self._alive(k))
+
+    def flushdb(self):
+        self._data.clear()
+        self._expires.clear()
+        return True
+
+    def info(self, section=None):
+        return {"used_memory_human": f"{sum(map(len, self._data.values())) / 1024:.1f}K"}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline: kòmand yo tann jiska execute()"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        self._redis._call("pipeline")
+        commands, self._commands = self._commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._commands = []
+
+
+@pytest.fixture
+def fake_redis():
+    """Redis an memwa"""
+    return FakeRedis()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for the job artifact cache
+Test pou kachaj rezilta travay yo (adrese pa kontni)
+"""
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import artifact_cache as artifact_module
+from app.artifact_cache import ArtifactCache, artifact_key, hash_file, output_files
+from utils import audio_assembly
+
+
+@pytest.fixture
+def output(tmp_path):
+    root = tmp_path / "output"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture
+def cache(output):
+    return ArtifactCache(cache_dir=output / "artifacts", output_root=output, max_entries=10)
+
+
+def make_output(output, name, content=b"audio"):
+    path = output / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return f"/output/{name}"
+
+
+def test_hash_file_matches_validator_hash(tmp_path):
+    content = b"%PDF-1.4 " * 300_000
+    path = tmp_path / "kou.pdf"
+    path.write_bytes(content)
+    assert hash_file(path, chunk_size=4096) == hashlib.sha256(content).hexdigest()
+
+
+def test_key_depends_on_options_and_pipeline(monkeypatch):
+    base = artifact_key("abc", "audiobook", voice="creole-native", max_pages=None)
+    assert base == artifact_key("abc", "audiobook", max_pages=None, voice="creole-native")
+    assert base != artifact_key("abc", "audiobook", voice="openai-alloy", max_pages=None)
+    assert base != artifact_key("abd", "audiobook", voice="creole-native", max_pages=None)
+    assert base != artifact_key("abc", "translate_pdf", voice="creole-native", max_pages=None)
+
+    monkeypatch.setattr(artifact_module, "PIPELINE_VERSION", "2")
+    assert base != artifact_key("abc", "audiobook", voice="creole-native", max_pages=None)
+
+
+def test_output_files_from_nested_result():
+    result = {"audio": "/output/a.mp3", "stats": {"files": ["/output/b/c.txt"]}, "name": "x.pdf"}
+    assert output_files(result) == ["a.mp3", "b/c.txt"]
+
+
+def test_put_get_roundtrip(cache, output):
+    result = {"audio": make_output(output, "book.mp3"), "text_length": 42}
+    assert cache.get("k1") is None
+
+    cache.put("k1", result, kind="audiobook")
+    hit = cache.get("k1")
+
+    assert hit == {**result, "cached": True}
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["entries"] == 1
+
+
+def test_missing_file_invalidates_entry(cache, output):
+    result = {"audio": make_output(output, "book.mp3"), "preview": make_output(output, "book.txt")}
+    cache.put("k1", result)
+    (output / "book.mp3").unlink()
+
+    assert cache.get("k1") is None
+    assert cache.get_stats()["entries"] == 0
+    # Fichye ki rete a pa gen referans ankò
+    assert not (output / "book.txt").exists()
+
+
+def test_shared_files_are_reference_counted(cache, output):
+    shared = make_output(output, "job/shared.mp3")
+    cache.put("a", {"audio": shared})
+    cache.put("b", {"audio": shared, "preview": make_output(output, "job/b.txt")})
+    assert cache.ref_counts() == {"job/shared.mp3": 2, "job/b.txt": 1}
+
+    cache.evict("b")
+    assert (output / "job/shared.mp3").exists()
+    assert not (output / "job/b.txt").exists()
+    assert cache.is_referenced(output / "job/shared.mp3")
+
+    cache.evict("a")
+    assert not (output / "job").exists()
+    assert not cache.is_referenced(output / "job/shared.mp3")
+
+
+def test_cleanup_evicts_least_recently_used(cache, output):
+    cache.max_entries = 2
+    for name in ("a", "b"):
+        cache.put(name, {"audio": make_output(output, f"{name}.mp3")})
+        time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+
+    cache.put("c", {"audio": make_output(output, "c.mp3")})
+
+    assert cache.get("b") is None
+    assert not (output / "b.mp3").exists()
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_cleanup_evicts_old_entries(cache, output):
+    cache.put("old", {"audio": make_output(output, "old.mp3")})
+    cache.max_age_days = 0
+    assert cache.cleanup() == 1
+    assert not (output / "old.mp3").exists()
+
+
+def test_disabled_cache(output):
+    cache = ArtifactCache(cache_dir=output / "artifacts", output_root=output, enabled=False)
+    cache.put("k", {"audio": make_output(output, "x.mp3")})
+    assert cache.get("k") is None
+
+
+def test_process_audiobook_reuses_artifact(tmp_path, monkeypatch):
+    """Menm dokiman nan yon dezyèm travay: rezilta a retounen san TTS"""
+    pytest.importorskip("celery")
+    import app.tasks as tasks
+    from app import job_manifest
+    from app.services.tts_service import TTSService
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(job_manifest, "JOBS_ROOT", tmp_path / "jobs")
+    monkeypatch.setattr(tasks, "AUDIOBOOK_CHUNK_CHARS", 40)
+    monkeypatch.setattr(tasks, "artifact_cache", ArtifactCache(
+        cache_dir=tmp_path / "output" / "artifacts", output_root=tmp_path / "output"
+    ))
+
+    calls = []
+
+    async def fake_tts(self, text, output_path, voice="creole-native"):
+        calls.append(text)
+        Path(output_path).write_bytes(text.encode("utf-8"))
+        return Path(output_path)
+
+    monkeypatch.setattr(TTSService, "text_to_speech_file", fake_tts)
+
+    def join_bytes(paths, output_path, silence_ms=0, bitrate=None):
+        # Fo TTS la ekri tèks, pa MP3: re-ankodaj la kole byte yo tou senpleman
+        Path(output_path).write_bytes(b"".join(Path(p).read_bytes() for p in paths))
+        return Path(output_path)
+
+    monkeypatch.setattr(audio_assembly, "assemble_files", join_bytes)
+
+    text = " ".join(f"Fraz nimewo {i} nan kou a." for i in range(6))
+    results = []
+    for job in ("job-1", "job-2"):
+        # Chak itilizatè voye pwòp kopi li (task la efase fichye a)
+        source = tmp_path / f"{job}.txt"
+        source.write_text(text, encoding="utf-8")
+        results.append(tasks.process_audiobook.apply(
+            args=[str(source), "creole-native"], task_id=job
+        ).get())
+        assert not source.exists()
+
+    first, second = results
+    assert second["cached"] is True
+    assert second["job_id"] == "job-2"
+    assert second["audio"] == first["audio"]
+    assert len(calls) == first["stats"]["chunks"]["chunks"]
+
+    # Lòt vwa: pa menm rezilta
+    source = tmp_path / "job-3.txt"
+    source.write_text(text, encoding="utf-8")
+    third = tasks.process_audiobook.apply(args=[str(source), "openai-alloy"], task_id="job-3").get()
+    assert "cached" not in third
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou asanblaj odyo / Tests for in-memory audio assembly
+"""
+
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio_assembly import AudioAssembler, assemble_files
+
+
+def write_wav(path, samples, rate=16000, channels=1):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.asarray(samples, dtype=np.int16).tobytes())
+    return path
+
+
+def read_wav(path):
+    with wave.open(str(path), "rb") as wav:
+        return wav.getframerate(), np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+
+def test_files_and_silences_laid_out_in_order(tmp_path):
+    a = write_wav(tmp_path / "a.wav", [100] * 160)
+    b = write_wav(tmp_path / "b.wav", [-200] * 320)
+
+    out = assemble_files([a, b], tmp_path / "out.wav", silence_ms=10)
+    rate, data = read_wav(out)
+
+    assert rate == 16000
+    expected = np.concatenate([[100] * 160, [0] * 160, [-200] * 320, [0] * 160])
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_arrays_are_converted_to_output_format():
+    assembler = AudioAssembler(sample_rate=16000)
+    assembler.add_array(np.full(800, 0.5, dtype=np.float32), 8000)
+    assembler.add_array(np.array([[1000, 3000]] * 10, dtype=np.int16), 16000, channels=2)
+
+    data = assembler.render()
+    assert assembler.frames == len(data) == 1600 + 10
+    assert abs(int(data[800]) - 16383) < 50
+    assert (data[-10:] == 2000).all()
+
+
+def test_normalize_scales_to_peak():
+    assembler = AudioAssembler(sample_rate=8000)
+    assembler.add_array(np.array([0, 8000, -16000, 4000], dtype=np.int16), 8000)
+    assembler.add_silence(1)
+    data = assembler.render(normalize=True)
+    assert 32000 < -int(data[2]) <= 32767
+    assert data[1] == pytest.approx(-data[2] / 2, abs=2)
+    assert (data[4:] == 0).all()
+
+
+def test_silence_needs_sample_rate():
+    with pytest.raises(ValueError):
+        AudioAssembler().add_silence(100)
+
+
+def _pydub_segments(count, rate=22050):
+    AudioSegment = pytest.importorskip("pydub").AudioSegment
+    rng = np.random.default_rng(0)
+    segments = [
+        AudioSegment(
+            data=rng.integers(-3000, 3000, size=rate // 20, dtype=np.int16).tobytes(),
+            sample_width=2, frame_rate=rate, channels=1
+        )
+        for _ in range(count)
+    ]
+    return AudioSegment, segments, AudioSegment.silent(duration=40, frame_rate=rate)
+
+
+def test_segments_match_pydub_concatenation():
+    AudioSegment, segments, silence = _pydub_segments(50)
+
+    combined = AudioSegment.empty()
+    assembler = AudioAssembler(sample_rate=22050)
+    for segment in segments:
+        combined += segment + silence
+        assembler.add_segment(segment)
+        assembler.add_silence(40)
+    assert assembler.render().tobytes() == combined.raw_data
+
+
+@pytest.mark.benchmark
+def test_benchmark_1000_segments_against_pydub():
+    """Asanblaj PCM lineyè vs combined += AudioSegment (kwadratik)"""
+    rate = 22050
+    AudioSegment, segments, silence = _pydub_segments(1000, rate)
+
+    start = time.perf_counter()
+    combined = AudioSegment.empty()
+    for segment in segments:
+        combined += segment
+        combined += silence
+    pydub_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assembler = AudioAssembler(sample_rate=rate)
+    for segment in segments:
+        assembler.add_segment(segment)
+        assembler.add_silence(40)
+    data = assembler.render()
+    numpy_seconds = time.perf_counter() - start
+
+    print(f"\n1000 segments: pydub {pydub_seconds:.3f}s, AudioAssembler {numpy_seconds:.3f}s")
+    assert data.tobytes() == combined.raw_data
+    assert numpy_seconds < pydub_seconds
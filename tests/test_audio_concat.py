@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou kole odyo san re-ankode / Tests for stream-copy concatenation
+"""
+
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import audio_assembly
+from utils.audio_concat import (
+    IncompatibleAudio, concat_audio, iter_frames, parse_frame_header,
+    probe_mp3, silent_frames, strip_id3,
+)
+
+
+def mp3_frame(fill: int, rate_index: int = 1, bitrate_index: int = 4, mono: bool = True) -> bytes:
+    """MPEG-2 layer III frame (24 kHz, 32 kbps by default) with a filler payload"""
+    header = bytes([0xFF, 0xF3, (bitrate_index << 4) | (rate_index << 2), 0xC0 if mono else 0x00])
+    length = parse_frame_header(header).length
+    return header + bytes([fill]) * (length - 4)
+
+
+def id3v2(payload: bytes = b"TIT2 title") -> bytes:
+    size = len(payload)
+    syncsafe = bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return b"ID3\x04\x00\x00" + syncsafe + payload
+
+
+def test_parse_frame_header():
+    frame = parse_frame_header(mp3_frame(1))
+    assert (frame.version, frame.layer, frame.sample_rate, frame.channels) == (2, 3, 24000, 1)
+    assert frame.bitrate == 32000 and frame.length == 96 and frame.samples == 576
+    assert parse_frame_header(b"RIFF") is None
+
+
+def test_strip_id3_and_walk_frames():
+    body = mp3_frame(1) + mp3_frame(2)
+    data = strip_id3(id3v2() + body + b"TAG" + bytes(125))
+    assert data == body
+    assert [offset for offset, _ in iter_frames(data)] == [0, 96]
+    with pytest.raises(IncompatibleAudio):
+        list(iter_frames(b"not an mp3 at all"))
+
+
+def test_xing_frame_is_skipped():
+    xing = bytearray(mp3_frame(0))
+    xing[4 + 9:4 + 13] = b"Xing"
+    info = probe_mp3(bytes(xing) + mp3_frame(7))
+    assert info.frames == 1
+
+
+def test_mp3_chunks_are_stream_copied(tmp_path):
+    a = tmp_path / "a.mp3"
+    b = tmp_path / "b.mp3"
+    a.write_bytes(id3v2() + mp3_frame(1) * 3)
+    b.write_bytes(id3v2(b"TALB album") + mp3_frame(2) * 2 + b"TAG" + bytes(125))
+
+    report = concat_audio([a, b], tmp_path / "out.mp3", silence_ms=100)
+    data = (tmp_path / "out.mp3").read_bytes()
+
+    assert report.mode == "mp3-copy" and report.reason is None
+    assert b"ID3" not in data and b"TAG" not in data
+    gap = silent_frames(parse_frame_header(mp3_frame(1)), 100)
+    assert data == mp3_frame(1) * 3 + gap + mp3_frame(2) * 2
+    assert report.audio_seconds == pytest.approx((5 * 576 + len(gap) // 96 * 576) / 24000)
+    assert report.saved_seconds >= 0
+
+
+def test_mismatched_codecs_fall_back_to_reencode(tmp_path, monkeypatch):
+    a = tmp_path / "a.mp3"
+    b = tmp_path / "b.mp3"
+    a.write_bytes(mp3_frame(1, rate_index=1))
+    b.write_bytes(mp3_frame(1, rate_index=0))
+
+    calls = []
+
+    def fake_assemble(paths, output_path, silence_ms=0, bitrate=None):
+        calls.append(list(paths))
+        Path(output_path).write_bytes(b"".join(Path(p).read_bytes() for p in paths))
+        return Path(output_path)
+
+    monkeypatch.setattr(audio_assembly, "assemble_files", fake_assemble)
+    report = concat_audio([a, b], tmp_path / "out.mp3")
+    assert report.mode == "reencode"
+    assert "codec" in report.reason
+    assert calls == [[a, b]]
+
+
+def test_wav_chunks_are_frame_copied(tmp_path):
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"{i}.wav"
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(8000)
+            w.writeframes(b"\x01\x00" * 80)
+        paths.append(path)
+
+    report = concat_audio(paths, tmp_path / "out.mp3", silence_ms=10)
+    assert report.mode == "wav-copy" and report.output.endswith("out.wav")
+    with wave.open(report.output, "rb") as w:
+        assert w.getnframes() == 80 + 80 + 80
+    assert report.audio_seconds == pytest.approx(240 / 8000)
+
+
+def test_generator_merge_parts_checks_wav_params(tmp_path, monkeypatch):
+    pytest.importorskip("gtts")
+    from src import AudiobookGenerator, Config
+
+    paths = []
+    for i, rate in enumerate((16000, 22050)):
+        path = tmp_path / f"{i}.wav"
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(rate)
+            w.writeframes(b"\x01\x00" * 100)
+        paths.append(path)
+
+    calls = []
+
+    def fake_assemble(paths, output_path, silence_ms=0, bitrate=None):
+        calls.append(list(paths))
+        Path(output_path).write_bytes(b"merged")
+        return Path(output_path)
+
+    monkeypatch.setattr(audio_assembly, "assemble_files", fake_assemble)
+    config = Config(data_dir=tmp_path / "data", output_dir=tmp_path / "output")
+    merged = AudiobookGenerator(config).merge_parts(paths, tmp_path / "out.mp3")
+    assert merged == tmp_path / "out.mp3" and calls == [paths]
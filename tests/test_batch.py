@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou batch liv yo / Tests for concurrent batch processing
+"""
+
+import json
+import pytest
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import batch_processor
+from batch_processor import BatchProcessor
+from cli import parse_stage_limits
+
+
+def test_batch_processor_keeps_book_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    delays = {"liv0": 0.05, "liv1": 0.0, "liv2": 0.02}
+
+    monkeypatch.setattr(batch_processor, "download_from_gcs", lambda src, dst, bucket: None)
+    monkeypatch.setattr(batch_processor, "extract_text_from_pdf", lambda path: Path(path).stem)
+
+    def fake_translate(text, lang):
+        time.sleep(delays[text])
+        return f"{text} an kreyòl"
+
+    monkeypatch.setattr(batch_processor, "translate_text", fake_translate)
+    monkeypatch.setattr(batch_processor, "generate_audio", lambda text, path, language: path)
+    monkeypatch.setattr(batch_processor, "mix_voices", lambda inputs, output: output)
+    monkeypatch.setattr(batch_processor, "upload_to_gcs", lambda local, remote, bucket, **kw: f"gs://{remote}")
+
+    processor = BatchProcessor("bucket", enable_email=False, max_concurrent=3,
+                               stage_limits={"translate": 3})
+    results = processor.process_batch([{"name": name, "input_pdf": f"{name}.pdf"} for name in delays])
+
+    assert [r["name"] for r in results] == ["liv0", "liv1", "liv2"]
+    assert all(r["status"] == "completed" for r in results)
+
+    saved = json.loads(next((tmp_path / "output" / "batch_results").glob("*.json")).read_text())
+    assert [r["name"] for r in saved["results"]] == ["liv0", "liv1", "liv2"]
+    assert saved["books_per_hour"] > 0
+    assert {s["name"] for s in saved["stage_stats"]} >= {"extract", "translate", "audio"}
+
+
+def test_parse_stage_limits():
+    assert parse_stage_limits(["translate=2", "tts=4"], books=3) == {
+        "extract": 3, "translate": 2, "tts": 4
+    }
+    with pytest.raises(ValueError):
+        parse_stage_limits(["translate"], books=2)
+
+
+class _FakeExtractor:
+    def iter_pages(self, pdf_path):
+        yield "Premye paj."
+        yield "Dezyèm paj."
+
+
+class _FakeTranslator:
+    def detect_language(self, text):
+        return "fr"
+
+    def translate_chunk(self, chunk, src_lang):
+        return chunk.upper()
+
+
+class _FakeGenerator:
+    def generate(self, text, output_path):
+        Path(output_path).write_bytes(text.encode("utf-8"))
+
+    def merge_parts(self, parts, output_path):
+        Path(output_path).write_bytes(b"".join(Path(p).read_bytes() for p in parts))
+
+
+def _pipeline_args():
+    import argparse
+    return argparse.Namespace(pipeline=True, extract_only=False, translate_only=False,
+                              no_audio=False, quiet=True, source_lang=None, output=None)
+
+
+def test_pipeline_mode_applies_batch_stage_limits(tmp_path):
+    import logging
+    from cli import process_single_file
+    from src import Config
+    from src.pipeline import BatchExecutor
+
+    config = Config(data_dir=tmp_path / "data", output_dir=tmp_path / "output")
+    modules = (_FakeExtractor(), _FakeTranslator(), _FakeGenerator())
+    executor = BatchExecutor(max_concurrent=2, stage_limits={"translate": 1, "tts": 1})
+    logger = logging.getLogger("test_batch")
+
+    results = list(executor.run(
+        [tmp_path / "liv0.pdf", tmp_path / "liv1.pdf"],
+        lambda pdf: process_single_file(pdf, config, _pipeline_args(), logger,
+                                        modules=modules, executor=executor)
+    ))
+
+    assert results == [True, True]
+    stages = {s["name"]: s for s in executor.stats()["stages"]}
+    assert stages.keys() >= {"translate", "tts"}
+    assert stages["translate"]["workers"] == 1
+    assert (tmp_path / "output" / "liv1_audiobook.mp3").exists()
+
+
+def test_pipeline_mode_saves_extracted_text(tmp_path):
+    import logging
+    from cli import process_single_file_pipeline
+    from src import Config
+    from src.pipeline import BatchExecutor
+
+    config = Config(data_dir=tmp_path / "data", output_dir=tmp_path / "output")
+    modules = (_FakeExtractor(), _FakeTranslator(), _FakeGenerator())
+
+    assert process_single_file_pipeline(tmp_path / "liv.pdf", config, _pipeline_args(),
+                                        logging.getLogger("test_batch"), modules=modules,
+                                        executor=BatchExecutor())
+
+    assert (tmp_path / "data" / "liv_text.txt").read_text(encoding="utf-8") == \
+        "Premye paj.\n\nDezyèm paj.\n\n"
+    assert "PREMYE PAJ." in (tmp_path / "output" / "liv_traduction.txt").read_text(encoding="utf-8")
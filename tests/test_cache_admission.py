@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for TinyLFU admission and cache analytics
+Test pou politik admisyon an ak estatistik hit ratio yo
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import cache_tiered
+from app.cache_tiered import LRUTTLCache, TieredCache
+from src.cache_admission import CacheAnalytics, FrequencySketch, TinyLFU
+from src.translator import DEFAULT_CACHE_MAX_ENTRIES, TranslationCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_sketch_counts_saturate_and_age():
+    sketch = FrequencySketch(width=64, sample_size=10_000)
+    assert sketch.estimate("bonjou") == 0
+    for _ in range(5):
+        sketch.increment("bonjou")
+    assert sketch.estimate("bonjou") == 5
+
+    for _ in range(40):
+        sketch.increment("bonjou")
+    assert sketch.estimate("bonjou") == 16  # 15 + doorkeeper
+
+    sketch._reset()
+    assert sketch.estimate("bonjou") == 7
+    assert sketch.resets == 1
+
+
+def test_tinylfu_prefers_frequent_keys():
+    policy = TinyLFU(width=256)
+    for _ in range(3):
+        policy.record("hot")
+    policy.record("once")
+
+    assert policy.admit("hot", "once")
+    assert not policy.admit("once", "hot")
+    assert not policy.admit("new", "once")
+    assert policy.get_stats()["admitted"] == 1 and policy.get_stats()["rejected"] == 2
+
+
+def test_lru_admission_resists_one_off_scan():
+    l1 = LRUTTLCache(max_entries=3, default_ttl=None, admission=TinyLFU(width=1024))
+    for key in ("a", "b", "c"):
+        l1.set(key, key)
+        for _ in range(3):
+            l1.get(key)
+
+    # Yon liv: chak moso yon sèl fwa
+    for i in range(50):
+        l1.get(f"chunk{i}")
+        assert l1.set(f"chunk{i}", "x") is False
+
+    assert all(l1.get(key) == key for key in ("a", "b", "c"))
+    assert l1.stats["not_admitted"] == 50
+    assert l1.stats["evictions"] == 0
+
+    # Yon kle ki vin cho antre
+    for _ in range(6):
+        l1.get("popular")
+    assert l1.set("popular", "p")
+    assert l1.get("popular") == "p"
+
+
+def test_analytics_windows_bytes_and_hot_keys():
+    clock = Clock()
+    analytics = CacheAnalytics("t", bucket_seconds=10, clock=clock)
+    analytics.record_miss("k1")
+    analytics.record_fill(300)
+    clock.now += 200
+    for _ in range(3):
+        analytics.record_hit("k1", 100, label="Bonjou")
+    analytics.record_miss("k2")
+
+    report = analytics.snapshot(top=1)
+    assert report["totals"]["hits"] == 3 and report["totals"]["misses"] == 2
+    assert report["totals"]["byte_hit_ratio"] == 0.5
+    assert report["windows"]["1m"] == {
+        "hits": 3, "misses": 1, "hit_ratio": 0.75,
+        "hit_bytes": 300, "miss_bytes": 0, "byte_hit_ratio": 1.0,
+    }
+    assert report["windows"]["5m"]["hit_ratio"] == 0.6
+    assert report["hot_keys"] == [{"key": "k1", "label": "Bonjou", "count": 4, "error": 0}]
+
+    clock.now += 4000
+    assert analytics.snapshot()["windows"]["1h"]["hits"] == 0
+
+
+def test_translation_cache_stats_and_bounded_admission(tmp_path):
+    cache = TranslationCache(tmp_path, max_entries=2)
+    cache.set("Hello", "Bonjou", "en", "ht")
+    cache.set("World", "Mond", "en", "ht")
+    for _ in range(3):
+        assert cache.get("Hello", "en", "ht") == "Bonjou"
+    assert cache.get("World", "en", "ht") == "Mond"
+
+    # Plen: yon moso yo poko janm mande pa pran plas yo
+    cache.get("Chapter one", "en", "ht")
+    cache.set("Chapter one", "Chapit en", "en", "ht")
+    assert cache.get("Chapter one", "en", "ht") is None
+    assert cache.get("World", "en", "ht") == "Mond"
+
+    stats = cache.get_stats()
+    assert stats["files"] == 2
+    assert stats["hits"] == cache.hits == 5
+    assert stats["misses"] == cache.misses == 2
+    assert round(stats["hit_rate"], 1) == 71.4
+    assert stats["admission"]["rejected"] == 1
+    assert stats["hot_keys"][0]["label"] == "Hello"
+    assert set(stats["windows"]) == {"1m", "5m", "1h"}
+
+
+def test_translation_cache_bounded_by_default(tmp_path):
+    cache = TranslationCache(tmp_path)
+    assert cache.max_entries == DEFAULT_CACHE_MAX_ENTRIES and cache.admission is not None
+
+    unbounded = TranslationCache(tmp_path / "all", max_entries=0)
+    for i in range(20):
+        unbounded.set(f"t{i}", f"v{i}", "en", "ht")
+    assert unbounded.admission is None
+    assert unbounded.get_stats()["files"] == 20
+
+
+def test_tiered_cache_reports_analytics(monkeypatch):
+    monkeypatch.setattr(cache_tiered, "_caches", {})
+    cache = cache_tiered.get_cache("adm_test", redis_client=None, admission=True)
+    cache.reset_stats()
+    cache.get("k")
+    cache.set("k", "bonjou")
+    cache.get("k")
+    cache.get_many(["k", "missing"])
+
+    report = cache_tiered.cache_analytics(top=5)["adm_test"]
+    assert report["totals"]["hits"] == 2 and report["totals"]["misses"] == 2
+    assert report["totals"]["byte_hit_ratio"] == round(12 / 18, 4)
+    assert report["hot_keys"][0]["key"] == "k"
+    assert "admitted" in report["admission"]
+    assert cache.get_stats()["l1_not_admitted"] == 0
+
+
+def test_tiered_cache_without_admission_admits_everything():
+    cache = TieredCache("plain", l1=LRUTTLCache(max_entries=1), redis_client=None)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("b") == "2" and cache.l1.admission is None
+
+
+def test_l2_admits_keys_missed_twice_across_workers(fake_redis):
+    workers = [TieredCache("adm_l2", redis_client=fake_redis, admission=True) for _ in range(3)]
+
+    # Premye worker: yon sèl demann, L1 sèlman
+    assert workers[0].get("phrase") is None
+    workers[0].set("phrase", "x")
+    assert fake_redis.get("adm_l2:phrase") is None
+    assert workers[0].get("phrase") == "x"
+    assert workers[0].stats["l2_not_admitted"] == 1
+
+    # Yon lòt worker (oswa apre yon restart) mande menm fraz la: li antre nan Redis
+    assert workers[1].get("phrase") is None
+    workers[1].set("phrase", "x")
+    assert fake_redis.get("adm_l2:phrase") is not None
+    assert workers[2].get("phrase") == "x"
+
+    # Warmup (force); set_many konte miss get_many yo
+    workers[2].set("warm", "w", force=True)
+    assert fake_redis.get("adm_l2:warm") is not None
+    workers[0].get_many(["a", "b"])
+    workers[1].get_many(["a"])
+    workers[1].set_many({"a": "1", "b": "2"})
+    assert fake_redis.get("adm_l2:a") is not None
+    assert fake_redis.get("adm_l2:b") is None
+    assert fake_redis.ttl("adm_l2:freq:b") > 0
+
+
+def test_l2_without_admission_writes_everything(fake_redis):
+    cache = TieredCache("plain_l2", redis_client=fake_redis)
+    cache.set("once", "x")
+    assert fake_redis.get("plain_l2:once") is not None
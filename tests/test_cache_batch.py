@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou lekti/ekriti kachaj an lo / Tests for batched cache lookups
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config
+from src.redis_cache import RedisCache, TranslationCache as RedisTranslationCache
+from src.translator import CreoleTranslator, TranslationCache as FileTranslationCache
+
+
+@pytest.fixture
+def redis_translations(fake_redis):
+    cache = RedisCache(enabled=False)
+    cache.client, cache.enabled = fake_redis, True
+    return RedisTranslationCache(redis_cache=cache)
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, chunk, src_lang, tgt_lang):
+        self.calls.append(chunk)
+        return [{"translation_text": f"[{tgt_lang}] {chunk}"}]
+
+
+def _translator(tmp_path, cache):
+    config = Config(data_dir=tmp_path, output_dir=tmp_path, logs_dir=tmp_path,
+                    cache_dir=tmp_path / "cache")
+    translator = CreoleTranslator(config, cache=cache)
+    translator.translator = FakeModel()
+    return translator
+
+
+def _book(n, changed=None):
+    paragraphs = [f"Paragraf {i}. " + "Mo " * 30 for i in range(n)]
+    if changed is not None:
+        paragraphs[changed] += "Nouvo fraz."
+    return "\n\n".join(paragraphs)
+
+
+def test_redis_batch_uses_one_mget_and_one_pipeline(fake_redis, redis_translations):
+    texts = [f"moso {i}" for i in range(2000)]
+    redis_translations.set_many([(t, t.upper()) for t in texts[:1500]], "fr", "ht")
+    assert fake_redis.calls == {"pipeline": 1, "set": 1500}
+
+    found = redis_translations.get_many(texts, "fr", "ht")
+
+    assert fake_redis.calls.get("get", 0) == 0 and fake_redis.calls["mget"] == 1
+    assert found[:1500] == [t.upper() for t in texts[:1500]]
+    assert found[1500:] == [None] * 500
+    assert redis_translations.get_stats()["hits"] == 1500
+
+
+def test_file_cache_batch_matches_single_lookups(tmp_path):
+    cache = FileTranslationCache(tmp_path)
+    cache.set_many([("Hello", "Bonjou"), ("World", "Mond")], "en", "ht")
+    assert cache.get_many(["Hello", "Nope", "World"], "en", "ht") == ["Bonjou", None, "Mond"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_translate_resolves_cache_in_one_round_trip(tmp_path, fake_redis, redis_translations):
+    translator = _translator(tmp_path, redis_translations)
+    first = translator.translate(_book(40), src_lang="fr", show_progress=False)
+    chunks = len(translator.translator.calls)
+    assert chunks > 3
+    assert fake_redis.calls["mget"] == 1 and fake_redis.calls["pipeline"] == 1
+
+    # Yon sèl paragraf chanje: se sèl moso sa a ki tradui ankò
+    fake_redis.calls.clear()
+    translator.translator.calls.clear()
+    second = translator.translate(_book(40, changed=7), src_lang="fr", show_progress=False)
+
+    assert len(translator.translator.calls) == 1
+    assert "Nouvo fraz" in translator.translator.calls[0]
+    assert fake_redis.calls == {"mget": 1, "pipeline": 1, "set": 1}
+    assert second.count("[ht]") == first.count("[ht]")
+
+
+def test_parallel_translate_only_schedules_misses(tmp_path):
+    translator = _translator(tmp_path, None)
+    translator.config.enable_parallel = True
+    translator.translate(_book(40), src_lang="fr", show_progress=False)
+    total = len(translator.translator.calls)
+
+    translator.translator.calls.clear()
+    translator.translate(_book(40, changed=3), src_lang="fr", show_progress=False)
+    assert total > 3 and len(translator.translator.calls) == 1
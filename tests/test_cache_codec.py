@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou kodek kachaj la / Tests for the cache codec
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import cache_codec
+from app.cache_codec import CODEC_VERSION, CacheCodec, CodecError, is_encoded
+
+_WORDS = ("liv sa a rakonte istwa yon ti fi ki te grandi Okap lavil lakay manman "
+          "papa lekòl travay lanmè mòn lapli solèy bèl anpil toujou jodi a demen").split()
+TRANSLATION = " ".join(
+    _WORDS[i] for i in np.random.default_rng(7).integers(0, len(_WORDS), 8000)
+)
+
+
+def test_round_trip_of_text_binary_and_structures():
+    codec = CacheCodec()
+    pcm = np.arange(-2000, 2000, dtype=np.int16).tobytes()
+    values = [
+        "Bonjou tout moun",
+        TRANSLATION,
+        pcm,
+        {"translated": "Mèsi", "audio": b"\xff\xfb\x90", "chunks": [1, 2.5, None, True]},
+        [1, "de", {"twa": 3}],
+        42,
+    ]
+    for value in values:
+        blob = codec.encode(value)
+        assert blob[0] == CODEC_VERSION
+        assert codec.decode(blob) == value
+
+
+def test_compression_only_above_threshold_and_when_it_pays():
+    codec = CacheCodec(compression="zlib", compress_min_bytes=1024)
+    short = codec.encode("Bonjou")
+    long = codec.encode(TRANSLATION)
+    noise = codec.encode(os.urandom(64 * 1024))  # tankou MP3: pa konprese
+
+    assert short[1] >> 4 == cache_codec.NONE
+    assert long[1] >> 4 == cache_codec.ZLIB and len(long) < len(TRANSLATION) / 2
+    assert noise[1] >> 4 == cache_codec.NONE and len(noise) == 64 * 1024 + 2
+
+
+def test_legacy_json_values_still_decode():
+    codec = CacheCodec()
+    legacy = json.dumps({"translation": "Bonjou"}, ensure_ascii=False)
+    assert not is_encoded(legacy.encode())
+    assert codec.decode(legacy.encode("utf-8")) == {"translation": "Bonjou"}
+    assert codec.decode(legacy) == {"translation": "Bonjou"}
+    assert codec.decode(b'"Mesi"') == "Mesi"
+
+
+def test_unknown_flags_are_rejected():
+    with pytest.raises(CodecError):
+        CacheCodec().decode(bytes((CODEC_VERSION, 0x0F)) + b"x")
+    with pytest.raises(ValueError):
+        CacheCodec(compression="lz4")
+
+
+@pytest.mark.skipif(cache_codec.MSGPACK_AVAILABLE, reason="msgpack enstale")
+def test_msgpack_requested_without_package():
+    with pytest.raises(ValueError):
+        CacheCodec(serializer="msgpack")
+
+
+def test_file_cache_stores_binary_and_reads_legacy_files(tmp_path, monkeypatch):
+    # Enpòte app.cache kreye cache/translations: fè l anba tmp_path, pa nan repo a
+    monkeypatch.chdir(tmp_path)
+    from app.cache import SimpleCache
+
+    tmp_path = tmp_path / "files"
+
+    cache = SimpleCache(str(tmp_path), ttl_hours=1)
+    mp3 = b"\xff\xf3\x44\xc0" * 1000
+    assert cache.set("odyo", mp3)
+    assert cache.get("odyo") == mp3
+    assert (tmp_path / "odyo.bin").read_bytes()[0] == CODEC_VERSION
+
+    (tmp_path / "ansyen.json").write_text(json.dumps(
+        {"timestamp": datetime.now().isoformat(), "value": "Bonjou"}
+    ))
+    assert cache.get("ansyen") == "Bonjou"
+    assert cache.get_stats()["total_entries"] == 2
+
+    old = time.time() - 7200
+    os.utime(tmp_path / "odyo.bin", (old, old))
+    assert cache.get("odyo") is None
+    assert cache.clear() == 1
+
+
+def _measure(encode, decode, value, rounds=20):
+    blob = encode(value)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encode(value)
+    encode_ms = (time.perf_counter() - start) / rounds * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decode(blob)
+    decode_ms = (time.perf_counter() - start) / rounds * 1000
+    return len(blob), encode_ms, decode_ms, peak
+
+
+def test_benchmark_against_json():
+    codec = CacheCodec()
+
+    def legacy_file_encode(value):
+        # Ansyen SimpleCache.set: JSON ak indent=2 (bytes an base64)
+        if isinstance(value, bytes):
+            value = base64.b64encode(value).decode("ascii")
+        return json.dumps({"timestamp": datetime.now().isoformat(), "value": value},
+                          ensure_ascii=False, indent=2).encode("utf-8")
+
+    def legacy_decode(blob):
+        return json.loads(blob)["value"]
+
+    pcm = (np.sin(np.arange(22050 * 10) / 10) * 8000).astype(np.int16).tobytes()
+    print(f"\n{'valè':<12}{'fòma':<16}{'gwosè':>10}{'encode ms':>11}{'decode ms':>11}{'pik KB':>9}")
+    for label, value in (("tradiksyon", TRANSLATION), ("PCM 10s", pcm)):
+        old = _measure(legacy_file_encode, legacy_decode, value)
+        new = _measure(codec.encode, codec.decode, value)
+        for name, (size, enc, dec, peak) in (("json indent=2", old), (codec.name, new)):
+            print(f"{label:<12}{name:<16}{size:>10}{enc:>11.2f}{dec:>11.2f}{peak / 1024:>9.0f}")
+        assert new[0] < old[0]
+    # Blob binè: pa gen kopi base64/JSON pandan encode
+    assert new[3] < old[3]
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou kachaj memwa limite pandan Redis tonbe
+Tests for the bounded Redis fallback store
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import cache_tiered
+from app.cache_tiered import LRUTTLCache, RedisHealth
+
+
+@pytest.fixture
+def shared(fake_redis, monkeypatch):
+    """Koneksyon pataje a (get_redis_client) sou yon FakeRedis, ak translation_cache"""
+    def connect():
+        fake_redis.ping()
+        return fake_redis
+
+    health = RedisHealth(connect, reconnect_interval=0)
+    cache = cache_tiered.translation_cache
+    monkeypatch.setattr(cache_tiered, "_shared_health", health)
+    monkeypatch.setattr(cache, "health", health)
+    monkeypatch.setattr(cache, "l1", LRUTTLCache(max_entries=3, default_ttl=300, max_bytes=1000))
+    monkeypatch.setattr(cache, "stats", dict.fromkeys(cache.stats, 0))
+    health.on_recover(cache._on_redis_recovered)
+    return health
+
+
+# ============================================================
+# LRUTTLCache: limit an bytes
+# ============================================================
+
+def test_lru_evicts_by_bytes():
+    l1 = LRUTTLCache(max_entries=100, default_ttl=None, max_bytes=100)
+    l1.set("a", b"x" * 40)
+    l1.set("b", b"y" * 40)
+    l1.get("a")
+    l1.set("c", b"z" * 40)
+
+    assert l1.get("b") is None
+    assert l1.get("a") == b"x" * 40
+    assert l1.bytes == 80
+    assert l1.stats["evictions"] == 1
+
+
+def test_lru_rejects_oversized_value_and_tracks_replacements():
+    l1 = LRUTTLCache(max_entries=10, default_ttl=None, max_bytes=10)
+    l1.set("a", "abc")
+    l1.set("a", "abcdef")
+    assert l1.bytes == 6
+
+    assert l1.set("big", "x" * 11) is False
+    assert l1.stats["rejected"] == 1
+    assert "big" not in l1
+    l1.delete("a")
+    assert l1.bytes == 0
+
+
+def test_lru_purge_expired():
+    l1 = LRUTTLCache(max_entries=10, default_ttl=0.01, max_bytes=1000)
+    l1.set("a", "1")
+    l1.set("b", "2", ttl=60)
+    time.sleep(0.02)
+
+    assert l1.purge_expired() == 1
+    assert len(l1) == 1 and l1.bytes == 1
+    assert l1.stats["expirations"] == 1
+
+
+# ============================================================
+# translation_cache: pann Redis ak rekoneksyon
+# ============================================================
+
+def test_worker_started_during_outage_reconnects(shared, fake_redis):
+    cache = cache_tiered.translation_cache
+    fake_redis.down = True
+
+    assert cache_tiered.get_redis_client() is None
+    assert cache.set("k", "memwa") is True  # L1 sèlman, pa gen L2 pou echwe
+    assert cache.get("k") == "memwa"
+    assert cache.get_stats()["fallback"]["active"] is True
+
+    fake_redis.down = False
+    assert cache_tiered.get_redis_client() is fake_redis
+    assert cache.available
+    # L1 vide: lòt nœud yo te ka ekri nan L2 pandan pann lan
+    assert len(cache.l1) == 0
+    cache.set("k", "redis", force=True)  # admisyon L2 teste apa
+    assert fake_redis.get("trans:k") is not None
+
+    metrics = cache.get_stats()["fallback"]
+    assert metrics["active"] is False
+    assert metrics["activations"] == 1 and metrics["recoveries"] == 1
+
+
+def test_outage_mid_run_stops_calling_redis(shared, fake_redis, monkeypatch):
+    cache = cache_tiered.translation_cache
+    assert cache_tiered.get_redis_client() is fake_redis
+    shared.reconnect_interval = 60
+    fake_redis.down = True
+
+    assert cache.get("a") is None
+    for i in range(5):
+        cache.set(f"k{i}", f"v{i}")
+        cache.get(f"k{i}")
+
+    # Yon sèl erè (timeout) epi L1 sèlman, san tantativ anvan entèval la
+    assert cache.stats["errors"] == 1
+    assert shared.stats["reconnect_attempts"] == 0
+    # Magazen fallback la limite
+    assert len(cache.l1) == 3 and cache.get("k4") == "v4" and cache.get("k0") is None
+    assert cache.get_stats()["fallback"]["active"] is True
+
+
+def test_fallback_entries_keep_full_ttl(shared, fake_redis):
+    cache = cache_tiered.translation_cache
+    fake_redis.down = True
+    cache.set("k", "v")
+
+    _, expires_at, _ = cache.l1._data["trans:k"]
+    assert expires_at - time.monotonic() > cache.l1.default_ttl
+
+
+def test_reconnect_attempts_are_throttled(shared, fake_redis):
+    shared.reconnect_interval = 60
+    fake_redis.down = True
+    assert cache_tiered.get_redis_client() is None
+    fake_redis.down = False
+
+    # Redis tounen men entèval la poko pase: toujou an memwa
+    assert cache_tiered.get_redis_client() is None
+    assert shared.stats["reconnect_attempts"] == 0
+
+    shared._last_attempt -= 61
+    assert cache_tiered.get_redis_client() is fake_redis
+    assert shared.stats["reconnect_attempts"] == 1
+    assert shared.get_stats()["fallback_seconds"] >= 0
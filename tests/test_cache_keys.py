@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for canonical translation cache keys
+Test pou kle kachaj tradiksyon yo (tèks kanonik, vèsyone)
+"""
+
+import json
+import sys
+import unicodedata
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import cache_keys
+from src.cache_keys import (
+    canonicalize, key_version, main, replay_corpus, split_segments, translation_key
+)
+from src.redis_cache import RedisCache, TranslationCache as RedisTranslationCache
+from src.translator import TranslationCache
+
+
+def test_whitespace_quotes_and_unicode_fold_together():
+    variants = [
+        "Li di: “Bonjou tout moun”.",
+        "  Li di: \"Bonjou  tout\nmoun\".  ",
+        "Li di: \"Bonjou​ tout\r\nmoun\".",
+        unicodedata.normalize("NFD", "Li di: \"Bonjou tout moun\"."),
+    ]
+    assert {canonicalize(v) for v in variants} == {'Li di: "Bonjou tout moun".'}
+    assert len({translation_key(v, "fr", "ht") for v in variants}) == 1
+
+
+def test_paragraph_breaks_and_accents_are_kept():
+    assert canonicalize("Premye.\n \n\nDezyèm.") == "Premye.\n\nDezyèm."
+    assert canonicalize("Premye. Dezyèm.") != canonicalize("Premye.\n\nDezyèm.")
+    assert translation_key("kote", "fr", "ht") != translation_key("koté", "fr", "ht")
+
+
+def test_case_rules():
+    assert canonicalize("Bonjou Jak", "preserve") == "Bonjou Jak"
+    assert canonicalize("Bonjou Jak", "lower") == "bonjou jak"
+    assert canonicalize("Bonjou Jak", "first") == "bonjou Jak"
+    with pytest.raises(ValueError):
+        canonicalize("x", "upper")
+
+
+def test_key_is_versioned(monkeypatch):
+    key = translation_key("Bonjou", "fr", "ht")
+    assert key != translation_key("Bonjou", "fr", "ht", case="lower")
+    assert key != translation_key("Bonjou", "en", "ht")
+    assert key_version("first") == f"{cache_keys.KEY_VERSION}-first"
+
+    monkeypatch.setattr(cache_keys, "KEY_VERSION", "k3")
+    assert translation_key("Bonjou", "fr", "ht") != key
+
+
+def test_caches_share_the_canonical_key(tmp_path, fake_redis):
+    files = TranslationCache(tmp_path)
+    files.set("Bonjou  tout moun", "Hello everyone", "ht", "en")
+    assert files.get("Bonjou tout\nmoun", "ht", "en") == "Hello everyone"
+
+    client = RedisCache(enabled=False)
+    client.client, client.enabled = fake_redis, True
+    redis_cache = RedisTranslationCache(redis_cache=client)
+    redis_cache.set("Bonjou  tout moun", "Hello everyone", "ht", "en")
+    assert redis_cache.get("Bonjou tout moun ", "ht", "en") == "Hello everyone"
+
+
+def test_replay_reports_improvement():
+    corpus = "Bonjou tout moun.\n\nBonjou  tout\nmoun.\n\nbonjou tout moun.\n\nOrevwa."
+    segments = split_segments(corpus, "paragraph")
+    report = replay_corpus(segments)
+
+    assert report["segments"] == 4
+    assert report["raw"]["hits"] == 0
+    assert report["preserve"]["hits"] == 1
+    assert report["lower"]["hits"] == 2 and report["lower"]["unique_keys"] == 2
+    assert report["improvement"] == 25.0
+
+
+def test_replay_cli(tmp_path, capsys):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("Bonjou!\nBonjou! \n“Mèsi”\n\"Mèsi\"\n", encoding="utf-8")
+
+    assert main([str(corpus), "--segment", "line", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["raw"]["hit_rate"] == 0.0
+    assert report["preserve"]["hit_rate"] == 50.0
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou kachaj L1/L2 / Tests for the tiered cache
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import cache_tiered
+from app.cache_tiered import LRUTTLCache, RedisHealth, TieredCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_tiered.time, "monotonic", clock)
+    return clock
+
+
+def test_lru_evicts_least_recently_used():
+    l1 = LRUTTLCache(max_entries=2, default_ttl=None)
+    l1.set("a", 1)
+    l1.set("b", 2)
+    assert l1.get("a") == 1  # "b" vin pi ansyen an
+    l1.set("c", 3)
+    assert l1.get("b") is None
+    assert l1.get("a") == 1 and l1.get("c") == 3
+    assert l1.stats["evictions"] == 1
+
+
+def test_lru_entries_expire(clock):
+    l1 = LRUTTLCache(max_entries=10, default_ttl=5)
+    l1.set("a", 1)
+    l1.set("b", 2, ttl=60)
+    clock.now += 6
+    assert l1.get("a") is None
+    assert l1.get("b") == 2
+    assert l1.stats["expirations"] == 1
+
+
+def test_read_through_and_write_through(fake_redis):
+    cache = TieredCache("trans", redis_client=fake_redis)
+    fake_redis.set("trans:k1", json.dumps("Bonjou"))
+
+    assert cache.get("k1") == "Bonjou"  # L2
+    assert cache.get("k1") == "Bonjou"  # L1, pa gen lòt GET
+    assert fake_redis.calls["get"] == 1
+
+    cache.set("k2", {"translated": "Mèsi"})
+    assert cache.codec.decode(fake_redis.get("trans:k2")) == {"translated": "Mèsi"}
+    assert 0 < fake_redis.ttl("trans:k2") <= 24 * 3600
+    assert cache.get("k2") == {"translated": "Mèsi"}
+
+    stats = cache.get_stats()
+    assert (stats["l1_hits"], stats["l2_hits"], stats["misses"]) == (2, 1, 0)
+
+
+def test_delete_and_clear_invalidate_both_tiers(fake_redis):
+    cache = TieredCache("audio", redis_client=fake_redis)
+    other = TieredCache("trans", redis_client=fake_redis)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    other.set("a", "kenbe")
+
+    cache.delete("a")
+    assert cache.get("a") is None and fake_redis.get("audio:a") is None
+
+    assert cache.clear() == 1
+    assert cache.get("b") is None and len(cache.l1) == 0
+    assert other.get("a") == "kenbe"
+
+
+def test_l1_ttl_bounds_staleness_from_other_instances(fake_redis, clock):
+    mine = TieredCache("trans", redis_client=fake_redis, l1_ttl=30)
+    theirs = TieredCache("trans", redis_client=fake_redis, l1_ttl=30)
+    mine.set("k", "v1")
+    theirs.set("k", "v2")
+
+    assert mine.get("k") == "v1"  # L1 poko ekspire
+    clock.now += 31
+    assert mine.get("k") == "v2"
+
+
+def test_redis_outage_falls_back_to_l1(fake_redis):
+    cache = TieredCache("trans", redis_client=fake_redis)
+    fake_redis.down = True
+
+    assert cache.set("k", "v") is False
+    assert cache.get("k") == "v"
+    assert cache.get("missing") is None
+    # Apre premye erè a, pa gen apèl Redis ankò jiska pwochen tantativ la
+    assert cache.stats["errors"] == 1
+    assert not cache.available
+
+
+def test_l1_only_without_redis():
+    cache = TieredCache("session", redis_client=None, l1=LRUTTLCache(max_entries=3))
+    for i in range(10):
+        cache.set(str(i), i)
+    assert not cache.available
+    assert len(cache.l1) == 3
+    assert cache.get("9") == 9 and cache.get("0") is None
+
+
+def test_legacy_call_sites_share_the_tiered_cache(fake_redis, monkeypatch, tmp_path):
+    # Enpòte app.cache kreye cache/translations: fè l anba tmp_path, pa nan repo a
+    monkeypatch.chdir(tmp_path)
+    from app import cache, cache_redis
+
+    monkeypatch.setattr(cache_tiered.translation_cache, "health", RedisHealth.for_client(fake_redis))
+    monkeypatch.setattr(cache_tiered.translation_cache, "l1", LRUTTLCache())
+    assert cache_redis.translation_cache is cache_tiered.translation_cache
+
+    calls = []
+
+    def translate(text, src, tgt):
+        calls.append(text)
+        return text.upper()
+
+    assert cache.cached_translation("bonjou", "fr", "ht", translate) == "BONJOU"
+    assert cache_redis.cached_translation("bonjou", "fr", "ht", translate) == "BONJOU"
+    assert calls == ["bonjou"]
+    assert cache_tiered.cache_stats()["trans"]["sets"] >= 1
+
+
+def test_get_many_checks_l1_then_one_mget(fake_redis):
+    cache = TieredCache("trans", redis_client=fake_redis)
+    cache.set_many({f"k{i}": f"v{i}" for i in range(100)})
+    assert fake_redis.calls["pipeline"] == 1
+
+    warm = TieredCache("trans", redis_client=fake_redis)
+    warm.set("k0", "v0")
+    values = warm.get_many([f"k{i}" for i in range(100)] + ["nope"])
+
+    assert values == [f"v{i}" for i in range(100)] + [None]
+    assert fake_redis.calls["mget"] == 1
+    assert (warm.stats["l1_hits"], warm.stats["l2_hits"], warm.stats["misses"]) == (1, 99, 1)
+    assert warm.get_many(["k5", "k6"]) == ["v5", "v6"] and fake_redis.calls["mget"] == 1
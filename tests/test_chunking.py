@@ -5,12 +5,15 @@ Tests pou chunking entèlijan / Tests for smart chunking
 """
 
 import pytest
+import random
+import re
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from main import smart_chunk_text
+from src.utils import smart_chunk_text, smart_chunk_spans
 
 
 def test_chunking_preserves_content():
@@ -44,13 +47,12 @@ Second paragraph is here.
 
 Third paragraph is here."""
     
-    chunks = smart_chunk_text(text, max_size=100)
+    # Paragraphs that fit are packed together
+    assert smart_chunk_text(text, max_size=100) == [text]
     
-    # Each paragraph should ideally be in its own chunk
-    assert len(chunks) >= 3
-    
-    # First chunk should contain first paragraph
-    assert "First paragraph" in chunks[0]
+    # Two paragraphs don't fit: each one stays whole in its own chunk
+    chunks = smart_chunk_text(text, max_size=30)
+    assert chunks == ["First paragraph is here.", "Second paragraph is here.", "Third paragraph is here."]
 
 
 def test_sentence_boundaries():
@@ -68,9 +70,8 @@ def test_sentence_boundaries():
 
 def test_empty_text():
     """Test handling of empty text"""
-    chunks = smart_chunk_text("", max_size=100)
-    assert len(chunks) == 1
-    assert chunks[0] == ""
+    assert smart_chunk_text("", max_size=100) == []
+    assert smart_chunk_spans("", max_size=100) == []
 
 
 def test_single_long_word():
@@ -111,6 +112,85 @@ def test_real_world_text():
     assert "lang ofisyèl" in combined
 
 
+def _random_text(size: int, seed: int = 0) -> str:
+    """Tèks o aza ak fraz, paragraf, liy kase ak mo trè long"""
+    rng = random.Random(seed)
+    words = ["Kreyòl", "ayisyen", "se", "yon", "lang", "rich", "istwa", "a" * 120]
+    endings = [" ", " ", " ", ". ", "! ", "? ", "\n", "\n\n", "  \n \n  ", "\t"]
+    parts, total = [], 0
+    while total < size:
+        part = rng.choice(words) + rng.choice(endings)
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("max_size", [1, 7, 50, 333, 1000])
+def test_spans_lossless_coverage(max_size):
+    """Spans don't overlap, respect max_size, and gaps are only whitespace"""
+    text = _random_text(20_000, seed=max_size)
+    spans = smart_chunk_spans(text, max_size=max_size)
+
+    previous_end = 0
+    for start, end in spans:
+        assert previous_end <= start < end <= len(text)
+        assert end - start <= max_size
+        assert text[previous_end:start].strip() == ""
+        previous_end = end
+    assert text[previous_end:].strip() == ""
+
+    assert smart_chunk_text(text, max_size=max_size) == [text[s:e] for s, e in spans]
+
+
+def test_short_paragraphs_are_packed():
+    """Many one-line paragraphs give a few full chunks, not one chunk each"""
+    text = "\n\n".join(f"Paragraf {i} la kout." for i in range(200))
+    chunks = smart_chunk_text(text, max_size=1000)
+
+    assert len(chunks) == 5
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert "\n\n".join(chunks) == text
+
+
+def test_paragraphs_that_fit_are_never_split():
+    """A paragraph no longer than max_size always lands whole in one chunk"""
+    text = _random_text(10_000, seed=42)
+    spans = smart_chunk_spans(text, max_size=400)
+    start = 0
+    for match in list(re.finditer(r"\n[^\S\n]*\n\s*", text)) + [None]:
+        end = match.start() if match else len(text)
+        paragraph = text[start:end].strip()
+        if paragraph and len(paragraph) <= 400:
+            offset = text.index(paragraph, start)
+            assert any(s <= offset and offset + len(paragraph) <= e for s, e in spans)
+        start = match.end() if match else len(text)
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        smart_chunk_text("abc", max_size=0)
+
+
+@pytest.mark.benchmark
+def test_benchmark_multi_megabyte():
+    """Micro-benchmark: chunking scales linearly on multi-MB text"""
+    small = _random_text(500_000, seed=1)
+    large = small * 8  # ~4 MB
+
+    timings = {}
+    for name, text in (("small", small), ("large", large)):
+        start = time.perf_counter()
+        chunks = smart_chunk_text(text, max_size=1000)
+        timings[name] = time.perf_counter() - start
+        assert chunks
+
+    mb_per_s = len(large) / (1024 * 1024) / max(timings["large"], 1e-9)
+    print(f"\n⚡ smart_chunk_text: {len(large) / 1e6:.1f} MB in {timings['large']:.3f}s ({mb_per_s:.1f} MB/s)")
+    # Lineyè: 8x plis tèks pa dwe koute plis pase ~20x tan
+    assert timings["large"] < max(timings["small"], 0.01) * 20
+    assert timings["large"] < 10
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for EPUB extraction
+Test pou ekstraksyon EPUB nan lòd spine
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+epub = pytest.importorskip("ebooklib.epub")
+
+from app.services.epub_extractor import (
+    extract_epub_chapters,
+    iter_epub_chapters,
+    parse_chapter_html,
+)
+
+
+def build_epub(path: Path, chapters: list) -> Path:
+    """Kreye yon ti EPUB; spine la nan lòd envès manifest la"""
+    book = epub.EpubBook()
+    book.set_identifier("test-book")
+    book.set_title("Liv Tès")
+    book.set_language("ht")
+
+    items = []
+    for i, (title, body) in enumerate(chapters, 1):
+        item = epub.EpubHtml(title=title, file_name=f"chap_{i}.xhtml", lang="ht")
+        item.content = f"<html><head><title>{title}</title></head><body>{body}</body></html>"
+        book.add_item(item)
+        items.append(item)
+
+    book.toc = [epub.Link(item.file_name, item.title, f"c{i}") for i, item in enumerate(items, 1)]
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    # Spine lan pa swiv lòd manifest la
+    book.spine = list(reversed(items))
+    epub.write_epub(str(path), book)
+    return path
+
+
+@pytest.fixture
+def sample_epub(tmp_path):
+    return build_epub(tmp_path / "book.epub", [
+        ("Premye", "<h1>Premye</h1><p>Bonjou tout moun.</p><p>Dezyèm paragraf.</p>"),
+        ("Dezyèm", "<h1>Dezyèm</h1><p>Kontinye istwa a.</p><script>var x = 1;</script>"),
+        ("Twazyèm", "<h1>Twazyèm</h1><p>Fen liv la.</p>"),
+    ])
+
+
+def test_chapters_follow_spine_order(sample_epub):
+    chapters = [c for c in extract_epub_chapters(sample_epub) if c.href.startswith("chap_")]
+    assert [c.title for c in chapters] == ["Twazyèm", "Dezyèm", "Premye"]
+    assert [c.index for c in chapters] == sorted(c.index for c in chapters)
+
+
+def test_chapter_text_is_clean(sample_epub):
+    chapters = {c.title: c for c in extract_epub_chapters(sample_epub)}
+    assert "var x" not in chapters["Dezyèm"].text
+    assert "Bonjou tout moun." in chapters["Premye"].text
+    assert "\n" in chapters["Premye"].text  # paragraf yo separe
+
+
+def test_chapter_range(sample_epub):
+    all_chapters = extract_epub_chapters(sample_epub)
+    subset = list(iter_epub_chapters(sample_epub, chapter_range=(2, 3)))
+    assert [c.index for c in subset] == [c.index for c in all_chapters if 2 <= c.index <= 3]
+
+    with pytest.raises(ValueError):
+        extract_epub_chapters(sample_epub, chapter_range=(10, 12))
+
+
+def test_parallel_matches_sequential(sample_epub):
+    sequential = extract_epub_chapters(sample_epub, max_workers=1)
+    parallel = extract_epub_chapters(sample_epub, max_workers=4)
+    assert sequential == parallel
+
+
+def test_parse_chapter_html_title_fallback():
+    title, text = parse_chapter_html(
+        "<html><head><title>Tit</title></head><body><p>Tèks</p></body></html>".encode("utf-8")
+    )
+    assert title == "Tit"
+    assert text == "Tèks"
+
+
+@pytest.mark.asyncio
+async def test_media_service_epub(sample_epub):
+    from app.services.media_service import MediaService
+
+    text = await MediaService().extract_text_from_document(str(sample_epub), chapter_range=(1, 10))
+    assert text.index("Fen liv la.") < text.index("Bonjou tout moun.")
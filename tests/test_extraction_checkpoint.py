@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for resumable PDF extraction
+Test pou checkpoint ekstraksyon ak limit paj tenant
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import extraction_checkpoint
+from app.services.extraction_checkpoint import ExtractionCheckpoint, get_page_budget
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_root(tmp_path, monkeypatch):
+    root = tmp_path / "checkpoints"
+    monkeypatch.setattr(extraction_checkpoint, "CHECKPOINT_ROOT", root)
+    monkeypatch.delenv("PAGE_BUDGET_DEFAULT", raising=False)
+    return root
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "book.pdf"
+    path.write_bytes(b"%PDF-1.4 fake")
+    return path
+
+
+def test_page_budget_from_env(monkeypatch):
+    assert get_page_budget("acme") is None
+    monkeypatch.setenv("PAGE_BUDGET_DEFAULT", "500")
+    assert get_page_budget("acme") == 500
+    monkeypatch.setenv("PAGE_BUDGET_ACME", "20")
+    assert get_page_budget("acme") == 20
+    assert get_page_budget(None) == 500
+
+
+def test_checkpoint_roundtrip(pdf_file):
+    checkpoint = ExtractionCheckpoint("job-1")
+    assert checkpoint.resume(pdf_file, 10) == 0
+    checkpoint.save(0, ["p1", "p2"])
+    checkpoint.save(2, ["p3"])
+
+    restored = ExtractionCheckpoint("job-1")
+    assert restored.resume(pdf_file, 10) == 3
+    assert restored.load_pages() == ["p1", "p2", "p3"]
+
+    with pytest.raises(ValueError):
+        restored.save(5, ["gap"])
+
+    restored.clear()
+    assert not restored.dir.exists()
+
+
+def test_checkpoint_discarded_for_other_pdf(pdf_file):
+    checkpoint = ExtractionCheckpoint("job-2")
+    checkpoint.resume(pdf_file, 10)
+    checkpoint.save(0, ["p1"])
+
+    # Menm job_id, men PDF la gen yon lòt kantite paj
+    assert ExtractionCheckpoint("job-2").resume(pdf_file, 12) == 0
+
+
+class FakePage:
+    def __init__(self, text, calls):
+        self.text = text
+        self.calls = calls
+
+    def extract_text(self):
+        self.calls.append(self.text)
+        return self.text
+
+
+def fake_reader_factory(total, calls):
+    class FakeReader:
+        def __init__(self, path):
+            self.pages = [FakePage(f"Paj nimewo {i} gen tèks pa l.", calls) for i in range(total)]
+    return FakeReader
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_extraction_resumes_after_crash(pdf_file, monkeypatch):
+    pypdf = pytest.importorskip("pypdf")
+    from app.services.media_service import MediaService
+
+    calls = []
+    monkeypatch.setattr(pypdf, "PdfReader", fake_reader_factory(12, calls))
+    service = MediaService()
+
+    def crash_after_first_chunks(done, total):
+        if done >= 8:
+            raise Crash()
+
+    with pytest.raises(Crash):
+        await service._extract_pdf_optimized(
+            pdf_file, show_progress=False, chunk_size=4, clean_layout=False,
+            job_id="job-crash", progress_callback=crash_after_first_chunks
+        )
+    assert len(calls) == 8
+
+    progress = []
+    calls.clear()
+    text = await service._extract_pdf_optimized(
+        pdf_file, show_progress=False, chunk_size=4, clean_layout=False,
+        job_id="job-crash", progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    # Sèlman dènye 4 paj yo re-ekstrè
+    assert len(calls) == 4
+    assert progress[0] == (8, 12) and progress[-1] == (12, 12)
+    assert [f"Paj nimewo {i} " in text for i in range(12)] == [True] * 12
+
+
+@pytest.mark.asyncio
+async def test_tenant_page_budget_limits_extraction(pdf_file, monkeypatch):
+    pypdf = pytest.importorskip("pypdf")
+    from app.services.media_service import MediaService
+
+    calls = []
+    monkeypatch.setattr(pypdf, "PdfReader", fake_reader_factory(30, calls))
+    monkeypatch.setenv("PAGE_BUDGET_ACME", "5")
+
+    text = await MediaService()._extract_pdf_optimized(
+        pdf_file, show_progress=False, clean_layout=False, tenant="acme"
+    )
+    assert len(calls) == 5
+    assert "5/30" in text
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for resumable audiobook jobs
+Test pou manifest travay ak rekòmansman pa moso
+"""
+
+import pytest
+import sys
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import job_manifest
+from app.job_manifest import JobManifest, merge_audio_files
+from utils import audio_assembly
+
+
+def _join_bytes(paths, output_path, silence_ms=0, bitrate=None):
+    """Fo TTS la ekri tèks, pa MP3: re-ankodaj la kole byte yo tou senpleman"""
+    Path(output_path).write_bytes(b"".join(Path(p).read_bytes() for p in paths))
+    return Path(output_path)
+
+
+@pytest.fixture
+def jobs_root(tmp_path, monkeypatch):
+    root = tmp_path / "jobs"
+    monkeypatch.setattr(job_manifest, "JOBS_ROOT", root)
+    return root
+
+
+def finish_chunk(manifest, index):
+    path = manifest.audio_path_for(index)
+    path.write_bytes(f"[{index}]".encode())
+    manifest.mark_done(index, path)
+
+
+def test_prepare_reuses_done_chunks(jobs_root):
+    manifest = JobManifest("job-a")
+    manifest.start({"voice": "creole-native"})
+    assert manifest.prepare_chunks(["a", "b", "c"]) == {"total": 3, "reused": 0, "pending": 3}
+    finish_chunk(manifest, 0)
+    finish_chunk(manifest, 1)
+
+    again = JobManifest.load("job-a")
+    again.start({})
+    # Moso 1 chanje tèks: li dwe refèt
+    assert again.prepare_chunks(["a", "B", "c"]) == {"total": 3, "reused": 1, "pending": 2}
+    assert again.pending_chunks() == [1, 2]
+    assert again.params == {"voice": "creole-native"}
+    assert again.report()["runs"] == 2
+
+
+def test_prepare_drops_stale_chunks(jobs_root):
+    manifest = JobManifest("job-b")
+    manifest.start({})
+    manifest.prepare_chunks(["a", "b", "c"])
+    manifest.prepare_chunks(["a"])
+    assert sorted(p.name for p in manifest.chunks_dir.glob("*.json")) == ["00000.json"]
+
+
+def test_load_missing_job(jobs_root):
+    with pytest.raises(FileNotFoundError):
+        JobManifest.load("nope")
+
+
+def test_merge_wav_files(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.wav"
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(16000)
+            w.writeframes(b"\x01\x00" * 100)
+        paths.append(path)
+
+    merged = merge_audio_files(paths, tmp_path / "out.mp3")
+    assert merged.suffix == ".wav"
+    with wave.open(str(merged), "rb") as w:
+        assert w.getnframes() == 300
+
+
+def test_merge_mp3_files_strips_tags(tmp_path):
+    from utils.audio_concat import parse_frame_header
+
+    header = bytes([0xFF, 0xF3, 0x44, 0xC0])
+    frame = header + bytes(parse_frame_header(header).length - 4)
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"{i}.mp3"
+        path.write_bytes(b"ID3\x04\x00\x00\x00\x00\x00\x02ab" + frame * 2)
+        paths.append(path)
+
+    merged = merge_audio_files(paths, tmp_path / "out.mp3")
+    assert merged.read_bytes() == frame * 4
+
+
+def test_process_audiobook_resumes_missing_chunks(jobs_root, tmp_path, monkeypatch):
+    pytest.importorskip("celery")
+    import app.tasks as tasks
+    from app.services.tts_service import TTSService
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tasks, "AUDIOBOOK_CHUNK_CHARS", 40)
+
+    source = tmp_path / "book.txt"
+    source.write_text(" ".join(f"Fraz nimewo {i} nan liv la." for i in range(12)), encoding="utf-8")
+
+    calls = []
+    fail_on = {"index": 3}
+
+    async def fake_tts(self, text, output_path, voice="creole-native"):
+        if len(calls) == fail_on["index"]:
+            fail_on["index"] = None
+            raise RuntimeError("worker restarted")
+        calls.append(text)
+        Path(output_path).write_bytes(text.encode("utf-8"))
+        return Path(output_path)
+
+    monkeypatch.setattr(TTSService, "text_to_speech_file", fake_tts)
+    monkeypatch.setattr(audio_assembly, "assemble_files", _join_bytes)
+
+    with pytest.raises(RuntimeError, match="worker restarted"):
+        tasks.process_audiobook.apply(
+            args=[str(source), "creole-native"], task_id="job-resume"
+        ).get()
+    assert JobManifest.load("job-resume").status == "failed"
+    first_run_calls = len(calls)
+
+    result = tasks.resume_job("job-resume")
+    chunks = result["stats"]["chunks"]
+    assert chunks["reused"] == first_run_calls == 3
+    assert chunks["recomputed"] == chunks["chunks"] - 3
+    assert len(calls) == chunks["chunks"]
+
+    audio = tmp_path / result["audio"].lstrip("/")
+    assert audio.read_bytes().decode("utf-8").replace(" ", "") == "".join(calls).replace(" ", "")
+
+    # Travay fini: resume retounen menm rezilta a san refè anyen
+    assert tasks.resume_job("job-resume") == result
+    assert len(calls) == chunks["chunks"]
+
+
+def test_process_audiobook_fan_out_chord(jobs_root, tmp_path, monkeypatch, fake_redis, capsys):
+    """Chord la (ekzekite lokalman) bay menm rezilta ak fan-in sou ID paran an"""
+    pytest.importorskip("celery")
+    import app.tasks as tasks
+    from app import cache_tiered
+    from app.services.tts_service import TTSService
+
+    from celery.backends.cache import CacheBackend
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tasks, "AUDIOBOOK_CHUNK_CHARS", 40)
+    monkeypatch.setattr(tasks, "JOBS_DIR_SHARED", True)
+    monkeypatch.setattr(cache_tiered, "get_redis_client", lambda: fake_redis)
+    # Canvas yo bezwen yon result backend; pa gen Redis nan tès yo
+    monkeypatch.setattr(
+        tasks.celery_app._local, "backend",
+        CacheBackend(app=tasks.celery_app, backend="memory"), raising=False
+    )
+
+    source = tmp_path / "book.txt"
+    source.write_text(" ".join(f"Fraz nimewo {i} nan liv la." for i in range(12)), encoding="utf-8")
+
+    calls = []
+
+    async def fake_tts(self, text, output_path, voice="creole-native"):
+        calls.append(text)
+        Path(output_path).write_bytes(text.encode("utf-8"))
+        return Path(output_path)
+
+    monkeypatch.setattr(TTSService, "text_to_speech_file", fake_tts)
+    monkeypatch.setattr(audio_assembly, "assemble_files", _join_bytes)
+
+    result = tasks.process_audiobook.apply(
+        kwargs={"file_path": str(source), "voice": "creole-native", "fan_out": True},
+        task_id="job-chord"
+    ).get()
+
+    assert result["job_id"] == "job-chord"
+    assert result["stats"]["chunks"]["recomputed"] == len(calls) > 1
+    assert JobManifest.load("job-chord").status == "complete"
+    audio = tmp_path / result["audio"].lstrip("/")
+    assert audio.read_bytes().decode("utf-8").replace(" ", "") == "".join(calls).replace(" ", "")
+
+    # Pwogresyon: yon INCR pa moso, pa okenn relekti manifest
+    assert fake_redis.calls["incr"] == len(calls)
+    assert f"moso {len(calls)}/{len(calls)}" in capsys.readouterr().out
+    assert fake_redis.get(tasks._chunk_counter_key("job-chord")) is None
+
+
+def test_fan_out_requires_shared_jobs_dir(jobs_root, tmp_path, monkeypatch):
+    pytest.importorskip("celery")
+    import app.tasks as tasks
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tasks, "AUDIOBOOK_CHUNK_CHARS", 40)
+    monkeypatch.setattr(tasks, "JOBS_DIR_SHARED", False)
+    source = tmp_path / "book.txt"
+    source.write_text(" ".join(f"Fraz nimewo {i} nan liv la." for i in range(12)), encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="JOBS_DIR_SHARED"):
+        tasks.process_audiobook.apply(
+            kwargs={"file_path": str(source), "voice": "creole-native", "fan_out": True},
+            task_id="job-local"
+        ).get()
+    assert JobManifest.load("job-local").status == "failed"
+
+
+def test_chunk_task_fails_fast_without_manifest(jobs_root):
+    pytest.importorskip("celery")
+    import app.tasks as tasks
+
+    with pytest.raises(RuntimeError, match="pa vizib"):
+        tasks.synthesize_audiobook_chunk.apply(args=["job-elsewhere", 0, "creole-native"]).get()
+
+
+def test_queued_resume_uses_env_fan_out_default(jobs_root, monkeypatch):
+    pytest.importorskip("celery")
+    import app.tasks as tasks
+    from types import SimpleNamespace
+
+    manifest = JobManifest("job-queued")
+    manifest.start({"file_path": "book.txt", "voice": "creole-native"})
+    queued = {}
+
+    def fake_apply_async(kwargs):
+        queued.update(kwargs)
+        return SimpleNamespace(id="celery-1")
+
+    monkeypatch.setattr(tasks.process_audiobook, "apply_async", fake_apply_async)
+    assert tasks.resume_job("job-queued", queue=True) == {
+        "status": "queued", "task_id": "celery-1", "job_id": "job-queued"
+    }
+    assert queued["fan_out"] is None
+
+    # Sou yon worker ak konfigirasyon default (JOBS_DIR pa pataje): pa gen erè, pa gen fan-out
+    monkeypatch.setattr(tasks, "JOBS_DIR_SHARED", False)
+    worker = SimpleNamespace(request=SimpleNamespace(is_eager=False))
+    assert tasks._use_fan_out(worker, queued["fan_out"], 10) is False
+    monkeypatch.setattr(tasks, "JOBS_DIR_SHARED", True)
+    monkeypatch.setattr(tasks, "AUDIOBOOK_FANOUT", False)
+    assert tasks._use_fan_out(worker, queued["fan_out"], 10) is False
+
+
+def test_resume_cli_exit_codes(jobs_root, monkeypatch, capsys):
+    pytest.importorskip("celery")
+    import app.tasks as tasks
+
+    assert tasks._resume_main("nope") == 1
+    assert "nope" in capsys.readouterr().out
+
+    outcomes = iter([{"status": "success"}, {"status": "queued", "task_id": "t"},
+                     {"status": "failed"}])
+    monkeypatch.setattr(tasks, "resume_job", lambda job, queue=False: next(outcomes))
+    assert [tasks._resume_main("job") for _ in range(3)] == [0, 0, 1]
@@ -8,12 +8,20 @@ Test Jesyon Metadone
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.metadata_manager import MetadataManager
 
 
+@pytest.fixture(autouse=True)
+def isolated_output(tmp_path, monkeypatch):
+    """MetadataManager ekri nan output/metadata: kouri tès yo nan tmp_path"""
+    monkeypatch.chdir(tmp_path)
+
+
 def test_create_metadata():
     """Test metadata creation"""
     print("=" * 60)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for PDF page cleanup
+Test pou retire antèt, pye paj ak nimewo paj
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.page_cleaner import PageCleaner, CleanupStats, clean_pages, dehyphenate
+
+
+def make_pages(count: int = 6) -> list:
+    """Paj ak antèt liv la, kò a, ak nimewo paj anba"""
+    words = ["lib", "ète", "lit", "kay", "lan", "mè", "pye", "bwa", "dlo", "tè", "syèl", "zile"]
+    return [
+        f"ISTWA AYITI - Chapit 1\nKò paj {i} la pale de {words[i % 12]}.\n"
+        f"Fraz sa a chanje: {' '.join(words[:i % 12 + 1])}.\n"
+        f"Dènye fraz {words[(i * 5) % 12]}.\n{i}"
+        for i in range(1, count + 1)
+    ]
+
+
+def test_repeated_headers_and_page_numbers_removed():
+    cleaned, stats = clean_pages(make_pages())
+    for i, page in enumerate(cleaned, 1):
+        assert "ISTWA AYITI" not in page
+        assert page.splitlines()[-1] != str(i)
+        assert f"Kò paj {i} la" in page
+    assert stats.pages == 6
+    assert stats.lines_removed == 12
+
+
+def test_stats_report_savings():
+    _, stats = clean_pages(make_pages(10))
+    assert stats.chars_removed == stats.chars_before - stats.chars_after > 0
+    data = stats.to_dict()
+    assert data["tokens_saved"] == stats.chars_removed // 4
+    assert data["audio_seconds_saved"] > 0
+
+
+def test_body_lines_kept_when_not_repeated():
+    titles = ["Lakay", "Lanmè", "Mòn yo", "Lavil", "Lekòl"]
+    pages = [f"{title}\nKò paj sou {title.lower()}." for title in titles]
+    cleaned, stats = clean_pages(pages)
+    assert cleaned == pages
+    assert stats.chars_removed == 0
+
+
+def test_few_pages_left_untouched():
+    pages = make_pages(2)
+    cleaned, stats = clean_pages(pages)
+    assert cleaned == pages
+    assert stats.lines_removed == 0
+
+
+def test_dehyphenate():
+    text, joined = dehyphenate("Sa se yon egzan-\nple ak pwoblè-\n  m. Men Port-\nAu-Prince rete.")
+    assert "egzanple" in text
+    assert "pwoblèm" in text
+    assert "Port-\nAu-Prince" in text  # majiskil: pa rekole non pwòp
+    assert joined == 2
+
+
+def test_page_cleaner_incremental():
+    cleaner = PageCleaner()
+    for page in make_pages(4):
+        cleaner.add_page(page)
+    stats = CleanupStats()
+    cleaned = cleaner.clean_pages(stats)
+    assert len(cleaned) == 4
+    assert all(not page.startswith("ISTWA") for page in cleaned)
+
+
+@pytest.mark.asyncio
+async def test_media_service_strips_layout(tmp_path, monkeypatch):
+    pypdf = pytest.importorskip("pypdf")
+    from app.services.media_service import MediaService
+
+    service = MediaService()
+    pages = make_pages(5)
+
+    class FakePage:
+        def __init__(self, text):
+            self.text = text
+
+        def extract_text(self):
+            return self.text
+
+    class FakeReader:
+        def __init__(self, path):
+            self.pages = [FakePage(text) for text in pages]
+
+    pdf_path = tmp_path / "book.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    monkeypatch.setattr(pypdf, "PdfReader", FakeReader)
+    text = await service._extract_pdf_optimized(pdf_path, show_progress=False)
+
+    assert "ISTWA AYITI" not in text
+    assert "Kò paj 5 la" in text
+    assert service.last_cleanup_stats["lines_removed"] == 10
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou pipeline an etap / Tests for the staged pipeline
+"""
+
+import pytest
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipeline import BatchExecutor, Stage, StagedPipeline, run_pipeline
+from src.utils import iter_chunks, smart_chunk_text
+
+
+def sleepy(seconds, func=lambda x: x):
+    def wrapped(item):
+        time.sleep(seconds)
+        return func(item)
+    return wrapped
+
+
+def test_results_keep_input_order():
+    """Multi-worker stages may finish out of order; output doesn't"""
+    rng = random.Random(0)
+
+    def jitter(x):
+        time.sleep(rng.random() * 0.01)
+        return x * 2
+
+    results, stats = run_pipeline(range(50), [
+        Stage("double", jitter, workers=4),
+        Stage("inc", lambda x: x + 1, workers=3),
+    ])
+    assert results == [x * 2 + 1 for x in range(50)]
+    assert [s['items'] for s in stats['stages']] == [50, 50, 50]
+
+
+def test_stages_overlap():
+    """Wall time approaches the slowest stage, not the sum"""
+    items, delay = 10, 0.03
+
+    def extract():
+        for i in range(items):
+            time.sleep(delay)
+            yield i
+
+    pipeline = StagedPipeline([
+        Stage("translate", sleepy(delay), workers=1),
+        Stage("tts", sleepy(delay), workers=1),
+    ], source_name="extract")
+
+    start = time.perf_counter()
+    assert list(pipeline.run(extract())) == list(range(items))
+    wall = time.perf_counter() - start
+
+    sequential = 3 * items * delay
+    assert wall < sequential * 0.7, f"no overlap: {wall:.2f}s vs {sequential:.2f}s"
+    assert {s['name'] for s in pipeline.stats()['stages']} == {"extract", "translate", "tts"}
+
+
+def test_backpressure_bounds_in_flight_items():
+    """A slow consumer stops the source from running ahead"""
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    pipeline = StagedPipeline([Stage("a", lambda x: x, queue_size=2)])
+    consumed = 0
+    for _ in pipeline.run(source()):
+        consumed += 1
+        time.sleep(0.005)
+        # source + stage queue + output queue + one item per thread
+        assert len(produced) - consumed <= 8
+    assert consumed == 100
+
+
+def test_error_propagates_and_threads_stop():
+    def boom(x):
+        if x == 5:
+            raise RuntimeError("chunk 5 failed")
+        return x
+
+    before = threading.active_count()
+    pipeline = StagedPipeline([Stage("boom", boom, workers=2), Stage("after", lambda x: x)])
+    seen = []
+    with pytest.raises(RuntimeError, match="chunk 5"):
+        for result in pipeline.run(range(20)):
+            seen.append(result)
+    assert seen == [0, 1, 2, 3, 4]
+
+    time.sleep(0.3)
+    assert threading.active_count() <= before
+
+
+def test_streamed_chunks_match_whole_document():
+    pages = [
+        "Premye paj. Li gen de fraz.\n\nAk yon lòt paragraf ki pi long pase limit la anpil.",
+        "   ",
+        "Dezyèm paj " * 30,
+    ]
+    streamed = list(iter_chunks(pages, max_size=60))
+    assert streamed == smart_chunk_text("\n\n".join(pages), max_size=60)
+    assert all(len(chunk) <= 60 for chunk in streamed)
+
+
+def test_batch_executor_runs_books_concurrently_in_order():
+    executor = BatchExecutor(max_concurrent=4, stage_limits={"translate": 1})
+    state = {"in_translate": 0, "max_translate": 0, "in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def process(book):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        with executor.stage("extract"):
+            time.sleep(0.02 * (8 - book) / 8)
+        with executor.stage("translate"):
+            with lock:
+                state["in_translate"] += 1
+                state["max_translate"] = max(state["max_translate"], state["in_translate"])
+            time.sleep(0.005)
+            with lock:
+                state["in_translate"] -= 1
+        with lock:
+            state["in_flight"] -= 1
+        return f"liv-{book}"
+
+    assert list(executor.run(range(8), process)) == [f"liv-{i}" for i in range(8)]
+    assert state["max_translate"] == 1
+    assert 1 < state["max_in_flight"] <= 4
+
+    stats = executor.stats()
+    assert stats["items"] == 8 and stats["items_per_hour"] > 0
+    assert {s["name"] for s in stats["stages"]} == {"extract", "translate"}
+
+
+def test_batch_executor_propagates_first_error():
+    def process(book):
+        if book == 2:
+            raise RuntimeError("liv 2 kase")
+        return book
+
+    executor = BatchExecutor(max_concurrent=2)
+    seen = []
+    with pytest.raises(RuntimeError, match="liv 2"):
+        for result in executor.run(range(5), process):
+            seen.append(result)
+    assert seen == [0, 1]
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou silans PodcastCreator / Tests for cached podcast silences
+"""
+
+import io
+import os
+import subprocess
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import podcast_creator
+from podcast_creator import PodcastCreator
+from utils.audio_concat import parse_frame_header
+
+
+@pytest.fixture
+def silence_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(podcast_creator, "SILENCE_CACHE_DIR", tmp_path / "silence")
+    return tmp_path / "silence"
+
+
+def test_wav_silence_generated_once_then_cached(silence_dir):
+    creator = PodcastCreator()
+    data, codec = creator.get_silence(300, 22050, "wav")
+    assert codec == "wav"
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        assert wav.getnframes() == 6615
+        assert wav.readframes(wav.getnframes()) == bytes(2 * 6615)
+
+    for _ in range(299):
+        assert creator.get_silence(300, 22050, "wav") == (data, "wav")
+    assert creator.silence_stats == {"memory_hits": 299, "disk_hits": 0, "generated": 1}
+
+    # Nouvo pwosesis: cache disk la
+    other = PodcastCreator()
+    assert other.get_silence(300, 22050, "wav") == (data, "wav")
+    assert other.silence_stats["disk_hits"] == 1
+
+
+def test_concurrent_silence_writes_use_unique_temp_files(silence_dir, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = []
+    real_replace = os.replace
+
+    def recording_replace(src, dst):
+        sources.append(src)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(podcast_creator.os, "replace", recording_replace)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: PodcastCreator().get_silence(300, 22050, "wav"), range(4)))
+
+    assert len({data for data, _ in results}) == 1
+    assert len(set(sources)) == len(sources) >= 1
+    assert [p.suffix for p in silence_dir.iterdir()] == [".wav"]
+
+
+def test_mp3_silence_from_template_needs_no_ffmpeg(silence_dir, monkeypatch):
+    def no_ffmpeg(*args, **kwargs):
+        raise AssertionError("ffmpeg should not be called")
+
+    monkeypatch.setattr(subprocess, "run", no_ffmpeg)
+    template = parse_frame_header(bytes([0xFF, 0xF3, 0x44, 0xC0]))
+
+    data, codec = PodcastCreator().get_silence(300, template=template)
+    assert codec == "mp3"
+    frame = parse_frame_header(data)
+    assert frame.sample_rate == 24000 and len(data) % frame.length == 0
+
+
+def test_mp3_silence_spawns_ffmpeg_at_most_once(silence_dir, monkeypatch, tmp_path):
+    calls = []
+
+    def missing_ffmpeg(*args, **kwargs):
+        calls.append(args)
+        raise FileNotFoundError("ffmpeg")
+
+    monkeypatch.setattr(subprocess, "run", missing_ffmpeg)
+    creator = PodcastCreator()
+    for i in range(300):
+        path = creator.create_silence_mp3(tmp_path / f"gap_{i}.mp3", 300)
+    assert len(calls) == 1
+    assert path.read_bytes()[:4] == b"RIFF"  # WAV si ffmpeg pa la
+
+
+def test_create_podcast_resynthesizes_only_edited_lines(silence_dir, tmp_path, monkeypatch):
+    from utils import segment_synth
+    from utils.audio_concat import silent_frames
+
+    monkeypatch.setattr(segment_synth, "SEGMENT_CACHE_DIR", tmp_path / "segments")
+    monkeypatch.chdir(tmp_path)
+    frame = parse_frame_header(bytes([0xFF, 0xF3, 0x44, 0xC0]))
+    calls = []
+
+    def fake_segment(self, text, speaker, output_path):
+        calls.append(text)
+        Path(output_path).write_bytes(silent_frames(frame, 200))
+        return output_path
+
+    monkeypatch.setattr(PodcastCreator, "generate_audio_segment", fake_segment)
+    script = "Host: Bonjou tout moun\nGuest: Mèsi pou envitasyon an\nHost: Ann kòmanse"
+
+    creator = PodcastCreator()
+    assert creator.create_podcast(script, tmp_path / "out" / "a.mp3")
+    assert sorted(calls) == sorted(["Bonjou tout moun", "Mèsi pou envitasyon an", "Ann kòmanse"])
+
+    calls.clear()
+    edited = script.replace("Ann kòmanse", "Ann kòmanse kounye a")
+    assert creator.create_podcast(edited, tmp_path / "out" / "b.mp3")
+    assert calls == ["Ann kòmanse kounye a"]
+    assert creator.last_synthesis_stats["cache_hits"] == 2
+    assert creator.last_merge_report.mode == "mp3-copy"
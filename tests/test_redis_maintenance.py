@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou efasman SCAN/UNLINK ak estatistik echantiyone
+Tests for incremental deletes and sampled keyspace stats
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.redis_cache import RedisCache
+from src.redis_maintenance import namespace_of, sample_keyspace, scan_delete
+from app.cache_tiered import LRUTTLCache, TieredCache
+
+MILLION = 1_000_000
+
+
+def _fill(fake, namespace, count, value=b"x" * 32):
+    """Chaje kle yo dirèkteman (set() youn pa youn twò lan pou 1M)"""
+    fake._data.update((f"{namespace}:{i}", value) for i in range(count))
+
+
+@pytest.fixture(scope="module")
+def big_redis():
+    """Redis an memwa ak 1M kle: 700k trans, 250k audio, 50k session"""
+    from tests.conftest import FakeRedis
+    fake = FakeRedis()
+    _fill(fake, "trans", 700_000)
+    _fill(fake, "audio", 250_000, value=b"a" * 512)
+    _fill(fake, "session", 50_000)
+    assert len(fake._data) == MILLION
+    return fake
+
+
+# ============================================================
+# scan_delete
+# ============================================================
+
+def test_scan_delete_batches_and_reports_progress(fake_redis):
+    _fill(fake_redis, "trans", 2_500)
+    _fill(fake_redis, "audio", 100)
+    progress = []
+
+    deleted = scan_delete(fake_redis, "trans:*", batch_size=1000, scan_count=300,
+                          progress=lambda d, s: progress.append((d, s)))
+
+    assert deleted == 2_500
+    assert fake_redis.dbsize() == 100
+    assert fake_redis.calls["unlink"] == 3
+    assert "delete" not in fake_redis.calls
+    assert [d for d, _ in progress] == [1000, 2000, 2500]
+
+
+def test_scan_delete_falls_back_to_del(fake_redis, monkeypatch):
+    _fill(fake_redis, "trans", 10)
+
+    def no_unlink(*keys):
+        raise Exception("ERR unknown command 'UNLINK'")
+    monkeypatch.setattr(fake_redis, "unlink", no_unlink)
+
+    assert scan_delete(fake_redis, "trans:*") == 10
+    assert fake_redis.calls["delete"] == 1
+
+
+def test_scan_delete_empty_match(fake_redis):
+    _fill(fake_redis, "audio", 50)
+    assert scan_delete(fake_redis, "trans:*") == 0
+    assert fake_redis.dbsize() == 50
+
+
+def test_clear_million_keys_without_keys_command(big_redis):
+    """1M kle: SCAN + UNLINK pa lo, pa janm KEYS ni yon gwo DEL"""
+    from tests.conftest import FakeRedis
+    fake = FakeRedis()
+    fake._data.update(big_redis._data)
+    batches = []
+    keys_called = []
+    fake.keys = lambda *a, **k: keys_called.append(a)
+
+    cache = RedisCache(enabled=False)
+    cache.client, cache.enabled = fake, True
+
+    start = time.perf_counter()
+    assert cache.clear("trans:*", progress=lambda d, s: batches.append(d))
+    elapsed = time.perf_counter() - start
+
+    assert not keys_called
+    assert len(fake._data) == 300_000
+    assert batches[-1] == 700_000
+    assert len(batches) == 700_000 // 500
+    print(f"\n  clear 700k/1M keys: {elapsed:.2f}s, {fake.calls['scan']} SCAN, "
+          f"{fake.calls['unlink']} UNLINK")
+
+
+def test_tiered_clear_pattern_uses_batched_unlink(fake_redis):
+    cache = TieredCache("trans", l1=LRUTTLCache(), redis_client=fake_redis)
+    for i in range(1200):
+        cache.set(f"k{i}", "v")
+    _fill(fake_redis, "audio", 10)
+    progress = []
+
+    assert cache.clear(progress=lambda d, s: progress.append(d)) == 1200
+    assert fake_redis.dbsize() == 10
+    assert fake_redis.calls["unlink"] == 3
+    assert progress == [500, 1000, 1200]
+    assert cache.get("k1") is None
+
+
+# ============================================================
+# sample_keyspace
+# ============================================================
+
+def test_sample_keyspace_small_is_exact(fake_redis):
+    _fill(fake_redis, "trans", 30)
+    _fill(fake_redis, "audio", 10)
+    fake_redis.set("plain", "v")
+
+    stats = sample_keyspace(fake_redis, sample_size=100)
+
+    assert stats["method"] == "exact"
+    assert stats["total_keys"] == 41
+    assert stats["namespaces"]["trans"]["keys"] == 30
+    assert stats["namespaces"]["audio"]["keys"] == 10
+    assert stats["namespaces"]["(none)"]["keys"] == 1
+    assert "randomkey" not in fake_redis.calls
+
+
+def test_sample_keyspace_million_keys(big_redis):
+    """Estimasyon pa echantiyon sou 1M kle, san SCAN"""
+    big_redis.calls.clear()
+
+    start = time.perf_counter()
+    stats = sample_keyspace(big_redis, sample_size=2000)
+    elapsed = time.perf_counter() - start
+
+    assert stats["method"] == "sample"
+    assert stats["total_keys"] == MILLION
+    assert stats["sampled"] == 2000
+    assert "scan" not in big_redis.calls
+    assert big_redis.calls["randomkey"] == 2000
+
+    namespaces = stats["namespaces"]
+    assert list(namespaces)[0] == "trans"
+    for name, expected in (("trans", 700_000), ("audio", 250_000), ("session", 50_000)):
+        entry = namespaces[name]
+        # 4 sigma: tès la pa dwe janm echwe pa chans
+        assert abs(entry["keys"] - expected) <= 2 * entry["keys_margin"] + 1000
+    # Valè audio yo 16x pi gwo: memwa yo domine menm si yo mwens
+    assert namespaces["audio"]["avg_bytes"] > namespaces["trans"]["avg_bytes"] * 5
+    assert namespaces["audio"]["memory_bytes"] > namespaces["trans"]["memory_bytes"]
+    print(f"\n  sample 2000/1M keys: {elapsed * 1000:.0f}ms")
+
+
+def test_sample_keyspace_empty(fake_redis):
+    assert sample_keyspace(fake_redis) == {
+        "total_keys": 0, "method": "exact", "sampled": 0, "namespaces": {}
+    }
+
+
+def test_namespace_of():
+    assert namespace_of(b"trans:abc") == "trans"
+    assert namespace_of("sf:trans:abc") == "sf"
+    assert namespace_of("plain") == "(none)"
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for the workflow scheduler
+Test pou WorkflowScheduler: limit, priyorite, timeout, anilasyon
+"""
+
+import asyncio
+import pytest
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.scheduler import WorkflowScheduler
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_and_submission_order():
+    scheduler = WorkflowScheduler(max_concurrency=3)
+    state = {"running": 0, "peak": 0}
+
+    async def work(i):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01 * (i % 4))
+        state["running"] -= 1
+        return i * i
+
+    for i in range(12):
+        scheduler.submit(lambda i=i: work(i))
+
+    assert await scheduler.run_all() == [i * i for i in range(12)]
+    assert state["peak"] == 3 == scheduler.stats["max_running"]
+
+
+@pytest.mark.asyncio
+async def test_priority_timeout_and_errors():
+    scheduler = WorkflowScheduler(max_concurrency=1)
+    order = []
+
+    async def work(name, delay=0.0):
+        order.append(name)
+        await asyncio.sleep(delay)
+        if name == "boom":
+            raise ValueError("kase")
+        return name
+
+    scheduler.submit(lambda: work("low"), key="low")
+    scheduler.submit(lambda: work("slow", 1.0), priority=5, timeout=0.02, key="slow")
+    scheduler.submit(lambda: work("boom"), priority=1, key="boom")
+
+    results = {job.key: job async for job in scheduler.as_completed()}
+    assert order == ["slow", "boom", "low"]
+    assert results["slow"].status == "timeout"
+    assert isinstance(results["boom"].error, ValueError)
+    assert results["low"].ok and results["low"].value == "low"
+    assert scheduler.stats["timed_out"] == 1 and scheduler.stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_pending_and_running():
+    scheduler = WorkflowScheduler(max_concurrency=1)
+    started = []
+
+    async def work(name):
+        started.append(name)
+        await asyncio.sleep(0.5 if name == "long" else 0)
+        return name
+
+    # "long" ap kouri, "queued" nan fil la: tou de anile
+    long_id = scheduler.submit(lambda: work("long"))
+    queued_id = scheduler.submit(lambda: work("queued"))
+    last_id = scheduler.submit(lambda: work("last"))
+
+    async def cancel_soon():
+        await asyncio.sleep(0.05)
+        assert scheduler.cancel(queued_id)
+        assert scheduler.cancel(long_id)
+
+    canceller = asyncio.ensure_future(cancel_soon())
+    statuses = {job.job_id: job.status async for job in scheduler.as_completed()}
+    await canceller
+
+    assert statuses == {long_id: "cancelled", queued_id: "cancelled", last_id: "ok"}
+    assert started == ["long", "last"]
+    assert scheduler.stats["cancelled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stress_memory_stays_bounded():
+    """2000 travay ak 256 KB chak: sèlman max_concurrency buffers egziste an menm tan"""
+    jobs, buffer_size, cap = 2000, 256 * 1024, 8
+    scheduler = WorkflowScheduler(max_concurrency=cap)
+
+    async def heavy(i):
+        buffer = bytearray(buffer_size)
+        await asyncio.sleep(0)
+        return len(buffer) + i - i
+
+    for i in range(jobs):
+        scheduler.submit(lambda i=i: heavy(i))
+
+    tracemalloc.start()
+    try:
+        completed = 0
+        async for job in scheduler.as_completed():
+            assert job.ok
+            completed += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert completed == jobs
+    assert scheduler.stats["max_running"] == cap
+    # San limit: ~500 MB; ak limit: kèk MB
+    assert peak < cap * buffer_size * 4, f"peak {peak / 1e6:.1f} MB"
+
+
+@pytest.mark.asyncio
+async def test_batch_url_to_audio_is_bounded(tmp_path, monkeypatch):
+    from app import workflows
+
+    state = {"running": 0, "peak": 0}
+
+    async def fake_url_to_audio(url, voice, out_dir):
+        assert Path(out_dir).is_dir()
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.001)
+        state["running"] -= 1
+        if url.endswith("/bad"):
+            raise RuntimeError("404")
+        return {"url": url}
+
+    monkeypatch.setattr(workflows, "url_to_audio", fake_url_to_audio)
+    urls = [f"https://example.org/{i}" for i in range(40)] + ["https://example.org/bad"]
+
+    results = await workflows.batch_url_to_audio(urls, "creole-native", str(tmp_path), max_concurrency=5)
+    assert [r["url"] for r in results[:-1]] == urls[:-1]
+    assert isinstance(results[-1], RuntimeError)
+    assert state["peak"] == 5
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou sentèz segman an paralèl / Tests for parallel segment synthesis
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.segment_synth import SegmentCache, SegmentSynthesizer, segment_cache_key
+
+
+class FakeTTS:
+    """TTS ki pran tan epi ki konte apèl yo"""
+
+    def __init__(self):
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, text, voice, output_path):
+        with self.lock:
+            self.calls.append(text)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(random.uniform(0.005, 0.03))
+        if text == "boom":
+            with self.lock:
+                self.running -= 1
+            raise RuntimeError("TTS down")
+        Path(output_path).write_text(f"{voice.get('speaker')}:{text}")
+        with self.lock:
+            self.running -= 1
+
+
+def _process_tts(text, voice, output_path):
+    Path(output_path).write_text(f"{os.getpid()}:{text}")
+
+
+def test_parallel_synthesis_keeps_script_order(tmp_path):
+    tts = FakeTTS()
+    synth = SegmentSynthesizer(tts, engine="fake", max_workers=4,
+                               cache=SegmentCache(tmp_path / "cache"))
+    segments = [{"text": f"liy {i}", "voice": {"speaker": "host"}} for i in range(20)]
+
+    results = synth.synthesize(segments, tmp_path / "out")
+
+    assert [r.index for r in results] == list(range(20))
+    assert [r.path.read_text() for r in results] == [f"host:liy {i}" for i in range(20)]
+    assert 1 < tts.max_running <= 4
+
+
+def test_edited_line_is_the_only_one_resynthesized(tmp_path):
+    cache = SegmentCache(tmp_path / "cache")
+    script = [{"text": f"liy {i}", "voice": {"speaker": "host"}} for i in range(10)]
+    SegmentSynthesizer(FakeTTS(), engine="fake", cache=cache).synthesize(script, tmp_path / "a")
+
+    script[3] = {"text": "liy 3 korije", "voice": {"speaker": "host"}}
+    tts = FakeTTS()
+    synth = SegmentSynthesizer(tts, engine="fake", cache=cache)
+    results = synth.synthesize(script, tmp_path / "b")
+
+    assert tts.calls == ["liy 3 korije"]
+    assert synth.stats["cache_hits"] == 9 and synth.stats["synthesized"] == 1
+    assert results[3].path.read_text() == "host:liy 3 korije" and not results[3].cached
+    assert all(r.cached for i, r in enumerate(results) if i != 3)
+
+
+def test_voice_is_part_of_the_key_and_duplicates_synthesize_once(tmp_path):
+    assert segment_cache_key("gtts", "Bonjou", {"speaker": "host"}) != \
+        segment_cache_key("gtts", "Bonjou", {"speaker": "guest"})
+
+    tts = FakeTTS()
+    synth = SegmentSynthesizer(tts, engine="fake", use_cache=False)
+    segments = [{"text": "Mèsi", "voice": {"speaker": "host"}}] * 3
+    results = synth.synthesize(segments, tmp_path)
+
+    assert tts.calls == ["Mèsi"]
+    assert len({r.path for r in results}) == 3
+    assert all(r.path.read_text() == "host:Mèsi" for r in results)
+
+
+def test_failed_segment_is_reported_and_not_cached(tmp_path):
+    cache = SegmentCache(tmp_path / "cache")
+    synth = SegmentSynthesizer(FakeTTS(), engine="fake", cache=cache)
+    segments = [{"text": t, "voice": {}} for t in ("a", "boom", "c")]
+
+    results = synth.synthesize(segments, tmp_path / "out")
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error == "TTS down"
+    assert cache.get(segment_cache_key("fake", "boom", {}), "mp3") is None
+    assert synth.stats["failed"] == 1
+
+
+def test_process_pool_for_cpu_engines(tmp_path):
+    synth = SegmentSynthesizer(_process_tts, engine="cpu", ext="wav", max_workers=2,
+                               use_processes=True, use_cache=False)
+    segments = [{"text": str(i), "voice": {}} for i in range(6)]
+
+    results = synth.synthesize(segments, tmp_path)
+
+    texts = [r.path.read_text().split(":") for r in results]
+    assert [t for _, t in texts] == [str(i) for i in range(6)]
+    assert all(int(pid) != os.getpid() for pid, _ in texts)
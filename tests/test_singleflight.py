@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou koalesans demann / Tests for single-flight request coalescing
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.singleflight import SingleFlight, singleflight_stats
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_concurrent_threads_share_one_computation():
+    flight = SingleFlight("test-threads")
+    release = threading.Event()
+    calls = []
+
+    def model():
+        calls.append(1)
+        release.wait(2)
+        return "rezilta"
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        futures = [pool.submit(flight.do, "k", model) for _ in range(10)]
+        _wait_for(lambda: flight.stats["coalesced"] == 9)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["rezilta"] * 10
+    assert len(calls) == 1
+    assert flight.stats["leaders"] == 1 and flight.in_flight() == 0
+
+
+def test_errors_reach_every_waiter_and_are_not_remembered():
+    flight = SingleFlight("test-errors")
+    release = threading.Event()
+
+    def broken():
+        release.wait(2)
+        raise RuntimeError("modèl la tonbe")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flight.do, "k", broken) for _ in range(3)]
+        _wait_for(lambda: flight.stats["coalesced"] == 2)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    assert flight.do("k", lambda: "ok") == "ok"
+
+
+def test_concurrent_coroutines_await_the_same_future():
+    flight = SingleFlight("test-async")
+    calls = []
+
+    async def translate():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"translated_text": "Bonjou"}
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("k", translate) for _ in range(20)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r == {"translated_text": "Bonjou"} for r in results)
+    assert flight.stats["coalesced"] == 19
+
+
+def test_other_node_waits_for_leader_result(fake_redis):
+    node_a = SingleFlight("trans", redis_client=fake_redis, poll_seconds=0.005)
+    node_b = SingleFlight("trans", redis_client=fake_redis, poll_seconds=0.005)
+    shared = {}
+    started = threading.Event()
+    calls = []
+
+    def model_a():
+        started.set()
+        time.sleep(0.05)
+        shared["k"] = "Bonjou"
+        return "Bonjou"
+
+    def model_b():
+        calls.append("b")
+        return "pa ta dwe kouri"
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(node_a.do, "k", model_a, lambda: shared.get("k"))
+        started.wait(2)
+        assert fake_redis.get("sf:trans:k") is not None
+        assert node_b.do("k", model_b, cache_get=lambda: shared.get("k")) == "Bonjou"
+        assert leader.result() == "Bonjou"
+
+    assert calls == []
+    assert node_b.stats["remote_coalesced"] == 1
+    assert fake_redis.get("sf:trans:k") is None  # lidè a lage lock la
+
+
+def test_dead_leader_lock_expires_and_caller_computes(fake_redis):
+    fake_redis.set("sf:trans:k", "lòt-nœud", px=30)
+    flight = SingleFlight("trans", redis_client=fake_redis, poll_seconds=0.005)
+
+    assert flight.do("k", lambda: "kalkile", cache_get=lambda: None) == "kalkile"
+    assert flight.stats["remote_coalesced"] == 0
+
+
+def test_tiered_and_file_get_or_compute_coalesce(fake_redis, tmp_path):
+    from app.cache import SimpleCache
+    from app.cache_tiered import TieredCache
+
+    for cache in (TieredCache("sf-test", redis_client=fake_redis), SimpleCache(str(tmp_path))):
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(2)
+            return "tradiksyon"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(cache.get_or_compute, "k", compute) for _ in range(8)]
+            _wait_for(lambda: cache.flight.stats["coalesced"] == 7)
+            release.set()
+            assert [f.result() for f in futures] == ["tradiksyon"] * 8
+        assert len(calls) == 1
+        assert cache.get("k") == "tradiksyon"
+
+    assert singleflight_stats()["namespaces"]["sf-test"]["coalesced"] >= 7
+    assert singleflight_stats()["total_coalesced"] >= 14
+
+
+def test_async_follower_node_reads_value_cached_before_unlock(fake_redis):
+    from app.cache_tiered import LRUTTLCache, TieredCache
+
+    node_a = TieredCache("sf-async", l1=LRUTTLCache(), redis_client=fake_redis)
+    node_b = TieredCache("sf-async", l1=LRUTTLCache(), redis_client=fake_redis)
+    node_b.flight.poll_seconds = 0.005
+    calls = []
+
+    async def model(name):
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return "Bonjou"
+
+    async def main():
+        leader = asyncio.create_task(node_a.get_or_compute_async("k", lambda: model("a")))
+        while fake_redis.get("sf:sf-async:k") is None:
+            await asyncio.sleep(0.001)
+        follower = await node_b.get_or_compute_async("k", lambda: model("b"))
+        return await leader, follower
+
+    assert asyncio.run(main()) == ("Bonjou", "Bonjou")
+    assert calls == ["a"]
+    assert node_b.flight.stats["remote_coalesced"] == 1
+    assert fake_redis.get("sf:sf-async:k") is None
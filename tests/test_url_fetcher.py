@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for URL ingestion
+Test pou URLFetcher ak yon ti sèvè HTTP lokal
+"""
+
+import pytest
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.url_fetcher import URLFetcher, extract_article_text
+
+ARTICLE = """<html><head><title>Atik</title><style>p {}</style></head><body>
+<nav>Meni</nav><header>Antèt sit la</header>
+<article><h1>Lang kreyòl</h1><p>Kreyòl ayisyen se lang tout Ayisyen.</p>
+<script>track()</script><p>Dezyèm paragraf.</p></article>
+<footer>Copyright</footer></body></html>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Sèvè fixture: /article (ETag), /slow (konte konkirans), /missing (404)"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        state = self.server.state
+        with state["lock"]:
+            state["hits"][self.path] = state["hits"].get(self.path, 0) + 1
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        try:
+            if self.path.startswith("/article"):
+                etag = '"v1"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                body = ARTICLE.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("ETag", etag)
+            elif self.path.startswith("/slow"):
+                time.sleep(0.1)
+                body = b"<p>lant</p>"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+            else:
+                body = b"not found"
+                self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with state["lock"]:
+                state["in_flight"] -= 1
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.daemon_threads = True
+    server.state = {"lock": threading.Lock(), "hits": {}, "in_flight": 0, "max_in_flight": 0}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_extract_article_text():
+    text = extract_article_text(ARTICLE)
+    assert "Kreyòl ayisyen se lang tout Ayisyen." in text
+    assert "Meni" not in text and "track()" not in text and "Copyright" not in text
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_uses_disk_cache(http_server, tmp_path):
+    server, base = http_server
+    fetcher = URLFetcher(cache_dir=tmp_path / "http")
+
+    first = await fetcher.fetch(f"{base}/article")
+    assert first.status_code == 200 and not first.from_cache
+
+    # Nouvo fetcher (nouvo pwosesis) men menm cache disk la
+    second_fetcher = URLFetcher(cache_dir=tmp_path / "http")
+    second = await second_fetcher.fetch(f"{base}/article")
+    assert second.status_code == 304 and second.from_cache
+    assert second.content == first.content
+    assert "Lang kreyòl" in await second_fetcher.fetch_text(f"{base}/article")
+
+    assert server.state["hits"]["/article"] == 3
+    await fetcher.aclose()
+    await second_fetcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_limit(http_server, tmp_path):
+    server, base = http_server
+    fetcher = URLFetcher(cache_dir=None, per_host=2)
+
+    results = await fetcher.fetch_many_text([f"{base}/slow?{i}" for i in range(6)])
+    assert results == ["lant"] * 6
+    assert server.state["max_in_flight"] <= 2
+    assert fetcher.stats["requests"] == 6
+    await fetcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_errors_returned_in_order(http_server, tmp_path):
+    server, base = http_server
+    fetcher = URLFetcher(cache_dir=tmp_path / "http")
+
+    results = await fetcher.fetch_many_text([f"{base}/article", f"{base}/missing"])
+    assert "Dezyèm paragraf." in results[0]
+    assert isinstance(results[1], Exception)
+    await fetcher.aclose()
+
+
+def test_new_event_loop_closes_stale_client(http_server):
+    import asyncio
+    server, base = http_server
+    fetcher = URLFetcher(cache_dir=None)
+
+    async def fetch():
+        await fetcher.fetch(f"{base}/slow")
+        return (await fetcher._get_client()).client
+
+    # Chak task Celery: yon asyncio.run nouvo
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    assert first is not second
+    assert first.is_closed and not second.is_closed
+    assert len(fetcher._clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_of_same_url_share_cache(http_server, tmp_path):
+    import asyncio
+    server, base = http_server
+    fetcher = URLFetcher(cache_dir=tmp_path / "http")
+
+    results = await asyncio.gather(*(fetcher.fetch(f"{base}/article") for _ in range(8)))
+    assert {r.status_code for r in results} == {200}
+    assert fetcher.stats["cache_stored"] == 8
+    assert sorted(p.suffix for p in (tmp_path / "http").iterdir()) == [".body", ".json"]
+    assert fetcher._read_cache(f"{base}/article")["etag"] == '"v1"'
+    await fetcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_evicts_oldest_entries(http_server, tmp_path):
+    import os
+    server, base = http_server
+    fetcher = URLFetcher(cache_dir=tmp_path / "http", max_cache_entries=2)
+
+    for i in range(2):
+        await fetcher.fetch(f"{base}/article?{i}")
+        meta_path, _ = fetcher._cache_paths(f"{base}/article?{i}")
+        os.utime(meta_path, (1000 + i, 1000 + i))
+    await fetcher.fetch(f"{base}/article?2")
+
+    assert len(list((tmp_path / "http").glob("*.json"))) == 2
+    assert len(list((tmp_path / "http").glob("*.body"))) == 2
+    assert fetcher._read_cache(f"{base}/article?0") is None
+    assert fetcher._read_cache(f"{base}/article?1") is not None
+    await fetcher.aclose()
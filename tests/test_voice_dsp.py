@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests pou efè vwa yo / Tests for the in-memory voice DSP
+"""
+
+import io
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.voice_dsp import apply_voice, time_stretch, to_int16
+
+SR = 16000
+
+
+def _tone(freq=440.0, seconds=2.0):
+    t = np.arange(int(SR * seconds)) / SR
+    return 0.5 * np.sin(2 * np.pi * freq * t)
+
+
+def _dominant(samples):
+    inner = samples[2000:-2000]
+    spectrum = np.abs(np.fft.rfft(inner * np.hanning(len(inner))))
+    return np.argmax(spectrum) * SR / len(inner)
+
+
+def test_time_stretch_keeps_pitch():
+    slow = time_stretch(_tone(), 0.8)
+    assert len(slow) == 40000
+    assert _dominant(slow) == pytest.approx(440, abs=3)
+
+
+@pytest.mark.parametrize("pitch_shift,speed", [(2, 1.0), (-1, 0.9), (2, 0.95)])
+def test_apply_voice_pitch_and_speed(pitch_shift, speed):
+    out = apply_voice(_tone(), pitch_shift=pitch_shift, speed=speed)
+    assert len(out) == round(2 * SR / speed)
+    assert _dominant(out) == pytest.approx(440 * (1 + pitch_shift * 0.05), abs=4)
+    assert 0.35 < np.abs(out[2000:-2000]).max() < 0.6
+
+
+def test_neutral_voice_is_untouched():
+    tone = _tone()
+    assert np.array_equal(apply_voice(tone, 0, 1.0), tone)
+    pcm = to_int16(tone)
+    assert pcm.dtype == np.int16 and pcm.max() == 32767
+
+
+def test_long_segment_int16_output():
+    samples = np.random.default_rng(0).normal(0, 0.2, SR * 10)
+    pcm = to_int16(apply_voice(samples, pitch_shift=2, speed=0.95))
+    assert pcm.dtype == np.int16
+    assert len(pcm) == round(10 * SR / 0.95)
+
+
+@pytest.mark.benchmark
+def test_benchmark_against_pydub_path():
+    pydub = pytest.importorskip("pydub")
+    import scipy.io.wavfile as wavfile
+
+    samples = np.random.default_rng(0).normal(0, 0.2, SR * 10)
+    apply_voice(samples[:SR], 2, 0.95)  # chofe scipy
+
+    def numpy_path():
+        return to_int16(apply_voice(samples, pitch_shift=2, speed=0.95))
+
+    def pydub_path():
+        # Ansyen chemen an: WAV → pydub, _spawn pou pitch, speedup pou vitès
+        buf = io.BytesIO()
+        wavfile.write(buf, SR, to_int16(samples))
+        buf.seek(0)
+        audio = pydub.AudioSegment.from_wav(buf)
+        audio = audio._spawn(audio.raw_data, overrides={"frame_rate": int(audio.frame_rate * 1.1)})
+        audio = audio.set_frame_rate(44100).speedup(playback_speed=0.95)
+        audio.export(io.BytesIO(), format="wav")
+
+    def best(func):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        dsp, legacy = best(numpy_path), best(pydub_path)
+    print(f"\n10s segment: numpy/scipy {dsp * 1000:.0f}ms, pydub {legacy * 1000:.0f}ms")
+    assert dsp < legacy
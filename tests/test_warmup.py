@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Tests for cache warmup
+Test pou warmup kachaj yo ak readiness
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import cache_tiered
+from app.cache_tiered import LRUTTLCache, TieredCache
+from app.warmup import Warmup, load_phrases, sample_text, main
+from src.cache_keys import translation_key
+from src.health import HealthChecker
+
+
+class FakeTranslator:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def translate(self, text, source_lang="auto", target_lang="ht"):
+        self.calls.append(text)
+        if self.fail:
+            return {"success": False, "error": "API down", "translated_text": text}
+        return {"success": True, "translated_text": f"[{target_lang}] {text}"}
+
+
+class FakeTTS:
+    """Menm entèfas ak TTSService (kachaj "audio" reyèl la)"""
+
+    def __init__(self, output_dir):
+        from app.services.tts_service import TTSService
+        self.output_dir = Path(output_dir)
+        self.generated = []
+        self.dummy = []
+        self.cached_speech = TTSService.cached_speech.__get__(self)
+        self.remember_speech = TTSService.remember_speech.__get__(self)
+
+    async def text_to_speech_file(self, text, output_path, voice="creole-native"):
+        self.dummy.append((text, voice))
+        Path(output_path).write_bytes(b"dummy")
+        return Path(output_path)
+
+    async def generate_speech(self, text, voice="creole-native"):
+        self.generated.append((text, voice))
+        path = self.output_dir / f"tts_{len(self.generated)}.mp3"
+        path.write_bytes(text.encode("utf-8"))
+        return path
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    """Kachaj trans/audio L1 sèlman (pa gen Redis)"""
+    trans = TieredCache("trans", l1=LRUTTLCache(), redis_client=None)
+    audio = TieredCache("audio", l1=LRUTTLCache(), redis_client=None)
+    monkeypatch.setattr(cache_tiered, "translation_cache", trans)
+    monkeypatch.setattr(cache_tiered, "audio_cache", audio)
+    return trans, audio
+
+
+def test_sample_text_cuts_at_sentence():
+    text = "Premye fraz.   Dezyèm\nfraz! Twazyèm fraz ki long anpil."
+    assert sample_text(text, 30) == "Premye fraz. Dezyèm fraz!"
+    assert sample_text("Kout", 30) == "Kout"
+
+
+def test_load_phrases_file_and_samples(tmp_path):
+    phrases = tmp_path / "fraz.txt"
+    phrases.write_text("# kòmantè\nBonjou!\n\nBonjou!\nOrevwa.\n", encoding="utf-8")
+    (tmp_path / "a.txt").write_text("Echantiyon A. " * 100, encoding="utf-8")
+
+    result = load_phrases(str(phrases), str(tmp_path / "a*.txt"), sample_chars=40)
+
+    assert result[:2] == ["Bonjou!", "Orevwa."]
+    assert len(result) == 3 and len(result[2]) <= 40
+
+
+def test_load_phrases_defaults_include_repo_samples():
+    phrases = load_phrases("", str(Path(__file__).parent.parent / "data" / "*.txt"))
+    assert "Bonjou! Byenveni nan Kreyòl IA Studio." in phrases
+    assert any("Bonjour à tous" in p for p in phrases)
+
+
+def test_warmup_fills_caches_and_gates_readiness(tmp_path, caches):
+    trans, audio = caches
+    tts = FakeTTS(tmp_path)
+    translator = FakeTranslator()
+    warmup = Warmup(["Bonjou.", "Mèsi."], ["creole-native"], [("auto", "ht")],
+                    tts_service=tts, translator=translator)
+    checker = HealthChecker()
+    checker.add_readiness_gate("warmup", warmup.is_ready)
+    assert not warmup.is_ready()
+    assert checker._check_gates() == {"warmup": False}
+
+    report = asyncio.run(warmup.run())
+
+    assert warmup.is_ready() and checker._check_gates() == {"warmup": True}
+    assert report["translated"] == 2 and report["synthesized"] == 2
+    assert report["errors"] == []
+    assert "tts" in report["models"] and "translation" in report["models"]
+    # Enferans bidon an pa nan kachaj la
+    assert tts.dummy == [("Bonjou.", "creole-native")]
+
+    # Menm kle ak /api/translate ak /api/tts
+    key = translation_key("Mèsi.", "auto", "ht")
+    assert trans.get(key) == "[ht] Mèsi."
+    assert tts.cached_speech("Mèsi.", "creole-native").read_bytes() == "Mèsi.".encode("utf-8")
+
+    # Dezyèm warmup: tout bagay deja nan kachaj
+    second = Warmup(["Bonjou.", "Mèsi."], ["creole-native"], [("auto", "ht")],
+                    tts_service=tts, translator=translator)
+    report = asyncio.run(second.run())
+    assert report["already_cached"] == 4 and report["synthesized"] == 0
+
+
+def test_warmup_errors_do_not_block_readiness(tmp_path, caches):
+    warmup = Warmup(["Bonjou."], [], [("fr", "ht")], translator=FakeTranslator(fail=True))
+    report = asyncio.run(warmup.run())
+
+    assert warmup.status == "complete" and warmup.is_ready()
+    assert {e["step"] for e in report["errors"]} == {"translation_model", "translate"}
+
+
+def test_background_warmup_and_timeout(tmp_path, caches):
+    tts = FakeTTS(tmp_path)
+    warmup = Warmup(["Bonjou."], ["creole-native"], [], tts_service=tts)
+    warmup.start_background().join(5)
+    assert warmup.is_ready() and tts.generated
+
+    stuck = Warmup(["Bonjou."], [], [], timeout=0.01)
+    stuck.status, stuck.started_at = "running", time.time()
+    assert not stuck.is_ready()
+    time.sleep(0.02)
+    assert stuck.is_ready()
+
+    assert Warmup([], [], [], enabled=False).is_ready()
+
+
+def test_readiness_probe_reports_gates(monkeypatch):
+    checker = HealthChecker()
+
+    async def remote_check():
+        raise AssertionError("readiness pa dwe rele sèvis aleka yo")
+
+    # Tradiktè an liy, baz done: pa nan readiness (deplwaman NLLB offline)
+    for name in ("check_all", "check_translator", "check_database", "check_cache"):
+        monkeypatch.setattr(checker, name, remote_check)
+    state = {"ready": False}
+    checker.add_readiness_gate("warmup", lambda: state["ready"])
+
+    assert asyncio.run(checker.readiness_probe())["status"] == "not_ready"
+    state["ready"] = True
+    result = asyncio.run(checker.readiness_probe())
+    assert result["status"] == "ready" and result["gates"] == {"warmup": True}
+    assert set(result["components"]) == {"storage"}
+
+
+def test_cli_translate_only(tmp_path, caches, monkeypatch):
+    from app import warmup as warmup_module
+    monkeypatch.setattr(warmup_module.Warmup, "translator", property(lambda self: FakeTranslator()))
+    phrases = tmp_path / "fraz.txt"
+    phrases.write_text("Bonjou!\n", encoding="utf-8")
+
+    assert main(["--phrases", str(phrases), "--samples", "", "--no-tts"]) == 0
+    assert caches[0].get(translation_key("Bonjou!", "auto", "ht")) == "[ht] Bonjou!"
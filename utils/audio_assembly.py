@@ -0,0 +1,246 @@
+"""
+In-memory audio assembly / Asanble odyo nan memwa
+Keep segments as PCM arrays, lay them out once and encode once
+"""
+import wave
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+
+PathLike = Union[str, Path]
+
+# Rezèv pou normalize (menm jan ak pydub normalize(headroom=0.1))
+NORMALIZE_HEADROOM_DB = 0.1
+
+
+def _resample(samples: np.ndarray, src_rate: int, dst_rate: int, channels: int) -> np.ndarray:
+    """Chanje frekans echantiyon / Resample interleaved int16 PCM"""
+    if src_rate == dst_rate or len(samples) == 0:
+        return samples
+    from math import gcd
+    from scipy.signal import resample_poly
+
+    g = gcd(src_rate, dst_rate)
+    frames = samples.reshape(-1, channels).astype(np.float32)
+    out = resample_poly(frames, dst_rate // g, src_rate // g, axis=0)
+    return np.clip(out, -32768, 32767).astype(np.int16).reshape(-1)
+
+
+def _match_channels(samples: np.ndarray, src: int, dst: int) -> np.ndarray:
+    """Mono ↔ stereo / Convert channel count of interleaved PCM"""
+    if src == dst:
+        return samples
+    frames = samples.reshape(-1, src)
+    if dst == 1:
+        return frames.mean(axis=1).astype(np.int16)
+    return np.repeat(frames[:, :1], dst, axis=1).reshape(-1)
+
+
+class AudioAssembler:
+    """
+    Asanble odyo / Assemble many audio segments into one file
+
+    ``combined += AudioSegment`` copies the whole accumulated buffer on each
+    append, so a long book is quadratic in its length. Here every segment is
+    kept as an int16 PCM array, silences are only a length, and ``render()``
+    preallocates the output once and copies each segment to its offset.
+    Encoding (MP3 via pydub/ffmpeg, WAV via the wave module) happens once.
+
+    Example:
+        assembler = AudioAssembler(sample_rate=22050)
+        for path in segment_paths:
+            assembler.add_file(path)
+            assembler.add_silence(400)
+        assembler.export("output/podcast.mp3", bitrate="192k", normalize=True)
+    """
+
+    def __init__(self, sample_rate: Optional[int] = None, channels: int = 1):
+        """
+        Args:
+            sample_rate: Output sample rate (default: rate of the first segment)
+            channels: Output channels (1 = mono, 2 = stereo)
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        # Chak antre se swa yon array PCM, swa yon kantite frames silans
+        self._parts: List[Union[np.ndarray, int]] = []
+        self._frames = 0
+        self._peak = 0
+
+    # ------------------------------------------------------------
+    # Add segments
+    # ------------------------------------------------------------
+
+    def add_array(self, samples: np.ndarray, sample_rate: int, channels: int = 1) -> None:
+        """
+        Ajoute PCM / Add interleaved PCM samples
+
+        Args:
+            samples: int16 samples, or float samples in [-1, 1]
+            sample_rate: Sample rate of the samples
+            channels: Channel count of the samples
+        """
+        samples = np.asarray(samples)
+        if samples.dtype.kind == 'f':
+            samples = np.clip(samples * 32767, -32768, 32767).astype(np.int16)
+        elif samples.dtype != np.int16:
+            samples = samples.astype(np.int16)
+        samples = samples.reshape(-1)
+
+        if self.sample_rate is None:
+            self.sample_rate = sample_rate
+        samples = _match_channels(samples, channels, self.channels)
+        samples = _resample(samples, sample_rate, self.sample_rate, self.channels)
+
+        if len(samples):
+            self._peak = max(self._peak, int(np.abs(samples.astype(np.int32)).max()))
+        self._parts.append(samples)
+        self._frames += len(samples) // self.channels
+
+    def add_segment(self, segment) -> None:
+        """Ajoute yon pydub AudioSegment / Add a pydub AudioSegment"""
+        segment = segment.set_sample_width(2)
+        self.add_array(
+            np.frombuffer(segment.raw_data, dtype=np.int16),
+            segment.frame_rate,
+            segment.channels
+        )
+
+    def add_file(self, path: PathLike) -> None:
+        """
+        Ajoute yon fichye / Decode an audio file and add it
+
+        WAV is read with the wave module (no ffmpeg); other formats are
+        decoded once through pydub.
+        """
+        path = Path(path)
+        if path.suffix.lower() == '.wav':
+            with wave.open(str(path), 'rb') as wav:
+                if wav.getsampwidth() == 2:
+                    data = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+                    self.add_array(data, wav.getframerate(), wav.getnchannels())
+                    return
+        from pydub import AudioSegment
+        self.add_segment(AudioSegment.from_file(str(path)))
+
+    def add_silence(self, duration_ms: int) -> None:
+        """Ajoute silans / Add silence (stored as a length, zero-filled at render)"""
+        if self.sample_rate is None:
+            raise ValueError("Sample rate unknown: add audio or pass sample_rate first")
+        frames = int(round(self.sample_rate * duration_ms / 1000))
+        if frames > 0:
+            self._parts.append(frames)
+            self._frames += frames
+
+    # ------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    @property
+    def duration_seconds(self) -> float:
+        return self._frames / self.sample_rate if self.sample_rate else 0.0
+
+    def render(self, normalize: bool = False) -> np.ndarray:
+        """
+        Konstwi tanpon final la / Lay out all segments in one buffer
+
+        Args:
+            normalize: Scale to the peak minus NORMALIZE_HEADROOM_DB
+
+        Returns:
+            Interleaved int16 array
+        """
+        out = np.zeros(self._frames * self.channels, dtype=np.int16)
+        gain = 1.0
+        if normalize and self._peak:
+            target = 32767 * 10 ** (-NORMALIZE_HEADROOM_DB / 20)
+            gain = target / self._peak
+
+        pos = 0
+        for part in self._parts:
+            if isinstance(part, (int, np.integer)):
+                pos += int(part) * self.channels
+                continue
+            end = pos + len(part)
+            if gain == 1.0:
+                out[pos:end] = part
+            else:
+                np.multiply(part, gain, out=out[pos:end], casting='unsafe')
+            pos = end
+        return out
+
+    def export(
+        self,
+        output_path: PathLike,
+        format: Optional[str] = None,
+        bitrate: Optional[str] = None,
+        normalize: bool = False
+    ) -> Path:
+        """
+        Ekri fichye a / Encode once and write the file
+
+        Args:
+            output_path: Output file
+            format: Output format (default: from the file extension)
+            bitrate: Encoder bitrate (e.g. "192k"), ignored for WAV
+            normalize: Peak-normalize before encoding
+
+        Returns:
+            Output path
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        format = (format or output_path.suffix.lstrip('.') or 'mp3').lower()
+        data = self.render(normalize=normalize)
+
+        if format == 'wav':
+            with wave.open(str(output_path), 'wb') as wav:
+                wav.setnchannels(self.channels)
+                wav.setsampwidth(2)
+                wav.setframerate(self.sample_rate or 22050)
+                wav.writeframes(data.tobytes())
+            return output_path
+
+        from pydub import AudioSegment
+        audio = AudioSegment(
+            data=data.tobytes(),
+            sample_width=2,
+            frame_rate=self.sample_rate or 22050,
+            channels=self.channels
+        )
+        kwargs = {'bitrate': bitrate} if bitrate else {}
+        audio.export(str(output_path), format=format, **kwargs)
+        return output_path
+
+
+def assemble_files(
+    audio_files: List[PathLike],
+    output_path: PathLike,
+    silence_ms: int = 0,
+    normalize: bool = False,
+    bitrate: Optional[str] = None
+) -> Path:
+    """
+    Mete plizyè fichye ansanm / Concatenate audio files in one pass
+
+    Args:
+        audio_files: Files in order
+        output_path: Output file (format from the extension)
+        silence_ms: Silence inserted after each file
+        normalize: Peak-normalize the result
+        bitrate: Encoder bitrate for compressed formats
+
+    Returns:
+        Output path
+    """
+    assembler = AudioAssembler()
+    for audio_file in audio_files:
+        assembler.add_file(audio_file)
+        if silence_ms:
+            assembler.add_silence(silence_ms)
+    return assembler.export(output_path, bitrate=bitrate, normalize=normalize)
@@ -0,0 +1,388 @@
+"""
+Stream-copy audio concatenation / Kole odyo san re-ankode
+Concatenate same-codec chunks at the frame level (MP3 frames, WAV PCM)
+and fall back to a decode/re-encode only when the chunks differ
+"""
+import os
+import time
+import wave
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+# Estimasyon tan re-ankodaj (segonn travay pa segonn odyo) lè nou poko
+# mezire l; chak re-ankodaj reyèl mete l ajou
+REENCODE_SECONDS_PER_AUDIO_SECOND = float(os.getenv("REENCODE_SECONDS_PER_AUDIO_SECOND", "0.05"))
+_reencode_rate = {"value": REENCODE_SECONDS_PER_AUDIO_SECOND}
+
+# ------------------------------------------------------------
+# MP3 frame headers
+# ------------------------------------------------------------
+
+_VERSIONS = {0b00: 2.5, 0b10: 2, 0b11: 1}
+_LAYERS = {0b01: 3, 0b10: 2, 0b11: 1}
+_SAMPLE_RATES = {
+    1: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    2.5: (11025, 12000, 8000),
+}
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+class IncompatibleAudio(ValueError):
+    """Chunks cannot be stream-copied together / Moso yo pa konpatib"""
+
+
+@dataclass(frozen=True)
+class Mp3Frame:
+    """Yon header ankadreman MP3 / One parsed MP3 frame header"""
+    header: bytes
+    version: float
+    layer: int
+    bitrate: int
+    sample_rate: int
+    channels: int
+    padding: int
+    protected: bool
+    length: int
+
+    @property
+    def samples(self) -> int:
+        if self.layer == 1:
+            return 384
+        if self.layer == 3 and self.version != 1:
+            return 576
+        return 1152
+
+    @property
+    def codec(self) -> Tuple:
+        """Paramèt ki dwe menm pou kole ankadreman yo / Stream-copy key"""
+        return ("mp3", self.version, self.layer, self.sample_rate, self.channels)
+
+
+def parse_frame_header(data: bytes, offset: int = 0) -> Optional[Mp3Frame]:
+    """
+    Li yon header MP3 / Parse the 4-byte MP3 frame header at offset
+
+    Returns:
+        Mp3Frame, or None if the bytes are not a valid (non free-format) header
+    """
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = _VERSIONS.get((b1 >> 3) & 0b11)
+    layer = _LAYERS.get((b1 >> 1) & 0b11)
+    bitrate_index = (b2 >> 4) & 0xF
+    rate_index = (b2 >> 2) & 0b11
+    if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    bitrate = _BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    if layer == 1:
+        length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 3 and version != 1:
+        length = 72 * bitrate // sample_rate + padding
+    else:
+        length = 144 * bitrate // sample_rate + padding
+
+    return Mp3Frame(
+        header=bytes(data[offset:offset + 4]),
+        version=version,
+        layer=layer,
+        bitrate=bitrate,
+        sample_rate=sample_rate,
+        channels=1 if (b3 >> 6) == 0b11 else 2,
+        padding=padding,
+        protected=not (b1 & 1),
+        length=length,
+    )
+
+
+def strip_id3(data: bytes) -> bytes:
+    """
+    Retire tag ID3 yo / Remove ID3v2 tags at the start and ID3v1 at the end
+
+    Tags in the middle of a concatenated stream confuse some players,
+    so every chunk is stripped before its frames are copied.
+    """
+    start = 0
+    while data[start:start + 3] == b"ID3" and len(data) >= start + 10:
+        size = 0
+        for byte in data[start + 6:start + 10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if data[start + 5] & 0x10 else 0
+        start += 10 + size + footer
+    end = len(data)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    return data[start:end]
+
+
+def _is_info_frame(data: bytes, offset: int, frame: Mp3Frame) -> bool:
+    """Xing/Info/VBRI frame: metadata for the whole original file, not audio"""
+    if frame.layer != 3:
+        return False
+    if frame.version == 1:
+        side = 17 if frame.channels == 1 else 32
+    else:
+        side = 9 if frame.channels == 1 else 17
+    pos = offset + 4 + (2 if frame.protected else 0) + side
+    tag = data[pos:pos + 4]
+    return tag in (b"Xing", b"Info") or data[offset + 36:offset + 40] == b"VBRI"
+
+
+def iter_frames(data: bytes) -> Iterator[Tuple[int, Mp3Frame]]:
+    """
+    Pakouri ankadreman yo / Walk the MP3 frames of ID3-stripped data
+
+    Yields:
+        (offset, frame) for every audio frame (Xing/Info frames skipped)
+
+    Raises:
+        IncompatibleAudio: If the data does not start with MP3 frames
+    """
+    pos = 0
+    first = True
+    while pos + 4 <= len(data):
+        frame = parse_frame_header(data, pos)
+        if frame is None or pos + frame.length > len(data):
+            if first:
+                raise IncompatibleAudio("Not an MP3 stream (no frame sync)")
+            # Done bytes ki pa fè yon ankadreman konplè (ke fichye a)
+            break
+        if not (first and _is_info_frame(data, pos, frame)):
+            yield pos, frame
+        first = False
+        pos += frame.length
+
+
+@dataclass
+class Mp3Info:
+    """Rezime yon fichye MP3 / Summary of an MP3 chunk"""
+    codec: Tuple
+    frames: int
+    samples: int
+    sample_rate: int
+    template: Mp3Frame
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.samples / self.sample_rate
+
+
+def probe_mp3(data: bytes) -> Mp3Info:
+    """
+    Verifye yon moso MP3 / Check that all frames share one codec
+
+    Args:
+        data: ID3-stripped MP3 bytes
+
+    Raises:
+        IncompatibleAudio: Not MP3, or the frames change codec mid-stream
+    """
+    codec = None
+    frames = samples = 0
+    template = None
+    for _, frame in iter_frames(data):
+        if codec is None:
+            codec, template = frame.codec, frame
+        elif frame.codec != codec:
+            raise IncompatibleAudio(f"Codec changes inside chunk: {codec} → {frame.codec}")
+        frames += 1
+        samples += frame.samples
+    if codec is None:
+        raise IncompatibleAudio("MP3 chunk has no audio frames")
+    return Mp3Info(codec, frames, samples, template.sample_rate, template)
+
+
+@lru_cache(maxsize=64)
+def silent_frames(template: Mp3Frame, duration_ms: int) -> bytes:
+    """
+    Ankadreman silans / Digital-silence MP3 frames matching a template
+
+    A layer III frame whose side info and main data are all zero decodes to
+    silence, so silence can be inserted between chunks without an encoder.
+    Results are cached per (template, duration).
+    """
+    if template.layer != 3:
+        raise IncompatibleAudio("Silent frames are only generated for layer III")
+    b2 = template.header[2] & ~0b10  # pa gen padding
+    header = bytes([template.header[0], template.header[1] | 1, b2, template.header[3]])
+    frame = parse_frame_header(header)
+    count = max(1, round(duration_ms / 1000 * frame.sample_rate / frame.samples)) if duration_ms > 0 else 0
+    return (header + bytes(frame.length - 4)) * count
+
+
+# ------------------------------------------------------------
+# Merge
+# ------------------------------------------------------------
+
+@dataclass
+class ConcatReport:
+    """
+    Rapò fizyon / Which merge path was taken and what it cost
+
+    Attributes:
+        mode: "mp3-copy", "wav-copy" or "reencode"
+        output: File written
+        files: Number of input chunks
+        seconds: Wall time of the merge
+        audio_seconds: Duration of the merged audio
+        saved_seconds: Estimated re-encode time avoided (0 for reencode)
+        reason: Why stream copy was not possible (reencode only)
+    """
+    mode: str
+    output: str
+    files: int
+    seconds: float
+    audio_seconds: float
+    saved_seconds: float = 0.0
+    reason: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def summary(self) -> str:
+        if self.mode == "reencode":
+            return f"re-encode ({self.reason}) in {self.seconds:.2f}s"
+        return (f"{self.mode} of {self.files} chunks in {self.seconds:.2f}s "
+                f"(~{self.saved_seconds:.1f}s re-encode saved)")
+
+
+def _wav_params(path: Path) -> Optional[Tuple]:
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return ("wav", wav.getnchannels(), wav.getsampwidth(), wav.getframerate())
+    except (wave.Error, EOFError):
+        return None
+
+
+def _copy_mp3(datas: List[bytes], infos: List[Mp3Info], output_path: Path, silence_ms: int) -> float:
+    gap = silent_frames(infos[0].template, silence_ms) if silence_ms else b""
+    gap_samples = (len(gap) // parse_frame_header(gap).length) * infos[0].template.samples if gap else 0
+    samples = 0
+    with open(output_path, "wb") as out:
+        for i, (data, info) in enumerate(zip(datas, infos)):
+            # Sèlman ankadreman odyo yo (pa Xing/Info, pa done apre dènye a)
+            for offset, frame in iter_frames(data):
+                out.write(data[offset:offset + frame.length])
+            samples += info.samples
+            if gap and i < len(datas) - 1:
+                out.write(gap)
+                samples += gap_samples
+    return samples / infos[0].sample_rate
+
+
+def _copy_wav(paths: List[Path], params: Tuple, output_path: Path, silence_ms: int) -> float:
+    _, channels, width, rate = params
+    gap = bytes(int(rate * silence_ms / 1000) * channels * width)
+    frames = 0
+    with wave.open(str(output_path), "wb") as out:
+        out.setnchannels(channels)
+        out.setsampwidth(width)
+        out.setframerate(rate)
+        for i, path in enumerate(paths):
+            with wave.open(str(path), "rb") as part:
+                frames += part.getnframes()
+                out.writeframes(part.readframes(part.getnframes()))
+            if gap and i < len(paths) - 1:
+                frames += len(gap) // (channels * width)
+                out.writeframes(gap)
+    return frames / rate
+
+
+def concat_audio(
+    paths: List[PathLike],
+    output_path: PathLike,
+    silence_ms: int = 0,
+    bitrate: Optional[str] = None
+) -> ConcatReport:
+    """
+    Kole moso odyo yo / Merge chunks, stream-copying when codecs match
+
+    1. All MP3 with the same MPEG version, layer, sample rate and channel
+       count: ID3 tags are stripped and frames are copied in-process
+       (silence = digital-silence frames).
+    2. All WAV with identical PCM parameters: PCM frames are copied.
+    3. Otherwise: decode and re-encode once with AudioAssembler.
+
+    Args:
+        paths: Chunks in order
+        output_path: Output file (a WAV-only merge gets a .wav suffix)
+        silence_ms: Silence between chunks
+        bitrate: Encoder bitrate for the re-encode fallback
+
+    Returns:
+        ConcatReport describing the path taken
+    """
+    paths = [Path(p) for p in paths]
+    output_path = Path(output_path)
+    if not paths:
+        raise ValueError("No audio files to merge")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+
+    reason = None
+    wav_params = [_wav_params(p) for p in paths]
+    if all(wav_params) and len(set(wav_params)) == 1:
+        output_path = output_path.with_suffix(".wav")
+        audio_seconds = _copy_wav(paths, wav_params[0], output_path, silence_ms)
+        mode = "wav-copy"
+    elif any(wav_params):
+        reason = "WAV chunks with different formats" if all(wav_params) else "mixed WAV and compressed chunks"
+        mode = None
+    else:
+        try:
+            datas = [strip_id3(p.read_bytes()) for p in paths]
+            infos = [probe_mp3(data) for data in datas]
+            codecs = {info.codec for info in infos}
+            if len(codecs) != 1:
+                raise IncompatibleAudio(f"different codec parameters: {sorted(codecs)}")
+            audio_seconds = _copy_mp3(datas, infos, output_path, silence_ms)
+            mode = "mp3-copy"
+        except IncompatibleAudio as e:
+            reason = str(e)
+            mode = None
+
+    if mode is None:
+        from utils.audio_assembly import assemble_files
+        output_path = assemble_files(paths, output_path, silence_ms=silence_ms, bitrate=bitrate)
+        seconds = time.perf_counter() - start
+        audio_seconds = _duration(output_path)
+        if audio_seconds:
+            # Moyèn mobil tan re-ankodaj reyèl la
+            rate = seconds / audio_seconds
+            _reencode_rate["value"] = 0.8 * _reencode_rate["value"] + 0.2 * rate
+        return ConcatReport("reencode", str(output_path), len(paths), seconds,
+                            audio_seconds, 0.0, reason)
+
+    seconds = time.perf_counter() - start
+    estimated = audio_seconds * _reencode_rate["value"]
+    return ConcatReport(mode, str(output_path), len(paths), seconds, audio_seconds,
+                        max(0.0, estimated - seconds))
+
+
+def _duration(path: Path) -> float:
+    """Dire yon fichye final / Duration of a merged file (best effort)"""
+    params = _wav_params(path)
+    if params:
+        with wave.open(str(path), "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    try:
+        return probe_mp3(strip_id3(path.read_bytes())).duration_seconds
+    except (IncompatibleAudio, OSError):
+        return 0.0
@@ -3,6 +3,7 @@ Simple audio generation wrapper
 """
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
@@ -12,6 +13,14 @@ from src.audio_generator import AudiobookGenerator
 from src.config import Config
 
 
+@lru_cache(maxsize=None)
+def get_generator(language: str = "ht") -> AudiobookGenerator:
+    """Jeneratè pataje pa lang / Shared audiobook generator per language"""
+    config = Config()
+    config.tts_language = language
+    return AudiobookGenerator(config)
+
+
 def generate_audio(text: str, output_path: str, language: str = "ht") -> str:
     """
     Jenere liv odyo / Generate audiobook
@@ -24,11 +33,7 @@ def generate_audio(text: str, output_path: str, language: str = "ht") -> str:
     Returns:
         Path to generated audio file
     """
-    # Create config
-    config = Config()
-    config.tts_language = language
-    
-    generator = AudiobookGenerator(config)
+    generator = get_generator(language)
     
     # Generate audio
     audio_path = generator.generate(text, output_path=Path(output_path))
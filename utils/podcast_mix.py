@@ -57,26 +57,25 @@ def mix_voices_advanced(audio_files: List[str], output_path: str) -> str:
         Path to final podcast file
     """
     try:
-        from pydub import AudioSegment
+        import pydub  # noqa: F401
+        from utils.audio_assembly import AudioAssembler
     except ImportError:
         print("⚠️  pydub pa enstale / pydub not installed")
         print("   Instalé ak: pip install pydub")
         return mix_voices(audio_files, output_path)
     
-    # Concatenate all audio files
-    combined = AudioSegment.empty()
+    # Concatenate all audio files (one decode per file, one encode)
+    assembler = AudioAssembler()
     
     for audio_file in audio_files:
-        audio = AudioSegment.from_mp3(audio_file)
-        combined += audio
+        assembler.add_file(audio_file)
     
     # Export combined audio
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    combined.export(str(output_path), format="mp3")
+    assembler.export(output_path, format="mp3")
     
     print(f"🎙️ Podcast kreyé ak {len(audio_files)} fichye / Podcast created with {len(audio_files)} files")
-    print(f"   📊 Dire / Duration: {len(combined) / 1000:.1f}s")
+    print(f"   📊 Dire / Duration: {assembler.duration_seconds:.1f}s")
     
     return str(output_path)
 
@@ -0,0 +1,235 @@
+"""
+Parallel segment synthesis / Sentèz segman an paralèl
+Synthesize script segments concurrently (threads for network TTS, processes
+for CPU models), keep script order, and reuse segments whose text and voice
+did not change
+"""
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+PathLike = Union[str, Path]
+
+SEGMENT_CACHE_DIR = Path(os.getenv("SEGMENT_CACHE_DIR", "cache/segments"))
+
+# Monte vèsyon sa a lè fason segman yo pwodui chanje (efè vwa, modèl...)
+SEGMENT_CACHE_VERSION = 2
+
+
+def segment_cache_key(engine: str, text: str, voice: Dict[str, Any]) -> str:
+    """
+    Kle kach yon segman / Cache key for one segment
+
+    Args:
+        engine: Synthesis engine name (e.g. "gtts", "vits")
+        text: Segment text
+        voice: Voice settings that change the audio
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(
+        {"v": SEGMENT_CACHE_VERSION, "engine": engine, "text": text, "voice": voice},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SegmentCache:
+    """
+    Kach segman sou disk / On-disk cache of synthesized segments
+
+    Files are stored as ``<cache_dir>/<key[:2]>/<key>.<ext>`` and written
+    atomically, so parallel runs never read a half-written segment.
+    """
+
+    def __init__(self, cache_dir: Optional[PathLike] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else SEGMENT_CACHE_DIR
+
+    def path_for(self, key: str, ext: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.{ext}"
+
+    def get(self, key: str, ext: str) -> Optional[Path]:
+        """Chemen segman an si li nan kach la / Cached file or None"""
+        path = self.path_for(key, ext)
+        return path if path.exists() and path.stat().st_size > 0 else None
+
+    def put(self, key: str, ext: str, source: PathLike) -> Path:
+        """Kopye yon segman nan kach la / Store a copy of a synthesized file"""
+        path = self.path_for(key, ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, path)
+        return path
+
+
+@dataclass
+class SegmentResult:
+    """
+    Rezilta yon segman / Outcome of one segment
+
+    Attributes:
+        index: Position in the script
+        path: Output file (None on failure)
+        cached: True if the audio came from the cache
+        error: Error message on failure
+    """
+    index: int
+    path: Optional[Path] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.path is not None
+
+
+class SegmentSynthesizer:
+    """
+    Sentèz segman an paralèl / Synthesize many segments concurrently
+
+    ``synth_func(text, voice, output_path)`` writes one segment; a falsy
+    return value (other than None) or an exception marks it as failed. With
+    ``use_processes=True`` the function must be a picklable module-level
+    function; each worker process then holds its own model.
+
+    Example:
+        synth = SegmentSynthesizer(gtts_segment, engine="gtts", max_workers=4)
+        results = synth.synthesize(
+            [{"text": "Bonjou", "voice": {"lang": "fr"}}], "temp_podcast"
+        )
+    """
+
+    def __init__(
+        self,
+        synth_func: Callable[[str, Dict[str, Any], Path], Any],
+        engine: str,
+        ext: str = "mp3",
+        max_workers: int = 4,
+        use_processes: bool = False,
+        cache: Optional[SegmentCache] = None,
+        use_cache: bool = True,
+        initializer: Optional[Callable] = None,
+        initargs: tuple = (),
+    ):
+        """
+        Args:
+            synth_func: Function writing one segment to output_path
+            engine: Engine name, part of the cache key
+            ext: Output file extension
+            max_workers: Concurrent syntheses
+            use_processes: Process pool (CPU-bound models) instead of threads
+            cache: Segment cache (default: SEGMENT_CACHE_DIR)
+            use_cache: Disable to always re-synthesize
+            initializer: Worker initializer (process pool only)
+            initargs: Arguments for the initializer
+        """
+        self.synth_func = synth_func
+        self.engine = engine
+        self.ext = ext
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.cache = (cache or SegmentCache()) if use_cache else None
+        self.initializer = initializer
+        self.initargs = initargs
+        self.stats = {"segments": 0, "cache_hits": 0, "synthesized": 0, "failed": 0}
+
+    def _executor(self):
+        if self.use_processes:
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="segment")
+
+    def synthesize(
+        self,
+        segments: List[Dict[str, Any]],
+        out_dir: PathLike,
+        prefix: str = "segment",
+        progress: Optional[Callable[[SegmentResult], None]] = None,
+    ) -> List[SegmentResult]:
+        """
+        Sentetize tout segman yo / Synthesize all segments
+
+        Identical (text, voice) pairs are synthesized once per run, and
+        cached segments are copied instead of synthesized.
+
+        Args:
+            segments: Dicts with "text" and "voice"
+            out_dir: Directory for the output files
+            prefix: Output file name prefix
+            progress: Called once per finished segment (any order)
+
+        Returns:
+            One SegmentResult per segment, in script order
+        """
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        results = [SegmentResult(index=i) for i in range(len(segments))]
+        self.stats["segments"] += len(segments)
+
+        # kle -> endèks ki bezwen l (premye a se sa n ap sentetize)
+        pending: Dict[str, List[int]] = {}
+        for i, segment in enumerate(segments):
+            key = segment_cache_key(self.engine, segment["text"], segment.get("voice", {}))
+            target = out_dir / f"{prefix}_{i:03d}.{self.ext}"
+            cached = self.cache.get(key, self.ext) if self.cache else None
+            if cached is not None:
+                shutil.copyfile(cached, target)
+                results[i].path, results[i].cached = target, True
+                self.stats["cache_hits"] += 1
+                if progress:
+                    progress(results[i])
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if not pending:
+            return results
+
+        with self._executor() as pool:
+            futures = {}
+            for key, indexes in pending.items():
+                first = indexes[0]
+                target = out_dir / f"{prefix}_{first:03d}.{self.ext}"
+                segment = segments[first]
+                future = pool.submit(self.synth_func, segment["text"], segment.get("voice", {}), target)
+                futures[future] = (key, indexes, target)
+
+            for future in as_completed(futures):
+                key, indexes, target = futures[future]
+                error = None
+                try:
+                    if future.result() is False or not target.exists():
+                        error = "synthesis returned no audio"
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+
+                if error is None and self.cache:
+                    self.cache.put(key, self.ext, target)
+
+                for n, i in enumerate(indexes):
+                    if error is not None:
+                        results[i].error = error
+                        self.stats["failed"] += 1
+                    else:
+                        if n:
+                            path = out_dir / f"{prefix}_{i:03d}.{self.ext}"
+                            shutil.copyfile(target, path)
+                        else:
+                            path = target
+                        results[i].path, results[i].cached = path, n > 0
+                        self.stats["synthesized" if n == 0 else "cache_hits"] += 1
+                    if progress:
+                        progress(results[i])
+
+        return results
@@ -3,6 +3,7 @@ Simple text extraction wrapper
 """
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
@@ -12,6 +13,12 @@ from src.pdf_extractor import PDFExtractor
 from src.config import Config
 
 
+@lru_cache(maxsize=None)
+def get_extractor() -> PDFExtractor:
+    """Ekstraktè pataje / Shared PDF extractor"""
+    return PDFExtractor(Config())
+
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Ekstrè tèks nan PDF / Extract text from PDF
@@ -22,9 +29,7 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     Returns:
         Extracted text
     """
-    # Create minimal config
-    config = Config()
-    extractor = PDFExtractor(config)
+    extractor = get_extractor()
     
     # Extract text
     text = extractor.extract(Path(pdf_path), show_progress=True)
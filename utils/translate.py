@@ -3,6 +3,7 @@ Simple translation wrapper
 """
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
@@ -12,6 +13,19 @@ from src.translator import CreoleTranslator
 from src.config import Config
 
 
+@lru_cache(maxsize=None)
+def get_translator(target_lang: str = "ht") -> CreoleTranslator:
+    """
+    Tradiktè pataje pa lang / Shared warm translator per target language
+    
+    The model is loaded once and reused by every call (and every book in
+    a batch) instead of being reloaded for each text.
+    """
+    config = Config()
+    config.target_language = target_lang
+    return CreoleTranslator(config)
+
+
 def translate_text(text: str, target_lang: str = "ht") -> str:
     """
     Tradui tèks / Translate text
@@ -23,11 +37,7 @@ def translate_text(text: str, target_lang: str = "ht") -> str:
     Returns:
         Translated text
     """
-    # Create config with target language
-    config = Config()
-    config.target_language = target_lang
-    
-    translator = CreoleTranslator(config)
+    translator = get_translator(target_lang)
     
     # Translate text
     translated = translator.translate(text, show_progress=True)
@@ -0,0 +1,161 @@
+"""
+Voice DSP / Efè vwa an memwa
+Pitch shift and time stretch on float waveforms with numpy/scipy:
+a phase vocoder for the tempo and polyphase resampling for the pitch,
+computed over the whole segment at once (no per-frame Python loop)
+"""
+from fractions import Fraction
+
+import numpy as np
+
+# Yon "pa" pitch_shift nan voices_config = 5% frekans (menm jan ak ansyen kòd la)
+PITCH_STEP = 0.05
+
+N_FFT = 1024
+HOP = N_FFT // 4
+
+
+def _frames(x: np.ndarray, n_fft: int, hop: int) -> np.ndarray:
+    """Koupe siyal la an fenèt / Windowed frames, shape (T, n_fft)"""
+    pad = n_fft // 2
+    x = np.pad(x, (pad, pad + hop))
+    view = np.lib.stride_tricks.sliding_window_view(x, n_fft)[::hop]
+    return view * np.hanning(n_fft)
+
+
+def _overlap_add(frames: np.ndarray, hop: int, length: int) -> np.ndarray:
+    """
+    Rekonstwi siyal la / Weighted overlap-add of windowed frames
+
+    Each frame is split into n_fft / hop blocks; block j of frame t lands on
+    output block t + j, so the sum is a handful of shifted array additions.
+    """
+    count, n_fft = frames.shape
+    ratio = n_fft // hop
+    window = np.hanning(n_fft)
+    blocks = (frames * window).reshape(count, ratio, hop)
+    weights = (window ** 2).reshape(ratio, hop)
+
+    out = np.zeros((count + ratio - 1, hop))
+    norm = np.zeros((count + ratio - 1, hop))
+    for j in range(ratio):
+        out[j:j + count] += blocks[:, j]
+        norm[j:j + count] += weights[j]
+    out = out.reshape(-1)
+    norm = norm.reshape(-1)
+    out = np.divide(out, norm, out=np.zeros_like(out), where=norm > 1e-3)
+
+    pad = n_fft // 2
+    out = out[pad:pad + length]
+    return np.pad(out, (0, length - len(out))) if len(out) < length else out
+
+
+def time_stretch(samples: np.ndarray, rate: float, n_fft: int = N_FFT, hop: int = HOP) -> np.ndarray:
+    """
+    Chanje vitès san chanje ton / Change tempo without changing pitch
+
+    Args:
+        samples: Mono float waveform
+        rate: Playback rate (>1 faster/shorter, <1 slower/longer)
+        n_fft: STFT size
+        hop: STFT hop (n_fft must be a multiple of it)
+
+    Returns:
+        Float waveform of about len(samples) / rate samples
+    """
+    samples = np.asarray(samples, dtype=np.float64).reshape(-1)
+    if rate == 1.0 or len(samples) == 0:
+        return samples.copy()
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+
+    spectrum = np.fft.rfft(_frames(samples, n_fft, hop), axis=1)
+    length = int(round(len(samples) / rate))
+
+    # Pozisyon (fraksyonè) fenèt sous yo pou chak fenèt sòti
+    steps = np.arange(0, spectrum.shape[0] - 1, rate)
+    base = steps.astype(int)
+    frac = (steps - base)[:, None]
+
+    magnitude = np.abs(spectrum)
+    phase = np.angle(spectrum)
+    mag = (1 - frac) * magnitude[base] + frac * magnitude[base + 1]
+
+    # Avans faz pa fenèt: faz atann + devyasyon (ramne nan [-pi, pi])
+    expected = 2 * np.pi * hop * np.arange(spectrum.shape[1]) / n_fft
+    delta = phase[base + 1] - phase[base] - expected
+    delta -= 2 * np.pi * np.round(delta / (2 * np.pi))
+    advance = expected + delta
+    out_phase = np.empty_like(advance)
+    out_phase[0] = phase[0]
+    np.cumsum(advance[:-1], axis=0, out=out_phase[1:])
+    out_phase[1:] += phase[0]
+
+    frames = np.fft.irfft(mag * np.exp(1j * out_phase), n=n_fft, axis=1)
+    return _overlap_add(frames, hop, length)
+
+
+def _resample(samples: np.ndarray, factor: float) -> np.ndarray:
+    """Resample pa yon faktè (rasyonèl) / Resample to len(samples) / factor"""
+    from scipy.signal import resample_poly
+
+    ratio = Fraction(factor).limit_denominator(200)
+    if ratio == 1:
+        return samples
+    return resample_poly(samples, ratio.denominator, ratio.numerator)
+
+
+def apply_voice(
+    samples: np.ndarray,
+    pitch_shift: float = 0,
+    speed: float = 1.0,
+    n_fft: int = N_FFT,
+    hop: int = HOP
+) -> np.ndarray:
+    """
+    Aplike pitch ak vitès yon vwa / Apply a voice's pitch and speed
+
+    Pitch and tempo are done in one pass: the vocoder stretches by
+    ``speed / factor`` and resampling by ``factor`` then restores the tempo
+    while scaling every frequency by ``factor``.
+
+    Args:
+        samples: Mono float waveform
+        pitch_shift: Pitch steps (each step is PITCH_STEP, e.g. 2 = +10%)
+        speed: Tempo (1.0 = unchanged, 0.9 = 10% slower)
+
+    Returns:
+        Float waveform, same sample rate, len(samples) / speed samples
+    """
+    samples = np.asarray(samples, dtype=np.float64).reshape(-1)
+    factor = 1.0 + pitch_shift * PITCH_STEP
+    if factor <= 0:
+        raise ValueError("pitch_shift too low")
+    if factor == 1.0 and speed == 1.0:
+        return samples.copy()
+
+    target = int(round(len(samples) / speed))
+    ratio = Fraction(factor).limit_denominator(200)
+    stretched = time_stretch(samples, speed / float(ratio), n_fft=n_fft, hop=hop)
+    out = _resample(stretched, float(ratio))
+
+    # Ajiste longè a (awondi resample) san chanje kontni an
+    if len(out) >= target:
+        return out[:target]
+    return np.pad(out, (0, target - len(out)))
+
+
+def to_int16(samples: np.ndarray, normalize: bool = True) -> np.ndarray:
+    """
+    Konvèti an PCM 16 bit / Convert a float waveform to int16
+
+    Args:
+        samples: Float waveform
+        normalize: Scale the peak to full range first
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if normalize:
+        peak = np.max(np.abs(samples)) if len(samples) else 0.0
+        if peak > 0:
+            samples = samples / peak
+    return np.clip(samples * 32767, -32768, 32767).astype(np.int16)